@@ -0,0 +1,4 @@
+"""
+Benchmarks de los caminos críticos del sistema sobre una base de datos
+sintética (ver data_generator y runner). Uso: python -m benchmarks --help
+"""
@@ -0,0 +1,58 @@
+import argparse
+import sys
+
+from benchmarks.data_generator import DEFAULT_PRESET, PRESETS, volumes_for
+from benchmarks.runner import (
+    HISTORY_FILE,
+    REPETICIONES,
+    format_comparison,
+    run_benchmarks,
+)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Genera una base sintética, mide los caminos críticos y "
+        "guarda los resultados en un historial JSON",
+    )
+    parser.add_argument("--preset", choices=sorted(PRESETS), default=DEFAULT_PRESET)
+    for clave in PRESETS[DEFAULT_PRESET]:
+        parser.add_argument(
+            f"--{clave.replace('_', '-')}", type=int, dest=clave, help="(sobrescribe el preset)"
+        )
+    parser.add_argument("--semilla", type=int, default=42)
+    parser.add_argument("--repeticiones", type=int, default=REPETICIONES)
+    parser.add_argument(
+        "--solo", nargs="+", help="medir solo los casos con estos nombres o prefijos"
+    )
+    parser.add_argument("--historial", default=HISTORY_FILE, help="archivo JSON de resultados")
+    parser.add_argument(
+        "--fallar-si-regresion",
+        action="store_true",
+        help="salir con código 1 si alguna medición empeoró",
+    )
+    args = parser.parse_args(argv)
+
+    volumenes = volumes_for(
+        args.preset, **{clave: getattr(args, clave) for clave in PRESETS[args.preset]}
+    )
+    corrida, comparacion = run_benchmarks(
+        volumenes,
+        semilla=args.semilla,
+        repeticiones=args.repeticiones,
+        solo=args.solo,
+        history_path=args.historial,
+    )
+    print()
+    print(format_comparison(comparacion))
+    for nombre, motivo in corrida["omitidos"].items():
+        print(f"Omitido {nombre}: {motivo}")
+    print(f"\nResultados agregados a {args.historial}")
+    if args.fallar_si_regresion and any(c[4] for c in comparacion):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
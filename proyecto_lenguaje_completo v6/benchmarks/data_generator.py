@@ -0,0 +1,393 @@
+import random
+from datetime import date, timedelta
+
+from config import database
+from config.database import get_db_connection, execute_with_retry
+from models.academic_period import AcademicPeriod
+from models.course import Course
+from utils.security import hash_password
+
+
+# Contraseña de todos los usuarios generados (para medir el inicio de sesión)
+PASSWORD = "Bench1234"
+PERIODO_ACTIVO = "2025-2"
+CORTES = ("corte1", "corte2", "corte3", "corte4")
+
+# Volúmenes predefinidos. carreras son carreras sintéticas que se suman al
+# pensum real que carga initialize_database.
+PRESETS = {
+    "pequeno": {
+        "carreras": 1,
+        "semestres": 6,
+        "materias_por_semestre": 5,
+        "profesores": 40,
+        "estudiantes": 500,
+        "secciones_por_materia": 1,
+        "inscripciones_por_estudiante": 4,
+        "cursadas_por_estudiante": 20,
+        "porcentaje_calificadas": 80,
+    },
+    "mediano": {
+        "carreras": 2,
+        "semestres": 9,
+        "materias_por_semestre": 6,
+        "profesores": 200,
+        "estudiantes": 5000,
+        "secciones_por_materia": 2,
+        "inscripciones_por_estudiante": 5,
+        "cursadas_por_estudiante": 40,
+        "porcentaje_calificadas": 80,
+    },
+    "grande": {
+        "carreras": 6,
+        "semestres": 10,
+        "materias_por_semestre": 7,
+        "profesores": 800,
+        "estudiantes": 30000,
+        "secciones_por_materia": 3,
+        "inscripciones_por_estudiante": 6,
+        "cursadas_por_estudiante": 60,
+        "porcentaje_calificadas": 80,
+    },
+}
+DEFAULT_PRESET = "mediano"
+
+_NOMBRES = (
+    "José", "María", "Luis", "Ana", "Carlos", "Carmen", "Jesús", "Rosa",
+    "Miguel", "Luisa", "Pedro", "Elena", "Juan", "Andrea", "Rafael", "Daniela",
+)
+_APELLIDOS = (
+    "González", "Rodríguez", "Pérez", "Hernández", "García", "Martínez",
+    "López", "Díaz", "Ramírez", "Torres", "Rojas", "Suárez", "Mendoza", "Silva",
+)
+
+
+def volumes_for(preset=DEFAULT_PRESET, **cambios):
+    """Volúmenes del preset con los cambios indicados (los None se ignoran)."""
+    volumenes = dict(PRESETS[preset])
+    for clave, valor in cambios.items():
+        if clave not in volumenes:
+            raise ValueError(f"Volumen desconocido: {clave}")
+        if valor is not None:
+            volumenes[clave] = valor
+    return volumenes
+
+
+def periodo_anterior(periodo):
+    """Inverso de AcademicPeriod.siguiente (2025-1 -> 2024-2)."""
+    anio, lapso = periodo.split("-")
+    if lapso == "2":
+        return f"{anio}-1"
+    return f"{int(anio) - 1}-2"
+
+
+def _fin_de(periodo):
+    """Fecha de cierre aproximada del período (julio o diciembre)."""
+    anio, lapso = periodo.split("-")
+    return f"{anio}-07-15" if lapso == "1" else f"{anio}-12-15"
+
+
+class DataGenerator:
+    """
+    Llena una base de datos nueva con datos sintéticos de una universidad:
+    carreras y materias (además del pensum real), profesores, coordinadores,
+    estudiantes, secciones del período activo con sus inscripciones y
+    calificaciones, y el historial archivado en materias_cursadas.
+
+    La misma semilla y los mismos volúmenes producen siempre los mismos
+    datos, así que las mediciones de corridas distintas son comparables.
+    Todo se inserta con executemany en una sola transacción por tabla.
+    """
+
+    def __init__(self, volumenes=None, semilla=42, periodo=PERIODO_ACTIVO):
+        self.volumenes = dict(volumenes or PRESETS[DEFAULT_PRESET])
+        self.semilla = semilla
+        self.periodo = periodo
+        self.random = random.Random(semilla)
+        self._hash = hash_password(PASSWORD)
+        self._cedula = 10_000_000
+
+    def generate(self, path, progress=None):
+        """
+        Crea la base en path (que no debe existir), la deja como base activa
+        del pool de conexiones y la llena. Retorna un diccionario con las
+        filas insertadas por tabla.
+        """
+        database.configure_connection_pool(database=path)
+        database.initialize_database()
+        Course.invalidate_cache()
+
+        pasos = [
+            ("periodos_academicos", self._insert_periodos),
+            ("materias", self._insert_materias),
+            ("profesores", self._insert_profesores),
+            ("coordinadores", self._insert_coordinadores),
+            ("estudiantes", self._insert_estudiantes),
+            ("secciones", self._insert_secciones),
+            ("inscripciones", self._insert_inscripciones),
+            ("calificaciones", self._insert_calificaciones),
+            ("materias_cursadas", self._insert_materias_cursadas),
+        ]
+        conteos = {}
+        for i, (tabla, paso) in enumerate(pasos, start=1):
+            if progress:
+                progress(i, len(pasos), tabla)
+            conteos[tabla] = execute_with_retry(lambda: self._run_step(paso))
+        Course.invalidate_cache()
+        database.set_periodo_activo(self.periodo)
+        with get_db_connection() as conn:
+            conn.execute("ANALYZE")
+            conn.commit()
+        return conteos
+
+    def _run_step(self, paso):
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                filas = paso(cursor)
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+        return filas
+
+    def _next_cedula(self):
+        self._cedula += 1
+        return str(self._cedula)
+
+    def _persona(self):
+        return (
+            self.random.choice(_NOMBRES),
+            f"{self.random.choice(_APELLIDOS)} {self.random.choice(_APELLIDOS)}",
+        )
+
+    def _fecha(self, desde_anio, hasta_anio):
+        inicio = date(desde_anio, 1, 1)
+        dias = (date(hasta_anio, 12, 31) - inicio).days
+        return (inicio + timedelta(days=self.random.randint(0, dias))).isoformat()
+
+    def _insert_usuarios(self, cursor, cantidad, rol):
+        """Inserta cantidad usuarios del rol y retorna sus id_usuario en orden."""
+        filas = [
+            (self._next_cedula(), *self._persona(), self._hash, rol)
+            for _ in range(cantidad)
+        ]
+        cursor.executemany(
+            """
+            INSERT INTO usuarios (cedula, nombre, apellido, contraseña_hash, rol)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            filas,
+        )
+        cursor.execute(
+            "SELECT id_usuario FROM usuarios WHERE rol = ? ORDER BY id_usuario", (rol,)
+        )
+        return [row[0] for row in cursor.fetchall()][-cantidad:] if cantidad else []
+
+    def _insert_periodos(self, cursor):
+        # El período activo y el siguiente (al que pasa el cierre)
+        cursor.executemany(
+            "INSERT OR IGNORE INTO periodos_academicos (periodo, es_activo) VALUES (?, 0)",
+            [(self.periodo,), (AcademicPeriod.siguiente(self.periodo),)],
+        )
+        return cursor.rowcount
+
+    def _insert_materias(self, cursor):
+        v = self.volumenes
+        filas = []
+        for n in range(1, v["carreras"] + 1):
+            carrera = f"Carrera Sintética {n}"
+            for semestre in range(1, v["semestres"] + 1):
+                for m in range(1, v["materias_por_semestre"] + 1):
+                    # Cada materia pide la del mismo orden del semestre anterior
+                    requisito = f"S{n:02d}-{semestre - 1}{m:02d}" if semestre > 1 else None
+                    filas.append(
+                        (
+                            f"S{n:02d}-{semestre}{m:02d}",
+                            f"MATERIA {m} SEMESTRE {semestre} ({carrera.upper()})",
+                            self.random.choice((2, 3, 4, 5)),
+                            requisito,
+                            carrera,
+                            semestre,
+                        )
+                    )
+        cursor.executemany(
+            """
+            INSERT INTO materias (codigo, nombre, creditos, requisitos, carrera, semestre)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            filas,
+        )
+        cursor.execute(
+            "SELECT id_materia, carrera, semestre FROM materias ORDER BY id_materia"
+        )
+        self.materias = cursor.fetchall()
+        self.carreras = sorted({carrera for _, carrera, _ in self.materias})
+        self.semestres_carrera = {}
+        for _, carrera, semestre in self.materias:
+            actual = self.semestres_carrera.get(carrera, 0)
+            self.semestres_carrera[carrera] = max(actual, semestre)
+        return len(filas)
+
+    def _insert_profesores(self, cursor):
+        ids = self._insert_usuarios(cursor, self.volumenes["profesores"], "profesor")
+        cursor.executemany(
+            """
+            INSERT INTO profesores (id_usuario, carrera, fecha_contratacion)
+            VALUES (?, ?, ?)
+            """,
+            [
+                (id_usuario, self.carreras[i % len(self.carreras)], self._fecha(2000, 2024))
+                for i, id_usuario in enumerate(ids)
+            ],
+        )
+        cursor.execute("SELECT id_profesor, carrera FROM profesores")
+        self.profesores = {}
+        for id_profesor, carrera in cursor.fetchall():
+            self.profesores.setdefault(carrera, []).append(id_profesor)
+        return len(ids)
+
+    def _insert_coordinadores(self, cursor):
+        ids = self._insert_usuarios(cursor, len(self.carreras), "coordinacion")
+        cursor.executemany(
+            "INSERT INTO coordinadores (id_usuario, carrera, fecha_ingreso) VALUES (?, ?, ?)",
+            [
+                (id_usuario, carrera, self._fecha(2015, 2024))
+                for id_usuario, carrera in zip(ids, self.carreras)
+            ],
+        )
+        return len(ids)
+
+    def _insert_estudiantes(self, cursor):
+        ids = self._insert_usuarios(cursor, self.volumenes["estudiantes"], "alumno")
+        filas = []
+        for id_usuario in ids:
+            carrera = self.random.choice(self.carreras)
+            semestre = self.random.randint(1, self.semestres_carrera[carrera])
+            filas.append((id_usuario, carrera, semestre, self._fecha(2018, 2025)))
+        cursor.executemany(
+            """
+            INSERT INTO estudiantes (id_usuario, carrera, semestre, fecha_ingreso)
+            VALUES (?, ?, ?, ?)
+            """,
+            filas,
+        )
+        cursor.execute("SELECT id_estudiante, carrera, semestre FROM estudiantes")
+        self.estudiantes = cursor.fetchall()
+        return len(filas)
+
+    def _insert_secciones(self, cursor):
+        filas = []
+        for id_materia, carrera, _ in self.materias:
+            profesores = self.profesores.get(carrera) or [None]
+            for numero in range(1, self.volumenes["secciones_por_materia"] + 1):
+                filas.append(
+                    (
+                        id_materia,
+                        numero,
+                        self.random.choice(profesores),
+                        self.periodo,
+                        f"A-{self.random.randint(1, 40):02d}",
+                        40,
+                    )
+                )
+        cursor.executemany(
+            """
+            INSERT INTO secciones (id_materia, numero_seccion, id_profesor, periodo, aula, capacidad)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            filas,
+        )
+        cursor.execute(
+            """
+            SELECT s.id_seccion, m.carrera, m.semestre
+            FROM secciones s JOIN materias m ON m.id_materia = s.id_materia
+            WHERE s.periodo = ?
+            """,
+            (self.periodo,),
+        )
+        self.secciones = {}
+        for id_seccion, carrera, semestre in cursor.fetchall():
+            self.secciones.setdefault((carrera, semestre), []).append(id_seccion)
+        return len(filas)
+
+    def _insert_inscripciones(self, cursor):
+        filas = []
+        fecha = date.today().isoformat()
+        por_estudiante = self.volumenes["inscripciones_por_estudiante"]
+        for id_estudiante, carrera, semestre in self.estudiantes:
+            disponibles = self.secciones.get((carrera, semestre), [])
+            for id_seccion in self.random.sample(
+                disponibles, min(por_estudiante, len(disponibles))
+            ):
+                filas.append((id_estudiante, id_seccion, fecha))
+        cursor.executemany(
+            """
+            INSERT INTO inscripciones (id_estudiante, id_seccion, fecha_inscripcion)
+            VALUES (?, ?, ?)
+            """,
+            filas,
+        )
+        return len(filas)
+
+    def _insert_calificaciones(self, cursor):
+        cursor.execute("SELECT id_inscripcion FROM inscripciones")
+        inscripciones = [row[0] for row in cursor.fetchall()]
+        fecha = date.today().isoformat()
+        porcentaje = self.volumenes["porcentaje_calificadas"]
+        filas = []
+        for id_inscripcion in inscripciones:
+            if self.random.randint(1, 100) > porcentaje:
+                continue
+            notas = [round(self.random.uniform(4, 20), 1) for _ in CORTES]
+            for tipo, nota in zip(CORTES, notas):
+                filas.append((id_inscripcion, tipo, nota, fecha))
+            filas.append((id_inscripcion, "nota_def", round(sum(notas) / len(notas)), fecha))
+        cursor.executemany(
+            """
+            INSERT INTO calificaciones (id_inscripcion, tipo_evaluacion, valor_nota, fecha_evaluacion)
+            VALUES (?, ?, ?, ?)
+            """,
+            filas,
+        )
+        return len(filas)
+
+    def _insert_materias_cursadas(self, cursor):
+        # Materias de los semestres ya cursados, un período por semestre
+        materias_semestre = {}
+        for id_materia, carrera, semestre in self.materias:
+            materias_semestre.setdefault((carrera, semestre), []).append(id_materia)
+        periodos = [self.periodo]
+        for _ in range(max(self.semestres_carrera.values(), default=0)):
+            periodos.append(periodo_anterior(periodos[-1]))
+
+        tope = self.volumenes["cursadas_por_estudiante"]
+        filas = []
+        for id_estudiante, carrera, semestre in self.estudiantes:
+            cantidad = 0
+            for anterior in range(semestre - 1, 0, -1):
+                periodo = periodos[semestre - anterior]
+                for id_materia in materias_semestre.get((carrera, anterior), []):
+                    if cantidad >= tope:
+                        break
+                    nota = self.random.randint(6, 20)
+                    estado = "APROBÓ" if nota >= 10 else "REPROBÓ"
+                    filas.append(
+                        (id_estudiante, id_materia, periodo, nota, estado, _fin_de(periodo))
+                    )
+                    cantidad += 1
+        cursor.executemany(
+            """
+            INSERT INTO materias_cursadas
+                (id_estudiante, id_materia, periodo, nota_final, estado, fecha_cursada)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            filas,
+        )
+        return len(filas)
+
+
+def generate_database(path, volumenes=None, semilla=42, progress=None):
+    """Atajo: crea y llena la base en path; retorna las filas por tabla."""
+    return DataGenerator(volumenes, semilla).generate(path, progress)
@@ -0,0 +1,560 @@
+import json
+import os
+import platform
+import sqlite3
+import statistics
+import subprocess
+import tempfile
+import time
+from datetime import datetime
+
+from config import database
+from config.database import get_db_connection
+from controllers.grade_controller import GradeController, GradeSaveQueue
+from controllers.section_controller import SectionController
+from models.academic_period import AcademicPeriod
+from models.course import Course
+from models.prerequisite_graph import get_prerequisite_graph
+from models.transcript import Transcript
+from models.user import User
+from benchmarks.data_generator import PASSWORD, generate_database
+from benchmarks.startup import measure_startup
+
+
+REPETICIONES = 5
+# Una medición es regresión si su mediana empeora más que esto respecto de
+# la corrida anterior con los mismos volúmenes...
+UMBRAL_REGRESION = 0.20
+# ...y la diferencia supera este mínimo (ms), para no marcar ruido
+MINIMO_REGRESION_MS = 1.0
+HISTORY_FILE = "benchmark_history.json"
+
+
+class BenchmarkCase:
+    """
+    Un camino a medir. func() se cronometra; setup(), si existe, se ejecuta
+    antes de cada repetición fuera de la medición. Con pasos=True, func
+    retorna {nombre: segundos} y cada entrada se registra además como una
+    medición aparte (p. ej. los pasos de un proceso).
+    """
+
+    def __init__(
+        self, nombre, func, setup=None, repeticiones=None, calentar=True, pasos=False
+    ):
+        self.nombre = nombre
+        self.func = func
+        self.setup = setup
+        self.repeticiones = repeticiones
+        self.calentar = calentar
+        self.pasos = pasos
+
+
+class Context:
+    """Datos de muestra de la base generada que usan los casos."""
+
+    def __init__(self):
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            self.periodo = database.get_periodo_activo()
+            # Estudiante con más historial archivado y con inscripciones activas
+            cursor.execute(
+                """
+                SELECT e.id_estudiante, u.cedula, u.nombre, u.apellido, e.carrera, e.semestre
+                FROM estudiantes e
+                JOIN usuarios u ON u.id_usuario = e.id_usuario
+                WHERE EXISTS (SELECT 1 FROM inscripciones i WHERE i.id_estudiante = e.id_estudiante)
+                ORDER BY (
+                    SELECT COUNT(*) FROM materias_cursadas mc
+                    WHERE mc.id_estudiante = e.id_estudiante
+                ) DESC, e.id_estudiante
+                LIMIT 1
+                """
+            )
+            fila = cursor.fetchone()
+            if fila is None:
+                raise RuntimeError("La base no tiene estudiantes inscritos")
+            (
+                self.estudiante_id,
+                self.cedula,
+                nombre,
+                apellido,
+                self.carrera,
+                semestre,
+            ) = fila
+            self.student_data = {
+                "cedula": self.cedula,
+                "nombre": nombre,
+                "apellido": apellido,
+                "carrera": self.carrera,
+                "semestre": semestre,
+            }
+            self.usuario = f"{nombre} {apellido}"
+            # Sección con más inscritos (la planilla más pesada)
+            cursor.execute(
+                """
+                SELECT i.id_seccion
+                FROM inscripciones i
+                GROUP BY i.id_seccion
+                ORDER BY COUNT(*) DESC, i.id_seccion
+                LIMIT 1
+                """
+            )
+            self.seccion_id = cursor.fetchone()[0]
+            # Materias inscritas del estudiante, como las arma el comprobante
+            cursor.execute(
+                """
+                SELECT m.codigo, m.nombre, m.creditos, s.numero_seccion,
+                       COALESCE(u.nombre || ' ' || u.apellido, 'Por asignar')
+                FROM inscripciones i
+                JOIN secciones s ON s.id_seccion = i.id_seccion
+                JOIN materias m ON m.id_materia = s.id_materia
+                LEFT JOIN profesores p ON p.id_profesor = s.id_profesor
+                LEFT JOIN usuarios u ON u.id_usuario = p.id_usuario
+                WHERE i.id_estudiante = ?
+                ORDER BY m.codigo
+                """,
+                (self.estudiante_id,),
+            )
+            self.materias_inscritas = [
+                (codigo, nombre, str(creditos), str(seccion), profesor)
+                for codigo, nombre, creditos, seccion, profesor in cursor.fetchall()
+            ]
+
+
+def check_section_switch(ctx):
+    """
+    Verifica que cambiar de sección con notas sin guardar y volver muestre
+    las notas recién guardadas, como hace la planilla del profesor con
+    GradeSaveQueue. Las tareas se ejecutan en el peor orden posible (la
+    última enviada primero). La nota modificada se deja como estaba. Lanza
+    RuntimeError si la planilla vuelve con la nota anterior.
+    """
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT id_seccion FROM inscripciones WHERE id_seccion != ? LIMIT 1",
+            (ctx.seccion_id,),
+        )
+        fila = cursor.fetchone()
+    otra = fila[0] if fila else ctx.seccion_id
+
+    controller = GradeController()
+    tareas = []
+
+    def submit(func, *args, on_success=None, on_error=None):
+        tareas.append((func, args, on_success, on_error))
+
+    def ejecutar():
+        while tareas:
+            func, args, on_success, on_error = tareas.pop()
+            try:
+                resultado = func(*args)
+            except Exception as e:
+                on_error(e)
+            else:
+                on_success(resultado)
+
+    def fallar(e):
+        raise e
+
+    cola = GradeSaveQueue(controller, submit)
+    seleccion = [ctx.seccion_id]
+    cargadas = []
+
+    def cargar():
+        submit(
+            controller.get_gradebook,
+            seleccion[0],
+            on_success=cargadas.append,
+            on_error=fallar,
+        )
+
+    planilla = controller.get_gradebook(ctx.seccion_id)
+    buffer = controller.create_write_buffer(planilla)
+    id_inscripcion, ci, original, nota_def = (
+        planilla[0][0],
+        planilla[0][1],
+        planilla[0][4],
+        planilla[0][8],
+    )
+    nueva = 0 if original == 20 else 20
+    buffer.set_grade(ci, "corte1", nueva)
+    # A la otra sección y de vuelta antes de que termine el guardado
+    seleccion[0] = otra
+    cola.save(buffer, then=cargar, on_error=fallar)
+    seleccion[0] = ctx.seccion_id
+    cola.save(buffer, then=cargar, on_error=fallar)
+    ejecutar()
+
+    recargada = {fila[1]: fila[4] for fila in cargadas[-1]}
+    controller.save_grades(
+        [(id_inscripcion, "corte1", original), (id_inscripcion, "nota_def", nota_def)]
+    )
+    if len(cargadas) != 1 or recargada.get(ci) != nueva:
+        raise RuntimeError(
+            f"La planilla recargada muestra corte1={recargada.get(ci)} "
+            f"en lugar de la nota guardada ({nueva})"
+        )
+
+
+def _timed(func):
+    inicio = time.perf_counter()
+    resultado = func()
+    return time.perf_counter() - inicio, resultado
+
+
+def measure(caso, repeticiones=REPETICIONES):
+    """Ejecuta el caso y retorna {nombre: [segundos por repetición]}."""
+    tiempos = {}
+    if caso.calentar:
+        if caso.setup:
+            caso.setup()
+        caso.func()
+    for _ in range(caso.repeticiones or repeticiones):
+        if caso.setup:
+            caso.setup()
+        segundos, resultado = _timed(caso.func)
+        tiempos.setdefault(caso.nombre, []).append(segundos)
+        if caso.pasos:
+            for nombre, valor in resultado.items():
+                tiempos.setdefault(f"{caso.nombre}.{nombre}", []).append(valor)
+    return tiempos
+
+
+def summarize(muestras):
+    """Estadísticas (en ms) de una lista de tiempos en segundos."""
+    ms = [s * 1000 for s in muestras]
+    return {
+        "mediana_ms": round(statistics.median(ms), 3),
+        "min_ms": round(min(ms), 3),
+        "max_ms": round(max(ms), 3),
+        "repeticiones": len(ms),
+    }
+
+
+def _close_period_case(ctx, plantilla):
+    """
+    Cierre del período activo. Cada repetición parte de una copia de la base
+    recién generada y mide cada paso (el primero es el archivo en
+    materias_cursadas) con el callback de progreso de AcademicPeriod.close.
+    """
+    destino = database.get_connection
+
+    def _restore():
+        database.close_all_connections()
+        origen = sqlite3.connect(plantilla)
+        try:
+            conn = destino()
+            try:
+                origen.backup(conn)
+            finally:
+                conn.close()
+        finally:
+            origen.close()
+
+    def _close():
+        marcas = []
+        AcademicPeriod.close(
+            ctx.periodo,
+            progress=lambda paso, total, descripcion: marcas.append(time.perf_counter()),
+        )
+        fin = time.perf_counter()
+        marcas.append(fin)
+        # Solo el primer paso (archivo); los demás se reportan juntos
+        return {"archivo": marcas[1] - marcas[0], "resto": fin - marcas[1]}
+
+    return BenchmarkCase(
+        "cierre_periodo", _close, setup=_restore, calentar=False, pasos=True
+    )
+
+
+def _pdf_cases(ctx, carpeta):
+    """Casos de cada generador de reportesPDF (los datos se leen una sola vez)."""
+    from pdf import reportesPDF
+
+    def ruta(nombre):
+        return os.path.join(carpeta, f"{nombre}.pdf")
+
+    por_carrera = database.get_estudiantes_por_carrera()
+    profesores_carrera = database.get_profesores_por_carrera()
+    por_materia = sorted(
+        database.get_estudiantes_nombres_y_cantidad_por_materia(), key=lambda x: x[0]
+    )
+    record = Transcript.get_by_student(ctx.estudiante_id)
+    por_semestre = database.get_estudiantes_por_semestre_por_carrera(ctx.carrera)
+    profesores_materia = database.get_profesores_por_materias_por_carrera(ctx.carrera)
+    seccion_info = SectionController().get_by_id(ctx.seccion_id)
+    estudiantes_notas = [
+        {
+            "ci": ci,
+            "nombres": nombres,
+            "apellidos": apellidos,
+            "corte1": c1,
+            "corte2": c2,
+            "corte3": c3,
+            "corte4": c4,
+            "nota_def": nota_def,
+        }
+        for _, ci, nombres, apellidos, c1, c2, c3, c4, nota_def in GradeController().get_gradebook(
+            ctx.seccion_id
+        )
+    ]
+    display = f"{seccion_info['nombre_materia']} (D{seccion_info['numero_seccion']})"
+    sd = ctx.student_data
+
+    generadores = {
+        "estudiantes_por_carrera": lambda: reportesPDF.estudiantesPorCarrera(
+            None,
+            [c for c, _ in por_carrera],
+            [n for _, n in por_carrera],
+            ruta("estudiantes_por_carrera"),
+            ctx.usuario,
+            abrir=False,
+        ),
+        "profesores_por_carrera": lambda: reportesPDF.profesoresPorCarrera(
+            None,
+            [c for c, _ in profesores_carrera],
+            [n for _, n in profesores_carrera],
+            ruta("profesores_por_carrera"),
+            ctx.usuario,
+            abrir=False,
+        ),
+        "estudiantes_por_materia": lambda: reportesPDF.estudiantesPorMaterias(
+            None, por_materia, ruta("estudiantes_por_materia"), ctx.usuario, abrir=False
+        ),
+        "materias_por_carrera": lambda: reportesPDF.materiasPorCarrera(
+            None, ruta("materias_por_carrera"), ctx.usuario, abrir=False
+        ),
+        "comprobante_inscripcion": lambda: reportesPDF.generar_comprobante_inscripcion_pdf(
+            ruta("comprobante_inscripcion"),
+            ctx.materias_inscritas,
+            sd["cedula"],
+            sd["nombre"],
+            sd["apellido"],
+            sd["carrera"],
+        ),
+        "notas_profesor": lambda: reportesPDF.generar_reporte_notas_profesor(
+            ruta("notas_profesor"),
+            estudiantes_notas,
+            seccion_info["nombre_materia"],
+            display,
+            "Profesor",
+            "Benchmark",
+            seccion_info,
+            abrir=False,
+        ),
+        "record_academico": lambda: reportesPDF.generate_record_academico_report(
+            ruta("record_academico"), sd, record, ctx.usuario, abrir=False
+        ),
+        "constancia_estudio": lambda: reportesPDF.generate_constancia_estudio_report(
+            ruta("constancia_estudio"), sd, ctx.usuario, abrir=False
+        ),
+        "estudiantes_por_semestre": lambda: reportesPDF.generate_students_by_semester_report(
+            ruta("estudiantes_por_semestre"),
+            por_semestre,
+            ctx.carrera,
+            ctx.usuario,
+            abrir=False,
+        ),
+        "profesores_por_materias": lambda: reportesPDF.generate_professors_by_courses_report(
+            ruta("profesores_por_materias"),
+            profesores_materia,
+            ctx.carrera,
+            ctx.usuario,
+            abrir=False,
+        ),
+    }
+    return [
+        BenchmarkCase(f"pdf.{nombre}", func, repeticiones=3)
+        for nombre, func in generadores.items()
+    ]
+
+
+def _startup_case(omitidos):
+    """
+    Arranque de la aplicación en un proceso nuevo sobre la base generada
+    (ver benchmarks.startup); cada paso se registra aparte. Sin pantalla no
+    se mide el primer cuadro y queda anotado en omitidos.
+    """
+    path = database.configure_connection_pool().database
+
+    def _start():
+        pasos, omitido = measure_startup(path)
+        if omitido:
+            omitidos["arranque.primer_cuadro"] = omitido
+        return pasos
+
+    return BenchmarkCase("arranque", _start, repeticiones=3, pasos=True)
+
+
+def build_cases(ctx, plantilla, carpeta_pdf):
+    """Lista de casos a medir. Los PDF se omiten si falta reportlab."""
+    casos = [
+        BenchmarkCase("login", lambda: User.authenticate(ctx.cedula, PASSWORD)),
+        BenchmarkCase("course_get_all.frio", Course.get_all, setup=Course.invalidate_cache),
+        BenchmarkCase("course_get_all.caliente", Course.get_all),
+        BenchmarkCase(
+            "planilla_notas", lambda: GradeController().get_gradebook(ctx.seccion_id)
+        ),
+        BenchmarkCase(
+            "elegibilidad_inscripcion",
+            lambda: get_prerequisite_graph(ctx.carrera).eligible_courses(ctx.estudiante_id),
+        ),
+        BenchmarkCase(
+            "record_academico",
+            lambda: Transcript.get_by_student(ctx.estudiante_id),
+        ),
+        BenchmarkCase(
+            "record_academico.lote", lambda: Transcript.get_by_students(ctx.carrera)
+        ),
+        BenchmarkCase("inicializar_base.rapida", database.initialize_database),
+        BenchmarkCase(
+            "inicializar_base.completa", lambda: database.initialize_database(force=True)
+        ),
+    ]
+    omitidos = {}
+    casos.append(_startup_case(omitidos))
+    try:
+        casos.extend(_pdf_cases(ctx, carpeta_pdf))
+    except ImportError as e:
+        omitidos["pdf"] = f"reportesPDF no disponible: {e}"
+    # El cierre modifica la base: va al final
+    casos.append(_close_period_case(ctx, plantilla))
+    return casos, omitidos
+
+
+def _git_commit():
+    try:
+        salida = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            timeout=5,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return salida.stdout.strip() or None
+
+
+def load_history(path):
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_history(path, historial):
+    temporal = f"{path}.tmp"
+    with open(temporal, "w", encoding="utf-8") as f:
+        json.dump(historial, f, ensure_ascii=False, indent=2)
+    os.replace(temporal, path)
+
+
+def compare(corrida, anterior, umbral=UMBRAL_REGRESION, minimo_ms=MINIMO_REGRESION_MS):
+    """
+    Compara las medianas con las de la corrida anterior. Retorna una lista
+    de (nombre, anterior_ms, actual_ms, cambio, es_regresion).
+    """
+    filas = []
+    previos = anterior["resultados"] if anterior else {}
+    for nombre, datos in corrida["resultados"].items():
+        actual = datos["mediana_ms"]
+        previo = previos.get(nombre, {}).get("mediana_ms")
+        if previo is None:
+            filas.append((nombre, None, actual, None, False))
+            continue
+        cambio = (actual - previo) / previo if previo else 0.0
+        regresion = cambio > umbral and actual - previo > minimo_ms
+        filas.append((nombre, previo, actual, cambio, regresion))
+    return filas
+
+
+def previous_run(historial, volumenes, semilla):
+    """Última corrida con los mismos volúmenes y semilla (comparable)."""
+    for corrida in reversed(historial):
+        if corrida.get("volumenes") == volumenes and corrida.get("semilla") == semilla:
+            return corrida
+    return None
+
+
+def run_benchmarks(
+    volumenes,
+    semilla=42,
+    repeticiones=REPETICIONES,
+    solo=None,
+    history_path=HISTORY_FILE,
+    log=print,
+):
+    """
+    Genera una base nueva en un directorio temporal, mide los casos y agrega
+    la corrida al historial JSON. Retorna (corrida, comparación).
+    solo: nombres (o prefijos) de los casos a medir; None = todos.
+    """
+    # Al terminar se vuelve a la base que usaba el pool
+    pool_anterior = database.configure_connection_pool().database
+    with tempfile.TemporaryDirectory(prefix="benchmark_") as carpeta:
+        path = os.path.join(carpeta, "benchmark.db")
+        plantilla = os.path.join(carpeta, "plantilla.db")
+        try:
+            inicio = time.perf_counter()
+            conteos = generate_database(
+                path,
+                volumenes,
+                semilla,
+                progress=lambda i, total, tabla: log(f"[{i}/{total}] Generando {tabla}..."),
+            )
+            generacion = time.perf_counter() - inicio
+            log(f"Base generada en {generacion:.1f} s: {conteos}")
+            with get_db_connection() as conn:
+                destino = sqlite3.connect(plantilla)
+                conn.backup(destino)
+                destino.close()
+
+            ctx = Context()
+            log("Verificando el cambio de sección con notas sin guardar...")
+            check_section_switch(ctx)
+            casos, omitidos = build_cases(ctx, plantilla, carpeta)
+            if solo:
+                casos = [c for c in casos if any(c.nombre.startswith(s) for s in solo)]
+            tiempos = {}
+            for caso in casos:
+                log(f"Midiendo {caso.nombre}...")
+                # Un caso que falla queda en omitidos y no corta la corrida
+                try:
+                    tiempos.update(measure(caso, repeticiones))
+                except Exception as e:
+                    omitidos[caso.nombre] = str(e) or e.__class__.__name__
+        finally:
+            database.configure_connection_pool(database=pool_anterior)
+            Course.invalidate_cache()
+
+    corrida = {
+        "fecha": datetime.now().isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "plataforma": platform.platform(),
+        "semilla": semilla,
+        "volumenes": volumenes,
+        "filas": conteos,
+        "generacion_s": round(generacion, 3),
+        "resultados": {nombre: summarize(m) for nombre, m in tiempos.items()},
+        "omitidos": omitidos,
+    }
+    historial = load_history(history_path)
+    comparacion = compare(corrida, previous_run(historial, volumenes, semilla))
+    historial.append(corrida)
+    save_history(history_path, historial)
+    return corrida, comparacion
+
+
+def format_comparison(comparacion):
+    """Tabla de texto con la comparación contra la corrida anterior."""
+    lineas = [f"{'Caso':<45}{'Anterior':>12}{'Actual':>12}{'Cambio':>10}"]
+    for nombre, previo, actual, cambio, regresion in comparacion:
+        anterior = f"{previo:.2f}" if previo is not None else "-"
+        variacion = f"{cambio:+.0%}" if cambio is not None else "nuevo"
+        marca = "  REGRESIÓN" if regresion else ""
+        lineas.append(f"{nombre:<45}{anterior:>12}{actual:>12.2f}{variacion:>10}{marca}")
+    return "\n".join(lineas)
@@ -0,0 +1,87 @@
+"""
+Tiempo de arranque de la aplicación, medido en un proceso nuevo (sin nada
+importado ni conexiones abiertas): importar main, inicializar la base y
+crear la ventana hasta que la pantalla de bienvenida queda dibujada y lista
+para recibir eventos.
+
+Uso: python -m benchmarks.startup [base.db]
+"""
+import json
+import os
+import subprocess
+import sys
+import time
+
+
+PROYECTO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _child(database):
+    """Se ejecuta en el proceso hijo: mide cada paso y lo imprime en JSON."""
+    inicio = time.perf_counter()
+    pasos = {}
+    omitido = None
+
+    marca = time.perf_counter()
+    import tkinter as tk
+
+    import main
+    from config import database as db
+
+    pasos["importaciones"] = time.perf_counter() - marca
+
+    if database:
+        db.configure_connection_pool(database=database)
+    marca = time.perf_counter()
+    db.initialize_database()
+    pasos["base_datos"] = time.perf_counter() - marca
+
+    try:
+        marca = time.perf_counter()
+        app = main.AcademicSystemApp()
+        # Primer cuadro: la bienvenida dibujada y sin eventos pendientes
+        app.root.update()
+        pasos["primer_cuadro"] = time.perf_counter() - marca
+        app.root.destroy()
+        main.shutdown_task_executor()
+    except tk.TclError as e:
+        # Sin pantalla no hay ventana que medir
+        omitido = str(e) or e.__class__.__name__
+    db.close_all_connections()
+
+    pasos["total"] = time.perf_counter() - inicio
+    print(json.dumps({"pasos": pasos, "omitido": omitido}))
+
+
+def measure_startup(database=None, python=sys.executable):
+    """
+    Arranca la aplicación en un proceso nuevo y retorna (pasos, omitido):
+    pasos es {nombre: segundos} e incluye "proceso" (desde lanzar el
+    intérprete hasta que termina); omitido explica por qué no se midió el
+    primer cuadro, o es None.
+    """
+    args = [python, "-m", "benchmarks.startup", "--hijo"]
+    if database:
+        args.append(os.path.abspath(database))
+    inicio = time.perf_counter()
+    salida = subprocess.run(
+        args, cwd=PROYECTO, capture_output=True, text=True, timeout=120
+    )
+    proceso = time.perf_counter() - inicio
+    if salida.returncode != 0:
+        raise RuntimeError(f"El arranque falló:\n{salida.stderr.strip()}")
+    datos = json.loads(salida.stdout.strip().splitlines()[-1])
+    pasos = datos["pasos"]
+    pasos["proceso"] = proceso
+    return pasos, datos["omitido"]
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--hijo":
+        _child(sys.argv[2] if len(sys.argv) > 2 else None)
+    else:
+        pasos, omitido = measure_startup(sys.argv[1] if len(sys.argv) > 1 else None)
+        for nombre, segundos in pasos.items():
+            print(f"{nombre:<15} {segundos * 1000:9.1f} ms")
+        if omitido:
+            print(f"Primer cuadro no medido: {omitido}")
@@ -0,0 +1,190 @@
+import csv
+import hashlib
+import io
+import os
+from datetime import datetime
+
+
+# Planes de estudio que trae la aplicación: un CSV por carrera
+PENSUM_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "pensum"
+)
+COLUMNAS = ("codigo", "nombre", "creditos", "requisitos", "carrera", "semestre")
+
+# Una materia del plan es (codigo, carrera, semestre), la restricción UNIQUE
+# de la tabla. Si ya existe, se actualizan nombre, créditos y requisitos, y
+# solo cuando cambiaron (así las filas iguales no tocan el índice de búsqueda).
+_UPSERT_MATERIA = """
+    INSERT INTO materias (codigo, nombre, creditos, requisitos, carrera, semestre)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT (codigo, carrera, semestre) DO UPDATE SET
+        nombre = excluded.nombre,
+        creditos = excluded.creditos,
+        requisitos = excluded.requisitos
+    WHERE nombre IS NOT excluded.nombre
+       OR creditos IS NOT excluded.creditos
+       OR requisitos IS NOT excluded.requisitos
+"""
+
+_REGISTRAR_ARCHIVO = """
+    INSERT INTO pensum_cargado (archivo, checksum, materias, fecha_carga)
+    VALUES (?, ?, ?, ?)
+    ON CONFLICT (archivo) DO UPDATE SET
+        checksum = excluded.checksum,
+        materias = excluded.materias,
+        fecha_carga = excluded.fecha_carga
+"""
+
+
+def curriculum_files(carpeta=PENSUM_DIR):
+    """Rutas de los CSV de carpeta, en orden alfabético."""
+    if not os.path.isdir(carpeta):
+        return []
+    return sorted(
+        os.path.join(carpeta, nombre)
+        for nombre in os.listdir(carpeta)
+        if nombre.lower().endswith(".csv")
+    )
+
+
+def clave_archivo(path):
+    """
+    Nombre con que path queda registrado en pensum_cargado: el nombre del
+    archivo para los planes de PENSUM_DIR, "importado/<nombre>" para los
+    demás. Así un CSV importado que se llame igual que uno de la aplicación
+    no pisa su checksum (y el de la aplicación no se recarga encima al
+    siguiente arranque).
+    """
+    nombre = os.path.basename(path)
+    carpeta = os.path.dirname(os.path.abspath(path))
+    if os.path.normcase(carpeta) == os.path.normcase(PENSUM_DIR):
+        return nombre
+    return f"importado/{nombre}"
+
+
+def _checksum(contenido):
+    return hashlib.sha256(contenido).hexdigest()
+
+
+def curriculum_checksums(carpeta=PENSUM_DIR):
+    """{nombre de archivo: checksum} de los planes de carpeta."""
+    checksums = {}
+    for path in curriculum_files(carpeta):
+        with open(path, "rb") as f:
+            checksums[os.path.basename(path)] = _checksum(f.read())
+    return checksums
+
+
+def parse_curriculum(contenido, archivo="pensum"):
+    """
+    Convierte el contenido (bytes) de un CSV de plan de estudios en filas
+    para la tabla materias. Las columnas son COLUMNAS, en cualquier orden;
+    requisitos puede ir vacío. Lanza ValueError con el número de línea si el
+    archivo no es válido.
+    """
+    try:
+        texto = contenido.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        raise ValueError(f"{archivo}: el archivo debe estar en UTF-8") from None
+    reader = csv.DictReader(io.StringIO(texto, newline=""))
+    if reader.fieldnames is None:
+        raise ValueError(f"{archivo}: el archivo está vacío")
+    reader.fieldnames = [c.strip().lower() for c in reader.fieldnames]
+    faltantes = [c for c in COLUMNAS if c not in reader.fieldnames]
+    if faltantes:
+        raise ValueError(f"{archivo}: faltan las columnas {', '.join(faltantes)}")
+
+    materias = []
+    for fila in reader:
+        valores = {c: (fila.get(c) or "").strip() for c in COLUMNAS}
+        if not any(valores.values()):
+            continue
+        if not (valores["codigo"] and valores["nombre"] and valores["carrera"]):
+            raise ValueError(
+                f"{archivo}, línea {reader.line_num}: código, nombre y carrera son obligatorios"
+            )
+        try:
+            creditos = int(valores["creditos"])
+            semestre = int(valores["semestre"])
+        except ValueError:
+            raise ValueError(
+                f"{archivo}, línea {reader.line_num}: créditos y semestre deben ser números enteros"
+            ) from None
+        materias.append(
+            (
+                valores["codigo"],
+                valores["nombre"],
+                creditos,
+                valores["requisitos"] or None,
+                valores["carrera"],
+                semestre,
+            )
+        )
+    return materias
+
+
+def load_curriculum(conn, paths=None, forzar=False, solo_registrar=False):
+    """
+    Carga planes de estudio (CSV) en la tabla materias dentro de la
+    transacción actual de conn, sin confirmarla. paths=None toma los de
+    PENSUM_DIR.
+
+    Cada archivo queda registrado en pensum_cargado con el checksum de su
+    contenido; si en la próxima carga el checksum es el mismo, el archivo se
+    omite (salvo con forzar=True). Las materias de un archivo se escriben con
+    un solo executemany. Las que ya no están en el archivo no se borran:
+    pueden tener secciones o historial.
+
+    solo_registrar=True guarda los checksums sin tocar materias (para una
+    base que ya tiene cargados esos planes).
+
+    Retorna {clave_archivo(path): materias insertadas o actualizadas} de los
+    archivos procesados.
+    """
+    cursor = conn.cursor()
+    cursor.execute("SELECT archivo, checksum FROM pensum_cargado")
+    cargados = dict(cursor.fetchall())
+    fecha = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    resultado = {}
+    for path in curriculum_files() if paths is None else paths:
+        archivo = clave_archivo(path)
+        with open(path, "rb") as f:
+            contenido = f.read()
+        checksum = _checksum(contenido)
+        if not forzar and cargados.get(archivo) == checksum:
+            continue
+        materias = parse_curriculum(contenido, os.path.basename(path))
+        escritas = 0
+        if not solo_registrar:
+            cursor.executemany(_UPSERT_MATERIA, materias)
+            escritas = max(cursor.rowcount, 0)
+        cursor.execute(_REGISTRAR_ARCHIVO, (archivo, checksum, len(materias), fecha))
+        resultado[archivo] = escritas
+    return resultado
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Carga planes de estudio (CSV por carrera) en la tabla materias"
+    )
+    parser.add_argument(
+        "archivos", nargs="*", help=f"CSV a cargar (por defecto, los de {PENSUM_DIR})"
+    )
+    parser.add_argument(
+        "--forzar", action="store_true", help="cargar aunque el checksum no haya cambiado"
+    )
+    args = parser.parse_args()
+
+    from config.database import get_db_connection, initialize_database
+
+    initialize_database()
+    with get_db_connection() as conn:
+        cargados = load_curriculum(conn, args.archivos or None, args.forzar)
+        conn.commit()
+    for archivo, materias in cargados.items():
+        print(f"{archivo}: {materias} materias insertadas o actualizadas")
+    if not cargados:
+        print("Sin cambios: los planes ya estaban cargados")
@@ -1,24 +1,255 @@
+import os
 import sqlite3
 import hashlib
+import threading
+from pathlib import Path
 from datetime import datetime
 from contextlib import contextmanager
 import time
+from config.curriculum import curriculum_checksums, load_curriculum
+from config.migrations import MIGRATIONS, apply_migrations
+from config.sql_profiler import SQLProfiler, SLOW_QUERY_MS
 
+DB_PATH = "academic_system.db"
+POOL_SIZE = 8
 
-def get_connection():
-    """Establece y retorna una conexión a la base de datos con timeout."""
-    conn = sqlite3.connect("academic_system.db", timeout=30.0)
+# Variables de entorno del modo de perfilado de SQL (ver enable_sql_profiling)
+SQL_PROFILE_ENV = "SQL_PROFILE"
+SQL_PROFILE_LOG_ENV = "SQL_PROFILE_LOG"
+
+_profiler = None
+
+
+def _open_connection(database=DB_PATH):
+    """Abre una conexión nueva y aplica los PRAGMAs de concurrencia."""
+    if _profiler is not None:
+        conn = _profiler.connect(database, timeout=30.0, check_same_thread=False)
+    else:
+        conn = sqlite3.connect(database, timeout=30.0, check_same_thread=False)
     conn.execute("PRAGMA journal_mode=WAL")  # Mejora la concurrencia
     conn.execute("PRAGMA busy_timeout=30000")  # 30 segundos de timeout
     return conn
 
 
+def _open_readonly_connection(database=DB_PATH):
+    """
+    Abre una conexión de solo lectura (URI file:...?mode=ro). No puede
+    escribir ni cambiar el modo de journal; lee del WAL que mantienen las
+    conexiones de escritura.
+    """
+    uri = f"{Path(database).resolve().as_uri()}?mode=ro"
+    if _profiler is not None:
+        conn = _profiler.connect(uri, uri=True, timeout=30.0, check_same_thread=False)
+    else:
+        conn = sqlite3.connect(uri, uri=True, timeout=30.0, check_same_thread=False)
+    conn.execute("PRAGMA busy_timeout=30000")
+    return conn
+
+
+def get_connection():
+    """Establece y retorna una conexión a la base de datos con timeout."""
+    return _open_connection(_pool.database)
+
+
+class ConnectionPool:
+    """
+    Pool de conexiones SQLite con una conexión en caché por hilo.
+
+    Cada hilo reutiliza su propia conexión (los PRAGMAs se aplican una sola vez
+    al abrirla). Si la conexión del hilo ya está en uso (llamadas anidadas) o el
+    pool alcanzó su tamaño máximo, se entrega una conexión temporal que se
+    cierra al liberarla.
+    """
+
+    def __init__(self, database=DB_PATH, size=POOL_SIZE):
+        self.database = database
+        self.size = size
+        self._lock = threading.Lock()
+        self._connections = {}  # ident del hilo -> (hilo, conexión)
+        self._in_use = set()
+
+    def _is_healthy(self, conn):
+        try:
+            conn.execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def _prune_dead_threads(self):
+        """Cierra las conexiones de hilos que ya terminaron."""
+        for ident, (thread, conn) in list(self._connections.items()):
+            # Un ident en uso pertenece a un hilo vivo que lo heredó
+            if not thread.is_alive() and ident not in self._in_use:
+                del self._connections[ident]
+                self._in_use.discard(ident)
+                conn.close()
+
+    def acquire(self):
+        """Obtiene una conexión para el hilo actual."""
+        ident = threading.get_ident()
+        with self._lock:
+            entry = self._connections.get(ident)
+            if entry and ident not in self._in_use:
+                conn = entry[1]
+                if self._is_healthy(conn):
+                    # El sistema reutiliza los ident de hilos terminados: la
+                    # conexión pasa a ser del hilo actual
+                    self._connections[ident] = (threading.current_thread(), conn)
+                    self._in_use.add(ident)
+                    return conn
+                del self._connections[ident]
+                try:
+                    conn.close()
+                except sqlite3.Error:
+                    pass
+                entry = None
+
+            if entry is None:
+                if len(self._connections) >= self.size:
+                    self._prune_dead_threads()
+                if len(self._connections) < self.size:
+                    conn = _open_connection(self.database)
+                    self._connections[ident] = (threading.current_thread(), conn)
+                    self._in_use.add(ident)
+                    return conn
+
+        # Conexión anidada o pool lleno: conexión temporal fuera del pool
+        return _open_connection(self.database)
+
+    def release(self, conn):
+        """Devuelve la conexión al pool descartando transacciones pendientes."""
+        ident = threading.get_ident()
+        with self._lock:
+            entry = self._connections.get(ident)
+            pooled = entry is not None and entry[1] is conn
+            if pooled:
+                self._in_use.discard(ident)
+        if conn.in_transaction:
+            # Igual que al cerrar una conexión: lo no confirmado se descarta
+            conn.rollback()
+        if not pooled:
+            conn.close()
+
+    def close_all(self):
+        """Cierra todas las conexiones del pool (usar al cerrar la aplicación)."""
+        with self._lock:
+            connections = [conn for _, conn in self._connections.values()]
+            self._connections.clear()
+            self._in_use.clear()
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+
+
+_pool = ConnectionPool()
+
+
+def configure_connection_pool(size=None, database=None):
+    """Reconfigura el pool de conexiones (tamaño y/o archivo de base de datos)."""
+    global _pool
+    _pool.close_all()
+    _pool = ConnectionPool(
+        database=database or _pool.database, size=size or _pool.size
+    )
+    return _pool
+
+
+def close_all_connections():
+    """Cierra todas las conexiones abiertas por el pool."""
+    _pool.close_all()
+
+
+def enable_sql_profiling(slow_ms=SLOW_QUERY_MS, log_file=None):
+    """
+    Activa el perfilado de SQL: todas las conexiones que se abran desde ahora
+    miden cada sentencia (latencia, filas y función que la ejecuta) y las que
+    superan slow_ms se registran con su EXPLAIN QUERY PLAN en log_file (o en
+    stderr). Las conexiones del pool se reabren para quedar perfiladas.
+    """
+    global _profiler
+    _profiler = SQLProfiler(_pool.database, slow_ms=slow_ms, log_file=log_file)
+    _pool.close_all()
+    return _profiler
+
+
+def enable_sql_profiling_from_env():
+    """
+    Activa el perfilado si está definida la variable SQL_PROFILE, cuyo valor
+    es el umbral de sentencia lenta en ms ("1" o vacío usa el valor por
+    defecto). SQL_PROFILE_LOG indica el archivo de log.
+    """
+    valor = os.environ.get(SQL_PROFILE_ENV)
+    if not valor or valor == "0":
+        return None
+    try:
+        slow_ms = float(valor) if valor != "1" else SLOW_QUERY_MS
+    except ValueError:
+        slow_ms = SLOW_QUERY_MS
+    return enable_sql_profiling(slow_ms, os.environ.get(SQL_PROFILE_LOG_ENV))
+
+
+def get_sql_profiler():
+    """Retorna el perfilador activo o None si el perfilado está desactivado."""
+    return _profiler
+
+
+def dump_sql_profile(limit=20):
+    """Escribe el resumen de la sesión del perfilador activo (si lo hay)."""
+    if _profiler is not None:
+        _profiler.write(_profiler.report(limit))
+
+
+# Conexión de snapshot activa en cada hilo (ver report_snapshot)
+_report_snapshot = threading.local()
+
+
+@contextmanager
+def report_snapshot():
+    """
+    Abre una conexión de solo lectura con una única transacción de lectura.
+    Mientras dure el bloque, todas las llamadas a get_db_connection del hilo
+    actual usan esa conexión, así que las consultas de un reporte ven el
+    mismo estado de la base de datos (un snapshot del WAL) aunque otros
+    usuarios sigan escribiendo. Los bloques anidados reutilizan el snapshot.
+    """
+    conn = getattr(_report_snapshot, "conn", None)
+    if conn is not None:
+        yield conn
+        return
+
+    conn = _open_readonly_connection(_pool.database)
+    try:
+        # La transacción de lectura (y el snapshot) empieza con la primera lectura
+        conn.execute("BEGIN")
+        conn.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()
+        _report_snapshot.conn = conn
+        yield conn
+    finally:
+        _report_snapshot.conn = None
+        conn.close()
+
+
+def run_report(func, *args, **kwargs):
+    """Ejecuta func(*args, **kwargs) dentro de report_snapshot()."""
+    with report_snapshot():
+        return func(*args, **kwargs)
+
+
 @contextmanager
 def get_db_connection():
     """Context manager para manejo seguro de conexiones a la base de datos."""
+    snapshot = getattr(_report_snapshot, "conn", None)
+    if snapshot is not None:
+        # Dentro de un reporte: se lee del snapshot de solo lectura
+        yield snapshot
+        return
+
+    pool = _pool
     conn = None
     try:
-        conn = get_connection()
+        conn = pool.acquire()
         yield conn
     except Exception as e:
         if conn:
@@ -26,7 +257,33 @@ def get_db_connection():
         raise e
     finally:
         if conn:
-            conn.close()
+            pool.release(conn)
+
+
+# Filas que se piden en cada fetchmany al recorrer resultados grandes
+FETCH_SIZE = 500
+
+
+def fetch_rows(cursor, size=FETCH_SIZE):
+    """Genera las filas del cursor leyéndolas por bloques con fetchmany."""
+    while True:
+        filas = cursor.fetchmany(size)
+        if not filas:
+            return
+        yield from filas
+
+
+# Máximo de resultados que devuelven las búsquedas de texto completo
+SEARCH_LIMIT = 500
+
+
+def build_fts_query(texto):
+    """
+    Convierte el texto de un buscador en una consulta FTS5: cada palabra se
+    busca como prefijo y todas deben aparecer. Retorna None si no hay texto.
+    """
+    terminos = ['"' + t.replace('"', '""') + '"*' for t in (texto or "").split()]
+    return " ".join(terminos) or None
 
 
 def get_carreras():
@@ -44,10 +301,11 @@ def get_estudiantes_por_carrera():
     """Devuelve una lista de tuplas (carrera, cantidad) de estudiantes por carrera."""
     with get_db_connection() as conn:
         cursor = conn.cursor()
+        # Conteos mantenidos por triggers (migración 2)
         cursor.execute(
             """
-            SELECT carrera, COUNT(*) as cantidad
-            FROM estudiantes
+            SELECT NULLIF(carrera, ''), SUM(estudiantes) as cantidad
+            FROM resumen_carrera_semestre
             GROUP BY carrera
             ORDER BY cantidad DESC
             """
@@ -56,10 +314,12 @@ def get_estudiantes_por_carrera():
         return resultados
 
 
-def get_all_estudiantes_info():
+def iter_all_estudiantes_info():
     """
-    Devuelve una lista de tuplas (Nombre y Apellido, Cédula, Carrera, Semestre) de todos los estudiantes,
-    ordenados por carrera y semestre.
+    Genera tuplas (Nombre y Apellido, Cédula, Carrera, Semestre) de todos los
+    estudiantes, ordenados por carrera y semestre, a medida que se leen
+    (fetchmany), para los reportes PDF que las consumen por página. La
+    conexión queda en uso hasta agotar o cerrar el generador.
     """
     with get_db_connection() as conn:
         cursor = conn.cursor()
@@ -71,8 +331,7 @@ def get_all_estudiantes_info():
             ORDER BY e.carrera, e.semestre DESC
         """
         )
-        rows = cursor.fetchall()
-        return rows
+        yield from fetch_rows(cursor)
 
 
 def get_estudiantes_nombres_y_cantidad_por_materia():
@@ -142,83 +401,6 @@ def get_todos_los_profesores(carrera):
         return resultados
 
 
-def get_record_academico_by_student_id(estudiante_id):
-    """
-    Devuelve una lista de tuplas con:
-    (codigo, materia, creditos, periodo, nota_def, estado)
-    Prioriza materias archivadas (materias_cursadas). Si no hay, muestra inscripciones activas.
-    """
-    with get_db_connection() as conn:
-        cursor = conn.cursor()
-        # Primero, buscar en materias_cursadas
-        cursor.execute(
-            """
-            SELECT 
-                m.codigo,
-                m.nombre,
-                m.creditos,
-                mc.periodo,
-                mc.nota_final,
-                mc.estado
-            FROM materias_cursadas mc
-            JOIN materias m ON mc.id_materia = m.id_materia
-            WHERE mc.id_estudiante = ?
-            ORDER BY mc.periodo, m.semestre, m.nombre
-            """,
-            (estudiante_id,),
-        )
-        records = cursor.fetchall()
-        if records:
-            return records
-        # Si no hay materias archivadas, mostrar inscripciones activas
-        cursor.execute(
-            """
-            SELECT 
-                m.codigo,
-                m.nombre,
-                m.creditos,
-                COALESCE(s.periodo, '') as periodo,
-                (
-                    SELECT c.valor_nota
-                    FROM calificaciones c
-                    WHERE c.id_inscripcion = i.id_inscripcion
-                    AND c.tipo_evaluacion = 'nota_def'
-                    LIMIT 1
-                ) as nota_def,
-                CASE
-                    WHEN (
-                        SELECT c.valor_nota
-                        FROM calificaciones c
-                        WHERE c.id_inscripcion = i.id_inscripcion
-                        AND c.tipo_evaluacion = 'nota_def'
-                        LIMIT 1
-                    ) >= 10 THEN 'APROBÓ'
-                    WHEN (
-                        SELECT c.valor_nota
-                        FROM calificaciones c
-                        WHERE c.id_inscripcion = i.id_inscripcion
-                        AND c.tipo_evaluacion = 'nota_def'
-                        LIMIT 1
-                    ) < 10 AND (
-                        SELECT c.valor_nota
-                        FROM calificaciones c
-                        WHERE c.id_inscripcion = i.id_inscripcion
-                        AND c.tipo_evaluacion = 'nota_def'
-                        LIMIT 1
-                    ) IS NOT NULL THEN 'REPROBÓ'
-                    ELSE 'EN CURSO'
-                END as estado
-            FROM inscripciones i
-            JOIN secciones s ON i.id_seccion = s.id_seccion
-            JOIN materias m ON s.id_materia = m.id_materia
-            WHERE i.id_estudiante = ?
-            ORDER BY s.periodo, m.semestre, m.nombre
-            """,
-            (estudiante_id,),
-        )
-        return cursor.fetchall()
-
-
 def get_estudiantes_por_semestre_por_carrera(carrera):
     """
     Devuelve los estudiantes agrupados por semestre, filtrados por carrera.
@@ -328,6 +510,68 @@ def get_total_estudiantes():
         return total
 
 
+# Segundos que se reutilizan las estadísticas del dashboard
+DASHBOARD_STATS_TTL = 30.0
+_dashboard_stats_cache = {"valor": None, "expira": 0.0}
+_dashboard_stats_lock = threading.Lock()
+
+
+def get_dashboard_stats(max_age=DASHBOARD_STATS_TTL):
+    """
+    Devuelve los totales del dashboard y la distribución de usuarios por rol
+    en una sola consulta. El resultado se guarda en caché durante max_age
+    segundos (0 para forzar la consulta).
+    """
+    ahora = time.monotonic()
+    with _dashboard_stats_lock:
+        if _dashboard_stats_cache["valor"] and ahora < _dashboard_stats_cache["expira"]:
+            return _dashboard_stats_cache["valor"]
+
+    def _get_stats():
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT
+                    (SELECT COUNT(*) FROM estudiantes e
+                     JOIN usuarios u ON e.id_usuario = u.id_usuario),
+                    (SELECT COUNT(*) FROM profesores p
+                     JOIN usuarios u ON p.id_usuario = u.id_usuario),
+                    (SELECT COUNT(*) FROM coordinadores c
+                     JOIN usuarios u ON c.id_usuario = u.id_usuario
+                     WHERE u.rol = 'coordinacion'),
+                    (SELECT COUNT(*) FROM materias),
+                    (SELECT COUNT(*) FROM secciones s
+                     JOIN materias m ON s.id_materia = m.id_materia),
+                    COALESCE(SUM(rol = 'administrador'), 0),
+                    COALESCE(SUM(rol = 'profesor'), 0),
+                    COALESCE(SUM(rol = 'alumno'), 0),
+                    COALESCE(SUM(rol = 'coordinacion'), 0)
+                FROM usuarios
+                """
+            )
+            row = cursor.fetchone()
+            return {
+                "estudiantes": row[0],
+                "profesores": row[1],
+                "coordinadores": row[2],
+                "materias": row[3],
+                "secciones": row[4],
+                "usuarios_por_rol": {
+                    "administrador": row[5],
+                    "profesor": row[6],
+                    "alumno": row[7],
+                    "coordinacion": row[8],
+                },
+            }
+
+    stats = execute_with_retry(_get_stats)
+    with _dashboard_stats_lock:
+        _dashboard_stats_cache["valor"] = stats
+        _dashboard_stats_cache["expira"] = time.monotonic() + max_age
+    return stats
+
+
 def execute_with_retry(func, max_retries=3, delay=0.1):
     """Ejecuta una función con reintentos en caso de database locked."""
     for attempt in range(max_retries):
@@ -340,8 +584,52 @@ def execute_with_retry(func, max_retries=3, delay=0.1):
             raise e
 
 
-def initialize_database():
-    """Crea las tablas necesarias si no existen y añade datos iniciales."""
+# Revisión de las tablas y datos iniciales que crea initialize_database.
+# Hay que subirla al cambiar ese código; las migraciones y los archivos del
+# pensum ya cuentan solos en la huella del esquema.
+BASE_SCHEMA_REVISION = 2
+
+
+def schema_fingerprint():
+    """
+    Huella del esquema que deja initialize_database: revisión base, versión
+    y contenido de las migraciones, checksums de los planes de estudio y el
+    año de los períodos iniciales (así el primer arranque de cada año crea
+    los suyos). Es un entero positivo de 31 bits porque se guarda en PRAGMA
+    user_version.
+    """
+    contenido = repr(
+        (
+            BASE_SCHEMA_REVISION,
+            [(version, sentencias) for version, _, sentencias in MIGRATIONS],
+            sorted(curriculum_checksums().items()),
+            datetime.now().year,
+        )
+    )
+    return int(hashlib.sha256(contenido.encode()).hexdigest()[:8], 16) & 0x7FFFFFFF
+
+
+def schema_is_current():
+    """True si la base ya fue inicializada con la huella actual del esquema."""
+
+    def _check():
+        with get_db_connection() as conn:
+            return conn.execute("PRAGMA user_version").fetchone()[0] == schema_fingerprint()
+
+    return execute_with_retry(_check)
+
+
+def initialize_database(force=False):
+    """
+    Crea las tablas necesarias si no existen y añade datos iniciales.
+
+    Al terminar guarda la huella del esquema (schema_fingerprint) en la
+    base. En los arranques siguientes, si la huella coincide, no se revisa
+    nada más: basta una lectura de PRAGMA user_version. force=True hace la
+    revisión completa de todos modos.
+    """
+    if not force and schema_is_current():
+        return
 
     def _initialize():
         with get_db_connection() as conn:
@@ -539,1635 +827,6 @@ def initialize_database():
                     ),
                 )
 
-            # Verificar si la tabla materias ya existe y tiene datos
-            cursor.execute("SELECT COUNT(*) FROM materias")
-            if cursor.fetchone()[0] == 0:
-                # Solo insertar materias si la tabla está vacía
-                materias = [
-                    (
-                        "ADG-25132",
-                        "EDUCACIÓN AMBIENTAL",
-                        2,
-                        None,
-                        "Ingeniería en Sistemas",
-                        1,
-                    ),
-                    (
-                        "ADG-25132",
-                        "EDUCACIÓN AMBIENTAL",
-                        2,
-                        None,
-                        "Ingeniería Mecánica",
-                        1,
-                    ),
-                    (
-                        "ADG-25132",
-                        "EDUCACIÓN AMBIENTAL",
-                        2,
-                        None,
-                        "Ingeniería Naval",
-                        1,
-                    ),
-                    (
-                        "ADG-25123",
-                        "HOMBRE, SOCIEDAD, CIENCIAS Y TECNOLOGÍA",
-                        3,
-                        None,
-                        "Ingeniería en Sistemas",
-                        1,
-                    ),
-                    (
-                        "ADG-25123",
-                        "HOMBRE, SOCIEDAD, CIENCIAS Y TECNOLOGÍA",
-                        3,
-                        None,
-                        "Ingeniería Mecánica",
-                        1,
-                    ),
-                    (
-                        "ADG-25123",
-                        "HOMBRE, SOCIEDAD, CIENCIAS Y TECNOLOGÍA",
-                        3,
-                        None,
-                        "Ingeniería Naval",
-                        1,
-                    ),
-                    ("IDM-24113", "INGLÉS I", 3, None, "Ingeniería en Sistemas", 1),
-                    ("IDM-24113", "INGLÉS I", 3, None, "Ingeniería Mecánica", 1),
-                    ("IDM-24113", "INGLÉS I", 3, None, "Ingeniería Naval", 1),
-                    ("MAT-21212", "DIBUJO", 2, None, "Ingeniería en Sistemas", 1),
-                    ("MAT-21212", "DIBUJO", 2, None, "Ingeniería Mecánica", 1),
-                    ("MAT-21212", "DIBUJO", 2, None, "Ingeniería Naval", 1),
-                    ("MAT-21215", "MATEMÁTICA I", 5, None, "Ingeniería en Sistemas", 1),
-                    ("MAT-21215", "MATEMÁTICA I", 5, None, "Ingeniería Mecánica", 1),
-                    ("MAT-21215", "MATEMÁTICA I", 5, None, "Ingeniería Naval", 1),
-                    (
-                        "MAT-21524",
-                        "GEOMETRÍA ANALÍTICA",
-                        4,
-                        None,
-                        "Ingeniería en Sistemas",
-                        1,
-                    ),
-                    (
-                        "MAT-21524",
-                        "GEOMETRÍA ANALÍTICA",
-                        4,
-                        None,
-                        "Ingeniería Mecánica",
-                        1,
-                    ),
-                    (
-                        "MAT-21524",
-                        "GEOMETRÍA ANALÍTICA",
-                        4,
-                        None,
-                        "Ingeniería Naval",
-                        1,
-                    ),
-                    ("ADG-25131", "SEMINARIO I", 1, None, "Ingeniería en Sistemas", 1),
-                    ("ADG-25131", "SEMINARIO I", 1, None, "Ingeniería Mecánica", 1),
-                    ("ADG-25131", "SEMINARIO I", 1, None, "Ingeniería Naval", 1),
-                    (
-                        "DIN-21113",
-                        "DEFENSA INTEGRAL DE LA NACIÓN I",
-                        3,
-                        None,
-                        "Ingeniería en Sistemas",
-                        1,
-                    ),
-                    (
-                        "DIN-21113",
-                        "DEFENSA INTEGRAL DE LA NACIÓN I",
-                        3,
-                        None,
-                        "Ingeniería Mecánica",
-                        1,
-                    ),
-                    (
-                        "DIN-21113",
-                        "DEFENSA INTEGRAL DE LA NACIÓN I",
-                        3,
-                        None,
-                        "Ingeniería Naval",
-                        1,
-                    ),
-                    (
-                        "ACO-20110",
-                        "ACTIVIDADES COMPLEMENTARIAS I (DEPORTE)",
-                        0,
-                        None,
-                        "Ingeniería en Sistemas",
-                        1,
-                    ),
-                    (
-                        "ACO-20110",
-                        "ACTIVIDADES COMPLEMENTARIAS I (DEPORTE)",
-                        0,
-                        None,
-                        "Ingeniería Mecánica",
-                        1,
-                    ),
-                    (
-                        "ACO-20110",
-                        "ACTIVIDADES COMPLEMENTARIAS I (DEPORTE)",
-                        0,
-                        None,
-                        "Ingeniería Naval",
-                        1,
-                    ),
-                    (
-                        "IDM-24123",
-                        "INGLÉS II",
-                        3,
-                        "IDM-24113",
-                        "Ingeniería en Sistemas",
-                        2,
-                    ),
-                    (
-                        "IDM-24123",
-                        "INGLÉS II",
-                        3,
-                        "IDM-24113",
-                        "Ingeniería Mecánica",
-                        2,
-                    ),
-                    ("IDM-24123", "INGLÉS II", 3, "IDM-24113", "Ingeniería Naval", 2),
-                    (
-                        "MAT-21225",
-                        "MATEMÁTICA II",
-                        5,
-                        "MAT-21215 / MAT-21524",
-                        "Ingeniería en Sistemas",
-                        2,
-                    ),
-                    (
-                        "MAT-21225",
-                        "MATEMÁTICA II",
-                        5,
-                        "MAT-21215 / MAT-21524",
-                        "Ingeniería Mecánica",
-                        2,
-                    ),
-                    (
-                        "MAT-21225",
-                        "MATEMÁTICA II",
-                        5,
-                        "MAT-21215 / MAT-21524",
-                        "Ingeniería Naval",
-                        2,
-                    ),
-                    (
-                        "MAT-21114",
-                        "ÁLGEBRA LINEAL",
-                        4,
-                        "MAT-21215 / MAT-21524",
-                        "Ingeniería en Sistemas",
-                        2,
-                    ),
-                    (
-                        "MAT-21114",
-                        "ÁLGEBRA LINEAL",
-                        4,
-                        "MAT-21215 / MAT-21524",
-                        "Ingeniería Mecánica",
-                        2,
-                    ),
-                    (
-                        "MAT-21114",
-                        "ÁLGEBRA LINEAL",
-                        4,
-                        "MAT-21215 / MAT-21524",
-                        "Ingeniería Naval",
-                        2,
-                    ),
-                    (
-                        "QUF-23015",
-                        "FÍSICA I",
-                        5,
-                        "MAT-21215 / MAT-21524",
-                        "Ingeniería en Sistemas",
-                        2,
-                    ),
-                    (
-                        "QUF-23015",
-                        "FÍSICA I",
-                        5,
-                        "MAT-21215 / MAT-21524",
-                        "Ingeniería Mecánica",
-                        2,
-                    ),
-                    (
-                        "QUF-23015",
-                        "FÍSICA I",
-                        5,
-                        "MAT-21215 / MAT-21524",
-                        "Ingeniería Naval",
-                        2,
-                    ),
-                    (
-                        "QUF-22014",
-                        "QUÍMICA GENERAL",
-                        4,
-                        None,
-                        "Ingeniería en Sistemas",
-                        2,
-                    ),
-                    ("QUF-22014", "QUÍMICA GENERAL", 4, None, "Ingeniería Mecánica", 2),
-                    ("QUF-22014", "QUÍMICA GENERAL", 4, None, "Ingeniería Naval", 2),
-                    (
-                        "ADG-25133",
-                        "SEMINARIO II",
-                        1,
-                        "ADG-25132",
-                        "Ingeniería en Sistemas",
-                        2,
-                    ),
-                    (
-                        "ADG-25133",
-                        "SEMINARIO II",
-                        1,
-                        "ADG-25132",
-                        "Ingeniería Mecánica",
-                        2,
-                    ),
-                    (
-                        "ADG-25133",
-                        "SEMINARIO II",
-                        1,
-                        "ADG-25132",
-                        "Ingeniería Naval",
-                        2,
-                    ),
-                    (
-                        "DIN-21123",
-                        "DEFENSA INTEGRAL DE LA NACIÓN II",
-                        3,
-                        "DIN-21113",
-                        "Ingeniería en Sistemas",
-                        2,
-                    ),
-                    (
-                        "DIN-21123",
-                        "DEFENSA INTEGRAL DE LA NACIÓN II",
-                        3,
-                        "DIN-21113",
-                        "Ingeniería Mecánica",
-                        2,
-                    ),
-                    (
-                        "DIN-21123",
-                        "DEFENSA INTEGRAL DE LA NACIÓN II",
-                        3,
-                        "DIN-21113",
-                        "Ingeniería Naval",
-                        2,
-                    ),
-                    (
-                        "ACO-20111",
-                        "ACTIVIDADES COMPLEMENTARIAS II (CULTURA)",
-                        0,
-                        None,
-                        "Ingeniería en Sistemas",
-                        2,
-                    ),
-                    (
-                        "ACO-20111",
-                        "ACTIVIDADES COMPLEMENTARIAS II (CULTURA)",
-                        0,
-                        None,
-                        "Ingeniería Mecánica",
-                        2,
-                    ),
-                    (
-                        "ACO-20111",
-                        "ACTIVIDADES COMPLEMENTARIAS II (CULTURA)",
-                        0,
-                        None,
-                        "Ingeniería Naval",
-                        2,
-                    ),
-                    (
-                        "QUF-23025",
-                        "FÍSICA II",
-                        5,
-                        "QUF-23015 / MAT-21225",
-                        "Ingeniería en Sistemas",
-                        3,
-                    ),
-                    (
-                        "QUF-23025",
-                        "FÍSICA II",
-                        5,
-                        "QUF-23015 / MAT-21225",
-                        "Ingeniería Mecánica",
-                        3,
-                    ),
-                    (
-                        "QUF-23025",
-                        "FÍSICA II",
-                        5,
-                        "QUF-23015 / MAT-21225",
-                        "Ingeniería Naval",
-                        3,
-                    ),
-                    (
-                        "MAT-21235",
-                        "MATEMÁTICA III",
-                        5,
-                        "MAT-21225",
-                        "Ingeniería en Sistemas",
-                        3,
-                    ),
-                    (
-                        "MAT-21235",
-                        "MATEMÁTICA III",
-                        5,
-                        "MAT-21225",
-                        "Ingeniería Mecánica",
-                        3,
-                    ),
-                    (
-                        "MAT-21235",
-                        "MATEMÁTICA III",
-                        5,
-                        "MAT-21225",
-                        "Ingeniería Naval",
-                        3,
-                    ),
-                    (
-                        "MAT-21414",
-                        "PROBABILIDAD Y ESTADÍSTICA",
-                        4,
-                        "MAT-21225",
-                        "Ingeniería en Sistemas",
-                        3,
-                    ),
-                    (
-                        "MAT-21414",
-                        "PROBABILIDAD Y ESTADÍSTICA",
-                        4,
-                        "MAT-21225",
-                        "Ingeniería Mecánica",
-                        3,
-                    ),
-                    (
-                        "MAT-21414",
-                        "PROBABILIDAD Y ESTADÍSTICA",
-                        4,
-                        "MAT-21225",
-                        "Ingeniería Naval",
-                        3,
-                    ),
-                    (
-                        "SYC-22113",
-                        "PROGRAMACIÓN",
-                        3,
-                        "MAT-21114",
-                        "Ingeniería en Sistemas",
-                        3,
-                    ),
-                    (
-                        "SYC-22113",
-                        "PROGRAMACIÓN",
-                        3,
-                        "MAT-21114",
-                        "Ingeniería Mecánica",
-                        3,
-                    ),
-                    (
-                        "SYC-22113",
-                        "PROGRAMACIÓN",
-                        3,
-                        "MAT-21114",
-                        "Ingeniería Naval",
-                        3,
-                    ),
-                    (
-                        "NAV-20114",
-                        "INTRODUCCIÓN A LOS SISTEMAS NAVALES",
-                        4,
-                        None,
-                        "Ingeniería Naval",
-                        3,
-                    ),
-                    (
-                        "DIN-21133",
-                        "DEFENSA INTEGRAL DE LA NACIÓN III",
-                        3,
-                        "DIN-21123",
-                        "Ingeniería en Sistemas",
-                        3,
-                    ),
-                    (
-                        "DIN-21133",
-                        "DEFENSA INTEGRAL DE LA NACIÓN III",
-                        3,
-                        "DIN-21123",
-                        "Ingeniería Mecánica",
-                        3,
-                    ),
-                    (
-                        "DIN-21133",
-                        "DEFENSA INTEGRAL DE LA NACIÓN III",
-                        3,
-                        "DIN-21123",
-                        "Ingeniería Naval",
-                        3,
-                    ),
-                    (
-                        "ACO-20130",
-                        "ACTIVIDADES COMPLEMENTARIAS III (DEPORTE)",
-                        0,
-                        None,
-                        "Ingeniería en Sistemas",
-                        3,
-                    ),
-                    (
-                        "ACO-20130",
-                        "ACTIVIDADES COMPLEMENTARIAS III (DEPORTE)",
-                        0,
-                        None,
-                        "Ingeniería Mecánica",
-                        3,
-                    ),
-                    (
-                        "ACO-20130",
-                        "ACTIVIDADES COMPLEMENTARIAS III (DEPORTE)",
-                        0,
-                        None,
-                        "Ingeniería Naval",
-                        3,
-                    ),
-                    (
-                        "MAT-30265",
-                        "MATEMÁTICAS APLICADA A LA INGENIERÍA",
-                        5,
-                        "MAT-21235",
-                        "Ingeniería Naval",
-                        4,
-                    ),
-                    (
-                        "MEC-30115",
-                        "MECÁNICA",
-                        5,
-                        "QUF-23025 / MAT-21235",
-                        "Ingeniería Naval",
-                        4,
-                    ),
-                    (
-                        "QUF-30314",
-                        "TERMODINÁMICA I",
-                        4,
-                        "QUF-23015 / MAT-21235",
-                        "Ingeniería Naval",
-                        4,
-                    ),
-                    (
-                        "MAT-30123",
-                        "GEOMETRÍA DESCRIPTIVA",
-                        3,
-                        "MAT-21212",
-                        "Ingeniería Naval",
-                        4,
-                    ),
-                    ("SYC-22114", "INFORMÁTICA", 4, "SYC-22113", "Ingeniería Naval", 4),
-                    (
-                        "MEC-30314",
-                        "ELEMENTOS DE CIENCIAS DE LOS MATERIALES",
-                        4,
-                        "QUF-22014",
-                        "Ingeniería Naval",
-                        4,
-                    ),
-                    (
-                        "DIN-31143",
-                        "DEFENSA INTEGRAL DE LA NACIÓN IV",
-                        3,
-                        "DIN-21133",
-                        "Ingeniería en Sistemas",
-                        4,
-                    ),
-                    (
-                        "DIN-31143",
-                        "DEFENSA INTEGRAL DE LA NACIÓN IV",
-                        3,
-                        "DIN-21133",
-                        "Ingeniería Mecánica",
-                        4,
-                    ),
-                    (
-                        "DIN-31143",
-                        "DEFENSA INTEGRAL DE LA NACIÓN IV",
-                        3,
-                        "DIN-21133",
-                        "Ingeniería Naval",
-                        4,
-                    ),
-                    (
-                        "ACO-20140",
-                        "ACTIVIDADES COMPLEMENTARIAS IV (CULTURA)",
-                        0,
-                        None,
-                        "Ingeniería en Sistemas",
-                        4,
-                    ),
-                    (
-                        "ACO-20140",
-                        "ACTIVIDADES COMPLEMENTARIAS IV (CULTURA)",
-                        0,
-                        None,
-                        "Ingeniería Mecánica",
-                        4,
-                    ),
-                    (
-                        "ACO-20140",
-                        "ACTIVIDADES COMPLEMENTARIAS IV (CULTURA)",
-                        0,
-                        None,
-                        "Ingeniería Naval",
-                        4,
-                    ),
-                    (
-                        "NAV-30214",
-                        "DIBUJO NAVAL",
-                        4,
-                        "MAT-30123",
-                        "Ingeniería Naval",
-                        5,
-                    ),
-                    ("MEC-30134", "MECANISMOS", 4, "MEC-30115", "Ingeniería Naval", 5),
-                    (
-                        "MEC-30215",
-                        "RESISTENCIA DE LOS MATERIALES",
-                        5,
-                        "MEC-30115",
-                        "Ingeniería Naval",
-                        5,
-                    ),
-                    (
-                        "NAV-30714",
-                        "EQUIPOS Y SERVICIOS",
-                        4,
-                        "NAV-20114 / CO NAV-302214",
-                        "Ingeniería Naval",
-                        5,
-                    ),
-                    (
-                        "NAV-30414",
-                        "CONSTRUCCIÓN NAVAL I",
-                        4,
-                        "NAV-20114 / CO NAV-302215",
-                        "Ingeniería Naval",
-                        5,
-                    ),
-                    (
-                        "MEC-30414",
-                        "MECÁNICA DE LOS FLUIDOS",
-                        4,
-                        "MEC-30115 / QUF-30314",
-                        "Ingeniería Naval",
-                        5,
-                    ),
-                    (
-                        "QUF-30323",
-                        "TERMODINÁMICA II",
-                        4,
-                        "QUF-30314",
-                        "Ingeniería Naval",
-                        5,
-                    ),
-                    (
-                        "DIN-31153",
-                        "DEFENSA INTEGRAL DE LA NACIÓN V",
-                        3,
-                        "DIN-31143",
-                        "Ingeniería en Sistemas",
-                        5,
-                    ),
-                    (
-                        "DIN-31153",
-                        "DEFENSA INTEGRAL DE LA NACIÓN V",
-                        3,
-                        "DIN-31143",
-                        "Ingeniería Mecánica",
-                        5,
-                    ),
-                    (
-                        "DIN-31153",
-                        "DEFENSA INTEGRAL DE LA NACIÓN V",
-                        3,
-                        "DIN-31143",
-                        "Ingeniería Naval",
-                        5,
-                    ),
-                    (
-                        "ADG-10820",
-                        "CÁTEDRA BOLIVARIANA I",
-                        0,
-                        None,
-                        "Ingeniería en Sistemas",
-                        5,
-                    ),
-                    (
-                        "ADG-10820",
-                        "CÁTEDRA BOLIVARIANA I",
-                        0,
-                        None,
-                        "Ingeniería Mecánica",
-                        5,
-                    ),
-                    (
-                        "ADG-10820",
-                        "CÁTEDRA BOLIVARIANA I",
-                        0,
-                        None,
-                        "Ingeniería Naval",
-                        5,
-                    ),
-                    (
-                        "TAI-01",
-                        "TALLER DE INDUCCIÓN AL SERVICIO COMUNITARIO",
-                        0,
-                        None,
-                        "Ingeniería en Sistemas",
-                        5,
-                    ),
-                    (
-                        "TAI-01",
-                        "TALLER DE INDUCCIÓN AL SERVICIO COMUNITARIO",
-                        0,
-                        None,
-                        "Ingeniería Mecánica",
-                        5,
-                    ),
-                    (
-                        "TAI-01",
-                        "TALLER DE INDUCCIÓN AL SERVICIO COMUNITARIO",
-                        0,
-                        None,
-                        "Ingeniería Naval",
-                        5,
-                    ),
-                    (
-                        "MEC-31413",
-                        "TECNOLOGÍA MECÁNICA",
-                        3,
-                        "MEC-30314 / MEC-30215",
-                        "Ingeniería Naval",
-                        6,
-                    ),
-                    (
-                        "NAV-30424",
-                        "CONSTRUCCIÓN NAVAL II",
-                        4,
-                        "NAV-30414 / NAV-30214",
-                        "Ingeniería Naval",
-                        6,
-                    ),
-                    (
-                        "NAV-30514",
-                        "TEORÍA DEL BUQUE I",
-                        4,
-                        "NAV-20114 / NAV-30214",
-                        "Ingeniería Naval",
-                        6,
-                    ),
-                    ("MEC-31513", "SOLDADURA", 3, "MEC-30314", "Ingeniería Naval", 6),
-                    (
-                        "AGP-30213",
-                        "HIGIENE Y SEGURIDAD INDUSTRIAL",
-                        3,
-                        None,
-                        "Ingeniería Naval",
-                        6,
-                    ),
-                    (
-                        "ADG-30214",
-                        "METODOLOGÍA DE LA INVESTIGACIÓN",
-                        4,
-                        None,
-                        "Ingeniería en Sistemas",
-                        7,
-                    ),
-                    (
-                        "ADG-30214",
-                        "METODOLOGÍA DE LA INVESTIGACIÓN",
-                        4,
-                        None,
-                        "Ingeniería Mecánica",
-                        6,
-                    ),
-                    (
-                        "ADG-30214",
-                        "METODOLOGÍA DE LA INVESTIGACIÓN",
-                        4,
-                        None,
-                        "Ingeniería Naval",
-                        6,
-                    ),
-                    (
-                        "ELC-30134",
-                        "FUNDAMENTOS DE ELECTROTECNIA",
-                        4,
-                        "QUF-23025",
-                        "Ingeniería Naval",
-                        6,
-                    ),
-                    (
-                        "ENT-31223",
-                        "ELECTIVA NO TÉCNICA (PLANIFIC. Y EVAL DE PROYECTOS)",
-                        3,
-                        None,
-                        "Ingeniería en Sistemas",
-                        7,
-                    ),
-                    (
-                        "ENT-31223",
-                        "ELECTIVA NO TÉCNICA ",
-                        3,
-                        None,
-                        "Ingeniería Mecánica",
-                        7,
-                    ),
-                    (
-                        "ENT-31223",
-                        "ELECTIVA NO TÉCNICA (PLANIFIC. Y EVAL DE PROYECTOS)",
-                        3,
-                        None,
-                        "Ingeniería Naval",
-                        6,
-                    ),
-                    (
-                        "DIN-31163",
-                        "DEFENSA INTEGRAL DE LA NACIÓN VI",
-                        3,
-                        "DIN-31153",
-                        "Ingeniería en Sistemas",
-                        6,
-                    ),
-                    (
-                        "DIN-31163",
-                        "DEFENSA INTEGRAL DE LA NACIÓN VI",
-                        3,
-                        "DIN-31153",
-                        "Ingeniería Mecánica",
-                        6,
-                    ),
-                    (
-                        "DIN-31163",
-                        "DEFENSA INTEGRAL DE LA NACIÓN VI",
-                        3,
-                        "DIN-31153",
-                        "Ingeniería Naval",
-                        6,
-                    ),
-                    (
-                        "ADG-10821",
-                        "CÁTEDRA BOLIVARIANA II",
-                        0,
-                        "ADG-10820",
-                        "Ingeniería en Sistemas",
-                        6,
-                    ),
-                    (
-                        "ADG-10821",
-                        "CÁTEDRA BOLIVARIANA II",
-                        0,
-                        "ADG-10820",
-                        "Ingeniería Mecánica",
-                        6,
-                    ),
-                    (
-                        "ADG-10821",
-                        "CÁTEDRA BOLIVARIANA II",
-                        0,
-                        "ADG-10820",
-                        "Ingeniería Naval",
-                        6,
-                    ),
-                    (
-                        "PRO-01",
-                        "PROYECTO DE SERVICIO COMUNITARIO",
-                        0,
-                        "TAI-01",
-                        "Ingeniería en Sistemas",
-                        6,
-                    ),
-                    (
-                        "PRO-01",
-                        "PROYECTO DE SERVICIO COMUNITARIO",
-                        0,
-                        "TAI-01",
-                        "Ingeniería Mecánica",
-                        6,
-                    ),
-                    (
-                        "PRO-01",
-                        "PROYECTO DE SERVICIO COMUNITARIO",
-                        0,
-                        "TAI-01",
-                        "Ingeniería Naval",
-                        6,
-                    ),
-                    (
-                        "NAV-30525",
-                        "TEORÍA DEL BUQUE II",
-                        4,
-                        "NAV-30514 / MEC-30314",
-                        "Ingeniería Naval",
-                        7,
-                    ),
-                    (
-                        "CIV-30114",
-                        "CÁLCULOS DE ESTRUCTURAS",
-                        4,
-                        "MEC-30215",
-                        "Ingeniería Naval",
-                        7,
-                    ),
-                    (
-                        "NAV-30814",
-                        "ELECTRICIDAD APLICADA AL BUQUE",
-                        4,
-                        "ELC-30134",
-                        "Ingeniería Naval",
-                        7,
-                    ),
-                    (
-                        "QUF-30414",
-                        "TRANSFERENCIA DE CALOR",
-                        4,
-                        "QUF-30314",
-                        "Ingeniería Naval",
-                        7,
-                    ),
-                    (
-                        "NAV-30314",
-                        "PROPULSIÓN NAVAL",
-                        4,
-                        "MEC-30134 / QUF-30314",
-                        "Ingeniería Naval",
-                        7,
-                    ),
-                    (
-                        "NAV-30614",
-                        "MÁQUINAS MARINAS",
-                        4,
-                        "MEC-30514 / MEC-30414",
-                        "Ingeniería Naval",
-                        7,
-                    ),
-                    (
-                        "EME-31113",
-                        "ELECTIVA TÉCNICA (CORROSIÓN Y DESGASTE)",
-                        3,
-                        None,
-                        "Ingeniería Naval",
-                        7,
-                    ),
-                    (
-                        "DIN-31173",
-                        "DEFENSA INTEGRAL DE LA NACIÓN VII",
-                        3,
-                        "DIN-31163",
-                        "Ingeniería en Sistemas",
-                        7,
-                    ),
-                    (
-                        "DIN-31173",
-                        "DEFENSA INTEGRAL DE LA NACIÓN VII",
-                        3,
-                        "DIN-31163",
-                        "Ingeniería Mecánica",
-                        7,
-                    ),
-                    (
-                        "DIN-31173",
-                        "DEFENSA INTEGRAL DE LA NACIÓN VII",
-                        3,
-                        "DIN-31163",
-                        "Ingeniería Naval",
-                        7,
-                    ),
-                    (
-                        "NAV-30915",
-                        "CÁLCULOS DE ESTRUCTURA DEL BUQUE",
-                        5,
-                        "NAV-30414 / CIV-30114",
-                        "Ingeniería Naval",
-                        8,
-                    ),
-                    (
-                        "CJU-37314",
-                        "MARCO LEGAL PARA EL EJERCICIO DE LA INGENIERÍA",
-                        4,
-                        None,
-                        "Ingeniería en Sistemas",
-                        8,
-                    ),
-                    (
-                        "CJU-37314",
-                        "MARCO LEGAL PARA EL EJERCICIO DE LA INGENIERÍA",
-                        4,
-                        None,
-                        "Ingeniería Mecánica",
-                        8,
-                    ),
-                    (
-                        "CJU-37314",
-                        "MARCO LEGAL PARA EL EJERCICIO DE LA INGENIERÍA",
-                        4,
-                        None,
-                        "Ingeniería Naval",
-                        8,
-                    ),
-                    (
-                        "AGM-30314",
-                        "MANTENIMIENTO GENERAL",
-                        4,
-                        None,
-                        "Ingeniería Naval",
-                        8,
-                    ),
-                    (
-                        "NAV-30925",
-                        "DISEÑO DEL BUQUE",
-                        5,
-                        "NAV-30424",
-                        "Ingeniería Naval",
-                        8,
-                    ),
-                    (
-                        "EME-31143",
-                        "ELECTIVA TÉCNICA (REFRIGERACIÓN Y AIRE ACOND.)",
-                        3,
-                        None,
-                        "Ingeniería Naval",
-                        8,
-                    ),
-                    (
-                        "ENT -31143",
-                        "ELECTIVA NO TÉCNICA (CALIDAD TOTAL)",
-                        3,
-                        None,
-                        "Ingeniería Naval",
-                        8,
-                    ),
-                    (
-                        "DIN-31183",
-                        "DEFENSA INTEGRAL DE LA NACIÓN VIII",
-                        3,
-                        "DIN-31173",
-                        "Ingeniería en Sistemas",
-                        8,
-                    ),
-                    (
-                        "DIN-31183",
-                        "DEFENSA INTEGRAL DE LA NACIÓN VIII",
-                        3,
-                        "DIN-31173",
-                        "Ingeniería Mecánica",
-                        8,
-                    ),
-                    (
-                        "DIN-31183",
-                        "DEFENSA INTEGRAL DE LA NACIÓN VIII",
-                        3,
-                        "DIN-31173",
-                        "Ingeniería Naval",
-                        8,
-                    ),
-                    ("PST-30010", "PASANTÍAS", 10, None, "Ingeniería Naval", 9),
-                    (
-                        "MAT-20814",
-                        "CÁLCULO NUMÉRICO",
-                        4,
-                        "MAT-21225/CO-MAT-21235",
-                        "Ingeniería Mecánica",
-                        3,
-                    ),
-                    (
-                        "MAT-30265",
-                        "MATEMÁTICAS APLICADA A LA INGENIERÍA",
-                        5,
-                        "MAT-21235",
-                        "Ingeniería Mecánica",
-                        4,
-                    ),
-                    (
-                        "MEC-30115",
-                        "MECÁNICA",
-                        5,
-                        "QUF-23025 / MAT-21235",
-                        "Ingeniería Mecánica",
-                        4,
-                    ),
-                    (
-                        "QUF-30314",
-                        "TERMODINÁMICA I",
-                        4,
-                        "QUF-23015 / MAT-21235",
-                        "Ingeniería Mecánica",
-                        4,
-                    ),
-                    (
-                        "MAT-30123",
-                        "GEOMETRÍA DESCRIPTIVA",
-                        3,
-                        "MAT-21212",
-                        "Ingeniería Mecánica",
-                        4,
-                    ),
-                    (
-                        "SYC-30114",
-                        "INFORMÁTICA",
-                        4,
-                        "SYC-22113",
-                        "Ingeniería Mecánica",
-                        4,
-                    ),
-                    (
-                        "MEC-30314",
-                        "ELEMENTOS DE CIENCIAS DE LOS MATERIALES",
-                        4,
-                        "QUF-22014",
-                        "Ingeniería Mecánica",
-                        4,
-                    ),
-                    (
-                        "QUF-30323",
-                        "TERMODINÁMICA II",
-                        5,
-                        "QUF-30314",
-                        "Ingeniería Mecánica",
-                        5,
-                    ),
-                    (
-                        "MEC-30215",
-                        "RESISTENCIA DE LOS MATERIALES",
-                        5,
-                        "MEC-30115",
-                        "Ingeniería Mecánica",
-                        5,
-                    ),
-                    (
-                        "MEC-30414",
-                        "MECÁNICA DE LOS FLUIDOS",
-                        4,
-                        "MEC-30115 / QUF-30314",
-                        "Ingeniería Mecánica",
-                        5,
-                    ),
-                    (
-                        "ELC-30315",
-                        "ELECTROTECNIA",
-                        5,
-                        "QUF-23025",
-                        "Ingeniería Mecánica",
-                        5,
-                    ),
-                    (
-                        "MEC-30124",
-                        "DIBUJO MECÁNICO",
-                        4,
-                        "MAT-30123",
-                        "Ingeniería Mecánica",
-                        5,
-                    ),
-                    (
-                        "MEC-30614",
-                        "PROCESOS DE FABRICACIÓN I",
-                        4,
-                        "CO-MEC-30215/MEC-30314",
-                        "Ingeniería Mecánica",
-                        5,
-                    ),
-                    (
-                        "MEC-30134",
-                        "MECANISMOS",
-                        4,
-                        "MEC-30115",
-                        "Ingeniería Mecánica",
-                        6,
-                    ),
-                    (
-                        "MEC-30514",
-                        "TRANSFERENCIA DE CALOR",
-                        4,
-                        "QUF-30115",
-                        "Ingeniería Mecánica",
-                        6,
-                    ),
-                    ("SYC-30814", "SISTEMAS", 4, "MAT-30265", "Ingeniería Mecánica", 6),
-                    (
-                        "MEC-30714",
-                        "DINÁMICA DE GASES",
-                        4,
-                        "QUF-314/MEC-30414",
-                        "Ingeniería Mecánica",
-                        6,
-                    ),
-                    (
-                        "MEC-30625",
-                        "PROCESOS DE FABRICACIÓN II",
-                        5,
-                        "MEC-30614",
-                        "Ingeniería Mecánica",
-                        6,
-                    ),
-                    (
-                        "MEC-30925",
-                        "VIBRACIONES MECÁNICAS",
-                        5,
-                        "MEC-30134",
-                        "Ingeniería Mecánica",
-                        7,
-                    ),
-                    (
-                        "MEC-30815",
-                        "DISEÑO DE ELEMENTOS DE MÁQUINAS I",
-                        5,
-                        "MEC-30115/CO-MEC-30915",
-                        "Ingeniería Mecánica",
-                        7,
-                    ),
-                    (
-                        "AGP-30213",
-                        "HIGIENE Y SEGURIDAD INDUSTRIAL",
-                        3,
-                        None,
-                        "Ingeniería Mecánica",
-                        7,
-                    ),
-                    (
-                        "AGM-30314",
-                        "MANTENIMIENTO GENERAL",
-                        5,
-                        None,
-                        "Ingeniería Mecánica",
-                        7,
-                    ),
-                    (
-                        "ENT-00001",
-                        "ELECTIVA TÉCNICA ",
-                        3,
-                        None,
-                        "Ingeniería Mecánica",
-                        7,
-                    ),
-                    (
-                        "MEC-30825",
-                        "DISEÑO DE ELEMENTOS DE MÁQUINAS II",
-                        5,
-                        "MEC-30815",
-                        "Ingeniería Mecánica",
-                        8,
-                    ),
-                    (
-                        "MEC-31015",
-                        "TURBOMÁQUINAS",
-                        5,
-                        "MEC-30414",
-                        "Ingeniería Mecánica",
-                        8,
-                    ),
-                    (
-                        "MEC-31115",
-                        "GENERACIÓN DE POTENCIA",
-                        5,
-                        "MEC-30825",
-                        "Ingeniería Mecánica",
-                        8,
-                    ),
-                    (
-                        "ENT-00002",
-                        "ELECTIVA NO TÉCNICA ",
-                        3,
-                        None,
-                        "Ingeniería Mecánica",
-                        8,
-                    ),
-                    (
-                        "ENT-00003",
-                        "ELECTIVA TÉCNICA ",
-                        3,
-                        None,
-                        "Ingeniería Mecánica",
-                        8,
-                    ),
-                    ("PST-30010", "PASANTÍAS", 10, None, "Ingeniería Mecánica", 9),
-                    (
-                        "AGG-22313",
-                        "SISTEMAS ADMINISTRATIVOS",
-                        4,
-                        None,
-                        "Ingeniería en Sistemas",
-                        3,
-                    ),
-                    (
-                        "SYC-32114",
-                        "TEORÍA DE LOS SISTEMAS",
-                        4,
-                        None,
-                        "Ingeniería en Sistemas",
-                        4,
-                    ),
-                    (
-                        "MAT-31714",
-                        "CÁLCULO NUMÉRICO",
-                        4,
-                        "MAT-21235",
-                        "Ingeniería en Sistemas",
-                        4,
-                    ),
-                    (
-                        "MAT-31214",
-                        "LÓGICA MATEMÁTICA",
-                        4,
-                        "MAT-21114",
-                        "Ingeniería en Sistemas",
-                        4,
-                    ),
-                    (
-                        "SYC-32225",
-                        "LENGUAJE DE PROGRAMACIÓN I",
-                        5,
-                        "SYC-22113",
-                        "Ingeniería en Sistemas",
-                        4,
-                    ),
-                    (
-                        "SYC-32414",
-                        "PROCESAMIENTO DE DATOS",
-                        4,
-                        "SYC-22113",
-                        "Ingeniería en Sistemas",
-                        4,
-                    ),
-                    (
-                        "AGL-30214",
-                        "SISTEMAS DE PRODUCCIÓN",
-                        4,
-                        "AGG-22313",
-                        "Ingeniería en Sistemas",
-                        4,
-                    ),
-                    (
-                        "SYC-32235",
-                        "LENGUAJE DE PROGRAMACIÓN II",
-                        5,
-                        "SYC-32225",
-                        "Ingeniería en Sistemas",
-                        5,
-                    ),
-                    (
-                        "MAT-31114",
-                        "TEORÍA DE GRAFOS",
-                        4,
-                        "MAT-31214/MAT-21414",
-                        "Ingeniería en Sistemas",
-                        5,
-                    ),
-                    (
-                        "MAT-30925",
-                        "INVESTIGACIÓN DE OPERACIONES",
-                        5,
-                        "MAT-31714",
-                        "Ingeniería en Sistemas",
-                        5,
-                    ),
-                    (
-                        "ELN-30514",
-                        "CIRCUITOS LÓGICOS",
-                        4,
-                        "MAT-31214",
-                        "Ingeniería en Sistemas",
-                        5,
-                    ),
-                    (
-                        "SYC-32514",
-                        "ANÁLISIS DE SISTEMAS",
-                        4,
-                        "SYC-32114",
-                        "Ingeniería en Sistemas",
-                        5,
-                    ),
-                    (
-                        "SYC-32614",
-                        "BASE DE DATOS",
-                        4,
-                        "SYC-32114",
-                        "Ingeniería en Sistemas",
-                        5,
-                    ),
-                    (
-                        "MAT-30935",
-                        "OPTIMIZACIÓN NO LINEAL",
-                        5,
-                        "MAT-30925",
-                        "Ingeniería en Sistemas",
-                        6,
-                    ),
-                    (
-                        "SYC-32245",
-                        "LENGUAJE DE PROGRAMACIÓN III",
-                        5,
-                        "SYC-32235",
-                        "Ingeniería en Sistemas",
-                        6,
-                    ),
-                    (
-                        "MAT-31414",
-                        "PROCESOS ESTOCÁSTICOS",
-                        4,
-                        "MAT-30925/MAT-31114",
-                        "Ingeniería en Sistemas",
-                        6,
-                    ),
-                    (
-                        "SYC-30525",
-                        "ARQUITECTURA DEL COMPUTADOR",
-                        5,
-                        "ELN-30514",
-                        "Ingeniería en Sistemas",
-                        6,
-                    ),
-                    (
-                        "SYC-32524",
-                        "DISEÑO DE SISTEMAS",
-                        4,
-                        "SYC-32514",
-                        "Ingeniería en Sistemas",
-                        6,
-                    ),
-                    (
-                        "SYC-30834",
-                        "SISTEMAS OPERATIVOS",
-                        4,
-                        "CO-SYC-30525",
-                        "Ingeniería en Sistemas",
-                        6,
-                    ),
-                    (
-                        "SYC-32714",
-                        "IMPLANTACIÓN DE SISTEMAS",
-                        4,
-                        "SYC-32524",
-                        "Ingeniería en Sistemas",
-                        7,
-                    ),
-                    (
-                        "MAT-30945",
-                        "SIMULACIÓN Y MODELOS",
-                        5,
-                        "MAT-30935/MAT-31414",
-                        "Ingeniería en Sistemas",
-                        7,
-                    ),
-                    ("SYC-31644", "REDES", 4, "SYC-30834", "Ingeniería en Sistemas", 7),
-                    (
-                        "ADG-39224",
-                        "GERENCIA DE LA INFORMÁTICA",
-                        4,
-                        None,
-                        "Ingeniería en Sistemas",
-                        7,
-                    ),
-                    (
-                        "ENT-00004",
-                        "ELECTIVA TÉCNICA ",
-                        3,
-                        None,
-                        "Ingeniería en Sistemas",
-                        7,
-                    ),
-                    (
-                        "MAT-31314",
-                        "TEORÍA DE DECISIONES",
-                        4,
-                        "MAT-30945",
-                        "Ingeniería en Sistemas",
-                        8,
-                    ),
-                    (
-                        "SYC-32814",
-                        "AUDITORIA DE SISTEMAS",
-                        4,
-                        "SYC-32714",
-                        "Ingeniería en Sistemas",
-                        8,
-                    ),
-                    (
-                        "TTC-31154",
-                        "TELEPROCESOS",
-                        4,
-                        "SYC-31644",
-                        "Ingeniería en Sistemas",
-                        8,
-                    ),
-                    (
-                        "ENT-00005",
-                        "ELECTIVA TÉCNICA ",
-                        3,
-                        None,
-                        "Ingeniería en Sistemas",
-                        8,
-                    ),
-                    (
-                        "ENT-00006",
-                        "ELECTIVA NO TÉCNICA ",
-                        3,
-                        None,
-                        "Ingeniería en Sistemas",
-                        8,
-                    ),
-                    ("PST-30010", "PASANTÍAS", 10, None, "Ingeniería en Sistemas", 9),
-                    ("CSL-10112", "PSICOLOGÍA GENERAL", 2, None, "Enfermería", 1),
-                    (
-                        "ADG-10812",
-                        "SALUD Y DESARROLLO ECONÓMICO SOCIAL",
-                        2,
-                        None,
-                        "Enfermería",
-                        1,
-                    ),
-                    ("CSL-10317", "ENFERMERÍA BÁSICA", 7, None, "Enfermería", 1),
-                    ("CSL-10622", "NUTRICIÓN Y DIETÉTICA", 2, None, "Enfermería", 1),
-                    ("CSL-10214", "MORFOLOGÍA", 4, None, "Enfermería", 1),
-                    (
-                        "DIN-11113",
-                        "DEFENSA INTEGRAL DE LA NACIÓN I",
-                        3,
-                        None,
-                        "Enfermería",
-                        1,
-                    ),
-                    (
-                        "ACO-20110",
-                        "ACTIVIDADES COMPLEMENTARIAS I (DEPORTE)",
-                        0,
-                        None,
-                        "Enfermería",
-                        1,
-                    ),
-                    ("CSL-10613", "BIOQUÍMICA", 3, "CSL-10214", "Enfermería", 2),
-                    (
-                        "CSL-10717",
-                        "ENFERMERÍA MATERNO INFANTIL I",
-                        7,
-                        "CSL-10317/CSL-10214/CSL-10112",
-                        "Enfermería",
-                        2,
-                    ),
-                    ("IDM-10122", "INGLÉS INSTRUMENTAL", 2, None, "Enfermería", 2),
-                    (
-                        "CSL-10512",
-                        "ESTADÍSTICA BIOESTADÍSTICA Y EPIDEMIOLOGÍA",
-                        2,
-                        None,
-                        "Enfermería",
-                        2,
-                    ),
-                    ("CSL-10224", "ANATOMÍA HUMANA", 4, "CSL-10214", "Enfermería", 2),
-                    ("ADG-10822", "SOCIOANTROPOLOGÍA", 2, "ADG-10812", "Enfermería", 2),
-                    (
-                        "DIN-11123",
-                        "DEFENSA INTEGRAL DE LA NACIÓN II",
-                        3,
-                        "DIN-11113",
-                        "Enfermería",
-                        2,
-                    ),
-                    (
-                        "ACO-20111",
-                        "ACTIVIDADES COMPLEMENTARIAS I (CULTURA)",
-                        0,
-                        None,
-                        "Enfermería",
-                        2,
-                    ),
-                    ("CSL-10623", "FARMACOLOGÍA", 3, "CSL-10613", "Enfermería", 3),
-                    (
-                        "CSL-10812",
-                        "MICROBIOLOGÍA Y PARASITOLOGÍA",
-                        2,
-                        "CSL-10224/CSL-10512",
-                        "Enfermería",
-                        3,
-                    ),
-                    (
-                        "CSL-10727",
-                        "ENFERMERÍA MATERNO INFANTIL II",
-                        7,
-                        "CSL-10717",
-                        "Enfermería",
-                        3,
-                    ),
-                    (
-                        "CSL-11017",
-                        "ENFERMERÍA MÉDICO QUIRÚRGICO I",
-                        7,
-                        "CSL-10317/CSL-10224",
-                        "Enfermería",
-                        3,
-                    ),
-                    ("CSL-10922", "ÉTICA DE LA ENFERMERÍA", 2, None, "Enfermería", 3),
-                    (
-                        "CSL-10915",
-                        "FISIOLOGÍA Y FISIOPATOLOGÍA",
-                        5,
-                        "CSL-10224/CO-CSL-10727/CO-CSL-11017",
-                        "Enfermería",
-                        3,
-                    ),
-                    ("ADG-10820", "CÁTEDRA BOLIVARIANA I", 0, None, "Enfermería", 3),
-                    (
-                        "DIN-11133",
-                        "DEFENSA INTEGRAL DE LA NACIÓN III",
-                        3,
-                        "DIN-11123",
-                        "Enfermería",
-                        3,
-                    ),
-                    (
-                        "ACO-20130",
-                        "ACTIVIDADES COMPLEMENTARIAS I (DEPORTE)",
-                        0,
-                        None,
-                        "Enfermería",
-                        3,
-                    ),
-                    (
-                        "CSL-11116",
-                        "ENFERMERÍA EN SALUD MENTAL Y PSIQUIATRÍA",
-                        6,
-                        "CSL-10112",
-                        "Enfermería",
-                        4,
-                    ),
-                    (
-                        "ADG-10213",
-                        "METODOLOGÍA DE LA INVESTIGACIÓN",
-                        4,
-                        None,
-                        "Enfermería",
-                        4,
-                    ),
-                    (
-                        "CSL-11027",
-                        "ENFERMERÍA MÉDICO QUIRÚRGICO II",
-                        7,
-                        "CSL-11017",
-                        "Enfermería",
-                        4,
-                    ),
-                    (
-                        "AGG-11414",
-                        "ADMINISTRACIÓN DE LA ATENCIÓN DE ENFERMERÍA",
-                        4,
-                        "CSL-11017/CO-CSL-11116",
-                        "Enfermería",
-                        4,
-                    ),
-                    (
-                        "CSL-11217",
-                        "ENFERMERÍA COMUNITARIA E INVESTIGACIÓN APLICADA",
-                        7,
-                        "CO-ADG-10213",
-                        "Enfermería",
-                        4,
-                    ),
-                    (
-                        "ADG-10821",
-                        "CÁTEDRA BOLIVARIANA II",
-                        0,
-                        "ADG-10820",
-                        "Enfermería",
-                        4,
-                    ),
-                    (
-                        "DIN-11143",
-                        "DEFENSA INTEGRAL DE LA NACIÓN IV",
-                        3,
-                        "DIN-11133",
-                        "Enfermería",
-                        4,
-                    ),
-                    ("IRA-30303", "PASANTÍA HOSPITALARIA", 3, None, "Enfermería", 5),
-                    ("IRC-30303", "PASANTÍA COMUNITARIA", 3, None, "Enfermería", 5),
-                ]
-
-                # Usar INSERT OR IGNORE para evitar errores de duplicados
-                for materia in materias:
-                    cursor.execute(
-                        """
-                        INSERT OR IGNORE INTO materias (codigo, nombre, creditos, requisitos, carrera, semestre)
-                        VALUES (?, ?, ?, ?, ?, ?)
-                        """,
-                        materia,
-                    )
-
             # Verificar si necesitamos agregar la columna numero_seccion a secciones existentes
             try:
                 cursor.execute("SELECT numero_seccion FROM secciones LIMIT 1")
@@ -2190,6 +849,24 @@ def initialize_database():
                 """
                 )
 
+            # Aplicar migraciones de esquema pendientes (índices, etc.)
+            apply_migrations(conn)
+
+            # Planes de estudio (data/pensum): se cargan los archivos nuevos o
+            # modificados desde la última vez. Una base creada antes de que
+            # existieran los archivos ya tiene esas materias: solo se
+            # registran sus checksums.
+            cursor.execute(
+                """
+                SELECT NOT EXISTS (SELECT 1 FROM pensum_cargado)
+                   AND EXISTS (SELECT 1 FROM materias)
+                """
+            )
+            load_curriculum(conn, solo_registrar=bool(cursor.fetchone()[0]))
+
+            # Los próximos arranques pueden saltarse todo lo anterior
+            cursor.execute(f"PRAGMA user_version = {schema_fingerprint()}")
+
             # Confirmar los cambios
             conn.commit()
 
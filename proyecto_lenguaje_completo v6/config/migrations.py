@@ -0,0 +1,668 @@
+from datetime import datetime
+
+
+# Reconstrucción completa de las tablas resumen a partir de los datos base.
+# La usa la migración 2 para poblarlas y rebuild_summary_tables para
+# repararlas si alguna vez se desincronizan.
+REBUILD_SUMMARY_SQL = [
+    "DELETE FROM resumen_ocupacion_secciones",
+    """
+    INSERT INTO resumen_ocupacion_secciones (id_seccion, inscritos)
+    SELECT s.id_seccion, COUNT(i.id_inscripcion)
+    FROM secciones s
+    LEFT JOIN inscripciones i
+        ON i.id_seccion = s.id_seccion AND i.estado = 'activo'
+    GROUP BY s.id_seccion
+    """,
+    "DELETE FROM resumen_carga_estudiantes",
+    """
+    INSERT INTO resumen_carga_estudiantes (id_estudiante, periodo, materias, creditos)
+    SELECT i.id_estudiante, s.periodo, COUNT(*), SUM(m.creditos)
+    FROM inscripciones i
+    JOIN secciones s ON s.id_seccion = i.id_seccion
+    JOIN materias m ON m.id_materia = s.id_materia
+    WHERE i.estado = 'activo' AND i.id_estudiante IS NOT NULL
+    GROUP BY i.id_estudiante, s.periodo
+    """,
+    "DELETE FROM resumen_carrera_semestre",
+    """
+    INSERT INTO resumen_carrera_semestre (carrera, semestre, estudiantes)
+    SELECT COALESCE(carrera, ''), COALESCE(semestre, 0), COUNT(*)
+    FROM estudiantes
+    GROUP BY COALESCE(carrera, ''), COALESCE(semestre, 0)
+    """,
+]
+
+# Cuerpos reutilizados por los triggers: sumar o restar una inscripción activa
+# (NEW u OLD) en la ocupación de su sección y en la carga del estudiante.
+_SUMAR_INSCRIPCION = """
+    INSERT INTO resumen_ocupacion_secciones (id_seccion, inscritos)
+    SELECT id_seccion, 1 FROM secciones WHERE id_seccion = NEW.id_seccion
+    ON CONFLICT (id_seccion) DO UPDATE SET inscritos = inscritos + 1;
+    INSERT INTO resumen_carga_estudiantes (id_estudiante, periodo, materias, creditos)
+    SELECT NEW.id_estudiante, s.periodo, 1, m.creditos
+    FROM secciones s
+    JOIN materias m ON m.id_materia = s.id_materia
+    WHERE s.id_seccion = NEW.id_seccion AND NEW.id_estudiante IS NOT NULL
+    ON CONFLICT (id_estudiante, periodo) DO UPDATE SET
+        materias = materias + 1,
+        creditos = creditos + excluded.creditos;
+"""
+_RESTAR_INSCRIPCION = """
+    UPDATE resumen_ocupacion_secciones
+    SET inscritos = inscritos - 1
+    WHERE id_seccion = OLD.id_seccion;
+    UPDATE resumen_carga_estudiantes
+    SET materias = materias - 1,
+        creditos = creditos - (
+            SELECT m.creditos FROM secciones s
+            JOIN materias m ON m.id_materia = s.id_materia
+            WHERE s.id_seccion = OLD.id_seccion
+        )
+    WHERE id_estudiante = OLD.id_estudiante
+      AND periodo = (SELECT periodo FROM secciones WHERE id_seccion = OLD.id_seccion);
+    DELETE FROM resumen_carga_estudiantes
+    WHERE id_estudiante = OLD.id_estudiante AND materias <= 0;
+"""
+_SUMAR_ESTUDIANTE = """
+    INSERT INTO resumen_carrera_semestre (carrera, semestre, estudiantes)
+    VALUES (COALESCE(NEW.carrera, ''), COALESCE(NEW.semestre, 0), 1)
+    ON CONFLICT (carrera, semestre) DO UPDATE SET estudiantes = estudiantes + 1;
+"""
+_RESTAR_ESTUDIANTE = """
+    UPDATE resumen_carrera_semestre
+    SET estudiantes = estudiantes - 1
+    WHERE carrera = COALESCE(OLD.carrera, '') AND semestre = COALESCE(OLD.semestre, 0);
+    DELETE FROM resumen_carrera_semestre WHERE estudiantes <= 0;
+"""
+
+# Índices de búsqueda de texto completo (FTS5). Cada fila se identifica por
+# el id de la tabla base (rowid) y los triggers la reescriben completa cuando
+# cambia cualquiera de sus datos de origen.
+_FTS_TOKENIZER = "unicode61 remove_diacritics 2"
+
+_USUARIO_FTS_SELECT = """
+    SELECT
+        u.id_usuario, u.cedula, u.nombre, u.apellido,
+        COALESCE(CASE u.rol
+            WHEN 'alumno' THEN (SELECT carrera FROM estudiantes WHERE id_usuario = u.id_usuario)
+            WHEN 'profesor' THEN (SELECT carrera FROM profesores WHERE id_usuario = u.id_usuario)
+            WHEN 'coordinacion' THEN (SELECT carrera FROM coordinadores WHERE id_usuario = u.id_usuario)
+        END, ''),
+        u.rol
+    FROM usuarios u
+"""
+_MATERIA_FTS_SELECT = """
+    SELECT id_materia, codigo, nombre, COALESCE(requisitos, ''),
+           COALESCE(carrera, ''), semestre
+    FROM materias
+"""
+_SECCION_FTS_SELECT = """
+    SELECT
+        s.id_seccion, m.codigo, m.nombre,
+        COALESCE(u.nombre || ' ' || u.apellido, ''),
+        COALESCE(s.aula, ''), COALESCE(s.periodo, ''), COALESCE(m.carrera, '')
+    FROM secciones s
+    JOIN materias m ON s.id_materia = m.id_materia
+    LEFT JOIN profesores p ON s.id_profesor = p.id_profesor
+    LEFT JOIN usuarios u ON p.id_usuario = u.id_usuario
+"""
+
+
+def _fts_refresh_usuario(id_usuario):
+    return f"""
+    DELETE FROM busqueda_usuarios WHERE rowid = {id_usuario};
+    INSERT INTO busqueda_usuarios (rowid, cedula, nombre, apellido, carrera, rol)
+    {_USUARIO_FTS_SELECT} WHERE u.id_usuario = {id_usuario};
+"""
+
+
+def _fts_refresh_secciones(condicion):
+    return f"""
+    DELETE FROM busqueda_secciones
+    WHERE rowid IN (SELECT s.id_seccion FROM secciones s WHERE {condicion});
+    INSERT INTO busqueda_secciones (rowid, codigo, materia, profesor, aula, periodo, carrera)
+    {_SECCION_FTS_SELECT} WHERE {condicion};
+"""
+
+
+REBUILD_SEARCH_SQL = [
+    "DELETE FROM busqueda_usuarios",
+    f"""
+    INSERT INTO busqueda_usuarios (rowid, cedula, nombre, apellido, carrera, rol)
+    {_USUARIO_FTS_SELECT}
+    """,
+    "DELETE FROM busqueda_materias",
+    f"""
+    INSERT INTO busqueda_materias (rowid, codigo, nombre, requisitos, carrera, semestre)
+    {_MATERIA_FTS_SELECT}
+    """,
+    "DELETE FROM busqueda_secciones",
+    f"""
+    INSERT INTO busqueda_secciones (rowid, codigo, materia, profesor, aula, periodo, carrera)
+    {_SECCION_FTS_SELECT}
+    """,
+]
+
+# Cada migración es (versión, descripción, lista de sentencias SQL).
+# Las versiones se aplican en orden y una sola vez; nunca modificar una
+# migración ya publicada, agregar una nueva al final.
+MIGRATIONS = [
+    (
+        1,
+        "Índices para las búsquedas por claves foráneas",
+        [
+            # Antes del índice único se eliminan notas duplicadas, conservando
+            # la más reciente (la misma que usa el cierre de período).
+            """
+            DELETE FROM calificaciones
+            WHERE id_calificacion NOT IN (
+                SELECT MAX(id_calificacion)
+                FROM calificaciones
+                GROUP BY id_inscripcion, tipo_evaluacion
+            )
+            """,
+            """
+            CREATE UNIQUE INDEX IF NOT EXISTS ux_calificaciones_inscripcion_tipo
+            ON calificaciones (id_inscripcion, tipo_evaluacion)
+            """,
+            """
+            CREATE INDEX IF NOT EXISTS ix_inscripciones_seccion
+            ON inscripciones (id_seccion, id_estudiante)
+            """,
+            """
+            CREATE INDEX IF NOT EXISTS ix_inscripciones_estudiante
+            ON inscripciones (id_estudiante, estado, id_seccion)
+            """,
+            """
+            CREATE INDEX IF NOT EXISTS ix_secciones_periodo
+            ON secciones (periodo, estado, id_materia)
+            """,
+            """
+            CREATE INDEX IF NOT EXISTS ix_secciones_materia_periodo
+            ON secciones (id_materia, periodo, estado, numero_seccion)
+            """,
+            """
+            CREATE INDEX IF NOT EXISTS ix_secciones_profesor
+            ON secciones (id_profesor)
+            """,
+            """
+            CREATE INDEX IF NOT EXISTS ix_materias_cursadas_estudiante
+            ON materias_cursadas (id_estudiante, id_materia, estado)
+            """,
+            """
+            CREATE INDEX IF NOT EXISTS ix_materias_cursadas_periodo
+            ON materias_cursadas (periodo)
+            """,
+        ],
+    ),
+    (
+        2,
+        "Tablas resumen de ocupación, carga de créditos y estudiantes por carrera",
+        [
+            # Inscripciones activas por sección
+            """
+            CREATE TABLE IF NOT EXISTS resumen_ocupacion_secciones (
+                id_seccion INTEGER PRIMARY KEY,
+                inscritos INTEGER NOT NULL DEFAULT 0
+            )
+            """,
+            # Materias y créditos inscritos por estudiante en cada período
+            """
+            CREATE TABLE IF NOT EXISTS resumen_carga_estudiantes (
+                id_estudiante INTEGER NOT NULL,
+                periodo TEXT NOT NULL,
+                materias INTEGER NOT NULL DEFAULT 0,
+                creditos INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (id_estudiante, periodo)
+            )
+            """,
+            # Estudiantes por carrera y semestre ('' y 0 representan NULL)
+            """
+            CREATE TABLE IF NOT EXISTS resumen_carrera_semestre (
+                carrera TEXT NOT NULL,
+                semestre INTEGER NOT NULL,
+                estudiantes INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (carrera, semestre)
+            )
+            """,
+            f"""
+            CREATE TRIGGER IF NOT EXISTS tr_resumen_inscripciones_insert
+            AFTER INSERT ON inscripciones
+            WHEN NEW.estado = 'activo'
+            BEGIN {_SUMAR_INSCRIPCION} END
+            """,
+            f"""
+            CREATE TRIGGER IF NOT EXISTS tr_resumen_inscripciones_delete
+            AFTER DELETE ON inscripciones
+            WHEN OLD.estado = 'activo'
+            BEGIN {_RESTAR_INSCRIPCION} END
+            """,
+            # Un cambio de estado, sección o estudiante equivale a quitar la
+            # inscripción anterior y agregar la nueva
+            f"""
+            CREATE TRIGGER IF NOT EXISTS tr_resumen_inscripciones_update_old
+            AFTER UPDATE OF estado, id_seccion, id_estudiante ON inscripciones
+            WHEN OLD.estado = 'activo'
+            BEGIN {_RESTAR_INSCRIPCION} END
+            """,
+            f"""
+            CREATE TRIGGER IF NOT EXISTS tr_resumen_inscripciones_update_new
+            AFTER UPDATE OF estado, id_seccion, id_estudiante ON inscripciones
+            WHEN NEW.estado = 'activo'
+            BEGIN {_SUMAR_INSCRIPCION} END
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS tr_resumen_secciones_insert
+            AFTER INSERT ON secciones
+            BEGIN
+                INSERT OR IGNORE INTO resumen_ocupacion_secciones (id_seccion, inscritos)
+                VALUES (NEW.id_seccion, 0);
+            END
+            """,
+            # Al eliminar una sección sus inscripciones dejan de contar; si se
+            # eliminan después, el trigger de inscripciones ya no las encuentra
+            """
+            CREATE TRIGGER IF NOT EXISTS tr_resumen_secciones_delete
+            AFTER DELETE ON secciones
+            BEGIN
+                DELETE FROM resumen_ocupacion_secciones WHERE id_seccion = OLD.id_seccion;
+                UPDATE resumen_carga_estudiantes
+                SET materias = materias - _quitar.cantidad,
+                    creditos = creditos - _quitar.cantidad * (
+                        SELECT creditos FROM materias WHERE id_materia = OLD.id_materia
+                    )
+                FROM (
+                    SELECT id_estudiante, COUNT(*) AS cantidad FROM inscripciones
+                    WHERE id_seccion = OLD.id_seccion AND estado = 'activo'
+                    GROUP BY id_estudiante
+                ) AS _quitar
+                WHERE resumen_carga_estudiantes.periodo = OLD.periodo
+                  AND resumen_carga_estudiantes.id_estudiante = _quitar.id_estudiante;
+                DELETE FROM resumen_carga_estudiantes WHERE materias <= 0;
+            END
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS tr_resumen_secciones_update
+            AFTER UPDATE OF id_materia, periodo ON secciones
+            WHEN OLD.id_materia IS NOT NEW.id_materia OR OLD.periodo IS NOT NEW.periodo
+            BEGIN
+                UPDATE resumen_carga_estudiantes
+                SET materias = materias - _quitar.cantidad,
+                    creditos = creditos - _quitar.cantidad * (
+                        SELECT creditos FROM materias WHERE id_materia = OLD.id_materia
+                    )
+                FROM (
+                    SELECT id_estudiante, COUNT(*) AS cantidad FROM inscripciones
+                    WHERE id_seccion = OLD.id_seccion AND estado = 'activo'
+                    GROUP BY id_estudiante
+                ) AS _quitar
+                WHERE resumen_carga_estudiantes.periodo = OLD.periodo
+                  AND resumen_carga_estudiantes.id_estudiante = _quitar.id_estudiante;
+                INSERT INTO resumen_carga_estudiantes (id_estudiante, periodo, materias, creditos)
+                SELECT i.id_estudiante, NEW.periodo, 1, m.creditos
+                FROM inscripciones i
+                JOIN materias m ON m.id_materia = NEW.id_materia
+                WHERE i.id_seccion = NEW.id_seccion AND i.estado = 'activo'
+                  AND i.id_estudiante IS NOT NULL
+                ON CONFLICT (id_estudiante, periodo) DO UPDATE SET
+                    materias = materias + 1,
+                    creditos = creditos + excluded.creditos;
+                DELETE FROM resumen_carga_estudiantes WHERE materias <= 0;
+            END
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS tr_resumen_materias_creditos
+            AFTER UPDATE OF creditos ON materias
+            WHEN OLD.creditos IS NOT NEW.creditos
+            BEGIN
+                UPDATE resumen_carga_estudiantes
+                SET creditos = creditos + (NEW.creditos - OLD.creditos) * (
+                    SELECT COUNT(*) FROM inscripciones i
+                    JOIN secciones s ON s.id_seccion = i.id_seccion
+                    WHERE s.id_materia = NEW.id_materia
+                      AND s.periodo = resumen_carga_estudiantes.periodo
+                      AND i.id_estudiante = resumen_carga_estudiantes.id_estudiante
+                      AND i.estado = 'activo'
+                )
+                WHERE id_estudiante IN (
+                    SELECT i.id_estudiante FROM inscripciones i
+                    JOIN secciones s ON s.id_seccion = i.id_seccion
+                    WHERE s.id_materia = NEW.id_materia AND i.estado = 'activo'
+                );
+            END
+            """,
+            f"""
+            CREATE TRIGGER IF NOT EXISTS tr_resumen_estudiantes_insert
+            AFTER INSERT ON estudiantes
+            BEGIN {_SUMAR_ESTUDIANTE} END
+            """,
+            f"""
+            CREATE TRIGGER IF NOT EXISTS tr_resumen_estudiantes_delete
+            AFTER DELETE ON estudiantes
+            BEGIN {_RESTAR_ESTUDIANTE} END
+            """,
+            f"""
+            CREATE TRIGGER IF NOT EXISTS tr_resumen_estudiantes_update
+            AFTER UPDATE OF carrera, semestre ON estudiantes
+            WHEN OLD.carrera IS NOT NEW.carrera OR OLD.semestre IS NOT NEW.semestre
+            BEGIN {_RESTAR_ESTUDIANTE} {_SUMAR_ESTUDIANTE} END
+            """,
+            *REBUILD_SUMMARY_SQL,
+        ],
+    ),
+    (
+        3,
+        "Índices FTS5 para buscar usuarios, materias y secciones",
+        [
+            # rol queda sin indexar: solo se usa para filtrar
+            f"""
+            CREATE VIRTUAL TABLE IF NOT EXISTS busqueda_usuarios USING fts5(
+                cedula, nombre, apellido, carrera, rol UNINDEXED,
+                tokenize = '{_FTS_TOKENIZER}'
+            )
+            """,
+            f"""
+            CREATE VIRTUAL TABLE IF NOT EXISTS busqueda_materias USING fts5(
+                codigo, nombre, requisitos, carrera, semestre UNINDEXED,
+                tokenize = '{_FTS_TOKENIZER}'
+            )
+            """,
+            f"""
+            CREATE VIRTUAL TABLE IF NOT EXISTS busqueda_secciones USING fts5(
+                codigo, materia, profesor, aula, periodo, carrera,
+                tokenize = '{_FTS_TOKENIZER}'
+            )
+            """,
+            # Peso de cada columna en el ranking bm25 (las coincidencias en
+            # cédula o código valen más que en la carrera)
+            "INSERT INTO busqueda_usuarios (busqueda_usuarios, rank) VALUES ('rank', 'bm25(10.0, 5.0, 5.0, 1.0)')",
+            "INSERT INTO busqueda_materias (busqueda_materias, rank) VALUES ('rank', 'bm25(10.0, 5.0, 1.0, 1.0)')",
+            "INSERT INTO busqueda_secciones (busqueda_secciones, rank) VALUES ('rank', 'bm25(10.0, 5.0, 3.0, 1.0, 1.0, 1.0)')",
+            # Usuarios: sus datos y la carrera de su tabla de rol
+            f"""
+            CREATE TRIGGER IF NOT EXISTS tr_busqueda_usuarios_insert
+            AFTER INSERT ON usuarios
+            BEGIN {_fts_refresh_usuario("NEW.id_usuario")} END
+            """,
+            f"""
+            CREATE TRIGGER IF NOT EXISTS tr_busqueda_usuarios_update
+            AFTER UPDATE OF cedula, nombre, apellido, rol ON usuarios
+            BEGIN
+                {_fts_refresh_usuario("NEW.id_usuario")}
+                {_fts_refresh_secciones(
+                    "s.id_profesor IN (SELECT id_profesor FROM profesores WHERE id_usuario = NEW.id_usuario)"
+                )}
+            END
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS tr_busqueda_usuarios_delete
+            AFTER DELETE ON usuarios
+            BEGIN
+                DELETE FROM busqueda_usuarios WHERE rowid = OLD.id_usuario;
+            END
+            """,
+            *[
+                f"""
+                CREATE TRIGGER IF NOT EXISTS tr_busqueda_{tabla}_{evento.lower()}
+                AFTER {evento}{" OF carrera, id_usuario" if evento == "UPDATE" else ""} ON {tabla}
+                BEGIN
+                    {_fts_refresh_usuario(f"{fila}.id_usuario")}
+                    {_fts_refresh_usuario("OLD.id_usuario") if evento == "UPDATE" else ""}
+                END
+                """
+                for tabla in ("estudiantes", "profesores", "coordinadores")
+                for evento, fila in (("INSERT", "NEW"), ("UPDATE", "NEW"), ("DELETE", "OLD"))
+            ],
+            f"""
+            CREATE TRIGGER IF NOT EXISTS tr_busqueda_materias_insert
+            AFTER INSERT ON materias
+            BEGIN
+                INSERT INTO busqueda_materias (rowid, codigo, nombre, requisitos, carrera, semestre)
+                {_MATERIA_FTS_SELECT} WHERE id_materia = NEW.id_materia;
+            END
+            """,
+            f"""
+            CREATE TRIGGER IF NOT EXISTS tr_busqueda_materias_update
+            AFTER UPDATE ON materias
+            BEGIN
+                DELETE FROM busqueda_materias WHERE rowid = OLD.id_materia;
+                INSERT INTO busqueda_materias (rowid, codigo, nombre, requisitos, carrera, semestre)
+                {_MATERIA_FTS_SELECT} WHERE id_materia = NEW.id_materia;
+                {_fts_refresh_secciones("s.id_materia = NEW.id_materia")}
+            END
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS tr_busqueda_materias_delete
+            AFTER DELETE ON materias
+            BEGIN
+                DELETE FROM busqueda_materias WHERE rowid = OLD.id_materia;
+            END
+            """,
+            f"""
+            CREATE TRIGGER IF NOT EXISTS tr_busqueda_secciones_insert
+            AFTER INSERT ON secciones
+            BEGIN {_fts_refresh_secciones("s.id_seccion = NEW.id_seccion")} END
+            """,
+            f"""
+            CREATE TRIGGER IF NOT EXISTS tr_busqueda_secciones_update
+            AFTER UPDATE ON secciones
+            BEGIN
+                DELETE FROM busqueda_secciones WHERE rowid = OLD.id_seccion;
+                {_fts_refresh_secciones("s.id_seccion = NEW.id_seccion")}
+            END
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS tr_busqueda_secciones_delete
+            AFTER DELETE ON secciones
+            BEGIN
+                DELETE FROM busqueda_secciones WHERE rowid = OLD.id_seccion;
+            END
+            """,
+            *REBUILD_SEARCH_SQL,
+        ],
+    ),
+    (
+        4,
+        "Índices para ordenar los listados paginados",
+        [
+            # Con (columna, rowid) en el índice, cada página ordenada por
+            # apellido o nombre es un rango del índice y no un ordenamiento
+            """
+            CREATE INDEX IF NOT EXISTS ix_usuarios_apellido
+            ON usuarios (apellido)
+            """,
+            """
+            CREATE INDEX IF NOT EXISTS ix_usuarios_nombre
+            ON usuarios (nombre)
+            """,
+            # Para que el join pueda partir de usuarios (en el orden del índice)
+            """
+            CREATE INDEX IF NOT EXISTS ix_estudiantes_usuario
+            ON estudiantes (id_usuario)
+            """,
+            """
+            CREATE INDEX IF NOT EXISTS ix_profesores_usuario
+            ON profesores (id_usuario)
+            """,
+        ],
+    ),
+    (
+        5,
+        "Registro de los planes de estudio cargados desde archivo",
+        [
+            # Un archivo del pensum (config/curriculum.py) y el checksum de
+            # su última carga: solo se vuelve a cargar si cambia
+            """
+            CREATE TABLE IF NOT EXISTS pensum_cargado (
+                archivo TEXT PRIMARY KEY,
+                checksum TEXT NOT NULL,
+                materias INTEGER NOT NULL,
+                fecha_carga TEXT NOT NULL
+            )
+            """,
+        ],
+    ),
+]
+
+# Consultas críticas y el índice que deben usar según EXPLAIN QUERY PLAN.
+EXPECTED_QUERY_PLANS = [
+    (
+        "SELECT valor_nota FROM calificaciones WHERE id_inscripcion = ? AND tipo_evaluacion = 'nota_def'",
+        (1,),
+        "ux_calificaciones_inscripcion_tipo",
+    ),
+    (
+        "SELECT id_inscripcion FROM inscripciones WHERE id_seccion = ?",
+        (1,),
+        "ix_inscripciones_seccion",
+    ),
+    (
+        "SELECT id_inscripcion FROM inscripciones WHERE id_estudiante = ?",
+        (1,),
+        "ix_inscripciones_estudiante",
+    ),
+    (
+        "SELECT id_seccion FROM secciones WHERE periodo = ?",
+        ("",),
+        "ix_secciones_periodo",
+    ),
+    (
+        "SELECT id_materia, estado FROM materias_cursadas WHERE id_estudiante = ?",
+        (1,),
+        "ix_materias_cursadas_estudiante",
+    ),
+]
+
+
+def ensure_schema_version_table(cursor):
+    """Crea la tabla de control de versiones del esquema si no existe."""
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS schema_version (
+            version INTEGER PRIMARY KEY,
+            descripcion TEXT NOT NULL,
+            fecha_aplicacion TEXT NOT NULL
+        )
+        """
+    )
+
+
+def get_schema_version(cursor):
+    """Devuelve la versión de esquema aplicada (0 si no hay ninguna)."""
+    ensure_schema_version_table(cursor)
+    cursor.execute("SELECT COALESCE(MAX(version), 0) FROM schema_version")
+    return cursor.fetchone()[0]
+
+
+def apply_migrations(conn):
+    """
+    Aplica las migraciones pendientes dentro de la transacción actual.
+    Es idempotente: las versiones ya registradas en schema_version se omiten.
+    Retorna la lista de versiones aplicadas.
+    """
+    cursor = conn.cursor()
+    version_actual = get_schema_version(cursor)
+    aplicadas = []
+    for version, descripcion, sentencias in MIGRATIONS:
+        if version <= version_actual:
+            continue
+        for sql in sentencias:
+            cursor.execute(sql)
+        cursor.execute(
+            """
+            INSERT INTO schema_version (version, descripcion, fecha_aplicacion)
+            VALUES (?, ?, ?)
+            """,
+            (version, descripcion, datetime.now().strftime("%Y-%m-%d %H:%M:%S")),
+        )
+        aplicadas.append(version)
+    return aplicadas
+
+
+def verify_query_plans(conn):
+    """
+    Ejecuta EXPLAIN QUERY PLAN sobre las consultas críticas y devuelve una
+    lista de (consulta, índice_esperado, plan) para las que no usan su índice.
+    Una lista vacía significa que no hay regresiones.
+    """
+    cursor = conn.cursor()
+    fallas = []
+    for sql, params, indice in EXPECTED_QUERY_PLANS:
+        cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+        plan = " | ".join(row[-1] for row in cursor.fetchall())
+        if indice not in plan:
+            fallas.append((sql, indice, plan))
+    return fallas
+
+
+def rebuild_summary_tables(conn):
+    """
+    Recalcula las tablas resumen desde cero dentro de la transacción actual
+    (reparación manual; en uso normal las mantienen los triggers).
+    """
+    cursor = conn.cursor()
+    for sql in REBUILD_SUMMARY_SQL:
+        cursor.execute(sql)
+
+
+def rebuild_search_index(conn):
+    """Regenera los índices FTS5 de búsqueda dentro de la transacción actual."""
+    cursor = conn.cursor()
+    for sql in REBUILD_SEARCH_SQL:
+        cursor.execute(sql)
+
+
+def verify_summary_tables(conn):
+    """
+    Compara cada tabla resumen con el valor recalculado a partir de los datos
+    base. Devuelve la lista de tablas desincronizadas (vacía si todo cuadra).
+    """
+    cursor = conn.cursor()
+    desincronizadas = []
+    for delete_sql, insert_sql in zip(REBUILD_SUMMARY_SQL[::2], REBUILD_SUMMARY_SQL[1::2]):
+        tabla = delete_sql.split()[-1]
+        consulta = insert_sql[insert_sql.index("SELECT") :]
+        cursor.execute(
+            f"""
+            SELECT COUNT(*) FROM (
+                SELECT * FROM (SELECT * FROM {tabla} EXCEPT {consulta})
+                UNION ALL
+                SELECT * FROM ({consulta} EXCEPT SELECT * FROM {tabla})
+            )
+            """
+        )
+        if cursor.fetchone()[0]:
+            desincronizadas.append(tabla)
+    return desincronizadas
+
+
+if __name__ == "__main__":
+    import sys
+    from config.database import get_db_connection, initialize_database
+
+    # Una base nueva necesita el esquema base antes de las migraciones
+    initialize_database()
+    with get_db_connection() as conn:
+        aplicadas = apply_migrations(conn)
+        conn.commit()
+        print(f"Migraciones aplicadas: {aplicadas or 'ninguna'}")
+        desincronizadas = verify_summary_tables(conn)
+        if "--rebuild-summaries" in sys.argv:
+            rebuild_summary_tables(conn)
+            conn.commit()
+            print(f"Tablas resumen reconstruidas (antes desincronizadas: "
+                  f"{', '.join(desincronizadas) or 'ninguna'})")
+        elif desincronizadas:
+            print(f"[RESUMEN] Tablas desincronizadas: {', '.join(desincronizadas)} "
+                  f"(usar --rebuild-summaries)")
+        if "--rebuild-search" in sys.argv:
+            rebuild_search_index(conn)
+            conn.commit()
+            print("Índices de búsqueda reconstruidos")
+        fallas = verify_query_plans(conn)
+    if fallas:
+        for sql, indice, plan in fallas:
+            print(f"[REGRESIÓN] {sql}\n  esperado: {indice}\n  plan: {plan}")
+        raise SystemExit(1)
+    print("Planes de consulta verificados correctamente")
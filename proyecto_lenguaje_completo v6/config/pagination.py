@@ -0,0 +1,246 @@
+import re
+import threading
+from collections import OrderedDict
+
+from config.database import get_db_connection, execute_with_retry
+
+
+# Filas por página y páginas que se conservan en memoria por fuente
+PAGE_SIZE = 100
+CACHE_PAGES = 20
+
+_FROM = re.compile(r"\sFROM\s", re.IGNORECASE)
+
+
+class KeysetPager:
+    """
+    Fuente de datos paginada para listados grandes.
+
+    Las páginas se leen con paginación por clave (keyset): en lugar de
+    LIMIT/OFFSET, cada página continúa a partir de la clave de orden de la
+    última fila de la anterior, así que leer la página 500 cuesta lo mismo
+    que leer la primera. La clave de orden es la columna elegida más una
+    columna única (desempate), para que el orden sea total y estable.
+
+    select: "SELECT <columnas mostradas> FROM ... JOIN ..." sin WHERE ni
+    ORDER BY. Las filas que retorna get_page tienen exactamente esas columnas.
+    columnas: {nombre_columna: expresión SQL} de las columnas ordenables. Las
+    que admiten NULL deben venir envueltas en COALESCE: una comparación con
+    NULL nunca es verdadera y la fila quedaría fuera de todas las páginas.
+    Las demás se dejan tal cual para que un índice sobre la columna sirva
+    para recorrer el orden.
+    clave: expresión única usada como desempate (p. ej. "u.id_usuario"), o
+    una tupla de expresiones que en conjunto son únicas.
+    where/params: filtro fijo del listado.
+    orden: columna inicial (None = solo por la clave).
+
+    Las páginas leídas se guardan en una caché LRU de cache_pages páginas;
+    las claves de fin de página se conservan aparte (son pequeñas) para poder
+    volver a leer cualquier página expulsada sin recorrer las anteriores.
+    """
+
+    def __init__(
+        self,
+        select,
+        columnas,
+        clave,
+        where=None,
+        params=(),
+        orden=None,
+        descendente=False,
+        page_size=PAGE_SIZE,
+        cache_pages=CACHE_PAGES,
+    ):
+        self.select = select
+        self.columnas = dict(columnas)
+        self.clave = (clave,) if isinstance(clave, str) else tuple(clave)
+        self.where = where
+        self.params = tuple(params)
+        self.page_size = page_size
+        self.cache_pages = cache_pages
+        self.orden = None
+        self.descendente = False
+        self._lock = threading.RLock()
+        self._lectura = threading.Lock()
+        self._version = 0
+        self.set_order(orden, descendente)
+
+    def sortable(self, columna):
+        return columna in self.columnas
+
+    def set_order(self, columna, descendente=False):
+        """Cambia el orden del listado; descarta las páginas leídas."""
+        if columna is not None and columna not in self.columnas:
+            raise ValueError(f"La columna '{columna}' no se puede ordenar")
+        expresiones = list(self.clave)
+        if columna is not None:
+            expresiones.insert(0, self.columnas[columna])
+        with self._lock:
+            self.orden = columna
+            self.descendente = bool(descendente)
+            self._claves = expresiones
+            self.invalidate()
+
+    def invalidate(self):
+        """Olvida las páginas y el total (los datos cambiaron)."""
+        with self._lock:
+            self._version += 1
+            self._paginas = OrderedDict()
+            self._limites = {}
+            self._total = None
+
+    def _from(self):
+        return self.select[_FROM.search(self.select).start() :].strip()
+
+    def _columnas(self):
+        return self.select[: _FROM.search(self.select).start()].strip()
+
+    def _sql(self, columnas, claves, descendente, despues_de=None):
+        condiciones = [f"({self.where})"] if self.where else []
+        params = list(self.params)
+        if despues_de is not None:
+            operador = "<" if descendente else ">"
+            condiciones.append(
+                f"({', '.join(claves)}) {operador} ({', '.join('?' for _ in claves)})"
+            )
+            params.extend(despues_de)
+        direccion = " DESC" if descendente else ""
+        sql = columnas
+        if condiciones:
+            sql += " WHERE " + " AND ".join(condiciones)
+        sql += " ORDER BY " + ", ".join(c + direccion for c in claves)
+        return sql, params
+
+    def count(self):
+        """Total de filas del listado."""
+        with self._lock:
+            if self._total is not None:
+                return self._total
+            version = self._version
+        sql = "SELECT COUNT(*) " + self._from()
+        if self.where:
+            sql += f" WHERE ({self.where})"
+
+        def _count():
+            with get_db_connection() as conn:
+                return conn.execute(sql, self.params).fetchone()[0]
+
+        total = execute_with_retry(_count)
+        with self._lock:
+            if version == self._version:
+                self._total = total
+        return total
+
+    def cached_page(self, indice):
+        """La página si ya está en memoria (None si hay que leerla)."""
+        with self._lock:
+            filas = self._paginas.get(indice)
+            if filas is not None:
+                self._paginas.move_to_end(indice)
+            return filas
+
+    def get_page(self, indice):
+        """Filas de la página 'indice' (desde 0), leyéndolas si hace falta."""
+        filas = self.cached_page(indice)
+        if filas is not None:
+            return filas
+        # Una lectura a la vez, para que dos peticiones de la misma página no
+        # consulten la base dos veces; la caché sigue disponible mientras tanto
+        with self._lectura:
+            filas = self.cached_page(indice)
+            if filas is not None:
+                return filas
+            with self._lock:
+                estado = (self._version, list(self._claves), self.descendente)
+                limites = dict(self._limites)
+            filas, nuevos_limites = execute_with_retry(
+                lambda: self._read_page(indice, estado[1], estado[2], limites)
+            )
+            with self._lock:
+                # Si el orden cambió durante la lectura, el resultado se descarta
+                if estado[0] == self._version:
+                    self._limites.update(nuevos_limites)
+                    self._paginas[indice] = filas
+                    while len(self._paginas) > self.cache_pages:
+                        self._paginas.popitem(last=False)
+            return filas
+
+    def _read_page(self, indice, claves, descendente, limites):
+        nuevos = {}
+        with get_db_connection() as conn:
+            despues_de = limites.get(indice - 1) if indice > 0 else None
+            if indice > 0 and despues_de is None:
+                despues_de = self._seek(conn, indice, claves, descendente, limites)
+                if despues_de is None:
+                    return [], nuevos
+                nuevos[indice - 1] = despues_de
+            sql, params = self._sql(
+                f"{self._columnas()}, {', '.join(claves)} {self._from()}",
+                claves,
+                descendente,
+                despues_de,
+            )
+            filas = conn.execute(sql + " LIMIT ?", params + [self.page_size]).fetchall()
+        if filas:
+            nuevos[indice] = tuple(filas[-1][-len(claves) :])
+        return [tuple(fila[: -len(claves)]) for fila in filas], nuevos
+
+    def _seek(self, conn, indice, claves, descendente, limites):
+        """
+        Clave de la última fila de la página indice-1 cuando no se conoce:
+        parte del límite conocido más cercano y salta el resto leyendo solo
+        las columnas de la clave.
+        """
+        anterior = max((i for i in limites if i < indice - 1), default=-1)
+        despues_de = limites.get(anterior)
+        saltar = (indice - 1 - anterior) * self.page_size - 1
+        sql, params = self._sql(
+            f"SELECT {', '.join(claves)} {self._from()}", claves, descendente, despues_de
+        )
+        fila = conn.execute(sql + " LIMIT 1 OFFSET ?", params + [saltar]).fetchone()
+        return tuple(fila) if fila is not None else None
+
+
+class ListSource:
+    """
+    Fuente con la misma interfaz que KeysetPager para filas ya cargadas en
+    memoria (p. ej. resultados de una búsqueda); ordena en Python.
+    """
+
+    def __init__(self, filas, columnas, page_size=PAGE_SIZE):
+        self.columnas = tuple(columnas)
+        self.page_size = page_size
+        self.orden = None
+        self.descendente = False
+        self._original = [tuple(f) for f in filas]
+        self._filas = self._original
+
+    def sortable(self, columna):
+        return columna in self.columnas
+
+    def set_order(self, columna, descendente=False):
+        self.orden = columna
+        self.descendente = bool(descendente)
+        if columna is None:
+            self._filas = self._original
+            return
+        i = self.columnas.index(columna)
+        # Los None primero en orden ascendente, igual que en SQLite
+        self._filas = sorted(
+            self._original,
+            key=lambda f: (f[i] is not None, f[i] if f[i] is not None else 0),
+            reverse=self.descendente,
+        )
+
+    def invalidate(self):
+        pass
+
+    def count(self):
+        return len(self._filas)
+
+    def cached_page(self, indice):
+        return self.get_page(indice)
+
+    def get_page(self, indice):
+        inicio = indice * self.page_size
+        return self._filas[inicio : inicio + self.page_size]
@@ -0,0 +1,335 @@
+import itertools
+import sqlite3
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+
+
+# Sentencias que tardan más que esto (ms) se registran con su plan de consulta
+SLOW_QUERY_MS = 100.0
+# Límites superiores (ms) de los intervalos del histograma de latencia
+HISTOGRAM_BUCKETS_MS = (1, 5, 10, 50, 100, 500, 1000)
+# Sentencias a las que se les puede pedir EXPLAIN QUERY PLAN
+_EXPLICABLES = ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE", "REPLACE")
+
+
+def normalize_sql(sql):
+    """Colapsa los espacios para que la misma consulta se agrupe siempre igual."""
+    return " ".join(sql.split())
+
+
+def _bucket(ms):
+    for limite in HISTOGRAM_BUCKETS_MS:
+        if ms < limite:
+            return f"<{limite}ms"
+    return f">={HISTOGRAM_BUCKETS_MS[-1]}ms"
+
+
+def _caller():
+    """Módulo y función (fuera de este archivo) que ejecutó la sentencia."""
+    frame = sys._getframe(1)
+    while frame is not None and frame.f_globals.get("__name__") == __name__:
+        frame = frame.f_back
+    if frame is None:
+        return "?"
+    codigo = frame.f_code
+    funcion = getattr(codigo, "co_qualname", codigo.co_name).replace(".<locals>", "")
+    return f"{frame.f_globals.get('__name__', '?')}:{funcion}"
+
+
+class StatementStats:
+    """Estadísticas acumuladas de una sentencia SQL (normalizada)."""
+
+    def __init__(self, sql):
+        self.sql = sql
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.rows = 0
+        self.histogram = Counter()
+        self.callers = Counter()
+
+    def add(self, ms, rows, caller):
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+        self.rows += max(rows, 0)
+        self.histogram[_bucket(ms)] += 1
+        self.callers[caller] += 1
+
+    def as_dict(self):
+        return {
+            "sql": self.sql,
+            "ejecuciones": self.count,
+            "total_ms": round(self.total_ms, 3),
+            "promedio_ms": round(self.total_ms / self.count, 3) if self.count else 0,
+            "max_ms": round(self.max_ms, 3),
+            "filas": self.rows,
+            "histograma": dict(self.histogram),
+            "llamadores": dict(self.callers),
+        }
+
+
+class ProfiledCursor(sqlite3.Cursor):
+    """
+    Cursor que mide cada ejecución. El tiempo de una consulta incluye el de
+    sus fetch*, porque SQLite produce las filas a medida que se leen; la
+    ejecución se registra al leer todas las filas, al ejecutar otra sentencia
+    o al descartar el cursor.
+    """
+
+    _actual = None
+
+    def execute(self, sql, parameters=()):
+        self._finish()
+        inicio = time.perf_counter()
+        resultado = super().execute(sql, parameters)
+        self._actual = [sql, parameters, time.perf_counter() - inicio, 0, _caller()]
+        if self.description is None:
+            # Sin filas que leer (INSERT, UPDATE, DDL...): se registra ya
+            self._actual[3] = self.rowcount
+            self._finish()
+        return resultado
+
+    def executemany(self, sql, seq_of_parameters):
+        self._finish()
+        # Se guarda la primera tupla de parámetros para el EXPLAIN de la
+        # sentencia; chain la devuelve a la secuencia sin consumir el resto
+        restantes = iter(seq_of_parameters)
+        primera = next(restantes, None)
+        if primera is not None:
+            restantes = itertools.chain((primera,), restantes)
+        inicio = time.perf_counter()
+        resultado = super().executemany(sql, restantes)
+        self._actual = [sql, primera, time.perf_counter() - inicio, self.rowcount, _caller()]
+        self._finish()
+        return resultado
+
+    def executescript(self, sql_script):
+        self._finish()
+        inicio = time.perf_counter()
+        resultado = super().executescript(sql_script)
+        self._actual = [sql_script, None, time.perf_counter() - inicio, 0, _caller()]
+        self._finish()
+        return resultado
+
+    def _fetch(self, metodo, *args):
+        inicio = time.perf_counter()
+        resultado = metodo(*args)
+        if self._actual is not None:
+            self._actual[2] += time.perf_counter() - inicio
+        return resultado
+
+    def fetchone(self):
+        fila = self._fetch(super().fetchone)
+        if self._actual is not None:
+            if fila is None:
+                self._finish()
+            else:
+                self._actual[3] += 1
+        return fila
+
+    def fetchmany(self, size=None):
+        filas = self._fetch(super().fetchmany, size or self.arraysize)
+        if self._actual is not None:
+            self._actual[3] += len(filas)
+            if not filas:
+                self._finish()
+        return filas
+
+    def fetchall(self):
+        filas = self._fetch(super().fetchall)
+        if self._actual is not None:
+            self._actual[3] += len(filas)
+            self._finish()
+        return filas
+
+    def __next__(self):
+        try:
+            fila = self._fetch(super().__next__)
+        except StopIteration:
+            self._finish()
+            raise
+        if self._actual is not None:
+            self._actual[3] += 1
+        return fila
+
+    def close(self):
+        self._finish()
+        super().close()
+
+    def __del__(self):
+        try:
+            self._finish()
+        except Exception:
+            pass
+
+    def _finish(self):
+        actual, self._actual = self._actual, None
+        if actual is not None:
+            sql, parametros, segundos, filas, caller = actual
+            self.connection.profiler.record(sql, parametros, segundos * 1000, filas, caller)
+
+
+class ProfiledConnection(sqlite3.Connection):
+    """Conexión cuyos cursores (incluido conn.execute) son ProfiledCursor."""
+
+    profiler = None
+
+    def cursor(self, factory=ProfiledCursor):
+        return super().cursor(factory)
+
+    # Los atajos de sqlite3.Connection crean un Cursor común; se redirigen
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+    def executescript(self, sql_script):
+        return self.cursor().executescript(sql_script)
+
+
+class SQLProfiler:
+    """
+    Perfilador de SQL de una sesión de la aplicación.
+
+    Agrupa las sentencias por texto normalizado y acumula latencia (con
+    histograma), filas y los módulos/funciones que las ejecutan. Las que
+    superan slow_ms se escriben en el log junto con su EXPLAIN QUERY PLAN.
+    El trace callback de SQLite se usa para contar transacciones, que el
+    módulo sqlite3 abre y confirma por su cuenta.
+    """
+
+    def __init__(self, database, slow_ms=SLOW_QUERY_MS, log_file=None):
+        self.database = database
+        self.slow_ms = slow_ms
+        self.log_file = log_file
+        self.inicio = time.time()
+        self.stats = {}
+        self.counters = Counter()
+        self._planes = {}
+        self._lock = threading.Lock()
+
+    def connect(self, database, **kwargs):
+        """Abre una conexión perfilada (mismos argumentos que sqlite3.connect)."""
+        conn = sqlite3.connect(database, factory=ProfiledConnection, **kwargs)
+        conn.profiler = self
+        conn.set_trace_callback(self._trace)
+        with self._lock:
+            self.counters["conexiones_abiertas"] += 1
+        return conn
+
+    def _trace(self, sql):
+        verbo = sql.lstrip().split(None, 1)[0].upper() if sql.strip() else ""
+        clave = {
+            "BEGIN": "transacciones_iniciadas",
+            "COMMIT": "transacciones_confirmadas",
+            "END": "transacciones_confirmadas",
+            "ROLLBACK": "transacciones_revertidas",
+        }.get(verbo)
+        with self._lock:
+            self.counters["sentencias"] += 1
+            if clave:
+                self.counters[clave] += 1
+
+    def record(self, sql, parametros, ms, filas, caller):
+        clave = normalize_sql(sql)
+        with self._lock:
+            stats = self.stats.get(clave)
+            if stats is None:
+                stats = self.stats[clave] = StatementStats(clave)
+            stats.add(ms, filas, caller)
+        if ms >= self.slow_ms:
+            self._log_slow(sql, parametros, ms, filas, caller)
+
+    def explain(self, sql, parametros=None):
+        """
+        EXPLAIN QUERY PLAN de la sentencia, calculado en una conexión aparte
+        para no interferir con la transacción de quien la ejecutó. Los planes
+        se guardan por texto normalizado; los errores no, porque pueden
+        depender de los parámetros de esa ejecución.
+        """
+        clave = normalize_sql(sql)
+        with self._lock:
+            plan = self._planes.get(clave)
+        if plan is not None:
+            return plan
+        if not clave.upper().startswith(_EXPLICABLES):
+            return ""
+        try:
+            conn = sqlite3.connect(self.database, timeout=1.0)
+            try:
+                filas = conn.execute(f"EXPLAIN QUERY PLAN {sql}", parametros or ()).fetchall()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            return f"(sin plan: {e})"
+        plan = " | ".join(fila[-1] for fila in filas)
+        with self._lock:
+            self._planes[clave] = plan
+        return plan
+
+    def _log_slow(self, sql, parametros, ms, filas, caller):
+        texto = f"[SQL LENTA] {ms:.1f} ms, {filas} filas, {caller}\n  {normalize_sql(sql)[:500]}"
+        plan = self.explain(sql, parametros)
+        if plan:
+            texto += f"\n  plan: {plan}"
+        self.write(texto)
+
+    def write(self, texto):
+        if self.log_file:
+            with self._lock, open(self.log_file, "a", encoding="utf-8") as f:
+                f.write(texto + "\n")
+        else:
+            print(texto, file=sys.stderr)
+
+    def summary(self):
+        """
+        Resumen de la sesión: contadores y sentencias ordenadas por tiempo
+        total (las rutas más costosas primero).
+        """
+        with self._lock:
+            sentencias = [s.as_dict() for s in self.stats.values()]
+            contadores = dict(self.counters)
+        sentencias.sort(key=lambda s: s["total_ms"], reverse=True)
+        return {
+            "inicio": datetime.fromtimestamp(self.inicio).strftime("%Y-%m-%d %H:%M:%S"),
+            "duracion_s": round(time.time() - self.inicio, 1),
+            "umbral_lento_ms": self.slow_ms,
+            "contadores": contadores,
+            "sentencias": sentencias,
+        }
+
+    def report(self, limit=20):
+        """Texto legible del resumen con las 'limit' sentencias más costosas."""
+        resumen = self.summary()
+        contadores = resumen["contadores"]
+        lineas = [
+            f"=== Perfil SQL de la sesión ({resumen['inicio']}, {resumen['duracion_s']} s) ===",
+            f"Conexiones abiertas: {contadores.get('conexiones_abiertas', 0)}  "
+            f"Sentencias: {contadores.get('sentencias', 0)}  "
+            f"Transacciones confirmadas: {contadores.get('transacciones_confirmadas', 0)}  "
+            f"revertidas: {contadores.get('transacciones_revertidas', 0)}",
+            f"{'total ms':>10} {'ejec.':>6} {'prom. ms':>9} {'máx. ms':>9} {'filas':>8}  sentencia",
+        ]
+        for s in resumen["sentencias"][:limit]:
+            llamador = max(s["llamadores"], key=s["llamadores"].get)
+            lineas.append(
+                f"{s['total_ms']:>10.1f} {s['ejecuciones']:>6} {s['promedio_ms']:>9.2f} "
+                f"{s['max_ms']:>9.1f} {s['filas']:>8}  {s['sql'][:90]}"
+            )
+            histograma = ", ".join(
+                f"{k}: {v}" for k, v in sorted(
+                    s["histograma"].items(), key=lambda kv: _orden_bucket(kv[0])
+                )
+            )
+            lineas.append(f"{'':>47}{llamador} [{histograma}]")
+        return "\n".join(lineas)
+
+
+def _orden_bucket(etiqueta):
+    etiquetas = [f"<{l}ms" for l in HISTOGRAM_BUCKETS_MS]
+    return etiquetas.index(etiqueta) if etiqueta in etiquetas else len(etiquetas)
@@ -1,4 +1,5 @@
 from models.coordinator import Coordinator
+from models.academic_period import AcademicPeriod
 
 
 class CoordinatorController:
@@ -6,6 +7,10 @@ class CoordinatorController:
         """Obtiene todos los coordinadores."""
         return Coordinator.get_all()
 
+    def search(self, texto, carrera=None):
+        """Busca coordinadores con el índice de texto completo."""
+        return Coordinator.search(texto, carrera)
+
     def get_by_id(self, coordinator_id):
         """Obtiene un coordinador por su ID."""
         return Coordinator.get_by_id(coordinator_id)
@@ -60,3 +65,11 @@ class CoordinatorController:
         if not coordinator:
             raise ValueError("Coordinador no encontrado")
         return Coordinator.delete(coordinator_id)
+
+    def get_period_close_summary(self, periodo):
+        """Simulación del cierre del período: qué se archivará y eliminará."""
+        return AcademicPeriod.get_close_summary(periodo)
+
+    def close_period(self, periodo, progress=None):
+        """Cierra el período académico y activa el siguiente."""
+        return AcademicPeriod.close(periodo, progress)
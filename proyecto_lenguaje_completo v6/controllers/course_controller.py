@@ -6,13 +6,33 @@ class CourseController:
         """Obtiene todas las materias."""
         return Course.get_all()
 
+    def search(self, texto, carrera=None):
+        """Busca materias con el índice de texto completo."""
+        return Course.search(texto, carrera)
+
     def get_by_id(self, course_id):
         """Obtiene una materia por su ID."""
         return Course.get_by_id(course_id)
 
-    def get_by_codigo(self, codigo):
-        """Obtiene una materia por su código."""
-        return Course.get_by_codigo(codigo)
+    def get_by_codigo(self, codigo, carrera=None):
+        """Obtiene una materia por su código (y carrera, si se indica)."""
+        return Course.get_by_codigo(codigo, carrera)
+
+    def filter(self, carrera=None, semestre=None):
+        """Obtiene las materias de una carrera y/o semestre."""
+        return Course.get_by_carrera_semestre(carrera, semestre)
+
+    def get_semestres(self, carrera=None):
+        """Semestres con materias registradas."""
+        return Course.get_semestres(carrera)
+
+    def get_carreras(self):
+        """Carreras con materias registradas."""
+        return Course.get_carreras()
+
+    def import_curriculum(self, path):
+        """Carga un plan de estudios desde un CSV; retorna las materias escritas."""
+        return Course.import_curriculum(path)
 
     def create(
         self, codigo, nombre, creditos, requisitos=None, carrera=None, semestre=None
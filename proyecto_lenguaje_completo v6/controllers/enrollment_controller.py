@@ -12,6 +12,16 @@ class EnrollmentController:
     def get_materias_inscritas(self, estudiante_id):
         return Enrollment.get_materias_inscritas(estudiante_id)
 
+    def get_creditos_inscritos(self, estudiante_id, periodo=None):
+        return Enrollment.get_creditos_inscritos(estudiante_id, periodo)
+
+    def enroll_selection(self, estudiante_id, secciones, semestre=None):
+        """
+        Inscribe la selección completa del estudiante en una transacción.
+        Retorna una lista de (id_seccion, codigo_materia, resultado).
+        """
+        return Enrollment.enroll_selection(estudiante_id, secciones, semestre)
+
     def get_by_id(self, enrollment_id):
         """Obtiene una inscripción por su ID."""
         return Enrollment.get_by_id(enrollment_id)
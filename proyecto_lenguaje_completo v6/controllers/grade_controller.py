@@ -1,5 +1,4 @@
 from models.grade import Grade
-from models.enrollment import Enrollment
 from datetime import datetime
 
 
@@ -31,24 +30,30 @@ class GradeController:
 
         return grade.update(valor_nota, comentarios)
 
+    def get_gradebook(self, section_id):
+        """
+        Retorna la planilla de notas de la sección:
+        (id_inscripcion, C.I, Nombres, Apellidos, Corte1, Corte2, Corte3, Corte4, NotaDef)
+        """
+        return Grade.get_gradebook_by_section(section_id)
+
+    def create_write_buffer(self, gradebook):
+        """Crea un buffer de escritura para la planilla de notas cargada."""
+        return GradeWriteBuffer(gradebook)
+
+    def save_grades(self, entries):
+        """
+        Guarda en una sola transacción las entradas de
+        GradeWriteBuffer.take_pending. Retorna la cantidad de filas escritas.
+        """
+        return Grade.bulk_upsert(entries)
+
     def get_students_by_section(self, section_id):
         """
-        Retorna una lista de tuplas con los datos de los estudiantes inscritos en la sección.
-        Puedes ajustar los campos según tu modelo de notas.
-        """
-        # Aquí puedes obtener los estudiantes inscritos en la sección
-        enrollments = Enrollment.get_by_section(section_id)
-        # Retorna: (C.I, Nombres, Apellidos, Corte1, Corte2, Corte3, Corte4, NotaDef)
-        # Por ahora, solo retorna los datos básicos, puedes agregar los cortes si tienes esa info
-        result = []
-        for e in enrollments:
-            # e = (id_inscripcion, cedula, nombre, apellido, fecha_inscripcion, estado)
-            ci = e[1]
-            nombres = e[2]
-            apellidos = e[3]
-            # Si tienes notas, agrégalas aquí. Por ahora, pon 0 o vacío.
-            result.append((ci, nombres, apellidos, 0, 0, 0, 0, 0))
-        return result
+        Retorna una lista de tuplas con los datos de los estudiantes inscritos en la sección:
+        (C.I, Nombres, Apellidos, Corte1, Corte2, Corte3, Corte4, NotaDef)
+        """
+        return [row[1:] for row in Grade.get_gradebook_by_section(section_id)]
 
     def delete(self, grade_id):
         """Elimina una calificación."""
@@ -57,3 +62,145 @@ class GradeController:
             raise ValueError("Calificación no encontrada")
 
         grade.delete()
+
+
+class GradeWriteBuffer:
+    """
+    Acumula las notas editadas de una sección y las guarda en lote.
+    Se construye con la planilla de get_gradebook, de modo que la cédula ya
+    está asociada a su id_inscripcion y no hace falta consultar la base de
+    datos por cada nota. La nota definitiva se recalcula al guardar.
+    """
+
+    CORTES = ("corte1", "corte2", "corte3", "corte4")
+
+    def __init__(self, gradebook):
+        self._inscripciones = {}
+        self._notas = {}
+        self._pendientes = {}
+        for row in gradebook:
+            id_inscripcion, ci = row[0], row[1]
+            self._inscripciones[str(ci)] = id_inscripcion
+            self._notas[id_inscripcion] = dict(zip(self.CORTES, row[4:8]))
+
+    def __len__(self):
+        return len(self._pendientes)
+
+    @staticmethod
+    def calcular_nota_def(cortes):
+        """Promedio de los cuatro cortes (25% cada uno); los vacíos cuentan como 0."""
+        return round(sum(float(v or 0) for v in cortes) / 4, 2)
+
+    def nota_def(self, ci):
+        id_inscripcion = self._inscripciones[str(ci)]
+        return self.calcular_nota_def(self._notas[id_inscripcion].values())
+
+    def set_grade(self, ci, tipo_evaluacion, valor_nota):
+        """
+        Registra una nota pendiente y retorna la nota definitiva resultante.
+        Lanza ValueError si el estudiante no pertenece a la sección.
+        """
+        if tipo_evaluacion not in self.CORTES:
+            raise ValueError(f"Tipo de evaluación inválido: {tipo_evaluacion}")
+        id_inscripcion = self._inscripciones.get(str(ci))
+        if id_inscripcion is None:
+            raise ValueError("No se encontró la inscripción del estudiante.")
+        self._notas[id_inscripcion][tipo_evaluacion] = valor_nota
+        self._pendientes[(id_inscripcion, tipo_evaluacion)] = valor_nota
+        return self.nota_def(ci)
+
+    def take_pending(self):
+        """
+        Retira las notas pendientes y retorna las entradas a guardar
+        (id_inscripcion, tipo_evaluacion, valor), con las definitivas
+        afectadas. Así se pueden guardar en otro hilo mientras se siguen
+        editando notas.
+        """
+        entries = [
+            (id_inscripcion, tipo, valor)
+            for (id_inscripcion, tipo), valor in self._pendientes.items()
+        ]
+        for id_inscripcion in {id_inscripcion for id_inscripcion, _ in self._pendientes}:
+            nota_def = self.calcular_nota_def(self._notas[id_inscripcion].values())
+            entries.append((id_inscripcion, "nota_def", nota_def))
+        self._pendientes.clear()
+        return entries
+
+    def restore(self, entries):
+        """
+        Vuelve a dejar pendientes las entradas que no se pudieron guardar,
+        sin pisar las notas editadas después.
+        """
+        for id_inscripcion, tipo, valor in entries:
+            if tipo != "nota_def":
+                self._pendientes.setdefault((id_inscripcion, tipo), valor)
+
+    def flush(self):
+        """
+        Guarda todas las notas pendientes y las definitivas afectadas en una
+        sola transacción. Retorna la cantidad de filas escritas.
+        """
+        entries = self.take_pending()
+        if not entries:
+            return 0
+        try:
+            return Grade.bulk_upsert(entries)
+        except Exception:
+            self.restore(entries)
+            raise
+
+
+class GradeSaveQueue:
+    """
+    Guardados en segundo plano de un GradeWriteBuffer, ordenados con lo que
+    lee las notas después (cargar otra planilla, exportar el PDF).
+
+    submit(func, *args, on_success=..., on_error=...) ejecuta func fuera del
+    hilo de la interfaz (p. ej. run_in_background) y llama los callbacks en
+    él. Lo que se pasa como then se ejecuta cuando no queda ningún guardado
+    en curso, así una planilla nunca se lee antes de que se escriban sus
+    notas, aunque el ejecutor corra las tareas en cualquier orden.
+    """
+
+    def __init__(self, controller, submit):
+        self.controller = controller
+        self.submit = submit
+        self.en_curso = 0
+        self._esperando = []
+
+    def save(self, buffer, then=None, on_error=None):
+        """
+        Guarda lo pendiente de buffer (puede ser None) y luego ejecuta
+        then(). Si el guardado falla, las notas vuelven a quedar pendientes en
+        buffer, lo que esperaba se descarta y se llama on_error(excepción).
+        """
+        entradas = buffer.take_pending() if buffer else []
+        # Pedir lo mismo varias veces mientras se guarda lo ejecuta una vez
+        if then is not None and then not in self._esperando:
+            self._esperando.append(then)
+        if not entradas:
+            self._ejecutar_esperando()
+            return
+
+        def _listo(_):
+            self.en_curso -= 1
+            self._ejecutar_esperando()
+
+        def _error(e):
+            self.en_curso -= 1
+            self._esperando.clear()
+            buffer.restore(entradas)
+            if on_error:
+                on_error(e)
+
+        self.en_curso += 1
+        self.submit(
+            self.controller.save_grades, entradas, on_success=_listo, on_error=_error
+        )
+
+    def _ejecutar_esperando(self):
+        if self.en_curso:
+            return
+        esperando, self._esperando = self._esperando, []
+        for callback in esperando:
+            callback()
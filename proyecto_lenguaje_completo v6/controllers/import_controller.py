@@ -0,0 +1,7 @@
+from models.user_import import UserImporter
+
+
+class ImportController:
+    def import_users(self, path, rol=None, progress=None):
+        """Importa usuarios desde un CSV; retorna un ImportResult."""
+        return UserImporter(rol=rol, progress=progress).run(path)
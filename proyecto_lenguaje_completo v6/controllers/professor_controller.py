@@ -6,6 +6,14 @@ class ProfessorController:
         """Obtiene todos los profesores."""
         return Professor.get_all()
 
+    def paged(self, carrera=None):
+        """Fuente paginada para el listado de profesores."""
+        return Professor.paged(carrera)
+
+    def search(self, texto, carrera=None):
+        """Busca profesores con el índice de texto completo."""
+        return Professor.search(texto, carrera)
+
     def get_by_id(self, professor_id):
         """Obtiene un profesor por su ID."""
         return Professor.get_by_id(professor_id)
@@ -0,0 +1,9 @@
+from pdf.batch_reports import BatchReportGenerator
+
+
+class ReportController:
+    def generate_batch(self, tipo, destino, usuario, carrera=None, semestre=None, progress=None):
+        """Genera records o constancias por lote; retorna un BatchResult."""
+        return BatchReportGenerator(tipo, usuario, progress=progress).run(
+            destino, carrera, semestre
+        )
@@ -1,4 +1,10 @@
-from config.database import get_db_connection, execute_with_retry
+from config.database import (
+    get_db_connection,
+    execute_with_retry,
+    build_fts_query,
+    SEARCH_LIMIT,
+)
+from config.pagination import KeysetPager
 from models.section import Section
 
 
@@ -32,6 +38,83 @@ class SectionController:
 
         return execute_with_retry(_get_all)
 
+    def paged(self, periodo):
+        """
+        Fuente paginada de las secciones del período, por defecto en el orden
+        de siempre (código de materia y número de sección).
+        """
+        return KeysetPager(
+            """
+            SELECT
+                s.id_seccion,
+                m.codigo,
+                m.nombre,
+                s.numero_seccion,
+                COALESCE(u.nombre || ' ' || u.apellido, 'Por asignar') as profesor,
+                COALESCE(s.aula, 'Por asignar') as aula,
+                s.capacidad,
+                s.estado
+            FROM secciones s
+            JOIN materias m ON s.id_materia = m.id_materia
+            LEFT JOIN profesores p ON s.id_profesor = p.id_profesor
+            LEFT JOIN usuarios u ON p.id_usuario = u.id_usuario
+            """,
+            columnas={
+                "id": "s.id_seccion",
+                "codigo": "m.codigo",
+                "materia": "m.nombre",
+                "seccion": "s.numero_seccion",
+                "profesor": "COALESCE(u.nombre || ' ' || u.apellido, '')",
+                "aula": "COALESCE(s.aula, '')",
+                "capacidad": "COALESCE(s.capacidad, 0)",
+                "estado": "COALESCE(s.estado, '')",
+            },
+            clave=("s.numero_seccion", "s.id_seccion"),
+            where="s.periodo = ?",
+            params=(periodo,),
+            orden="codigo",
+        )
+
+    def search(self, texto, carrera=None, limit=SEARCH_LIMIT):
+        """
+        Busca secciones por código o nombre de materia, profesor, aula o
+        período con el índice FTS5 (prefijos, ordenadas por relevancia).
+        Retorna filas con el mismo formato que get_all.
+        """
+        consulta = build_fts_query(texto)
+        if consulta is None:
+            return []
+
+        def _search():
+            with get_db_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    """
+                    SELECT 
+                        s.id_seccion,
+                        m.codigo,
+                        m.nombre,
+                        s.numero_seccion,
+                        COALESCE(u.nombre || ' ' || u.apellido, 'Por asignar') as profesor,
+                        COALESCE(s.aula, 'Por asignar') as aula,
+                        s.capacidad,
+                        s.estado,
+                        s.periodo
+                    FROM busqueda_secciones f
+                    JOIN secciones s ON s.id_seccion = f.rowid
+                    JOIN materias m ON s.id_materia = m.id_materia
+                    LEFT JOIN profesores p ON s.id_profesor = p.id_profesor
+                    LEFT JOIN usuarios u ON p.id_usuario = u.id_usuario
+                    WHERE busqueda_secciones MATCH ? AND (? IS NULL OR m.carrera = ?)
+                    ORDER BY f.rank
+                    LIMIT ?
+                """,
+                    (consulta, carrera, carrera, limit),
+                )
+                return cursor.fetchall()
+
+        return execute_with_retry(_search)
+
     def get_section(self, section_id):
         """Obtiene una sección específica"""
 
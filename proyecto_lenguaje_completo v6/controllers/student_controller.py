@@ -7,6 +7,14 @@ class StudentController:
         """Obtiene todos los estudiantes."""
         return Student.get_all()
 
+    def paged(self, carrera=None):
+        """Fuente paginada para el listado de estudiantes."""
+        return Student.paged(carrera)
+
+    def search(self, texto, carrera=None):
+        """Busca estudiantes con el índice de texto completo."""
+        return Student.search(texto, carrera)
+
     def get_by_id(self, student_id):
         """Obtiene un estudiante por su ID."""
         return Student.get_by_id(student_id)
@@ -1,8 +1,13 @@
 import tkinter as tk
 from views.welcome_view import WelcomeView
-from config.database import initialize_database
+from config.database import (
+    initialize_database,
+    close_all_connections,
+    enable_sql_profiling_from_env,
+    dump_sql_profile,
+)
 from config.styles import configure_styles
-from views.dashboard_view import DashboardView
+from utils.task_executor import init_task_executor, shutdown_task_executor
 
 
 class AcademicSystemApp:
@@ -15,6 +20,12 @@ class AcademicSystemApp:
         # self.root.attributes("-fullscreen", True)
         self.root.configure(bg="#f8f9fa")
 
+        # Ejecutor compartido para el trabajo en segundo plano de las vistas
+        init_task_executor(self.root)
+
+        # Perfilado de SQL opcional (variable de entorno SQL_PROFILE)
+        enable_sql_profiling_from_env()
+
         # Inicializar la base de datos
         initialize_database()
 
@@ -42,6 +53,10 @@ class AcademicSystemApp:
         for widget in self.root.winfo_children():
             widget.destroy()
 
+        # El dashboard y sus vistas (reportlab, matplotlib...) se cargan al
+        # iniciar sesión, no al abrir la aplicación
+        from views.dashboard_view import DashboardView
+
         # Crear y mostrar el dashboard
         self.current_view = DashboardView(self.root, self, user)
 
@@ -50,7 +65,13 @@ class AcademicSystemApp:
         self.show_welcome()
 
     def run(self):
-        self.root.mainloop()
+        try:
+            self.root.mainloop()
+        finally:
+            # Detener las tareas pendientes y liberar las conexiones del pool
+            shutdown_task_executor()
+            dump_sql_profile()
+            close_all_connections()
 
 
 if __name__ == "__main__":
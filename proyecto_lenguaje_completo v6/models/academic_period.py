@@ -0,0 +1,197 @@
+from config.database import get_db_connection, execute_with_retry
+
+
+# Inscripciones del período con su nota definitiva más reciente y el estado
+# académico resultante. Es la misma regla que se aplicaba fila por fila:
+# sin nota o con nota menor a 10 el estudiante reprueba.
+_CIERRE_CTE = """
+WITH notas AS (
+    SELECT
+        c.id_inscripcion,
+        c.valor_nota,
+        ROW_NUMBER() OVER (
+            PARTITION BY c.id_inscripcion ORDER BY c.id_calificacion DESC
+        ) AS rn
+    FROM calificaciones c
+    JOIN inscripciones i ON i.id_inscripcion = c.id_inscripcion
+    JOIN secciones s ON s.id_seccion = i.id_seccion
+    WHERE c.tipo_evaluacion = 'nota_def'
+      AND s.estado = 'activa' AND s.periodo = :periodo
+),
+cierre AS (
+    SELECT
+        s.id_seccion,
+        i.id_inscripcion,
+        i.id_estudiante,
+        s.id_materia,
+        s.periodo,
+        n.valor_nota AS nota_final,
+        CASE WHEN n.valor_nota >= 10 THEN 'APROBÓ' ELSE 'REPROBÓ' END AS estado
+    FROM secciones s
+    JOIN inscripciones i ON i.id_seccion = s.id_seccion
+    LEFT JOIN notas n ON n.id_inscripcion = i.id_inscripcion AND n.rn = 1
+    WHERE s.estado = 'activa' AND s.periodo = :periodo
+)
+"""
+
+
+class AcademicPeriod:
+    @staticmethod
+    def siguiente(periodo):
+        """Retorna el período que sigue a 'AAAA-L' (2024-1 -> 2024-2 -> 2025-1)."""
+        anio, lapso = periodo.split("-")
+        if lapso == "1":
+            return f"{anio}-2"
+        return f"{int(anio) + 1}-1"
+
+    @staticmethod
+    def get_close_summary(periodo):
+        """
+        Simulación del cierre (no modifica nada). Retorna un diccionario con
+        lo que se archivaría y eliminaría al cerrar el período.
+        """
+
+        def _get():
+            with get_db_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    _CIERRE_CTE
+                    + """
+                SELECT
+                    COUNT(DISTINCT id_seccion),
+                    COUNT(*),
+                    COALESCE(SUM(estado = 'APROBÓ'), 0),
+                    COALESCE(SUM(estado = 'REPROBÓ'), 0),
+                    COALESCE(SUM(nota_final IS NULL), 0)
+                FROM cierre
+                """,
+                    {"periodo": periodo},
+                )
+                secciones_activas, archivadas, aprobados, reprobados, sin_nota = (
+                    cursor.fetchone()
+                )
+                cursor.execute(
+                    """
+                SELECT
+                    COUNT(DISTINCT s.id_seccion),
+                    COUNT(DISTINCT i.id_inscripcion),
+                    COUNT(c.id_calificacion)
+                FROM secciones s
+                LEFT JOIN inscripciones i ON i.id_seccion = s.id_seccion
+                LEFT JOIN calificaciones c ON c.id_inscripcion = i.id_inscripcion
+                WHERE s.periodo = ?
+                """,
+                    (periodo,),
+                )
+                secciones, inscripciones, calificaciones = cursor.fetchone()
+                return {
+                    "periodo": periodo,
+                    "siguiente": AcademicPeriod.siguiente(periodo),
+                    "secciones_activas": secciones_activas,
+                    "materias_archivadas": archivadas,
+                    "aprobados": aprobados,
+                    "reprobados": reprobados,
+                    "sin_nota": sin_nota,
+                    "secciones_eliminadas": secciones,
+                    "inscripciones_eliminadas": inscripciones,
+                    "calificaciones_eliminadas": calificaciones,
+                }
+
+        return execute_with_retry(_get)
+
+    @staticmethod
+    def close(periodo, progress=None):
+        """
+        Cierra el período en una sola transacción: archiva las inscripciones de
+        las secciones activas en materias_cursadas, elimina calificaciones,
+        inscripciones y secciones del período y activa el período siguiente.
+        progress(paso, total, descripcion) se llama antes de cada paso.
+        Retorna un diccionario con las filas afectadas por cada paso.
+        """
+        siguiente = AcademicPeriod.siguiente(periodo)
+        pasos = [
+            (
+                "materias_archivadas",
+                "Archivando materias cursadas",
+                """
+                INSERT INTO materias_cursadas
+                    (id_estudiante, id_materia, periodo, nota_final, estado, fecha_cursada)
+                """
+                + _CIERRE_CTE
+                + """
+                SELECT id_estudiante, id_materia, periodo, nota_final, estado, DATE('now')
+                FROM cierre
+                ORDER BY id_materia, id_seccion, id_estudiante, id_inscripcion
+                """,
+                {"periodo": periodo},
+            ),
+            (
+                "calificaciones_eliminadas",
+                "Eliminando calificaciones",
+                """
+                DELETE FROM calificaciones
+                WHERE id_inscripcion IN (
+                    SELECT i.id_inscripcion
+                    FROM inscripciones i
+                    JOIN secciones s ON s.id_seccion = i.id_seccion
+                    WHERE s.periodo = ?
+                )
+                """,
+                (periodo,),
+            ),
+            (
+                "inscripciones_eliminadas",
+                "Eliminando inscripciones",
+                """
+                DELETE FROM inscripciones
+                WHERE id_seccion IN (SELECT id_seccion FROM secciones WHERE periodo = ?)
+                """,
+                (periodo,),
+            ),
+            (
+                "secciones_eliminadas",
+                "Eliminando secciones",
+                "DELETE FROM secciones WHERE periodo = ?",
+                (periodo,),
+            ),
+            (
+                None,
+                f"Activando el período {siguiente}",
+                """
+                INSERT INTO periodos_academicos (periodo, es_activo)
+                SELECT ?, 0
+                WHERE NOT EXISTS (SELECT 1 FROM periodos_academicos WHERE periodo = ?)
+                """,
+                (siguiente, siguiente),
+            ),
+            (
+                None,
+                None,
+                "UPDATE periodos_academicos SET es_activo = (periodo = ?)",
+                (siguiente,),
+            ),
+        ]
+
+        def _close():
+            resultado = {"periodo": periodo, "siguiente": siguiente}
+            with get_db_connection() as conn:
+                cursor = conn.cursor()
+                # Reservar la escritura desde el inicio para no fallar a mitad del cierre
+                cursor.execute("BEGIN IMMEDIATE")
+                try:
+                    descripciones = [p[1] for p in pasos if p[1]]
+                    paso = 0
+                    for clave, descripcion, sql, params in pasos:
+                        if descripcion and progress:
+                            paso += 1
+                            progress(paso, len(descripciones), descripcion)
+                        cursor.execute(sql, params)
+                        if clave:
+                            resultado[clave] = cursor.rowcount
+                    conn.commit()
+                except Exception:
+                    conn.rollback()
+                    raise
+            return resultado
+
+        return execute_with_retry(_close)
@@ -1,4 +1,4 @@
-from config.database import get_connection
+from config.database import get_connection, build_fts_query, SEARCH_LIMIT
 
 
 class Coordinator:
@@ -31,6 +31,34 @@ class Coordinator:
         conn.close()
         return coordinators
 
+    @classmethod
+    def search(cls, texto, carrera=None, limit=SEARCH_LIMIT):
+        """
+        Busca coordinadores con el índice FTS5 (prefijos, ordenados por
+        relevancia). Retorna filas con el mismo formato que get_all.
+        """
+        consulta = build_fts_query(texto)
+        if consulta is None:
+            return []
+        conn = get_connection()
+        cursor = conn.cursor()
+        cursor.execute(
+            """
+            SELECT u.id_usuario, u.cedula, u.nombre, u.apellido, c.carrera, c.fecha_ingreso
+            FROM busqueda_usuarios f
+            JOIN usuarios u ON u.id_usuario = f.rowid
+            JOIN coordinadores c ON u.id_usuario = c.id_usuario
+            WHERE busqueda_usuarios MATCH ? AND f.rol = ?
+              AND (? IS NULL OR c.carrera = ?)
+            ORDER BY f.rank
+            LIMIT ?
+        """,
+            (consulta, "coordinacion", carrera, carrera, limit),
+        )
+        coordinators = cursor.fetchall()
+        conn.close()
+        return coordinators
+
     @classmethod
     def get_by_id(cls, coordinator_id):
         conn = get_connection()
@@ -1,4 +1,139 @@
-from config.database import get_db_connection, execute_with_retry
+import threading
+from config.curriculum import clave_archivo, load_curriculum
+from config.database import (
+    get_db_connection,
+    execute_with_retry,
+    build_fts_query,
+    SEARCH_LIMIT,
+)
+
+
+def _clave_carrera(carrera):
+    return str(carrera or "").strip().lower()
+
+
+def _clave_semestre(semestre):
+    texto = str(semestre if semestre is not None else "").strip()
+    return str(int(texto)) if texto.isdigit() else texto
+
+
+def _orden_indice(curso):
+    # Orden del índice UNIQUE (codigo, carrera, semestre) de materias
+    return (curso.carrera or "", curso.semestre or 0)
+
+
+def _indexar_primero(indice, clave, curso):
+    """Guarda curso en indice[clave] si es el primero en orden de índice."""
+    actual = indice.get(clave)
+    if actual is None or _orden_indice(curso) < _orden_indice(actual):
+        indice[clave] = curso
+
+
+class CourseCatalog:
+    """
+    Caché en memoria del pensum (tabla materias).
+
+    Se carga completa en la primera consulta y se indexa por id, código,
+    (código, carrera), carrera y (carrera, semestre), de modo que los
+    filtros de las vistas no consultan la base de datos.
+    Course.create/update/delete la invalidan.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._cursos = None
+        # Aumenta en cada invalidación; sirve a las cachés derivadas del pensum
+        self.version = 0
+        self._indices = None
+
+    def invalidate(self):
+        with self._lock:
+            self._cursos = None
+            self.version += 1
+
+    def _cargar(self):
+        """
+        Retorna (materias, índices), cargándolos si no están en caché.
+        Los índices se devuelven junto con la lista para que una consulta
+        nunca mezcle una lista con los índices de otra carga.
+        """
+        with self._lock:
+            if self._cursos is not None:
+                return self._cursos, self._indices
+            version = self.version
+
+        cursos = execute_with_retry(Course._get_all_from_db)
+        por_id, por_codigo, por_codigo_carrera = {}, {}, {}
+        por_carrera, por_carrera_semestre = {}, {}
+        for curso in cursos:
+            por_id[curso.id] = curso
+            carrera = _clave_carrera(curso.carrera)
+            # Un código se repite entre carreras: sin carrera se toma la
+            # primera materia en el orden del índice, como la consulta por código
+            _indexar_primero(por_codigo, curso.codigo, curso)
+            _indexar_primero(por_codigo_carrera, (curso.codigo, carrera), curso)
+            por_carrera.setdefault(carrera, []).append(curso)
+            por_carrera_semestre.setdefault(
+                (carrera, _clave_semestre(curso.semestre)), []
+            ).append(curso)
+
+        indices = {
+            "id": por_id,
+            "codigo": por_codigo,
+            "codigo_carrera": por_codigo_carrera,
+            "carrera": por_carrera,
+            "carrera_semestre": por_carrera_semestre,
+        }
+        with self._lock:
+            # Si se invalidó durante la lectura, la lista puede estar vieja:
+            # se usa para esta consulta pero no queda en caché
+            if self.version == version:
+                self._cursos = cursos
+                self._indices = indices
+        return cursos, indices
+
+    def all(self):
+        return list(self._cargar()[0])
+
+    def by_id(self, course_id):
+        indices = self._cargar()[1]
+        try:
+            return indices["id"].get(int(course_id))
+        except (TypeError, ValueError):
+            return None
+
+    def by_codigo(self, codigo, carrera=None):
+        indices = self._cargar()[1]
+        if carrera is not None:
+            return indices["codigo_carrera"].get((codigo, _clave_carrera(carrera)))
+        return indices["codigo"].get(codigo)
+
+    def filter(self, carrera=None, semestre=None):
+        """
+        Materias de la carrera y/o semestre indicados (None = sin filtrar).
+        La carrera se compara sin distinguir mayúsculas ni espacios.
+        """
+        cursos, indices = self._cargar()
+        if carrera is not None and semestre is not None:
+            clave = (_clave_carrera(carrera), _clave_semestre(semestre))
+            return list(indices["carrera_semestre"].get(clave, []))
+        if carrera is not None:
+            return list(indices["carrera"].get(_clave_carrera(carrera), []))
+        if semestre is not None:
+            clave = _clave_semestre(semestre)
+            return [c for c in cursos if _clave_semestre(c.semestre) == clave]
+        return list(cursos)
+
+    def semestres(self, carrera=None):
+        """Semestres (como texto, ordenados) con materias en la carrera dada."""
+        cursos = self.filter(carrera=carrera)
+        return sorted({str(c.semestre) for c in cursos if c.semestre is not None})
+
+    def carreras(self):
+        return sorted({str(c.carrera) for c in self._cargar()[0] if c.carrera is not None})
+
+
+_catalog = CourseCatalog()
 
 
 class Course:
@@ -36,6 +171,7 @@ class Course:
                 )
                 course_id = cursor.lastrowid
                 conn.commit()
+                _catalog.invalidate()
                 return Course(
                     id=course_id,
                     codigo=codigo,
@@ -51,51 +187,107 @@ class Course:
     @staticmethod
     def get_by_id(course_id):
         """Obtiene una materia por su ID."""
+        return _catalog.by_id(course_id)
+
+    @staticmethod
+    def get_by_codigo(codigo, carrera=None):
+        """
+        Obtiene una materia por su código. El mismo código puede estar en
+        varias carreras: sin carrera se retorna la primera por carrera y
+        semestre.
+        """
+        return _catalog.by_codigo(codigo, carrera)
+
+    @staticmethod
+    def get_all():
+        """Obtiene todas las materias (desde el catálogo en memoria)."""
+        return _catalog.all()
+
+    @staticmethod
+    def get_by_carrera_semestre(carrera=None, semestre=None):
+        """Obtiene las materias de una carrera y/o semestre."""
+        return _catalog.filter(carrera, semestre)
+
+    @staticmethod
+    def search(texto, carrera=None, limit=SEARCH_LIMIT):
+        """
+        Busca materias por código, nombre, requisitos o carrera con el índice
+        FTS5 (prefijos, ordenadas por relevancia). Los objetos se toman del
+        catálogo en memoria.
+        """
+        consulta = build_fts_query(texto)
+        if consulta is None:
+            return []
 
-        def _get():
+        def _search():
             with get_db_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     """
-                SELECT id_materia, codigo, nombre, creditos, requisitos, carrera, semestre
-                FROM materias
-                WHERE id_materia = ?
-                """,
-                    (course_id,),
+                    SELECT rowid FROM busqueda_materias
+                    WHERE busqueda_materias MATCH ? AND (? IS NULL OR carrera = ?)
+                    ORDER BY rank
+                    LIMIT ?
+                    """,
+                    (consulta, carrera, carrera, limit),
                 )
-                course_data = cursor.fetchone()
-                if course_data:
-                    return Course(
-                        id=course_data[0],
-                        codigo=course_data[1],
-                        nombre=course_data[2],
-                        creditos=int(course_data[3]) if course_data[3] else 0,
-                        requisitos=course_data[4],
-                        carrera=course_data[5],
-                        semestre=course_data[6],
-                    )
-                return None
+                return [row[0] for row in cursor.fetchall()]
 
-        return execute_with_retry(_get)
+        cursos = (_catalog.by_id(id_materia) for id_materia in execute_with_retry(_search))
+        return [curso for curso in cursos if curso is not None]
+
+    @staticmethod
+    def get_semestres(carrera=None):
+        """Semestres con materias registradas (opcionalmente de una carrera)."""
+        return _catalog.semestres(carrera)
 
     @staticmethod
-    def get_by_codigo(codigo):
-        """Obtiene una materia por su código."""
+    def get_carreras():
+        """Carreras con materias registradas."""
+        return _catalog.carreras()
 
-        def _get():
+    @staticmethod
+    def get_catalog_version():
+        """Versión actual del catálogo (cambia cada vez que se invalida)."""
+        return _catalog.version
+
+    @staticmethod
+    def invalidate_cache():
+        """Descarta el catálogo en memoria (tras modificar materias por fuera del modelo)."""
+        _catalog.invalidate()
+
+    @staticmethod
+    def import_curriculum(path):
+        """
+        Carga o actualiza un plan de estudios desde un CSV (mismo formato que
+        los de data/pensum) en una sola transacción. Retorna la cantidad de
+        materias insertadas o actualizadas.
+        """
+
+        def _import():
             with get_db_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    """
+                cargados = load_curriculum(conn, [path], forzar=True)
+                conn.commit()
+                return cargados[clave_archivo(path)]
+
+        materias = execute_with_retry(_import)
+        _catalog.invalidate()
+        return materias
+
+    @staticmethod
+    def _get_all_from_db():
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
                 SELECT id_materia, codigo, nombre, creditos, requisitos, carrera, semestre
                 FROM materias
-                WHERE codigo = ?
-                """,
-                    (codigo,),
-                )
-                course_data = cursor.fetchone()
-                if course_data:
-                    return Course(
+                """
+            )
+            courses = []
+            for course_data in cursor.fetchall():
+                courses.append(
+                    Course(
                         id=course_data[0],
                         codigo=course_data[1],
                         nombre=course_data[2],
@@ -104,39 +296,8 @@ class Course:
                         carrera=course_data[5],
                         semestre=course_data[6],
                     )
-                return None
-
-        return execute_with_retry(_get)
-
-    @staticmethod
-    def get_all():
-        """Obtiene todas las materias."""
-
-        def _get():
-            with get_db_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    """
-                    SELECT id_materia, codigo, nombre, creditos, requisitos, carrera, semestre
-                    FROM materias
-                    """
                 )
-                courses = []
-                for course_data in cursor.fetchall():
-                    courses.append(
-                        Course(
-                            id=course_data[0],
-                            codigo=course_data[1],
-                            nombre=course_data[2],
-                            creditos=int(course_data[3]) if course_data[3] else 0,
-                            requisitos=course_data[4],
-                            carrera=course_data[5],
-                            semestre=course_data[6],
-                        )
-                    )
-                return courses
-
-        return execute_with_retry(_get)
+            return courses
 
     def update(self, nombre=None, creditos=None, requisitos=None, carrera=None):
         """Actualiza los datos de la materia."""
@@ -169,7 +330,11 @@ class Course:
                 conn.commit()
                 return self
 
-        return execute_with_retry(_update)
+        try:
+            return execute_with_retry(_update)
+        finally:
+            # La instancia puede estar en el catálogo y ya fue modificada
+            _catalog.invalidate()
 
     def delete(self):
         """Elimina la materia de la base de datos."""
@@ -182,5 +347,6 @@ class Course:
                     (self.id,),
                 )
                 conn.commit()
+                _catalog.invalidate()
 
         return execute_with_retry(_delete)
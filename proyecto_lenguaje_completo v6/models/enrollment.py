@@ -159,6 +159,131 @@ class Enrollment:
 
         return execute_with_retry(_get)
 
+    # Resultados posibles de enroll_selection para cada sección
+    INSCRITA = "inscrita"
+    YA_INSCRITA = "ya_inscrita"
+    SIN_CUPO = "sin_cupo"
+    APROBADA = "aprobada"
+    NO_DISPONIBLE = "no_disponible"
+
+    @staticmethod
+    def enroll_selection(estudiante_id, secciones, semestre=None):
+        """
+        Inscribe al estudiante en todas las secciones indicadas dentro de una
+        sola transacción BEGIN IMMEDIATE, de modo que los cupos se cuentan y
+        se ocupan sin que otro inscriptor escriba en medio.
+
+        Cada inscripción es un INSERT condicional que solo ocurre si la sección
+        sigue activa, no está llena (resumen_ocupacion_secciones frente a
+        secciones.capacidad; los triggers la actualizan en la misma
+        transacción) y el
+        estudiante no está ya inscrito en ella. Si se indica semestre, también
+        se actualiza el del estudiante.
+
+        Retorna una lista de (id_seccion, codigo_materia, resultado).
+        """
+        secciones = list(dict.fromkeys(int(s) for s in secciones))
+
+        def _enroll():
+            with get_db_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("BEGIN IMMEDIATE")
+                try:
+                    marcadores = ", ".join("?" for _ in secciones)
+                    cursor.execute(
+                        f"""
+                        SELECT
+                            s.id_seccion,
+                            m.codigo,
+                            s.estado,
+                            EXISTS (
+                                SELECT 1 FROM inscripciones i
+                                WHERE i.id_seccion = s.id_seccion AND i.id_estudiante = ?
+                            ),
+                            EXISTS (
+                                SELECT 1 FROM materias_cursadas mc
+                                WHERE mc.id_estudiante = ? AND mc.id_materia = s.id_materia
+                                  AND mc.estado = 'APROBÓ'
+                            )
+                        FROM secciones s
+                        JOIN materias m ON s.id_materia = m.id_materia
+                        WHERE s.id_seccion IN ({marcadores})
+                        """,
+                        (estudiante_id, estudiante_id, *secciones),
+                    )
+                    info = {row[0]: row[1:] for row in cursor.fetchall()}
+
+                    resultados = []
+                    for id_seccion in secciones:
+                        if id_seccion not in info:
+                            resultados.append((id_seccion, None, Enrollment.NO_DISPONIBLE))
+                            continue
+                        codigo, estado, ya_inscrito, aprobada = info[id_seccion]
+                        if ya_inscrito:
+                            resultado = Enrollment.YA_INSCRITA
+                        elif aprobada:
+                            resultado = Enrollment.APROBADA
+                        elif estado != "activa":
+                            resultado = Enrollment.NO_DISPONIBLE
+                        else:
+                            # Solo inserta si quedan cupos en la sección
+                            cursor.execute(
+                                """
+                                INSERT INTO inscripciones (id_estudiante, id_seccion, fecha_inscripcion)
+                                SELECT ?, s.id_seccion, date('now')
+                                FROM secciones s
+                                WHERE s.id_seccion = ?
+                                  AND COALESCE((
+                                      SELECT o.inscritos FROM resumen_ocupacion_secciones o
+                                      WHERE o.id_seccion = s.id_seccion
+                                  ), 0) < COALESCE(s.capacidad, 30)
+                                """,
+                                (estudiante_id, id_seccion),
+                            )
+                            resultado = (
+                                Enrollment.INSCRITA
+                                if cursor.rowcount
+                                else Enrollment.SIN_CUPO
+                            )
+                        resultados.append((id_seccion, codigo, resultado))
+
+                    if semestre is not None:
+                        cursor.execute(
+                            "UPDATE estudiantes SET semestre = ? WHERE id_estudiante = ?",
+                            (semestre, estudiante_id),
+                        )
+                    conn.commit()
+                    return resultados
+                except Exception:
+                    conn.rollback()
+                    raise
+
+        return execute_with_retry(_enroll)
+
+    @staticmethod
+    def get_creditos_inscritos(estudiante_id, periodo=None):
+        """
+        Créditos (UC) inscritos por el estudiante, leídos de la tabla resumen
+        que mantienen los triggers. Sin período, suma todos los períodos.
+        """
+
+        def _get():
+            with get_db_connection() as conn:
+                cursor = conn.cursor()
+                if periodo is None:
+                    cursor.execute(
+                        "SELECT COALESCE(SUM(creditos), 0) FROM resumen_carga_estudiantes WHERE id_estudiante = ?",
+                        (estudiante_id,),
+                    )
+                else:
+                    cursor.execute(
+                        "SELECT COALESCE(SUM(creditos), 0) FROM resumen_carga_estudiantes WHERE id_estudiante = ? AND periodo = ?",
+                        (estudiante_id, periodo),
+                    )
+                return cursor.fetchone()[0]
+
+        return execute_with_retry(_get)
+
     @staticmethod
     def get_materias_inscritas(estudiante_id):
         def _get():
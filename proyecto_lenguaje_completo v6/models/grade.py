@@ -212,6 +212,34 @@ class Grade:
 
         return execute_with_retry(_save_or_update)
 
+    @staticmethod
+    def bulk_upsert(entries):
+        """
+        Guarda un lote de notas en una sola transacción.
+        entries: iterable de tuplas (inscripcion_id, tipo_evaluacion, valor_nota).
+        Usa INSERT ... ON CONFLICT sobre el índice único (id_inscripcion, tipo_evaluacion).
+        """
+        entries = list(entries)
+        if not entries:
+            return 0
+
+        def _upsert():
+            with get_db_connection() as conn:
+                cursor = conn.cursor()
+                cursor.executemany(
+                    """
+                INSERT INTO calificaciones (id_inscripcion, tipo_evaluacion, valor_nota, fecha_evaluacion)
+                VALUES (?, ?, ?, date('now'))
+                ON CONFLICT (id_inscripcion, tipo_evaluacion)
+                DO UPDATE SET valor_nota = excluded.valor_nota
+                """,
+                    entries,
+                )
+                conn.commit()
+                return len(entries)
+
+        return execute_with_retry(_upsert)
+
     @staticmethod
     def get_by_inscripcion(inscripcion_id):
         """Devuelve una lista de objetos Grade para una inscripción."""
@@ -241,6 +269,43 @@ class Grade:
 
         return execute_with_retry(_get)
 
+    @staticmethod
+    def get_gradebook_by_section(section_id):
+        """
+        Devuelve la planilla de notas completa de una sección en una sola consulta.
+        Cada fila es (id_inscripcion, cedula, nombre, apellido,
+        corte1, corte2, corte3, corte4, nota_def); las notas faltantes valen 0.
+        """
+
+        def _get():
+            with get_db_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    """
+                SELECT
+                    i.id_inscripcion,
+                    u.cedula,
+                    u.nombre,
+                    u.apellido,
+                    COALESCE(MAX(CASE WHEN c.tipo_evaluacion = 'corte1' THEN c.valor_nota END), 0),
+                    COALESCE(MAX(CASE WHEN c.tipo_evaluacion = 'corte2' THEN c.valor_nota END), 0),
+                    COALESCE(MAX(CASE WHEN c.tipo_evaluacion = 'corte3' THEN c.valor_nota END), 0),
+                    COALESCE(MAX(CASE WHEN c.tipo_evaluacion = 'corte4' THEN c.valor_nota END), 0),
+                    COALESCE(MAX(CASE WHEN c.tipo_evaluacion = 'nota_def' THEN c.valor_nota END), 0)
+                FROM inscripciones i
+                JOIN estudiantes e ON i.id_estudiante = e.id_estudiante
+                JOIN usuarios u ON e.id_usuario = u.id_usuario
+                LEFT JOIN calificaciones c ON c.id_inscripcion = i.id_inscripcion
+                WHERE i.id_seccion = ?
+                GROUP BY i.id_inscripcion
+                ORDER BY i.id_inscripcion
+                """,
+                    (section_id,),
+                )
+                return cursor.fetchall()
+
+        return execute_with_retry(_get)
+
     def delete(self):
         """Elimina la calificación de la base de datos."""
 
@@ -0,0 +1,191 @@
+import threading
+from models.course import Course
+from models.enrollment import Enrollment
+
+
+# Estados que devuelve eligible_courses
+APROBADA = "aprobada"
+INSCRITA = "inscrita"
+BLOQUEADA = "bloqueada"
+EXCEDE_UC = "excede_uc"
+DISPONIBLE = "disponible"
+
+CORREQUISITO_PREFIJO = "CO-"
+
+
+def parse_requisitos(requisitos):
+    """
+    Separa el texto de materias.requisitos ("A/B/CO-C") en dos tuplas:
+    (prerrequisitos, correquisitos).
+    """
+    prerrequisitos = []
+    correquisitos = []
+    for codigo in (requisitos or "").split("/"):
+        codigo = codigo.strip()
+        if not codigo:
+            continue
+        if codigo.startswith(CORREQUISITO_PREFIJO):
+            correquisitos.append(codigo[len(CORREQUISITO_PREFIJO) :])
+        else:
+            prerrequisitos.append(codigo)
+    return tuple(prerrequisitos), tuple(correquisitos)
+
+
+class PrerequisiteGraph:
+    """
+    Grafo de prerrequisitos y correquisitos de una carrera.
+
+    Se construye una sola vez a partir del catálogo de materias: los
+    requisitos quedan ya separados por materia, con sus cierres transitivos
+    y los ciclos detectados, de modo que evaluar la elegibilidad de todo el
+    pensum no vuelve a interpretar el texto de requisitos.
+    """
+
+    def __init__(self, cursos):
+        self.cursos = {c.codigo: c for c in cursos}
+        self.prerrequisitos = {}
+        self.correquisitos = {}
+        self.dependientes = {c.codigo: set() for c in cursos}
+        for curso in cursos:
+            pre, co = parse_requisitos(curso.requisitos)
+            self.prerrequisitos[curso.codigo] = pre
+            self.correquisitos[curso.codigo] = co
+            for codigo in pre:
+                self.dependientes.setdefault(codigo, set()).add(curso.codigo)
+
+        self.ciclos = self._find_cycles()
+        self._cierre = {}
+        for codigo in self.cursos:
+            self._transitive_prerequisites(codigo)
+        self.dependientes_transitivos = {codigo: set() for codigo in self.cursos}
+        for codigo, ancestros in self._cierre.items():
+            for ancestro in ancestros:
+                if ancestro in self.dependientes_transitivos:
+                    self.dependientes_transitivos[ancestro].add(codigo)
+
+    def _find_cycles(self):
+        """Retorna la lista de ciclos de prerrequisitos (cada uno como lista de códigos)."""
+        BLANCO, GRIS, NEGRO = 0, 1, 2
+        color = {codigo: BLANCO for codigo in self.cursos}
+        ciclos = []
+
+        for inicio in self.cursos:
+            if color[inicio] != BLANCO:
+                continue
+            # DFS iterativo: (nodo, iterador de prerrequisitos)
+            camino = [inicio]
+            pila = [(inicio, iter(self.prerrequisitos[inicio]))]
+            color[inicio] = GRIS
+            while pila:
+                nodo, hijos = pila[-1]
+                siguiente = next(hijos, None)
+                if siguiente is None:
+                    color[nodo] = NEGRO
+                    pila.pop()
+                    camino.pop()
+                elif siguiente not in color:
+                    continue  # requisito que no pertenece a esta carrera
+                elif color[siguiente] == GRIS:
+                    ciclos.append(camino[camino.index(siguiente) :] + [siguiente])
+                elif color[siguiente] == BLANCO:
+                    color[siguiente] = GRIS
+                    camino.append(siguiente)
+                    pila.append((siguiente, iter(self.prerrequisitos[siguiente])))
+        return ciclos
+
+    def _transitive_prerequisites(self, codigo):
+        if codigo in self._cierre:
+            return self._cierre[codigo]
+        # Marca provisional: si hay un ciclo, corta la recursión
+        self._cierre[codigo] = frozenset()
+        cierre = set()
+        for requisito in self.prerrequisitos.get(codigo, ()):
+            cierre.add(requisito)
+            cierre |= self._transitive_prerequisites(requisito)
+        cierre.discard(codigo)
+        self._cierre[codigo] = frozenset(cierre)
+        return self._cierre[codigo]
+
+    def transitive_prerequisites(self, codigo):
+        """Todas las materias que deben aprobarse antes de cursar 'codigo'."""
+        return self._cierre.get(codigo, frozenset())
+
+    def transitive_dependents(self, codigo):
+        """Todas las materias que dependen (directa o indirectamente) de 'codigo'."""
+        return frozenset(self.dependientes_transitivos.get(codigo, ()))
+
+    def describe(self, codigo):
+        """Texto legible de los requisitos de una materia (para reportes)."""
+        pre = self.prerrequisitos.get(codigo, ())
+        co = self.correquisitos.get(codigo, ())
+        partes = []
+        if pre:
+            partes.append(", ".join(pre))
+        if co:
+            partes.append("Correquisito: " + ", ".join(co))
+        return " / ".join(partes) if partes else "Ninguno"
+
+    def evaluate(self, aprobadas, inscritas_ids, tentativas=(), uc_disponibles=None):
+        """
+        Evalúa todas las materias de la carrera en una sola pasada.
+
+        aprobadas: códigos aprobados; inscritas_ids: id_materia con inscripción
+        activa; tentativas: códigos seleccionados pero aún no inscritos;
+        uc_disponibles: créditos que aún puede inscribir (None = sin límite).
+        Retorna {codigo: estado}.
+        """
+        tentativas = set(tentativas)
+        estados = {}
+        for codigo, curso in self.cursos.items():
+            if codigo in aprobadas:
+                estado = APROBADA
+            elif codigo in tentativas or curso.id in inscritas_ids:
+                estado = INSCRITA
+            elif any(r not in aprobadas for r in self.prerrequisitos[codigo]) or any(
+                r not in aprobadas and r not in tentativas
+                for r in self.correquisitos[codigo]
+            ):
+                estado = BLOQUEADA
+            elif uc_disponibles is not None and int(curso.creditos) > uc_disponibles:
+                estado = EXCEDE_UC
+            else:
+                estado = DISPONIBLE
+            estados[codigo] = estado
+        return estados
+
+    def eligible_courses(self, student_id, tentative_set=(), uc_disponibles=None):
+        """
+        Estado de cada materia de la carrera para el estudiante indicado.
+        Consulta sus materias aprobadas e inscripciones activas y evalúa todo
+        el pensum de una vez (ver evaluate).
+        """
+        aprobadas = set()
+        for cursada in Enrollment.get_materias_cursadas(student_id):
+            if cursada["estado"] == "APROBÓ":
+                curso = Course.get_by_id(cursada["id_materia"])
+                if curso:
+                    aprobadas.add(curso.codigo)
+        inscritas = Enrollment.get_materias_inscritas(student_id)
+        return self.evaluate(aprobadas, inscritas, tentative_set, uc_disponibles)
+
+
+_graphs = {}
+_graphs_lock = threading.Lock()
+
+
+def get_prerequisite_graph(carrera):
+    """
+    Retorna el grafo de la carrera, construyéndolo la primera vez. Se
+    reconstruye automáticamente cuando cambia el catálogo de materias.
+    """
+    clave = str(carrera or "").strip().lower()
+    version = Course.get_catalog_version()
+    with _graphs_lock:
+        cacheado = _graphs.get(clave)
+        if cacheado and cacheado[0] == version:
+            return cacheado[1]
+
+    grafo = PrerequisiteGraph(Course.get_by_carrera_semestre(carrera=carrera))
+    with _graphs_lock:
+        _graphs[clave] = (version, grafo)
+    return grafo
@@ -1,4 +1,10 @@
-from config.database import get_db_connection, execute_with_retry
+from config.database import (
+    get_db_connection,
+    execute_with_retry,
+    build_fts_query,
+    SEARCH_LIMIT,
+)
+from config.pagination import KeysetPager
 
 
 class Professor:
@@ -108,6 +114,38 @@ class Professor:
 
         return execute_with_retry(_get)
 
+    @staticmethod
+    def search(texto, carrera=None, limit=SEARCH_LIMIT):
+        """
+        Busca profesores por cédula, nombre, apellido o carrera usando el
+        índice FTS5 (prefijos, ordenados por relevancia). Retorna filas con
+        el mismo formato que get_all.
+        """
+        consulta = build_fts_query(texto)
+        if consulta is None:
+            return []
+
+        def _search():
+            with get_db_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    """
+                SELECT p.id_profesor, u.cedula, u.nombre, u.apellido,
+                       p.carrera, p.fecha_contratacion
+                FROM busqueda_usuarios f
+                JOIN usuarios u ON u.id_usuario = f.rowid
+                JOIN profesores p ON p.id_usuario = u.id_usuario
+                WHERE busqueda_usuarios MATCH ? AND f.rol = 'profesor'
+                  AND (? IS NULL OR p.carrera = ?)
+                ORDER BY f.rank
+                LIMIT ?
+                """,
+                    (consulta, carrera, carrera, limit),
+                )
+                return cursor.fetchall()
+
+        return execute_with_retry(_search)
+
     @staticmethod
     def get_all():
         """Obtiene todos los profesores con información de usuario."""
@@ -128,6 +166,30 @@ class Professor:
 
         return execute_with_retry(_get)
 
+    @staticmethod
+    def paged(carrera=None):
+        """
+        Fuente paginada del listado de profesores (columnas del listado, sin
+        el id), ordenable por cualquiera de sus columnas.
+        """
+        return KeysetPager(
+            """
+            SELECT u.cedula, u.nombre, u.apellido, p.carrera, p.fecha_contratacion
+            FROM profesores p
+            JOIN usuarios u ON p.id_usuario = u.id_usuario
+            """,
+            columnas={
+                "cedula": "u.cedula",
+                "nombre": "u.nombre",
+                "apellido": "u.apellido",
+                "carrera": "COALESCE(p.carrera, '')",
+                "fecha_contratacion": "COALESCE(p.fecha_contratacion, '')",
+            },
+            clave="u.id_usuario",
+            where="? IS NULL OR p.carrera = ?",
+            params=(carrera, carrera),
+        )
+
     @classmethod
     def update(cls, professor_id, carrera=None, fecha_contratacion=None):
         """Actualiza los datos del profesor."""
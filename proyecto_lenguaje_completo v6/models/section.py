@@ -107,13 +107,12 @@ class Section:
                         s.periodo,          -- 1: periodo
                         s.aula,             -- 2: aula
                         s.numero_seccion,   -- 3: sección
-                        COUNT(i.id_inscripcion) as estudiantes, -- 4: estudiantes
+                        COALESCE(o.inscritos, 0) as estudiantes, -- 4: estudiantes
                         s.id_seccion        -- 5: id_seccion
                     FROM secciones s
                     JOIN materias m ON s.id_materia = m.id_materia
-                    LEFT JOIN inscripciones i ON s.id_seccion = i.id_seccion
+                    LEFT JOIN resumen_ocupacion_secciones o ON o.id_seccion = s.id_seccion
                     WHERE s.id_profesor = ?
-                    GROUP BY s.id_seccion
                     ORDER BY s.periodo DESC, m.nombre
                     """,
                     (professor_id,),
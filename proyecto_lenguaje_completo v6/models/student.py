@@ -1,4 +1,10 @@
-from config.database import get_db_connection, execute_with_retry
+from config.database import (
+    get_db_connection,
+    execute_with_retry,
+    build_fts_query,
+    SEARCH_LIMIT,
+)
+from config.pagination import KeysetPager
 
 
 class Student:
@@ -93,6 +99,38 @@ class Student:
 
         return execute_with_retry(_get)
 
+    @staticmethod
+    def search(texto, carrera=None, limit=SEARCH_LIMIT):
+        """
+        Busca estudiantes por cédula, nombre, apellido o carrera usando el
+        índice FTS5 (prefijos, ordenados por relevancia). Retorna filas con
+        el mismo formato que get_all.
+        """
+        consulta = build_fts_query(texto)
+        if consulta is None:
+            return []
+
+        def _search():
+            with get_db_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    """
+                SELECT e.id_estudiante, u.cedula, u.nombre, u.apellido,
+                       e.carrera, e.semestre, e.fecha_ingreso
+                FROM busqueda_usuarios f
+                JOIN usuarios u ON u.id_usuario = f.rowid
+                JOIN estudiantes e ON e.id_usuario = u.id_usuario
+                WHERE busqueda_usuarios MATCH ? AND f.rol = 'alumno'
+                  AND (? IS NULL OR e.carrera = ?)
+                ORDER BY f.rank
+                LIMIT ?
+                """,
+                    (consulta, carrera, carrera, limit),
+                )
+                return cursor.fetchall()
+
+        return execute_with_retry(_search)
+
     @staticmethod
     def get_all():
         """Obtiene todos los estudiantes con información de usuario."""
@@ -113,6 +151,31 @@ class Student:
 
         return execute_with_retry(_get)
 
+    @staticmethod
+    def paged(carrera=None):
+        """
+        Fuente paginada del listado de estudiantes (columnas del listado, sin
+        el id), ordenable por cualquiera de sus columnas.
+        """
+        return KeysetPager(
+            """
+            SELECT u.cedula, u.nombre, u.apellido, e.carrera, e.semestre, e.fecha_ingreso
+            FROM estudiantes e
+            JOIN usuarios u ON e.id_usuario = u.id_usuario
+            """,
+            columnas={
+                "cedula": "u.cedula",
+                "nombre": "u.nombre",
+                "apellido": "u.apellido",
+                "carrera": "COALESCE(e.carrera, '')",
+                "semestre": "COALESCE(e.semestre, 0)",
+                "fecha_ingreso": "COALESCE(e.fecha_ingreso, '')",
+            },
+            clave="u.id_usuario",
+            where="? IS NULL OR e.carrera = ?",
+            params=(carrera, carrera),
+        )
+
     def update(self, carrera=None, semestre=None):
         """Actualiza los datos del estudiante."""
 
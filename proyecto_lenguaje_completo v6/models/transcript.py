@@ -0,0 +1,219 @@
+from collections import namedtuple
+
+from config.database import get_db_connection, execute_with_retry
+
+
+# Estados que cuentan como materia aprobada (los de la leyenda del record)
+ESTADOS_APROBADOS = ("APROBÓ", "REPITIÓ", "REPARACIÓN")
+
+# Record académico completo en una sola consulta. El historial de cada
+# estudiante son sus materias_cursadas o, si no tiene ninguna, sus
+# inscripciones con la nota definitiva. Sobre ese historial, con funciones
+# de ventana:
+# - intento: número de vez que se cursa la materia, con una sola ventana
+#   por materia ordenada por período (el nombre y los créditos se buscan
+#   después, así las ventanas ordenan filas cortas);
+# - la última vez (sin intento siguiente), si aprobó después de haber
+#   reprobado, queda REPITIÓ;
+# - créditos aprobados y promedios ponderados por créditos (solo materias
+#   con nota) del período y acumulado hasta el período inclusive;
+# - las materias van en orden cronológico (período, semestre de la
+#   materia, nombre) y las repeticiones juntas, donde la materia apareció
+#   por primera vez.
+_TRANSCRIPT_SQL = """
+WITH alumnos AS (
+    {alumnos}
+),
+historial AS (
+    SELECT mc.id_estudiante, mc.id_materia, mc.periodo, mc.nota_final AS nota,
+           mc.estado, mc.id_cursada AS fila
+    FROM materias_cursadas mc
+    WHERE mc.id_estudiante IN (SELECT id_estudiante FROM alumnos)
+    UNION ALL
+    SELECT i.id_estudiante, s.id_materia, COALESCE(s.periodo, ''), c.valor_nota,
+           CASE
+               WHEN c.valor_nota >= 10 THEN 'APROBÓ'
+               WHEN c.valor_nota IS NOT NULL THEN 'REPROBÓ'
+               ELSE 'EN CURSO'
+           END,
+           i.id_inscripcion
+    FROM inscripciones i
+    JOIN secciones s ON s.id_seccion = i.id_seccion
+    LEFT JOIN calificaciones c
+        ON c.id_inscripcion = i.id_inscripcion AND c.tipo_evaluacion = 'nota_def'
+    WHERE i.id_estudiante IN (SELECT id_estudiante FROM alumnos)
+      AND NOT EXISTS (
+          SELECT 1 FROM materias_cursadas mc WHERE mc.id_estudiante = i.id_estudiante
+      )
+),
+intentos AS (
+    SELECT h.*,
+           ROW_NUMBER() OVER materia AS intento,
+           LEAD(fila) OVER materia IS NULL AS ultimo,
+           SUM(estado = 'REPROBÓ') OVER materia AS reprobadas,
+           FIRST_VALUE(periodo) OVER materia AS primer_periodo
+    FROM historial h
+    WINDOW materia AS (PARTITION BY id_estudiante, id_materia ORDER BY periodo, fila)
+),
+resuelto AS (
+    SELECT i.*, m.codigo, m.nombre AS materia, m.creditos, m.semestre AS orden,
+           CASE
+               WHEN ultimo AND estado = 'APROBÓ' AND reprobadas > 0 THEN 'REPITIÓ'
+               ELSE estado
+           END AS estado_final,
+           CASE WHEN nota IS NOT NULL THEN nota * m.creditos END AS puntos,
+           CASE WHEN nota IS NOT NULL THEN m.creditos END AS creditos_con_nota
+    FROM intentos i
+    JOIN materias m ON m.id_materia = i.id_materia
+)
+SELECT id_estudiante, codigo, materia, creditos, periodo, nota, estado_final,
+       intento, intento > 1 OR NOT ultimo,
+       CASE WHEN estado_final IN ('APROBÓ', 'REPITIÓ', 'REPARACIÓN') THEN creditos ELSE 0 END,
+       SUM(puntos) OVER periodo / SUM(creditos_con_nota) OVER periodo,
+       SUM(puntos) OVER acumulado / SUM(creditos_con_nota) OVER acumulado
+FROM resuelto
+WINDOW acumulado AS (PARTITION BY id_estudiante ORDER BY periodo),
+       periodo AS (acumulado RANGE BETWEEN CURRENT ROW AND CURRENT ROW)
+ORDER BY id_estudiante, primer_periodo, orden, materia, id_materia, periodo, fila
+"""
+
+_SQL_ESTUDIANTE = _TRANSCRIPT_SQL.format(alumnos="SELECT :id_estudiante AS id_estudiante")
+_SQL_FILTRO = _TRANSCRIPT_SQL.format(
+    alumnos="""
+    SELECT id_estudiante FROM estudiantes
+    WHERE (:carrera IS NULL OR carrera = :carrera)
+      AND (:semestre IS NULL OR semestre = :semestre)
+    """
+)
+
+# Una materia del record. estado ya viene resuelto (REPITIÓ incluido);
+# intento es el número de vez que se cursa y repetida indica si se cursó más
+# de una vez. promedio_periodo y promedio_acumulado son ponderados por
+# créditos (None si todavía no hay notas).
+TranscriptEntry = namedtuple(
+    "TranscriptEntry",
+    [
+        "codigo",
+        "materia",
+        "creditos",
+        "periodo",
+        "nota",
+        "estado",
+        "intento",
+        "repetida",
+        "creditos_aprobados",
+        "promedio_periodo",
+        "promedio_acumulado",
+    ],
+)
+
+# Resumen de un período del record
+PeriodSummary = namedtuple(
+    "PeriodSummary",
+    ["periodo", "materias", "creditos", "creditos_aprobados", "promedio", "promedio_acumulado"],
+)
+
+
+class Transcript:
+    """
+    Record académico de un estudiante, ya resuelto por la base de datos
+    (ver _TRANSCRIPT_SQL): las entradas están en el orden del documento y
+    traen el estado final, las repeticiones y los promedios. Lo usan el
+    record académico en PDF y la pantalla del estudiante.
+    """
+
+    def __init__(self, entradas=()):
+        self.entradas = list(entradas)
+
+    def __iter__(self):
+        return iter(self.entradas)
+
+    def __len__(self):
+        return len(self.entradas)
+
+    @property
+    def total_creditos(self):
+        """Créditos de todas las materias cursadas (con repeticiones)."""
+        return sum(int(e.creditos) for e in self.entradas)
+
+    @property
+    def creditos_aprobados(self):
+        return sum(e.creditos_aprobados for e in self.entradas)
+
+    @property
+    def aprobadas(self):
+        return sum(1 for e in self.entradas if e.estado in ESTADOS_APROBADOS)
+
+    @property
+    def reprobadas(self):
+        return sum(1 for e in self.entradas if e.estado == "REPROBÓ")
+
+    @property
+    def promedio_general(self):
+        """Promedio simple de las notas (0 si no hay ninguna)."""
+        notas = [float(e.nota) for e in self.entradas if e.nota is not None]
+        return sum(notas) / len(notas) if notas else 0
+
+    @property
+    def promedio_ponderado(self):
+        """Promedio acumulado ponderado por créditos (None si no hay notas)."""
+        periodos = self.periodos()
+        return periodos[-1].promedio_acumulado if periodos else None
+
+    def periodos(self):
+        """Resumen por período, en orden cronológico."""
+        resumen = {}
+        for e in self.entradas:
+            actual = resumen.get(e.periodo)
+            if actual is None:
+                resumen[e.periodo] = PeriodSummary(
+                    e.periodo,
+                    1,
+                    int(e.creditos),
+                    e.creditos_aprobados,
+                    e.promedio_periodo,
+                    e.promedio_acumulado,
+                )
+            else:
+                resumen[e.periodo] = actual._replace(
+                    materias=actual.materias + 1,
+                    creditos=actual.creditos + int(e.creditos),
+                    creditos_aprobados=actual.creditos_aprobados + e.creditos_aprobados,
+                )
+        # Mismo orden que ORDER BY periodo en SQLite (NULL primero)
+        orden = sorted(resumen, key=lambda periodo: (periodo is not None, periodo or ""))
+        return [resumen[periodo] for periodo in orden]
+
+    @staticmethod
+    def get_by_student(estudiante_id):
+        """Record académico de un estudiante."""
+
+        def _get():
+            with get_db_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(_SQL_ESTUDIANTE, {"id_estudiante": estudiante_id})
+                return Transcript(TranscriptEntry(*fila[1:]) for fila in cursor)
+
+        return execute_with_retry(_get)
+
+    @staticmethod
+    def get_by_students(carrera=None, semestre=None):
+        """
+        Records de todos los estudiantes de una carrera y/o semestre (None =
+        sin filtro) en una sola consulta: {id_estudiante: Transcript}. Los
+        estudiantes sin historial no aparecen.
+        """
+
+        def _get():
+            with get_db_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(_SQL_FILTRO, {"carrera": carrera, "semestre": semestre})
+                records = {}
+                for fila in cursor:
+                    record = records.get(fila[0])
+                    if record is None:
+                        record = records[fila[0]] = Transcript()
+                    record.entradas.append(TranscriptEntry(*fila[1:]))
+                return records
+
+        return execute_with_retry(_get)
@@ -0,0 +1,306 @@
+import csv
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+from config.database import get_db_connection, execute_with_retry
+from utils.security import hash_password
+from utils.validators import validate_cedula, validate_password_strength
+
+
+# Filas por transacción (cada lote es un executemany por tabla)
+BATCH_SIZE = 5000
+# Con menos contraseñas distintas que esto no compensa arrancar procesos
+POOL_MIN_PASSWORDS = 2000
+
+ROLES_IMPORTABLES = ("alumno", "profesor", "coordinacion")
+# Contraseña inicial cuando el archivo no trae una (las mismas que usan las
+# altas individuales de profesores y coordinadores)
+DEFAULT_PASSWORDS = {
+    "alumno": "alumno123",
+    "profesor": "profesor123",
+    "coordinacion": "coordinador123",
+}
+SIN_ASIGNAR = "Sin asignar"
+
+_INSERT_ROL = {
+    "alumno": """
+        INSERT INTO estudiantes (id_usuario, carrera, semestre, fecha_ingreso)
+        VALUES (?, ?, ?, ?)
+    """,
+    "profesor": """
+        INSERT INTO profesores (id_usuario, carrera, fecha_contratacion)
+        VALUES (?, ?, ?)
+    """,
+    "coordinacion": """
+        INSERT INTO coordinadores (id_usuario, carrera, fecha_ingreso)
+        VALUES (?, ?, ?)
+    """,
+}
+
+
+class ImportResult:
+    """Resultado de una importación: contadores y errores por fila."""
+
+    def __init__(self):
+        self.leidas = 0
+        self.importadas = 0
+        self.errores = []  # (línea, cédula, mensaje)
+        self.segundos = 0.0
+
+    def add_error(self, linea, cedula, mensaje):
+        self.errores.append((linea, cedula, mensaje))
+
+    def write_errors(self, path):
+        """Escribe el reporte de errores en CSV (línea, cédula, error)."""
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["linea", "cedula", "error"])
+            writer.writerows(sorted(self.errores))
+
+    def summary(self):
+        return (
+            f"{self.importadas} de {self.leidas} filas importadas en "
+            f"{self.segundos:.1f} s ({len(self.errores)} con errores)"
+        )
+
+
+def read_rows(source, encoding="utf-8-sig"):
+    """
+    Lee el CSV fila por fila (sin cargarlo entero). source puede ser una
+    ruta o un archivo abierto. Genera (número de línea, diccionario) con los
+    nombres de columna en minúsculas.
+    """
+    f = open(source, newline="", encoding=encoding) if isinstance(source, str) else source
+    try:
+        reader = csv.DictReader(f)
+        if reader.fieldnames is None:
+            return
+        reader.fieldnames = [c.strip().lower() for c in reader.fieldnames]
+        for fila in reader:
+            yield reader.line_num, {
+                k: (v or "").strip() for k, v in fila.items() if k is not None
+            }
+    finally:
+        if f is not source:
+            f.close()
+
+
+def hash_passwords(passwords, workers=None):
+    """
+    Hashes de las contraseñas indicadas, como {contraseña: hash}. Cada
+    contraseña distinta se calcula una sola vez; con workers > 1 y muchas
+    contraseñas distintas el cálculo se reparte en un pool de procesos.
+    """
+    distintas = list(set(passwords))
+    if workers and workers > 1 and len(distintas) >= POOL_MIN_PASSWORDS:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            hashes = list(
+                pool.map(
+                    hash_password, distintas, chunksize=len(distintas) // workers + 1
+                )
+            )
+    else:
+        hashes = [hash_password(p) for p in distintas]
+    return dict(zip(distintas, hashes))
+
+
+def _fecha(valor):
+    datetime.strptime(valor, "%Y-%m-%d")
+    return valor
+
+
+class UserImporter:
+    """
+    Importación masiva de usuarios (estudiantes, profesores y
+    coordinadores) desde CSV.
+
+    Columnas: cedula, nombre, apellido y opcionalmente rol, carrera,
+    semestre, fecha (ingreso o contratación) y password. Si el archivo no
+    trae la columna rol se usa el rol indicado al crear el importador.
+
+    Las filas se validan y se insertan por lotes: los usuarios con un
+    executemany, luego sus filas de estudiantes/profesores/coordinadores con
+    otro, todo el lote en una transacción. Las filas inválidas no detienen la
+    importación; quedan en ImportResult.errores con su número de línea.
+    """
+
+    def __init__(self, rol=None, batch_size=BATCH_SIZE, workers=None, progress=None):
+        if rol is not None and rol not in ROLES_IMPORTABLES:
+            raise ValueError(f"Rol no importable: {rol}")
+        self.rol = rol
+        self.batch_size = batch_size
+        self.workers = workers
+        self.progress = progress
+        self._hoy = datetime.now().strftime("%Y-%m-%d")
+
+    def run(self, source):
+        """Importa el archivo (ruta o archivo abierto) y retorna un ImportResult."""
+        resultado = ImportResult()
+        inicio = time.perf_counter()
+        vistas = set()
+        lote = []
+        for linea, fila in read_rows(source):
+            resultado.leidas += 1
+            valido = self._validate(linea, fila, vistas, resultado)
+            if valido:
+                lote.append(valido)
+            if len(lote) >= self.batch_size:
+                self._import_batch(lote, resultado)
+                lote = []
+        if lote:
+            self._import_batch(lote, resultado)
+        resultado.segundos = time.perf_counter() - inicio
+        return resultado
+
+    def _validate(self, linea, fila, vistas, resultado):
+        """Normaliza la fila; retorna None (y registra el error) si no es válida."""
+        cedula = fila.get("cedula", "")
+        try:
+            if not all(fila.get(c) for c in ("cedula", "nombre", "apellido")):
+                raise ValueError("cedula, nombre y apellido son obligatorios")
+            if not validate_cedula(cedula):
+                raise ValueError("Cédula inválida")
+            if cedula in vistas:
+                raise ValueError("Cédula repetida en el archivo")
+            rol = (fila.get("rol") or self.rol or "").lower()
+            if rol not in ROLES_IMPORTABLES:
+                raise ValueError(f"Rol inválido: '{rol}'")
+            password = fila.get("password") or DEFAULT_PASSWORDS[rol]
+            if fila.get("password") and not validate_password_strength(password):
+                raise ValueError(
+                    "Contraseña débil (mínimo 8 caracteres, mayúscula, minúscula y número)"
+                )
+            semestre = None
+            if fila.get("semestre"):
+                semestre = int(fila["semestre"])
+                if not 1 <= semestre <= 12:
+                    raise ValueError("El semestre debe estar entre 1 y 12")
+            fecha = _fecha(fila["fecha"]) if fila.get("fecha") else self._hoy
+        except ValueError as e:
+            mensaje = str(e)
+            if mensaje.startswith("invalid literal"):
+                mensaje = "El semestre debe ser un número"
+            elif mensaje.startswith("time data"):
+                mensaje = "La fecha debe tener el formato AAAA-MM-DD"
+            resultado.add_error(linea, cedula, mensaje)
+            return None
+        vistas.add(cedula)
+        return {
+            "linea": linea,
+            "cedula": cedula,
+            "nombre": fila["nombre"].title(),
+            "apellido": fila["apellido"].title(),
+            "rol": rol,
+            "password": password,
+            "carrera": fila.get("carrera") or SIN_ASIGNAR,
+            "semestre": semestre,
+            "fecha": fecha,
+        }
+
+    def _import_batch(self, lote, resultado):
+        hashes = hash_passwords([f["password"] for f in lote], self.workers)
+
+        def _insert():
+            with get_db_connection() as conn:
+                cursor = conn.cursor()
+                # Reservar la escritura desde el inicio: el lote entra completo o nada
+                cursor.execute("BEGIN IMMEDIATE")
+                try:
+                    cedulas = json.dumps([f["cedula"] for f in lote])
+                    cursor.execute(
+                        """
+                        SELECT cedula FROM usuarios
+                        WHERE cedula IN (SELECT value FROM json_each(?))
+                        """,
+                        (cedulas,),
+                    )
+                    existentes = {row[0] for row in cursor.fetchall()}
+                    nuevas = [f for f in lote if f["cedula"] not in existentes]
+                    cursor.executemany(
+                        """
+                        INSERT INTO usuarios (cedula, nombre, apellido, contraseña_hash, rol)
+                        VALUES (?, ?, ?, ?, ?)
+                        """,
+                        [
+                            (
+                                f["cedula"],
+                                f["nombre"],
+                                f["apellido"],
+                                hashes[f["password"]],
+                                f["rol"],
+                            )
+                            for f in nuevas
+                        ],
+                    )
+                    cursor.execute(
+                        """
+                        SELECT cedula, id_usuario FROM usuarios
+                        WHERE cedula IN (SELECT value FROM json_each(?))
+                        """,
+                        (cedulas,),
+                    )
+                    ids = dict(cursor.fetchall())
+                    for rol, sql in _INSERT_ROL.items():
+                        filas = [f for f in nuevas if f["rol"] == rol]
+                        if not filas:
+                            continue
+                        if rol == "alumno":
+                            params = [
+                                (ids[f["cedula"]], f["carrera"], f["semestre"], f["fecha"])
+                                for f in filas
+                            ]
+                        else:
+                            params = [
+                                (ids[f["cedula"]], f["carrera"], f["fecha"])
+                                for f in filas
+                            ]
+                        cursor.executemany(sql, params)
+                    conn.commit()
+                except Exception:
+                    conn.rollback()
+                    raise
+            return existentes, len(nuevas)
+
+        existentes, importadas = execute_with_retry(_insert)
+        for f in lote:
+            if f["cedula"] in existentes:
+                resultado.add_error(
+                    f["linea"], f["cedula"], "La cédula ya está registrada en el sistema"
+                )
+        resultado.importadas += importadas
+        if self.progress:
+            self.progress(resultado.leidas, resultado.importadas)
+
+
+def import_users(source, rol=None, workers=None, progress=None):
+    """Atajo: importa el archivo con un UserImporter y retorna el resultado."""
+    return UserImporter(rol=rol, workers=workers, progress=progress).run(source)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Importa usuarios (estudiantes, profesores, coordinadores) desde CSV"
+    )
+    parser.add_argument("archivo", help="CSV con cedula, nombre, apellido, ...")
+    parser.add_argument("--rol", choices=ROLES_IMPORTABLES, help="rol si el CSV no trae la columna")
+    parser.add_argument("--errores", help="ruta del reporte de errores (CSV)")
+    parser.add_argument("--workers", type=int, help="procesos para calcular los hashes")
+    parser.add_argument("--lote", type=int, default=BATCH_SIZE, help="filas por transacción")
+    args = parser.parse_args()
+
+    from config.database import initialize_database
+
+    initialize_database()
+    resultado = UserImporter(args.rol, args.lote, args.workers).run(args.archivo)
+    print(resultado.summary())
+    if resultado.errores:
+        if args.errores:
+            resultado.write_errors(args.errores)
+            print(f"Reporte de errores: {args.errores}")
+        else:
+            for linea, cedula, mensaje in sorted(resultado.errores)[:50]:
+                print(f"  línea {linea} ({cedula or '-'}): {mensaje}")
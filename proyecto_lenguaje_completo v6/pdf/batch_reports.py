@@ -0,0 +1,213 @@
+import csv
+import io
+import os
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from config.database import get_db_connection, execute_with_retry, run_report
+from models.transcript import Transcript
+
+
+TIPOS = {
+    "record": "Record Académico",
+    "constancia": "Constancia de Estudio",
+}
+# Documentos por tarea enviada al pool: menos idas y vueltas entre procesos
+# sin dejar procesos ociosos al final del lote
+CHUNK_SIZE = 8
+
+# Estudiantes del lote, en el orden de los documentos
+_PLAN_ESTUDIANTES = """
+SELECT e.id_estudiante, u.cedula, u.nombre, u.apellido, e.carrera, e.semestre
+FROM estudiantes e
+JOIN usuarios u ON u.id_usuario = e.id_usuario
+WHERE (:carrera IS NULL OR e.carrera = :carrera)
+  AND (:semestre IS NULL OR e.semestre = :semestre)
+ORDER BY e.carrera, e.semestre, u.apellido, u.nombre, e.id_estudiante
+"""
+
+
+class BatchResult:
+    """Resultado de un lote: documentos generados y errores por estudiante."""
+
+    def __init__(self, destino):
+        self.destino = destino
+        self.total = 0
+        self.generados = 0
+        self.errores = []  # (cédula, nombre, mensaje)
+        self.segundos = 0.0
+
+    def write_errors(self, path):
+        """Escribe el reporte de errores en CSV (cédula, nombre, error)."""
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["cedula", "nombre", "error"])
+            writer.writerows(self.errores)
+
+    def summary(self):
+        return (
+            f"{self.generados} de {self.total} documentos generados en "
+            f"{self.segundos:.1f} s ({len(self.errores)} con errores)"
+        )
+
+
+def plan_batch(tipo, carrera=None, semestre=None):
+    """
+    Arma los trabajos del lote. Retorna una lista de (nombre_archivo,
+    student_data, records); records es el Transcript del estudiante (todos
+    salen de una sola consulta, ver Transcript.get_by_students) o None para
+    las constancias. Estudiantes y records se leen del mismo snapshot.
+    """
+    if tipo not in TIPOS:
+        raise ValueError(f"Tipo de documento desconocido: {tipo}")
+    params = {"carrera": carrera, "semestre": semestre}
+
+    def _plan():
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(_PLAN_ESTUDIANTES, params)
+            estudiantes = cursor.fetchall()
+        transcripts = Transcript.get_by_students(carrera, semestre) if tipo == "record" else {}
+        trabajos = []
+        for id_estudiante, cedula, nombre, apellido, carrera_e, semestre_e in estudiantes:
+            student_data = {
+                "cedula": cedula,
+                "nombre": nombre,
+                "apellido": apellido,
+                "carrera": carrera_e,
+                "semestre": semestre_e,
+            }
+            records = transcripts.get(id_estudiante, Transcript()) if tipo == "record" else None
+            trabajos.append((f"{tipo}_{cedula}.pdf", student_data, records))
+        return trabajos
+
+    return execute_with_retry(lambda: run_report(_plan))
+
+
+def _render_chunk(tipo, trabajos, usuario, carpeta):
+    """
+    Genera los documentos de un grupo de trabajos (se ejecuta en un proceso
+    del pool). Con carpeta=None los PDF se retornan en memoria (para el zip).
+    Retorna [(nombre_archivo, bytes o None, error o None)].
+    """
+    from pdf import reportesPDF
+
+    resultados = []
+    for nombre, student_data, records in trabajos:
+        destino = io.BytesIO() if carpeta is None else os.path.join(carpeta, nombre)
+        try:
+            if tipo == "record":
+                reportesPDF.generate_record_academico_report(
+                    destino, student_data, records, usuario, abrir=False
+                )
+            else:
+                reportesPDF.generate_constancia_estudio_report(
+                    destino, student_data, usuario, abrir=False
+                )
+        except Exception as e:
+            resultados.append((nombre, None, str(e) or e.__class__.__name__))
+            continue
+        resultados.append((nombre, destino.getvalue() if carpeta is None else None, None))
+    return resultados
+
+
+class BatchReportGenerator:
+    """
+    Genera records académicos o constancias de estudio para todos los
+    estudiantes de una carrera y/o semestre.
+
+    Los datos se leen con una sola consulta (plan_batch) y los PDF se
+    generan en un pool de procesos, en grupos de CHUNK_SIZE documentos, así
+    que el tiempo baja casi en proporción a los núcleos disponibles. El
+    destino es una carpeta o, si termina en .zip, un archivo zip (los PDF
+    ya vienen comprimidos y se guardan sin volver a comprimir). Un error en
+    un documento no detiene el lote: queda en BatchResult.errores.
+    """
+
+    def __init__(self, tipo, usuario, workers=None, progress=None):
+        if tipo not in TIPOS:
+            raise ValueError(f"Tipo de documento desconocido: {tipo}")
+        self.tipo = tipo
+        self.usuario = usuario
+        self.workers = workers or os.cpu_count() or 1
+        self.progress = progress
+
+    def run(self, destino, carrera=None, semestre=None):
+        resultado = BatchResult(destino)
+        inicio = time.perf_counter()
+        trabajos = plan_batch(self.tipo, carrera, semestre)
+        resultado.total = len(trabajos)
+        cedulas = {nombre: datos for nombre, datos, _ in trabajos}
+
+        en_zip = destino.lower().endswith(".zip")
+        if not en_zip:
+            os.makedirs(destino, exist_ok=True)
+        archivo = zipfile.ZipFile(destino, "w", zipfile.ZIP_STORED) if en_zip else None
+        try:
+            for nombre, contenido, error in self._render(trabajos, None if en_zip else destino):
+                if error:
+                    datos = cedulas[nombre]
+                    resultado.errores.append(
+                        (datos["cedula"], f"{datos['nombre']} {datos['apellido']}", error)
+                    )
+                else:
+                    if archivo is not None:
+                        archivo.writestr(nombre, contenido)
+                    resultado.generados += 1
+                if self.progress:
+                    self.progress(
+                        resultado.generados + len(resultado.errores), resultado.total
+                    )
+        finally:
+            if archivo is not None:
+                archivo.close()
+        resultado.segundos = time.perf_counter() - inicio
+        return resultado
+
+    def _render(self, trabajos, carpeta):
+        """Genera los resultados de _render_chunk a medida que terminan."""
+        grupos = [trabajos[i : i + CHUNK_SIZE] for i in range(0, len(trabajos), CHUNK_SIZE)]
+        if self.workers <= 1 or len(grupos) <= 1:
+            for grupo in grupos:
+                yield from _render_chunk(self.tipo, grupo, self.usuario, carpeta)
+            return
+        with ProcessPoolExecutor(max_workers=min(self.workers, len(grupos))) as pool:
+            pendientes = [
+                pool.submit(_render_chunk, self.tipo, grupo, self.usuario, carpeta)
+                for grupo in grupos
+            ]
+            for futuro in as_completed(pendientes):
+                yield from futuro.result()
+
+
+def generate_batch(tipo, destino, usuario, carrera=None, semestre=None, workers=None, progress=None):
+    """Atajo: genera el lote con un BatchReportGenerator y retorna el resultado."""
+    return BatchReportGenerator(tipo, usuario, workers, progress).run(destino, carrera, semestre)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Genera records académicos o constancias de estudio por lote"
+    )
+    parser.add_argument("tipo", choices=sorted(TIPOS))
+    parser.add_argument("destino", help="carpeta de salida o archivo .zip")
+    parser.add_argument("--carrera")
+    parser.add_argument("--semestre", type=int)
+    parser.add_argument("--workers", type=int, help="procesos (por defecto, uno por núcleo)")
+    parser.add_argument("--usuario", default="Control de Estudios")
+    args = parser.parse_args()
+
+    resultado = generate_batch(
+        args.tipo,
+        args.destino,
+        args.usuario,
+        args.carrera,
+        args.semestre,
+        args.workers,
+    )
+    print(resultado.summary())
+    for cedula, nombre, mensaje in resultado.errores[:50]:
+        print(f"  {cedula} ({nombre}): {mensaje}")
@@ -0,0 +1,212 @@
+import io
+import os
+import threading
+from datetime import datetime
+
+from reportlab.lib import colors
+from reportlab.lib.utils import ImageReader
+from reportlab.platypus import Image
+
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+LOGO_IZQUIERDO = os.path.join(BASE_DIR, "..", "img", "logo1.jpeg")
+LOGO_DERECHO = os.path.join(BASE_DIR, "..", "img", "logo3.jpeg")
+
+COLOR_TITULO = colors.HexColor("#1e293b")
+
+# Membretes: texto institucional, tamaño de letra y de los logos.
+# "listado": reportes de listados (estudiantes/profesores/materias por carrera);
+# "documento": record, constancia, planillas y reportes de coordinación;
+# "logos": solo los logos (el texto va en el cuerpo del documento).
+MEMBRETES = {
+    "listado": {
+        "lineas": (
+            "REPUBLICA BOLIVARIANA DE VENEZUELA",
+            "MINISTERIO DEL PODER POPULAR PARA LA DEFENSA",
+            "UNIVERSIDAD NACIONAL EXPERIMENTAL",
+            "POLITECNICA DE LAS FUERZAS ARMADAS",
+            "NUCLEO PTO. CABELLO - EDO. CARABOBO",
+        ),
+        "fuente": 10,
+        "logo": 100,
+        "logos_en_margen": False,
+    },
+    "documento": {
+        "lineas": (
+            "REPÚBLICA BOLIVARIANA DE VENEZUELA",
+            "MINISTERIO DEL PODER POPULAR PARA LA DEFENSA",
+            "UNIVERSIDAD NACIONAL EXPERIMENTAL POLITÉCNICA",
+            "DE LA FUERZA ARMADA NACIONAL BOLIVARIANA",
+            "NÚCLEO CARABOBO - SEDE PUERTO CABELLO",
+        ),
+        "fuente": 12,
+        "logo": 80,
+        "logos_en_margen": True,
+    },
+    "logos": {"lineas": (), "fuente": 12, "logo": 80, "logos_en_margen": True},
+}
+
+# Distancia (pt) desde el borde superior de la página a la primera línea
+_MARGEN_SUPERIOR = 62
+_INTERLINEADO = 15
+
+# Logos decodificados una sola vez por proceso (ruta -> ImageReader)
+_imagenes = {}
+_imagenes_lock = threading.Lock()
+
+
+def cached_image(path):
+    """
+    ImageReader de la imagen, leído y decodificado una sola vez por proceso.
+    Dibujar siempre el mismo objeto evita volver a leer el archivo en cada
+    página y cada reporte.
+    """
+    path = os.path.abspath(path)
+    with _imagenes_lock:
+        imagen = _imagenes.get(path)
+        if imagen is None:
+            imagen = ImageReader(path)
+            # Decodificar ya: drawImage calcula la firma de la imagen con estos datos
+            imagen.getRGBData()
+            _imagenes[path] = imagen
+        return imagen
+
+
+class ReportTemplate:
+    """
+    Encabezado y pie de página comunes de los reportes PDF.
+
+    El membrete (texto institucional, logos y, si se indican, el título y las
+    líneas de datos del reporte) se dibuja una sola vez por documento en un
+    form XObject (beginForm/endForm) y cada página que lo lleva solo lo
+    referencia con doForm, así que repetirlo en cientos de páginas no repite
+    su contenido. Los logos se toman de cached_image.
+
+    titulo: título grande bajo el membrete (None = sin título; el documento
+    lo pone en su cuerpo).
+    datos: líneas de texto bajo el título (fecha, usuario, totales...).
+    pie: texto del pie a la derecha (por defecto "Generado el <fecha>";
+    False = sin texto).
+    membrete: clave de MEMBRETES.
+    encabezado_en_todas: repetir el membrete en todas las páginas (por
+    defecto solo en la primera).
+    numerar: mostrar "Página N" a la izquierda del pie.
+
+    Uso: ReportTemplate(...).build(doc, elements), o pasar la instancia
+    como onFirstPage/onLaterPages de doc.build.
+    """
+
+    def __init__(
+        self,
+        titulo=None,
+        datos=(),
+        pie=None,
+        membrete="documento",
+        encabezado_en_todas=False,
+        numerar=True,
+    ):
+        self.titulo = titulo
+        self.datos = tuple(datos)
+        if pie is None:
+            pie = f"Generado el {datetime.now().strftime('%d/%m/%Y %H:%M')}"
+        self.pie = pie
+        self.membrete = MEMBRETES[membrete]
+        self.encabezado_en_todas = encabezado_en_todas
+        self.numerar = numerar
+        self._id = f"{membrete}{id(self)}"
+
+    def build(self, doc, elements):
+        """Construye el documento con este encabezado y pie."""
+        doc.build(elements, onFirstPage=self, onLaterPages=self)
+
+    def __call__(self, canvas, doc):
+        encabezado = doc.page == 1 or self.encabezado_en_todas
+        if not (encabezado or self.numerar or self.pie):
+            return
+        canvas.saveState()
+        if encabezado:
+            canvas.doForm(self._header_form(canvas, doc))
+        # El pie son dos textos cortos: dibujarlo ocupa menos que un form
+        canvas.setFont("Helvetica-Oblique", 8)
+        canvas.setFillColor(colors.grey)
+        if self.numerar:
+            canvas.drawString(doc.leftMargin, 30, f"Página {doc.page}")
+        if self.pie:
+            canvas.drawRightString(doc.leftMargin + doc.width, 30, self.pie)
+        canvas.restoreState()
+
+    def _header_form(self, canvas, doc):
+        """Nombre del form del membrete, creándolo la primera vez en este PDF."""
+        nombre = f"encabezado_{self._id}"
+        if not canvas._doc.hasForm(nombre):
+            canvas.beginForm(nombre)
+            self._draw_header(canvas, doc)
+            canvas.endForm()
+        return nombre
+
+    def _draw_header(self, canvas, doc):
+        ancho, alto = doc.pagesize
+        membrete = self.membrete
+        arriba = alto - _MARGEN_SUPERIOR
+        canvas.setFont("Helvetica-Bold", membrete["fuente"])
+        for i, linea in enumerate(membrete["lineas"]):
+            canvas.drawCentredString(ancho / 2, arriba - i * _INTERLINEADO, linea)
+
+        lado = membrete["logo"]
+        if membrete["logos_en_margen"]:
+            y = arriba - 50
+            x_izquierdo = doc.leftMargin - 20
+            x_derecho = doc.leftMargin + doc.width - 60
+        else:
+            y = arriba - 60
+            x_izquierdo = 30
+            x_derecho = ancho - 142
+        for imagen, x in ((LOGO_IZQUIERDO, x_izquierdo), (LOGO_DERECHO, x_derecho)):
+            canvas.drawImage(
+                cached_image(imagen),
+                x,
+                y,
+                width=lado,
+                height=lado,
+                preserveAspectRatio=True,
+                mask="auto",
+            )
+
+        if self.titulo:
+            canvas.setFont("Helvetica-Bold", 22)
+            canvas.setFillColor(COLOR_TITULO)
+            canvas.drawCentredString(ancho / 2, arriba - 100, self.titulo)
+            canvas.setFillColor(colors.black)
+        canvas.setFont("Helvetica", 12)
+        for i, linea in enumerate(self.datos):
+            canvas.drawString(30, arriba - 130 - i * 20, linea)
+
+
+def chart_image(nombre, etiquetas, valores, ancho=400):
+    """
+    Gráfico de barras de utils.charts (el mismo de la pantalla) como imagen
+    del reporte, con el ancho indicado en puntos.
+    """
+    # matplotlib solo se carga en los reportes que llevan gráfico
+    from utils.charts import CHARTS, chart_png
+
+    figura_ancho, figura_alto = CHARTS[nombre]["figsize"]
+    return Image(
+        io.BytesIO(chart_png(nombre, etiquetas, valores)),
+        width=ancho,
+        height=ancho * figura_alto / figura_ancho,
+    )
+
+
+def report_data(usuario, tipo, total=None):
+    """Líneas de datos habituales bajo el título (fecha, hora, usuario...)."""
+    ahora = datetime.now()
+    lineas = [
+        f"Fecha: {ahora.strftime('%Y-%m-%d')}",
+        f"Hora: {ahora.strftime('%H:%M:%S')}",
+        f"Usuario: {usuario}",
+        f"Tipo de Reporte: {tipo}",
+    ]
+    if total is not None:
+        lineas.append(total)
+    return lineas
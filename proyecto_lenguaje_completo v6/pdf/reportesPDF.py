@@ -4,78 +4,33 @@ from reportlab.lib import colors
 import os
 from reportlab.platypus import Table, TableStyle, SimpleDocTemplate, Spacer, PageBreak
 from config import database
-import datetime
 from reportlab.lib.styles import ParagraphStyle
 from reportlab.platypus import Paragraph
+from models.prerequisite_graph import get_prerequisite_graph
+from models.transcript import Transcript
+from pdf.report_template import ReportTemplate, chart_image, report_data
+from pdf.streaming_table import StreamingTable
 
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-imagen1 = os.path.join(BASE_DIR, "..", "img", "logo1.jpeg")
-imagen2 = os.path.join(BASE_DIR, "..", "img", "logo3.jpeg")
 
 
-def estudiantesPorCarrera(self, carreras, valores, fileName, usuario):
-    data = [["Nombre y Apellido", "Cédula", "Carrera", "Semestre"]]
-    estudiantes = database.get_all_estudiantes_info()
-    data.extend(estudiantes)
-
-    table = Table(data, colWidths=[160, 100, 130, 80])
-    style = TableStyle(
-        [
-            ("GRID", (0, 0), (-1, -1), 1, colors.black),
-            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-            ("FONTSIZE", (0, 0), (-1, 0), 12),
-            ("ALIGN", (0, 0), (-1, -1), "CENTER"),
-            ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#dbeafe")),
-            ("TEXTCOLOR", (0, 0), (-1, 0), colors.HexColor("#1e293b")),
-        ]
-        + [
-            (
-                "BACKGROUND",
-                (0, i),
-                (-1, i),
-                colors.whitesmoke if i % 2 == 0 else colors.lightgrey,
-            )
-            for i in range(1, len(data))
-        ]
+def estudiantesPorCarrera(self, carreras, valores, fileName, usuario, abrir=True):
+    style = [
+        ("GRID", (0, 0), (-1, -1), 1, colors.black),
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("FONTSIZE", (0, 0), (-1, 0), 12),
+        ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+        ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#dbeafe")),
+        ("TEXTCOLOR", (0, 0), (-1, 0), colors.HexColor("#1e293b")),
+    ]
+    # Las filas se leen de la base de datos a medida que se maqueta cada página
+    estudiantes = database.iter_all_estudiantes_info()
+    table = StreamingTable(
+        ["Nombre y Apellido", "Cédula", "Carrera", "Semestre"],
+        estudiantes,
+        colWidths=[160, 100, 130, 80],
+        style=style,
+        bandas=[colors.lightgrey, colors.whitesmoke],
     )
-    table.setStyle(style)
-
-    def encabezado(canvas, doc):
-        canvas.saveState()
-        canvas.setFont("Helvetica-Bold", 10)
-        canvas.drawCentredString(300, 730, "REPUBLICA BOLIVARIANA DE VENEZUELA")
-        canvas.drawCentredString(
-            300, 715, "MINISTERIO DEL PODER POPULAR PARA LA DEFENSA"
-        )
-        canvas.drawCentredString(300, 700, "UNIVERSIDAD NACIONAL EXPERIMENTAL")
-        canvas.drawCentredString(300, 685, "POLITECNICA DE LAS FUERZAS ARMADAS")
-        canvas.drawCentredString(300, 670, "NUCLEO PTO. CABELLO - EDO. CARABOBO")
-        canvas.drawImage(imagen1, 30, 670, width=100, height=100)
-        canvas.drawImage(imagen2, 470, 670, width=100, height=100)
-        canvas.setFont("Helvetica-Bold", 22)
-        canvas.setFillColor(colors.HexColor("#1e293b"))
-        canvas.drawCentredString(300, 630, "REPORTE DE ESTUDIANTES POR CARRERA")
-        canvas.setFillColor(colors.black)
-        canvas.setFont("Helvetica", 12)
-        now = datetime.datetime.now()
-        fecha_actual = now.strftime("%Y-%m-%d")
-        hora_actual = now.strftime("%H:%M:%S")
-        canvas.drawString(30, 600, f"Fecha: {fecha_actual}")
-        canvas.drawString(30, 580, f"Hora: {hora_actual}")
-        canvas.drawString(30, 560, f"Usuario: {usuario}")
-        canvas.drawString(30, 540, "Tipo de Reporte: Estudiantes por Carrera")
-        total_estudiantes = database.get_total_estudiantes()
-        canvas.drawString(30, 520, f"Total de Estudiantes: {total_estudiantes}")
-        canvas.restoreState()
-
-    def pie_pagina(canvas, doc):
-        canvas.saveState()
-        canvas.setFont("Helvetica-Oblique", 8)
-        canvas.setFillColor(colors.grey)
-        canvas.drawRightString(
-            570, 20, f"Generado el {datetime.datetime.now().strftime('%d/%m/%Y %H:%M')}"
-        )
-        canvas.restoreState()
 
     elements = []
     elements.append(Spacer(1, 260))  # Espacio entre encabezado y tabla
@@ -104,33 +59,41 @@ def estudiantesPorCarrera(self, carreras, valores, fileName, usuario):
 
     resumen_table = Table(resumen_data, colWidths=[220, 180])
     resumen_style = TableStyle(
-        [
-            ("GRID", (0, 0), (-1, -1), 1, colors.black),
-            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-            ("FONTSIZE", (0, 0), (-1, 0), 12),
-            ("ALIGN", (0, 0), (-1, -1), "CENTER"),
-            ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#dbeafe")),
-            ("TEXTCOLOR", (0, 0), (-1, 0), colors.HexColor("#1e293b")),
-        ]
+        style
         + [
             (
-                "BACKGROUND",
-                (0, i),
-                (-1, i),
-                colors.whitesmoke if i % 2 == 0 else colors.lightgrey,
+                "ROWBACKGROUNDS",
+                (0, 1),
+                (-1, -1),
+                [colors.lightgrey, colors.whitesmoke],
             )
-            for i in range(1, len(resumen_data))
         ]
     )
     resumen_table.setStyle(resumen_style)
     elements.append(resumen_table)
+    elements.append(Spacer(1, 20))
+    elements.append(chart_image("estudiantes_por_carrera", carreras, valores))
 
     doc = SimpleDocTemplate(fileName, pagesize=letter)
-    doc.build(elements, onFirstPage=encabezado, onLaterPages=pie_pagina)
-    os.startfile(fileName)
+    try:
+        ReportTemplate(
+            titulo="REPORTE DE ESTUDIANTES POR CARRERA",
+            datos=report_data(
+                usuario,
+                "Estudiantes por Carrera",
+                f"Total de Estudiantes: {database.get_total_estudiantes()}",
+            ),
+            membrete="listado",
+            numerar=False,
+        ).build(doc, elements)
+    finally:
+        # Liberar la conexión aunque el PDF falle a mitad de la tabla
+        estudiantes.close()
+    if abrir:
+        os.startfile(fileName)
 
 
-def profesoresPorCarrera(self, carreras, valores, fileName, usuario):
+def profesoresPorCarrera(self, carreras, valores, fileName, usuario, abrir=True):
     elements = []
     style = TableStyle(
         [
@@ -192,56 +155,28 @@ def profesoresPorCarrera(self, carreras, valores, fileName, usuario):
         if idx < len(carreras) - 1:
             elements.append(Spacer(1, 40))
 
-    def encabezado(canvas, doc):
-        canvas.saveState()
-        canvas.setFont("Helvetica-Bold", 10)
-        canvas.drawCentredString(300, 730, "REPUBLICA BOLIVARIANA DE VENEZUELA")
-        canvas.drawCentredString(
-            300, 715, "MINISTERIO DEL PODER POPULAR PARA LA DEFENSA"
-        )
-        canvas.drawCentredString(300, 700, "UNIVERSIDAD NACIONAL EXPERIMENTAL")
-        canvas.drawCentredString(300, 685, "POLITECNICA DE LAS FUERZAS ARMADAS")
-        canvas.drawCentredString(300, 670, "NUCLEO PTO. CABELLO - EDO. CARABOBO")
-        canvas.drawImage(imagen1, 30, 670, width=100, height=100)
-        canvas.drawImage(imagen2, 470, 670, width=100, height=100)
-        canvas.setFont("Helvetica-Bold", 22)
-        canvas.setFillColor(colors.HexColor("#1e293b"))
-        canvas.drawCentredString(300, 630, "REPORTE DE PROFESORES POR CARRERA")
-        canvas.setFillColor(colors.black)
-        canvas.setFont("Helvetica", 12)
-        now = datetime.datetime.now()
-        fecha_actual = now.strftime("%Y-%m-%d")
-        hora_actual = now.strftime("%H:%M:%S")
-        canvas.drawString(30, 600, f"Fecha: {fecha_actual}")
-        canvas.drawString(30, 580, f"Hora: {hora_actual}")
-        canvas.drawString(30, 560, f"Usuario: {usuario}")
-        canvas.drawString(30, 540, "Tipo de Reporte: Profesores por Carrera")
-        canvas.drawString(30, 520, f"Total de Profesores: {total_profesores}")
-        canvas.restoreState()
-
-    def pie_pagina(canvas, doc):
-        canvas.saveState()
-        canvas.setFont("Helvetica-Oblique", 8)
-        canvas.setFillColor(colors.grey)
-        canvas.drawRightString(
-            570, 20, f"Generado el {datetime.datetime.now().strftime('%d/%m/%Y %H:%M')}"
-        )
-        canvas.restoreState()
+    elements.append(Spacer(1, 40))
+    elements.append(chart_image("profesores_por_carrera", carreras, valores))
 
     doc = SimpleDocTemplate(fileName, pagesize=letter)
-    doc.build(elements, onFirstPage=encabezado, onLaterPages=pie_pagina)
-    os.startfile(fileName)
+    ReportTemplate(
+        titulo="REPORTE DE PROFESORES POR CARRERA",
+        datos=report_data(
+            usuario,
+            "Profesores por Carrera",
+            f"Total de Profesores: {total_profesores}",
+        ),
+        membrete="listado",
+        numerar=False,
+    ).build(doc, elements)
+    if abrir:
+        os.startfile(fileName)
 
 
 # estudiantes por materias apartado del profesor
 
 
-def estudiantesPorMaterias(self, resultado, fileName, usuario):
-    # --- DATOS DE LA TABLA ---
-    data = [["Nombre y Apellido", "Cedula", "Materia"]]
-    # Aquí podrías agregar una función en database.py para obtener todos los estudiantes ordenados por carrera y semestre
-    data.extend(resultado)
-
+def estudiantesPorMaterias(self, resultado, fileName, usuario, abrir=True):
     # Agrupar y contar estudiantes por materia
     materias_conteo = {}
     for row in resultado:
@@ -252,47 +187,17 @@ def estudiantesPorMaterias(self, resultado, fileName, usuario):
             materias_conteo[materia] = 0
         materias_conteo[materia] += 1
 
-    table = Table(data, colWidths=[150, 100, 120, 80])
-    style = TableStyle(
-        [
+    table = StreamingTable(
+        ["Nombre y Apellido", "Cedula", "Materia"],
+        resultado,
+        colWidths=[150, 100, 120, 80],
+        style=[
             ("GRID", (0, 0), (-1, -1), 0, colors.white),
             ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
             ("ALIGN", (0, 0), (-1, -1), "CENTER"),
             ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
-        ]
+        ],
     )
-    table.setStyle(style)
-
-    def encabezado(canvas, doc):
-        canvas.saveState()
-        canvas.setFont("Helvetica-Bold", 10)
-        canvas.drawCentredString(300, 730, "REPUBLICA BOLIVARIANA DE VENEZUELA")
-        canvas.drawCentredString(
-            300, 715, "MINISTERIO DEL PODER POPULAR PARA LA DEFENSA"
-        )
-        canvas.drawCentredString(300, 700, "UNIVERSIDAD NACIONAL EXPERIMENTAL")
-        canvas.drawCentredString(300, 685, "POLITECNICA DE LAS FUERZAS ARMADAS")
-        canvas.drawCentredString(300, 670, "NUCLEO PTO. CABELLO - EDO. CARABOBO")
-        canvas.drawImage(imagen1, 30, 670, width=100, height=100)
-        canvas.drawImage(imagen2, 470, 670, width=100, height=100)
-        canvas.setFont("Helvetica-Bold", 20)
-        canvas.drawCentredString(300, 630, "ESTUDIANTES POR MATERIA")
-        canvas.setFont("Helvetica", 12)
-        now = datetime.datetime.now()
-        fecha_actual = now.strftime("%Y-%m-%d")
-        hora_actual = now.strftime("%H:%M:%S")
-        canvas.drawString(30, 600, f"Fecha: {fecha_actual}")
-        canvas.drawString(30, 580, f"Hora: {hora_actual}")
-        canvas.drawString(
-            30, 560, f"Usuario: {usuario}"
-        )  # Cambia tipo_usuario por el usuario actual
-        canvas.drawString(30, 540, "Tipo de Reporte: Estudiantes por Materia")
-        total_estudiantes = len(resultado)
-        canvas.drawString(30, 520, f"Total de Estudiantes: {total_estudiantes}")
-        canvas.restoreState()
-
-    def sin_encabezado(canvas, doc):
-        pass
 
     elements = []
     elements.append(Spacer(1, 220))
@@ -319,12 +224,23 @@ def estudiantesPorMaterias(self, resultado, fileName, usuario):
     elements.append(resumen_table)
 
     doc = SimpleDocTemplate(fileName, pagesize=letter)
-    doc.build(elements, onFirstPage=encabezado, onLaterPages=sin_encabezado)
-
-    os.startfile(fileName)
-
-
-def materiasPorCarrera(self, fileName, usuario):
+    ReportTemplate(
+        titulo="ESTUDIANTES POR MATERIA",
+        datos=report_data(
+            usuario,
+            "Estudiantes por Materia",
+            f"Total de Estudiantes: {len(resultado)}",
+        ),
+        membrete="listado",
+        numerar=False,
+        pie=False,
+    ).build(doc, elements)
+
+    if abrir:
+        os.startfile(fileName)
+
+
+def materiasPorCarrera(self, fileName, usuario, abrir=True):
     carreras = database.get_carreras()
     materias_por_carrera = {}
     total_general = 0
@@ -344,45 +260,6 @@ def materiasPorCarrera(self, fileName, usuario):
             materias_por_carrera[carrera] = materias
             total_general += len(materias)
 
-    BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-    imagen1 = os.path.join(BASE_DIR, "..", "img", "logo1.jpeg")
-    imagen2 = os.path.join(BASE_DIR, "..", "img", "logo3.jpeg")
-
-    def encabezado(canvas, doc):
-        canvas.saveState()
-        canvas.setFont("Helvetica-Bold", 10)
-        canvas.drawCentredString(300, 730, "REPUBLICA BOLIVARIANA DE VENEZUELA")
-        canvas.drawCentredString(
-            300, 715, "MINISTERIO DEL PODER POPULAR PARA LA DEFENSA"
-        )
-        canvas.drawCentredString(300, 700, "UNIVERSIDAD NACIONAL EXPERIMENTAL")
-        canvas.drawCentredString(300, 685, "POLITECNICA DE LAS FUERZAS ARMADAS")
-        canvas.drawCentredString(300, 670, "NUCLEO PTO. CABELLO - EDO. CARABOBO")
-        canvas.drawImage(imagen1, 30, 670, width=100, height=100)
-        canvas.drawImage(imagen2, 470, 670, width=100, height=100)
-        canvas.setFont("Helvetica-Bold", 22)
-        canvas.setFillColor(colors.HexColor("#1e293b"))
-        canvas.drawCentredString(300, 630, "REPORTE DE MATERIAS POR CARRERA")
-        canvas.setFillColor(colors.black)
-        canvas.setFont("Helvetica", 12)
-        now = datetime.datetime.now()
-        fecha_actual = now.strftime("%Y-%m-%d")
-        hora_actual = now.strftime("%H:%M:%S")
-        canvas.drawString(30, 600, f"Fecha: {fecha_actual}")
-        canvas.drawString(30, 580, f"Hora: {hora_actual}")
-        canvas.drawString(30, 560, f"Usuario: {usuario}")
-        canvas.drawString(30, 540, "Tipo de Reporte: Materias por Carrera")
-        canvas.restoreState()
-
-    def pie_pagina(canvas, doc):
-        canvas.saveState()
-        canvas.setFont("Helvetica-Oblique", 8)
-        canvas.setFillColor(colors.grey)
-        canvas.drawRightString(
-            570, 20, f"Generado el {datetime.datetime.now().strftime('%d/%m/%Y %H:%M')}"
-        )
-        canvas.restoreState()
-
     elements = []
     elements.append(Spacer(1, 220))
 
@@ -453,8 +330,9 @@ def materiasPorCarrera(self, fileName, usuario):
                     Paragraph("Requisitos", requisitos_style),
                 ]
             ]
+            grafo = get_prerequisite_graph(carrera)
             for materia in materias_por_semestre[semestre]:
-                requisitos = materia[3] if materia[3] else "Ninguno"
+                requisitos = grafo.describe(materia[0])
                 # Usar Paragraph para salto de línea en requisitos largos
                 requisitos_paragraph = Paragraph(requisitos, requisitos_style)
                 data.append(
@@ -515,8 +393,14 @@ def materiasPorCarrera(self, fileName, usuario):
     elements.append(total_general_table)
 
     doc = SimpleDocTemplate(fileName, pagesize=letter, rightMargin=20, leftMargin=20)
-    doc.build(elements, onFirstPage=encabezado, onLaterPages=pie_pagina)
-    os.startfile(fileName)
+    ReportTemplate(
+        titulo="REPORTE DE MATERIAS POR CARRERA",
+        datos=report_data(usuario, "Materias por Carrera"),
+        membrete="listado",
+        numerar=False,
+    ).build(doc, elements)
+    if abrir:
+        os.startfile(fileName)
 
 
 def generar_comprobante_inscripcion_pdf(
@@ -628,46 +512,6 @@ def generar_comprobante_inscripcion_pdf(
     )
     elements = []
 
-    # Cargar imágenes
-    imagen1 = "img/logo1.jpeg"
-    imagen2 = "img/logo3.jpeg"
-
-    # --- Encabezado y Pie de Página ---
-    def header_footer(canvas, doc):
-        canvas.saveState()
-        # Solo mostrar encabezado en la primera página
-        if doc.page == 1:
-            # Logos
-            canvas.drawImage(
-                imagen1,
-                doc.leftMargin - 20,
-                680,
-                width=80,
-                height=80,
-                preserveAspectRatio=True,
-                mask="auto",
-            )
-            canvas.drawImage(
-                imagen2,
-                doc.width + doc.leftMargin - 60,
-                680,
-                width=80,
-                height=80,
-                preserveAspectRatio=True,
-                mask="auto",
-            )
-
-        # Pie de página (en todas las páginas)
-        canvas.setFont("Helvetica-Oblique", 8)
-        canvas.setFillColor(colors.grey)
-        canvas.drawString(doc.leftMargin, 30, f"Página {doc.page}")
-        canvas.drawRightString(
-            doc.width + doc.leftMargin,
-            30,
-            f"Generado el {datetime.now().strftime('%d/%m/%Y %H:%M')}",
-        )
-        canvas.restoreState()
-
     # Encabezado UNEFA serio
     elements.append(
         Paragraph("UNIVERSIDAD NACIONAL EXPERIMENTAL POLITÉCNICA", unefa_title_style)
@@ -771,7 +615,7 @@ def generar_comprobante_inscripcion_pdf(
     elements.append(Paragraph(f"Fecha de emisión: {fecha_actual}", verificacion_style))
     elements.append(Paragraph("Página 1/1", verificacion_style))
     elements.append(Spacer(1, 8))
-    doc.build(elements, onFirstPage=header_footer, onLaterPages=header_footer)
+    ReportTemplate(membrete="logos").build(doc, elements)
 
 
 def generar_reporte_notas_profesor(
@@ -782,6 +626,7 @@ def generar_reporte_notas_profesor(
     profesor_nombre,
     profesor_apellido,
     seccion_info,
+    abrir=True,
 ):
     from reportlab.lib.pagesizes import landscape, letter
     from reportlab.platypus import (
@@ -794,7 +639,6 @@ def generar_reporte_notas_profesor(
     from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
     from reportlab.lib import colors
     from reportlab.lib.units import inch
-    from datetime import datetime
 
     doc = SimpleDocTemplate(
         file_path,
@@ -851,55 +695,6 @@ def generar_reporte_notas_profesor(
         "Firma", fontName="Helvetica-Bold", fontSize=11, alignment=1
     )
 
-    # --- Encabezado y Pie de Página ---
-    def header_footer(canvas, doc):
-        canvas.saveState()
-        # Solo mostrar encabezado en la primera página
-        if doc.page == 1:
-            # Encabezado institucional grande
-            canvas.setFont("Helvetica-Bold", 13)
-            canvas.drawCentredString(415, 555, "REPÚBLICA BOLIVARIANA DE VENEZUELA")
-            canvas.drawCentredString(
-                415, 537, "MINISTERIO DEL PODER POPULAR PARA LA DEFENSA"
-            )
-            canvas.drawCentredString(
-                415, 519, "UNIVERSIDAD NACIONAL EXPERIMENTAL POLITÉCNICA"
-            )
-            canvas.drawCentredString(
-                415, 501, "DE LA FUERZA ARMADA NACIONAL BOLIVARIANA"
-            )
-            canvas.drawCentredString(415, 483, "NÚCLEO CARABOBO - SEDE PUERTO CABELLO")
-            # Logos grandes y alineados
-            canvas.drawImage(
-                imagen1,
-                doc.leftMargin - 20,
-                680,
-                width=80,
-                height=80,
-                preserveAspectRatio=True,
-                mask="auto",
-            )
-            canvas.drawImage(
-                imagen2,
-                doc.width + doc.leftMargin - 60,
-                680,
-                width=80,
-                height=80,
-                preserveAspectRatio=True,
-                mask="auto",
-            )
-
-        # Pie de página
-        canvas.setFont("Helvetica-Oblique", 8)
-        canvas.setFillColor(colors.grey)
-        canvas.drawString(doc.leftMargin, 30, f"Página {doc.page}")
-        canvas.drawRightString(
-            doc.width + doc.leftMargin,
-            30,
-            f"Generado el {datetime.now().strftime('%d/%m/%Y %H:%M')}",
-        )
-        canvas.restoreState()
-
     # --- Título ---
     elements.append(Spacer(1, 70))
     elements.append(Paragraph("PLANILLA DE REGISTRO DE CALIFICACIONES", style_title))
@@ -1038,21 +833,24 @@ def generar_reporte_notas_profesor(
     elements.append(firma_table)
 
     # --- Construir PDF ---
-    doc.build(elements, onFirstPage=header_footer, onLaterPages=header_footer)
-    os.startfile(file_path)
+    ReportTemplate().build(doc, elements)
+    if abrir:
+        os.startfile(file_path)
 
 
 def generate_record_academico_report(
-    file_path, student_data, academic_records, usuario
+    file_path, student_data, academic_records, usuario, abrir=True
 ):
     """
     Genera un reporte de record académico completo para un estudiante.
 
     Args:
-        file_path: Ruta donde guardar el PDF
+        file_path: Ruta donde guardar el PDF (o un archivo abierto en modo binario)
         student_data: Diccionario con datos del estudiante (cedula, nombre, apellido, carrera, semestre)
-        academic_records: Lista de tuplas con registros académicos (codigo, materia, creditos, periodo, nota_def, estado)
+        academic_records: Record académico (models.transcript.Transcript, o
+            sus TranscriptEntry en orden)
         usuario: Usuario que genera el reporte
+        abrir: Abrir el PDF al terminar (False en la generación por lote)
     """
     from reportlab.lib.pagesizes import letter
     from reportlab.platypus import (
@@ -1077,6 +875,11 @@ def generate_record_academico_report(
         bottomMargin=0.8 * inch,
     )
 
+    record = (
+        academic_records
+        if isinstance(academic_records, Transcript)
+        else Transcript(academic_records)
+    )
     elements = []
 
     # --- Estilos Profesionales ---
@@ -1137,55 +940,6 @@ def generate_record_academico_report(
         spaceAfter=10,
     )
 
-    # --- Encabezado y Pie de Página ---
-    def header_footer(canvas, doc):
-        canvas.saveState()
-        if doc.page == 1:
-            # Encabezado institucional
-            canvas.setFont("Helvetica-Bold", 12)
-            canvas.drawCentredString(300, 730, "REPÚBLICA BOLIVARIANA DE VENEZUELA")
-            canvas.drawCentredString(
-                300, 715, "MINISTERIO DEL PODER POPULAR PARA LA DEFENSA"
-            )
-            canvas.drawCentredString(
-                300, 700, "UNIVERSIDAD NACIONAL EXPERIMENTAL POLITÉCNICA"
-            )
-            canvas.drawCentredString(
-                300, 685, "DE LA FUERZA ARMADA NACIONAL BOLIVARIANA"
-            )
-            canvas.drawCentredString(300, 670, "NÚCLEO CARABOBO - SEDE PUERTO CABELLO")
-
-            # Logos
-            canvas.drawImage(
-                imagen1,
-                doc.leftMargin - 20,
-                680,
-                width=80,
-                height=80,
-                preserveAspectRatio=True,
-                mask="auto",
-            )
-            canvas.drawImage(
-                imagen2,
-                doc.width + doc.leftMargin - 60,
-                680,
-                width=80,
-                height=80,
-                preserveAspectRatio=True,
-                mask="auto",
-            )
-
-        # Pie de página (en todas las páginas)
-        canvas.setFont("Helvetica-Oblique", 8)
-        canvas.setFillColor(colors.grey)
-        canvas.drawString(doc.leftMargin, 30, f"Página {doc.page}")
-        canvas.drawRightString(
-            doc.width + doc.leftMargin,
-            30,
-            f"Generado el {datetime.now().strftime('%d/%m/%Y %H:%M')}",
-        )
-        canvas.restoreState()
-
     # --- Título Principal ---
     elements.append(Spacer(1, 60))
     elements.append(Paragraph("RECORD ACADÉMICO", style_title))
@@ -1251,7 +1005,7 @@ def generate_record_academico_report(
     elements.append(Spacer(1, 25))
 
     # --- Tabla de Registros Académicos ---
-    if academic_records:
+    if record:
         elements.append(Paragraph("HISTORIAL ACADÉMICO", style_subtitle))
         elements.append(Spacer(1, 10))
 
@@ -1267,78 +1021,22 @@ def generate_record_academico_report(
         ]
         data = [[Paragraph(h, style_table_header) for h in headers]]
 
-        # --- NUEVA LÓGICA PARA DETECTAR REPITENCIAS ---
-        # Creamos un diccionario para agrupar las materias por código
-        materias_por_codigo = {}
-        for rec in academic_records:
-            codigo = rec[0]
-            if codigo not in materias_por_codigo:
-                materias_por_codigo[codigo] = []
-            materias_por_codigo[codigo].append(rec)
-
-        # Creamos una nueva lista para los registros con el estado corregido
-        academic_records_corregido = []
-        for codigo, repeticiones in materias_por_codigo.items():
-            if len(repeticiones) > 1:
-                # Ordenar por periodo (por si acaso)
-                repeticiones_ordenadas = sorted(repeticiones, key=lambda x: x[3])
-                for i, rec in enumerate(repeticiones_ordenadas):
-                    # Si es la última vez y el estado es 'APROBÓ', pero antes hubo un 'REPROBÓ', poner 'REPITIÓ'
-                    if i == len(repeticiones_ordenadas) - 1 and rec[5] == "APROBÓ":
-                        hubo_reprobado = any(
-                            r[5] == "REPROBÓ" for r in repeticiones_ordenadas[:-1]
-                        )
-                        if hubo_reprobado:
-                            # Cambiamos el estado a 'REPITIÓ'
-                            rec = list(rec)
-                            rec[5] = "REPITIÓ"
-                            rec = tuple(rec)
-                    academic_records_corregido.append(rec)
-            else:
-                academic_records_corregido.append(repeticiones[0])
-
-        # Datos de las materias
-        total_creditos = 0
-        materias_aprobadas = 0
-        materias_reprobadas = 0
-        promedio_general = 0
-        suma_notas = 0
-        materias_con_nota = 0
-
-        for idx, record in enumerate(academic_records_corregido, 1):
-            codigo, materia, creditos, periodo, nota_def, estado = record
-
-            # Calcular estadísticas
-            total_creditos += int(creditos)
-            if estado == "APROBÓ" or estado == "REPITIÓ":
-                materias_aprobadas += 1
-            elif estado == "REPROBÓ":
-                materias_reprobadas += 1
-
-            if nota_def is not None:
-                suma_notas += float(nota_def)
-                materias_con_nota += 1
-
-            # Formatear nota
-            nota_str = f"{nota_def:.2f}" if nota_def is not None else "-"
-
+        # El record ya viene resuelto (orden, REPITIÓ, promedios): ver
+        # models.transcript
+        for idx, entrada in enumerate(record, 1):
+            nota_str = f"{entrada.nota:.2f}" if entrada.nota is not None else "-"
             data.append(
                 [
                     Paragraph(str(idx), style_cell),
-                    Paragraph(codigo, style_cell),
-                    Paragraph(materia.upper(), style_cell_left),
-                    Paragraph(str(creditos), style_cell),
-                    Paragraph(periodo, style_cell),
+                    Paragraph(entrada.codigo, style_cell),
+                    Paragraph(entrada.materia.upper(), style_cell_left),
+                    Paragraph(str(entrada.creditos), style_cell),
+                    Paragraph(entrada.periodo, style_cell),
                     Paragraph(nota_str, style_cell),
-                    Paragraph(estado if estado else "-", style_cell),
+                    Paragraph(entrada.estado if entrada.estado else "-", style_cell),
                 ]
             )
 
-        # Calcular promedio general
-        promedio_general = (
-            suma_notas / materias_con_nota if materias_con_nota > 0 else 0
-        )
-
         # Crear tabla
         col_widths = [
             0.4 * inch,  # Nº
@@ -1383,29 +1081,38 @@ def generate_record_academico_report(
         summary_data = [
             [
                 Paragraph("<b>Total de Materias Cursadas:</b>", style_label),
-                Paragraph(str(len(academic_records)), style_value),
+                Paragraph(str(len(record)), style_value),
                 Paragraph("<b>Total de Créditos:</b>", style_label),
-                Paragraph(str(total_creditos), style_value),
+                Paragraph(str(record.total_creditos), style_value),
             ],
             [
                 Paragraph("<b>Materias Aprobadas:</b>", style_label),
-                Paragraph(str(materias_aprobadas), style_value),
+                Paragraph(str(record.aprobadas), style_value),
                 Paragraph("<b>Materias Reprobadas:</b>", style_label),
-                Paragraph(str(materias_reprobadas), style_value),
+                Paragraph(str(record.reprobadas), style_value),
             ],
             [
-                Paragraph("<b>Promedio General:</b>", style_label),
-                Paragraph(f"{promedio_general:.2f}", style_value),
-                Paragraph("<b>Porcentaje de Aprobación:</b>", style_label),
+                Paragraph("<b>Créditos Aprobados:</b>", style_label),
+                Paragraph(str(record.creditos_aprobados), style_value),
+                Paragraph("<b>Promedio Ponderado:</b>", style_label),
                 Paragraph(
                     (
-                        f"{(materias_aprobadas / len(academic_records) * 100):.1f}%"
-                        if len(academic_records) > 0
-                        else "0%"
+                        f"{record.promedio_ponderado:.2f}"
+                        if record.promedio_ponderado is not None
+                        else "-"
                     ),
                     style_value,
                 ),
             ],
+            [
+                Paragraph("<b>Promedio General:</b>", style_label),
+                Paragraph(f"{record.promedio_general:.2f}", style_value),
+                Paragraph("<b>Porcentaje de Aprobación:</b>", style_label),
+                Paragraph(
+                    f"{(record.aprobadas / len(record) * 100):.1f}%",
+                    style_value,
+                ),
+            ],
         ]
 
         summary_table = Table(
@@ -1479,18 +1186,20 @@ def generate_record_academico_report(
         )
 
     # --- Construir PDF ---
-    doc.build(elements, onFirstPage=header_footer, onLaterPages=header_footer)
-    os.startfile(file_path)
+    ReportTemplate().build(doc, elements)
+    if abrir:
+        os.startfile(file_path)
 
 
-def generate_constancia_estudio_report(file_path, student_data, usuario):
+def generate_constancia_estudio_report(file_path, student_data, usuario, abrir=True):
     """
     Genera una constancia de estudio para un estudiante.
 
     Args:
-        file_path: Ruta donde guardar el PDF
+        file_path: Ruta donde guardar el PDF (o un archivo abierto en modo binario)
         student_data: Diccionario con datos del estudiante (cedula, nombre, apellido, carrera, semestre)
         usuario: Usuario que genera el reporte
+        abrir: Abrir el PDF al terminar (False en la generación por lote)
     """
     from reportlab.lib.pagesizes import letter
     from reportlab.platypus import (
@@ -1572,56 +1281,6 @@ def generate_constancia_estudio_report(file_path, student_data, usuario):
         spaceAfter=5,
     )
 
-    # --- Encabezado y Pie de Página ---
-    def header_footer(canvas, doc):
-        canvas.saveState()
-        # Solo mostrar encabezado en la primera página
-        if doc.page == 1:
-            # Encabezado institucional
-            canvas.setFont("Helvetica-Bold", 12)
-            canvas.drawCentredString(300, 730, "REPÚBLICA BOLIVARIANA DE VENEZUELA")
-            canvas.drawCentredString(
-                300, 715, "MINISTERIO DEL PODER POPULAR PARA LA DEFENSA"
-            )
-            canvas.drawCentredString(
-                300, 700, "UNIVERSIDAD NACIONAL EXPERIMENTAL POLITÉCNICA"
-            )
-            canvas.drawCentredString(
-                300, 685, "DE LA FUERZA ARMADA NACIONAL BOLIVARIANA"
-            )
-            canvas.drawCentredString(300, 670, "NÚCLEO CARABOBO - SEDE PUERTO CABELLO")
-
-            # Logos
-            canvas.drawImage(
-                imagen1,
-                doc.leftMargin - 20,
-                680,
-                width=80,
-                height=80,
-                preserveAspectRatio=True,
-                mask="auto",
-            )
-            canvas.drawImage(
-                imagen2,
-                doc.width + doc.leftMargin - 60,
-                680,
-                width=80,
-                height=80,
-                preserveAspectRatio=True,
-                mask="auto",
-            )
-
-        # Pie de página
-        canvas.setFont("Helvetica-Oblique", 8)
-        canvas.setFillColor(colors.grey)
-        canvas.drawString(doc.leftMargin, 30, f"Página {doc.page}")
-        canvas.drawRightString(
-            doc.width + doc.leftMargin,
-            30,
-            f"Generado el {datetime.now().strftime('%d/%m/%Y %H:%M')}",
-        )
-        canvas.restoreState()
-
     # --- Título Principal ---
     elements.append(Spacer(1, 60))
     elements.append(Paragraph("CONSTANCIA DE ESTUDIO", style_title))
@@ -1724,12 +1383,13 @@ def generate_constancia_estudio_report(file_path, student_data, usuario):
     elements.append(signature_table)
 
     # --- Construir PDF ---
-    doc.build(elements, onFirstPage=header_footer, onLaterPages=header_footer)
-    os.startfile(file_path)
+    ReportTemplate().build(doc, elements)
+    if abrir:
+        os.startfile(file_path)
 
 
 def generate_students_by_semester_report(
-    file_path, students_by_semester, carrera, usuario
+    file_path, students_by_semester, carrera, usuario, abrir=True
 ):
     """
     Genera un reporte de estudiantes agrupados por semestre, filtrado por carrera.
@@ -1739,19 +1399,17 @@ def generate_students_by_semester_report(
         students_by_semester: Diccionario con semestres como claves y listas de estudiantes como valores
         carrera: Nombre de la carrera del coordinador
         usuario: Usuario que genera el reporte
+        abrir: Abrir el PDF al terminar
     """
     from reportlab.lib.pagesizes import letter
     from reportlab.platypus import (
         SimpleDocTemplate,
         Paragraph,
         Spacer,
-        Table,
-        TableStyle,
     )
     from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
     from reportlab.lib import colors
     from reportlab.lib.units import inch
-    from datetime import datetime
     import os
 
     doc = SimpleDocTemplate(
@@ -1765,10 +1423,6 @@ def generate_students_by_semester_report(
 
     elements = []
 
-    # Cargar imágenes
-    imagen1 = "img/logo1.jpeg"
-    imagen2 = "img/logo3.jpeg"
-
     # Estilos
     style_title = ParagraphStyle(
         "Title",
@@ -1788,13 +1442,7 @@ def generate_students_by_semester_report(
         textColor=colors.HexColor("#1e293b"),
         leading=16,
     )
-    style_table_header = ParagraphStyle(
-        "TableHeader",
-        fontName="Helvetica-Bold",
-        fontSize=10,
-        alignment=1,
-        textColor=colors.white,
-    )
+    # Solo para las celdas que no caben en una línea (ver StreamingTable)
     style_cell = ParagraphStyle(
         "Cell",
         fontName="Helvetica",
@@ -1813,56 +1461,31 @@ def generate_students_by_semester_report(
         spaceAfter=0,
         leading=11,
     )
-
-    # --- Encabezado y Pie de Página ---
-    def header_footer(canvas, doc):
-        canvas.saveState()
-        # Solo mostrar encabezado en la primera página
-        if doc.page == 1:
-            # Encabezado institucional
-            canvas.setFont("Helvetica-Bold", 12)
-            canvas.drawCentredString(300, 730, "REPÚBLICA BOLIVARIANA DE VENEZUELA")
-            canvas.drawCentredString(
-                300, 715, "MINISTERIO DEL PODER POPULAR PARA LA DEFENSA"
-            )
-            canvas.drawCentredString(
-                300, 700, "UNIVERSIDAD NACIONAL EXPERIMENTAL POLITÉCNICA"
-            )
-            canvas.drawCentredString(
-                300, 685, "DE LA FUERZA ARMADA NACIONAL BOLIVARIANA"
-            )
-            canvas.drawCentredString(300, 670, "NÚCLEO CARABOBO - SEDE PUERTO CABELLO")
-
-            # Logos
-            canvas.drawImage(
-                imagen1,
-                doc.leftMargin - 20,
-                680,
-                width=80,
-                height=80,
-                preserveAspectRatio=True,
-                mask="auto",
-            )
-            canvas.drawImage(
-                imagen2,
-                doc.width + doc.leftMargin - 60,
-                680,
-                width=80,
-                height=80,
-                preserveAspectRatio=True,
-                mask="auto",
-            )
-
-        # Pie de página (en todas las páginas)
-        canvas.setFont("Helvetica-Oblique", 8)
-        canvas.setFillColor(colors.grey)
-        canvas.drawString(doc.leftMargin, 30, f"Página {doc.page}")
-        canvas.drawRightString(
-            doc.width + doc.leftMargin,
-            30,
-            f"Generado el {datetime.now().strftime('%d/%m/%Y %H:%M')}",
-        )
-        canvas.restoreState()
+    table_style = [
+        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+        ("GRID", (0, 0), (-1, -1), 0.7, colors.HexColor("#1e293b")),
+        ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#1e293b")),
+        ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("FONTSIZE", (0, 0), (-1, 0), 10),
+        ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
+        ("FONTSIZE", (0, 1), (-1, -1), 9),
+        ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+        ("ALIGN", (2, 1), (2, -1), "LEFT"),
+        ("LEFTPADDING", (2, 1), (2, -1), 6),
+        ("BACKGROUND", (0, 1), (-1, -1), colors.white),
+        ("TEXTCOLOR", (0, 1), (-1, -1), colors.black),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 3),
+        ("TOPPADDING", (0, 0), (-1, -1), 3),
+    ]
+    headers = ["Nº", "CÉDULA", "NOMBRES Y APELLIDOS", "CARRERA", "SEMESTRE"]
+    col_widths = [
+        0.4 * inch,  # Nº
+        1.0 * inch,  # CÉDULA
+        3.0 * inch,  # NOMBRES Y APELLIDOS
+        1.5 * inch,  # CARRERA
+        1.0 * inch,  # SEMESTRE
+    ]
 
     # --- Título Principal ---
     elements.append(Spacer(1, 60))
@@ -1883,63 +1506,28 @@ def generate_students_by_semester_report(
         elements.append(Spacer(1, 10))
 
         if estudiantes:
-            # Headers de la tabla
-            headers = [
-                "Nº",
-                "CÉDULA",
-                "NOMBRES Y APELLIDOS",
-                "CARRERA",
-                "SEMESTRE",
-            ]
-            data = [[Paragraph(h, style_table_header) for h in headers]]
-
-            # Datos de los estudiantes
-            for idx, estudiante in enumerate(estudiantes, 1):
-                data.append(
-                    [
-                        Paragraph(str(idx), style_cell),
-                        Paragraph(f"V-{estudiante['cedula']}", style_cell),
-                        Paragraph(
-                            f"{estudiante['nombre'].upper()} {estudiante['apellido'].upper()}",
-                            style_cell_left,
-                        ),
-                        Paragraph(estudiante["carrera"], style_cell),
-                        Paragraph(str(estudiante["semestre"]), style_cell),
-                    ]
+            filas = (
+                (
+                    idx,
+                    f"V-{estudiante['cedula']}",
+                    f"{estudiante['nombre'].upper()} {estudiante['apellido'].upper()}",
+                    estudiante["carrera"],
+                    estudiante["semestre"],
                 )
-
-            # Crear tabla
-            col_widths = [
-                0.4 * inch,  # Nº
-                1.0 * inch,  # CÉDULA
-                3.0 * inch,  # NOMBRES Y APELLIDOS
-                1.5 * inch,  # CARRERA
-                1.0 * inch,  # SEMESTRE
-            ]
-
-            table = Table(data, colWidths=col_widths, hAlign="CENTER")
-            table.setStyle(
-                TableStyle(
-                    [
-                        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-                        ("GRID", (0, 0), (-1, -1), 0.7, colors.HexColor("#1e293b")),
-                        ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#1e293b")),
-                        ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
-                        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                        ("FONTSIZE", (0, 0), (-1, 0), 10),
-                        ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
-                        ("FONTSIZE", (0, 1), (-1, -1), 9),
-                        ("ALIGN", (0, 1), (0, -1), "CENTER"),
-                        ("ALIGN", (2, 1), (2, -1), "LEFT"),
-                        ("LEFTPADDING", (2, 1), (2, -1), 6),
-                        ("BACKGROUND", (0, 1), (-1, -1), colors.white),
-                        ("TEXTCOLOR", (0, 1), (-1, -1), colors.black),
-                        ("BOTTOMPADDING", (0, 0), (-1, -1), 3),
-                        ("TOPPADDING", (0, 0), (-1, -1), 3),
-                    ]
+                for idx, estudiante in enumerate(estudiantes, 1)
+            )
+            elements.append(
+                StreamingTable(
+                    headers,
+                    filas,
+                    colWidths=col_widths,
+                    style=table_style,
+                    wrap_styles={
+                        2: style_cell_left,
+                        3: style_cell,
+                    },
                 )
             )
-            elements.append(table)
         else:
             # Si no hay estudiantes en este semestre
             elements.append(
@@ -1958,12 +1546,13 @@ def generate_students_by_semester_report(
         elements.append(Spacer(1, 20))
 
     # --- Construir PDF ---
-    doc.build(elements, onFirstPage=header_footer, onLaterPages=header_footer)
-    os.startfile(file_path)
+    ReportTemplate().build(doc, elements)
+    if abrir:
+        os.startfile(file_path)
 
 
 def generate_professors_by_courses_report(
-    file_path, professors_by_courses, carrera, usuario
+    file_path, professors_by_courses, carrera, usuario, abrir=True
 ):
     """
     Genera un reporte de profesores agrupados por materias, filtrado por carrera.
@@ -1973,6 +1562,7 @@ def generate_professors_by_courses_report(
         professors_by_courses: Diccionario con materias como claves y listas de profesores como valores
         carrera: Nombre de la carrera del coordinador
         usuario: Usuario que genera el reporte
+        abrir: Abrir el PDF al terminar
     """
     from reportlab.lib.pagesizes import letter
     from reportlab.platypus import (
@@ -1985,7 +1575,6 @@ def generate_professors_by_courses_report(
     from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
     from reportlab.lib import colors
     from reportlab.lib.units import inch
-    from datetime import datetime
     import os
 
     doc = SimpleDocTemplate(
@@ -1999,10 +1588,6 @@ def generate_professors_by_courses_report(
 
     elements = []
 
-    # Cargar imágenes
-    imagen1 = "img/logo1.jpeg"
-    imagen2 = "img/logo3.jpeg"
-
     # Estilos
     style_title = ParagraphStyle(
         "Title",
@@ -2048,56 +1633,6 @@ def generate_professors_by_courses_report(
         leading=11,
     )
 
-    # --- Encabezado y Pie de Página ---
-    def header_footer(canvas, doc):
-        canvas.saveState()
-        # Solo mostrar encabezado en la primera página
-        if doc.page == 1:
-            # Encabezado institucional
-            canvas.setFont("Helvetica-Bold", 12)
-            canvas.drawCentredString(300, 730, "REPÚBLICA BOLIVARIANA DE VENEZUELA")
-            canvas.drawCentredString(
-                300, 715, "MINISTERIO DEL PODER POPULAR PARA LA DEFENSA"
-            )
-            canvas.drawCentredString(
-                300, 700, "UNIVERSIDAD NACIONAL EXPERIMENTAL POLITÉCNICA"
-            )
-            canvas.drawCentredString(
-                300, 685, "DE LA FUERZA ARMADA NACIONAL BOLIVARIANA"
-            )
-            canvas.drawCentredString(300, 670, "NÚCLEO CARABOBO - SEDE PUERTO CABELLO")
-
-            # Logos
-            canvas.drawImage(
-                imagen1,
-                doc.leftMargin - 20,
-                680,
-                width=80,
-                height=80,
-                preserveAspectRatio=True,
-                mask="auto",
-            )
-            canvas.drawImage(
-                imagen2,
-                doc.width + doc.leftMargin - 60,
-                680,
-                width=80,
-                height=80,
-                preserveAspectRatio=True,
-                mask="auto",
-            )
-
-        # Pie de página (en todas las páginas)
-        canvas.setFont("Helvetica-Oblique", 8)
-        canvas.setFillColor(colors.grey)
-        canvas.drawString(doc.leftMargin, 30, f"Página {doc.page}")
-        canvas.drawRightString(
-            doc.width + doc.leftMargin,
-            30,
-            f"Generado el {datetime.now().strftime('%d/%m/%Y %H:%M')}",
-        )
-        canvas.restoreState()
-
     # --- Título Principal ---
     elements.append(Spacer(1, 60))
     elements.append(Paragraph("REPORTE DE PROFESORES Y SUS MATERIAS", style_title))
@@ -2194,5 +1729,6 @@ def generate_professors_by_courses_report(
         )
 
     # --- Construir PDF ---
-    doc.build(elements, onFirstPage=header_footer, onLaterPages=header_footer)
-    os.startfile(file_path)
+    ReportTemplate().build(doc, elements)
+    if abrir:
+        os.startfile(file_path)
@@ -0,0 +1,157 @@
+from collections import deque
+from xml.sax.saxutils import escape
+
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.platypus import Flowable, Paragraph, Table
+
+
+# Relleno horizontal por defecto de una celda (LEFTPADDING + RIGHTPADDING)
+_RELLENO_CELDA = 12
+
+
+class StreamingTable(Flowable):
+    """
+    Tabla de un reporte que se arma página por página a partir de un
+    iterable de filas (por ejemplo, database.fetch_rows de un cursor).
+
+    En vez de una sola Table con todas las filas (que ReportLab mide entera
+    y vuelve a partir en cada página), se toman solo las filas que caben en
+    el espacio disponible y se emite una Table de ese tamaño, con la fila de
+    encabezado repetida. Así la memoria y el tiempo de maquetado dependen
+    del tamaño de una página, no del total de filas.
+
+    header: fila de encabezado.
+    style: comandos de TableStyle, aplicados a cada trozo (fila 0 = encabezado).
+    bandas: colores alternos de las filas de datos (ROWBACKGROUNDS); la
+    alternancia continúa entre páginas.
+    wrap_styles: {columna: ParagraphStyle}. En esas columnas solo se usa un
+    Paragraph cuando el texto no cabe en una línea; el resto de celdas son
+    texto simple.
+    """
+
+    def __init__(
+        self,
+        header,
+        rows,
+        colWidths,
+        style=(),
+        bandas=None,
+        wrap_styles=None,
+        hAlign="CENTER",
+        relleno=_RELLENO_CELDA,
+    ):
+        super().__init__()
+        self.header = list(header)
+        self.colWidths = colWidths
+        self.style = list(style)
+        self.bandas = list(bandas) if bandas else None
+        self.wrap_styles = wrap_styles or {}
+        self.hAlign = hAlign
+        self.relleno = relleno
+        self._filas = iter(rows)
+        self._pendientes = deque()
+        self._agotado = False
+        self._emitidas = 0
+        self._final = None
+        self._alto_encabezado = None
+        self._alto_fila = None
+
+    def _fill(self, n):
+        """Lee del iterable hasta tener n filas pendientes (o agotarlo)."""
+        while not self._agotado and len(self._pendientes) < n:
+            try:
+                self._pendientes.append(self._cells(next(self._filas)))
+            except StopIteration:
+                self._agotado = True
+
+    def _cells(self, fila):
+        celdas = []
+        for col, valor in enumerate(fila):
+            texto = "" if valor is None else str(valor)
+            estilo = self.wrap_styles.get(col)
+            if estilo is not None and (
+                stringWidth(texto, estilo.fontName, estilo.fontSize)
+                > self.colWidths[col] - self.relleno
+            ):
+                celdas.append(Paragraph(escape(texto), estilo))
+            else:
+                celdas.append(texto)
+        return celdas
+
+    def _table(self, filas):
+        estilo = list(self.style)
+        if self.bandas and filas:
+            # Rotar los colores para seguir la alternancia del trozo anterior
+            desde = self._emitidas % len(self.bandas)
+            estilo.append(
+                (
+                    "ROWBACKGROUNDS",
+                    (0, 1),
+                    (-1, -1),
+                    self.bandas[desde:] + self.bandas[:desde],
+                )
+            )
+        return Table(
+            [self.header] + list(filas),
+            colWidths=self.colWidths,
+            style=estilo,
+            repeatRows=1,
+            hAlign=self.hAlign,
+        )
+
+    def _rows_that_fit(self, availWidth, availHeight):
+        """Máximo de filas de una línea que caben debajo del encabezado."""
+        if self._alto_fila is None:
+            _, self._alto_encabezado = Table(
+                [self.header], colWidths=self.colWidths, style=self.style
+            ).wrap(availWidth, availHeight)
+            _, alto = Table(
+                [self.header, [""] * len(self.header)],
+                colWidths=self.colWidths,
+                style=self.style,
+            ).wrap(availWidth, availHeight)
+            self._alto_fila = max(alto - self._alto_encabezado, 1)
+        return int((availHeight - self._alto_encabezado) // self._alto_fila)
+
+    def wrap(self, availWidth, availHeight):
+        n = max(self._rows_that_fit(availWidth, availHeight), 0)
+        self._fill(n + 1)
+        if not self._agotado or len(self._pendientes) > n:
+            # Faltan filas: ocupar más de lo disponible para que se parta aquí
+            self._final = None
+            self.width = sum(self.colWidths)
+            return self.width, availHeight + 1
+        if not self._pendientes and self._emitidas:
+            self._final = None
+            self.width = 0
+            return 0, 0
+        self._final = self._table(self._pendientes)
+        self.width, alto = self._final.wrap(availWidth, availHeight)
+        return self.width, alto
+
+    def split(self, availWidth, availHeight):
+        n = self._rows_that_fit(availWidth, availHeight)
+        if n < 1:
+            return []
+        self._fill(n)
+        trozo = self._table(list(self._pendientes)[:n])
+        partes = trozo.split(availWidth, availHeight)
+        if not partes:
+            return []
+        primera = partes[0]
+        usadas = primera._nrows - 1
+        for _ in range(usadas):
+            self._pendientes.popleft()
+        self._emitidas += usadas
+        self._final = None
+        # El resto de la tabla es este mismo objeto: quitar la marca que deja
+        # el documento cuando no cupo nada al final de la página anterior,
+        # o en la siguiente se tomaría como un flowable que no cabe en ninguna
+        self.__dict__.pop("_postponed", None)
+        return [primera, self]
+
+    def draw(self):
+        if self._final is not None:
+            self._emitidas += len(self._pendientes)
+            self._pendientes.clear()
+            self._final.drawOn(self.canv, 0, 0)
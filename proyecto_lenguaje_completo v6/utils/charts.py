@@ -0,0 +1,157 @@
+import hashlib
+import io
+import threading
+from collections import OrderedDict
+
+import matplotlib.ticker as mticker
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+
+COLORES = ["#3498db", "#2ecc71", "#f39c12", "#e74c3c"]
+
+# Gráficos de la aplicación: título, eje Y, tamaño (pulgadas) y si las
+# etiquetas del eje X van inclinadas
+CHARTS = {
+    "usuarios_por_rol": {
+        "titulo": "Usuarios por Rol",
+        "etiqueta_y": "Cantidad",
+        "figsize": (8, 4),
+        "rotar": False,
+    },
+    "estudiantes_por_carrera": {
+        "titulo": "Distribución de Estudiantes por Carrera",
+        "etiqueta_y": "Cantidad de Estudiantes",
+        "figsize": (10, 6),
+        "rotar": True,
+    },
+    "profesores_por_carrera": {
+        "titulo": "Distribución de Profesores por Carrera",
+        "etiqueta_y": "Cantidad de Profesores",
+        "figsize": (10, 6),
+        "rotar": True,
+    },
+    "materias_por_carrera": {
+        "titulo": "Distribución de Materias por Carrera",
+        "etiqueta_y": "Cantidad de Materias",
+        "figsize": (10, 6),
+        "rotar": True,
+    },
+}
+
+# Imágenes PNG ya generadas (clave de los datos -> bytes)
+PNG_CACHE_SIZE = 32
+_png_cache = OrderedDict()
+# matplotlib no es seguro entre hilos: las imágenes para los PDF se
+# dibujan de a una
+_render_lock = threading.Lock()
+
+_charts = {}
+
+
+def _draw_bars(ax, spec, etiquetas, valores):
+    """Dibuja el gráfico de barras completo en ax; retorna las barras."""
+    ax.clear()
+    barras = ax.bar(etiquetas, valores, color=COLORES)
+    ax.set_ylabel(spec["etiqueta_y"])
+    ax.set_title(spec["titulo"])
+    ax.yaxis.set_major_locator(mticker.MaxNLocator(integer=True))
+    ax.yaxis.set_major_formatter(mticker.StrMethodFormatter("{x:.0f}"))
+    if spec["rotar"]:
+        for etiqueta in ax.get_xticklabels():
+            etiqueta.set_rotation(45)
+            etiqueta.set_horizontalalignment("right")
+    return barras
+
+
+class BarChart:
+    """
+    Gráfico de barras de la interfaz, armado con matplotlib.figure.Figure
+    (sin pyplot, así las figuras no quedan registradas en ningún estado
+    global y se liberan con el gráfico).
+
+    Cada gráfico (ver get_chart) tiene una sola figura durante toda la
+    sesión. update() cambia solo la altura de las barras cuando las
+    etiquetas no cambian, y show() reutiliza el FigureCanvasTkAgg mientras
+    su contenedor siga existiendo; si la vista se volvió a crear, la misma
+    figura se muestra en un canvas nuevo.
+    """
+
+    def __init__(self, spec):
+        self.spec = spec
+        self.figure = Figure(figsize=spec["figsize"])
+        self.ax = self.figure.add_subplot()
+        self.canvas = None
+        self._barras = None
+        self._etiquetas = None
+
+    def update(self, etiquetas, valores):
+        etiquetas = list(etiquetas)
+        if self._barras is not None and etiquetas == self._etiquetas:
+            for barra, valor in zip(self._barras, valores):
+                barra.set_height(valor)
+            self.ax.relim()
+            self.ax.autoscale_view()
+        else:
+            self._barras = _draw_bars(self.ax, self.spec, etiquetas, valores)
+            self._etiquetas = etiquetas
+            if self.spec["rotar"]:
+                self.figure.tight_layout()
+        if self.canvas is not None and self.canvas.get_tk_widget().winfo_exists():
+            self.canvas.draw_idle()
+
+    def show(self, master):
+        """Retorna el widget del gráfico dentro de master (sin empaquetarlo)."""
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+        widget = self.canvas.get_tk_widget() if self.canvas is not None else None
+        if widget is None or not widget.winfo_exists() or widget.master is not master:
+            self.canvas = FigureCanvasTkAgg(self.figure, master=master)
+            widget = self.canvas.get_tk_widget()
+        self.canvas.draw_idle()
+        return widget
+
+
+def get_chart(nombre):
+    """BarChart de la sesión para uno de los gráficos de CHARTS."""
+    chart = _charts.get(nombre)
+    if chart is None:
+        chart = _charts[nombre] = BarChart(CHARTS[nombre])
+    return chart
+
+
+def show_chart(nombre, master, etiquetas, valores):
+    """Actualiza el gráfico con los datos y retorna su widget en master."""
+    chart = get_chart(nombre)
+    chart.update(etiquetas, valores)
+    return chart.show(master)
+
+
+def chart_png(nombre, etiquetas, valores, dpi=100):
+    """
+    El gráfico como imagen PNG (bytes), para incluirlo en los reportes PDF.
+    Se dibuja en una figura aparte, fuera de pantalla, y se guarda en
+    memoria según los datos: pedir otra vez el mismo gráfico con los mismos
+    valores no lo vuelve a dibujar.
+    """
+    etiquetas = [str(e) for e in etiquetas]
+    valores = [float(v) for v in valores]
+    clave = hashlib.sha1(repr((nombre, etiquetas, valores, dpi)).encode()).hexdigest()
+    with _render_lock:
+        png = _png_cache.get(clave)
+        if png is not None:
+            _png_cache.move_to_end(clave)
+            return png
+
+        spec = CHARTS[nombre]
+        figure = Figure(figsize=spec["figsize"], dpi=dpi)
+        FigureCanvasAgg(figure)
+        _draw_bars(figure.add_subplot(), spec, etiquetas, valores)
+        if spec["rotar"]:
+            figure.tight_layout()
+        salida = io.BytesIO()
+        figure.savefig(salida, format="png")
+        png = _png_cache[clave] = salida.getvalue()
+        if len(_png_cache) > PNG_CACHE_SIZE:
+            _png_cache.popitem(last=False)
+        return png
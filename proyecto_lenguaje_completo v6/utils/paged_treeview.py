@@ -0,0 +1,259 @@
+from tkinter import ttk
+from utils.task_executor import run_in_background
+
+
+# Texto de las filas cuya página todavía se está leyendo
+CARGANDO = "Cargando..."
+# Filas que mueve cada paso de la rueda del mouse
+WHEEL_ROWS = 3
+# Altura de fila y de encabezado (px) mientras no se pueda medir el Treeview
+_ALTO_FILA = 20
+_ALTO_ENCABEZADO = 25
+
+
+class PagedTreeview:
+    """
+    Muestra una fuente paginada (config.pagination) en un ttk.Treeview ya
+    creado, sin cargar el listado completo.
+
+    El Treeview solo contiene las filas visibles: al desplazarse se
+    actualizan los valores de esos ítems con las filas de la página
+    correspondiente, que se leen en segundo plano si no están en caché
+    (mientras tanto se muestran como "Cargando..."). La barra de desplazamiento
+    vertical refleja la posición dentro del total de filas, y al hacer clic
+    en un encabezado ordenable se reordena la fuente.
+
+    Los ítems se identifican por la posición absoluta de la fila, así que
+    tree.selection() y tree.item(sel, "values") siguen funcionando igual que
+    con un Treeview común para las filas visibles; selected_values() incluye
+    además las filas seleccionadas que quedaron fuera de la vista.
+    """
+
+    def __init__(self, tree, scrollbar, source=None):
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.source = None
+        self.total = 0
+        self.top = 0
+        self._visibles = 1
+        self._generacion = 0
+        self._pendientes = set()
+        self._seleccion = {}
+        self._titulos = {col: tree.heading(col, "text") for col in tree["columns"]}
+
+        tree.configure(yscrollcommand="")
+        scrollbar.configure(command=self._on_scrollbar)
+        tree.bind("<Configure>", lambda e: self._render(), add="+")
+        tree.bind("<<TreeviewSelect>>", self._on_select, add="+")
+        tree.bind("<Button-1>", self._on_click, add="+")
+        tree.bind("<MouseWheel>", self._on_wheel, add="+")
+        tree.bind("<Button-4>", lambda e: self.scroll(-WHEEL_ROWS), add="+")
+        tree.bind("<Button-5>", lambda e: self.scroll(WHEEL_ROWS), add="+")
+        for tecla, paso in (("<Up>", -1), ("<Down>", 1)):
+            tree.bind(tecla, lambda e, paso=paso: self._move_selection(paso))
+        tree.bind("<Prior>", lambda e: self._move_selection(-self._visibles))
+        tree.bind("<Next>", lambda e: self._move_selection(self._visibles))
+        tree.bind("<Home>", lambda e: self._move_selection(-self.total))
+        tree.bind("<End>", lambda e: self._move_selection(self.total))
+
+        if source is not None:
+            self.set_source(source)
+
+    def set_source(self, source):
+        """Muestra otra fuente desde el principio (p. ej. resultados de búsqueda)."""
+        self.source = source
+        self.top = 0
+        self._seleccion = {}
+        self._update_headings()
+        self.reload()
+
+    def refresh(self):
+        """Vuelve a leer la fuente actual conservando la posición."""
+        if self.source is not None:
+            self.source.invalidate()
+            self.reload()
+
+    def reload(self):
+        """Pide el total a la fuente y vuelve a dibujar."""
+        self._generacion += 1
+        self._pendientes = set()
+        generacion = self._generacion
+        run_in_background(
+            self.tree,
+            self.source.count,
+            on_success=lambda total: self._on_count(generacion, total),
+        )
+
+    def sort(self, columna):
+        """Ordena por la columna (un segundo clic invierte el sentido)."""
+        if self.source is None or not self.source.sortable(columna):
+            return
+        descendente = self.source.orden == columna and not self.source.descendente
+        self.source.set_order(columna, descendente)
+        self.top = 0
+        self._seleccion = {}
+        self._update_headings()
+        self.reload()
+
+    def selected_values(self):
+        """
+        Valores de las filas seleccionadas, en orden, aunque no estén
+        visibles (se omiten las que aún se están cargando).
+        """
+        return [
+            self._seleccion[i]
+            for i in sorted(self._seleccion)
+            if self._seleccion[i] and self._seleccion[i][0] != CARGANDO
+        ]
+
+    def scroll(self, filas):
+        self._scroll_to(self.top + filas)
+        return "break"
+
+    def _scroll_to(self, top):
+        top = max(0, min(top, self.total - self._visibles))
+        if top != self.top:
+            self.top = top
+            self._render()
+
+    def _on_count(self, generacion, total):
+        if generacion != self._generacion:
+            return
+        self.total = total
+        self.top = max(0, min(self.top, total - self._visibles))
+        self._seleccion = {i: v for i, v in self._seleccion.items() if i < total}
+        self._render()
+
+    def _update_headings(self):
+        for col, titulo in self._titulos.items():
+            if self.source is None or not self.source.sortable(col):
+                self.tree.heading(col, text=titulo)
+                continue
+            if self.source.orden == col:
+                titulo += " ▼" if self.source.descendente else " ▲"
+            self.tree.heading(col, text=titulo, command=lambda c=col: self.sort(c))
+
+    def _measure(self):
+        """Cantidad de filas que caben en el alto actual del Treeview."""
+        alto_fila, inicio = _ALTO_FILA, _ALTO_ENCABEZADO
+        hijos = self.tree.get_children()
+        caja = self.tree.bbox(hijos[0]) if hijos else None
+        if caja:
+            inicio, alto_fila = caja[1], caja[3]
+        else:
+            try:
+                alto_fila = int(ttk.Style(self.tree).lookup("Treeview", "rowheight")) or alto_fila
+            except (TypeError, ValueError):
+                pass
+        alto = self.tree.winfo_height()
+        if alto <= 1:
+            # Aún no se dibujó: usar la altura configurada (en filas)
+            return int(self.tree.cget("height"))
+        return max(1, (alto - inicio) // alto_fila)
+
+    def _render(self):
+        if self.source is None:
+            return
+        self._visibles = self._measure()
+        fin = min(self.top + self._visibles, self.total)
+        tamano = self.source.page_size
+
+        filas = {}
+        faltantes = set()
+        for pagina in range(self.top // tamano, (fin - 1) // tamano + 1 if fin else 0):
+            datos = self.source.cached_page(pagina)
+            if datos is None:
+                faltantes.add(pagina)
+                continue
+            for i, valores in enumerate(datos, start=pagina * tamano):
+                filas[i] = valores
+        # Leer también la página siguiente para que el desplazamiento sea fluido
+        siguiente = fin // tamano
+        if fin < self.total and self.source.cached_page(siguiente) is None:
+            faltantes.add(siguiente)
+        for pagina in faltantes:
+            self._fetch(pagina)
+
+        columnas = len(self.tree["columns"])
+        actuales = set(self.tree.get_children())
+        nuevos = [str(i) for i in range(self.top, fin)]
+        for iid in actuales.difference(nuevos):
+            self.tree.delete(iid)
+        for posicion, iid in enumerate(nuevos):
+            valores = filas.get(int(iid), (CARGANDO,) + ("",) * (columnas - 1))
+            if iid in actuales:
+                self.tree.item(iid, values=valores)
+                self.tree.move(iid, "", posicion)
+            else:
+                self.tree.insert("", posicion, iid=iid, values=valores)
+            if int(iid) in filas and int(iid) in self._seleccion:
+                self._seleccion[int(iid)] = filas[int(iid)]
+        visibles_sel = [iid for iid in nuevos if int(iid) in self._seleccion]
+        if tuple(self.tree.selection()) != tuple(visibles_sel):
+            self.tree.selection_set(visibles_sel)
+        self.tree.yview_moveto(0)
+
+        if self.total:
+            self.scrollbar.set(self.top / self.total, fin / self.total)
+        else:
+            self.scrollbar.set(0, 1)
+
+    def _fetch(self, pagina):
+        clave = (self._generacion, pagina)
+        if clave in self._pendientes:
+            return
+        self._pendientes.add(clave)
+
+        def _listo(_filas):
+            self._pendientes.discard(clave)
+            if clave[0] == self._generacion:
+                self._render()
+
+        run_in_background(
+            self.tree,
+            self.source.get_page,
+            pagina,
+            on_success=_listo,
+            busy=False,
+        )
+
+    def _on_scrollbar(self, accion, cantidad, unidad=None):
+        if accion == "moveto":
+            self._scroll_to(int(float(cantidad) * self.total))
+        elif accion == "scroll":
+            paso = self._visibles if unidad == "pages" else 1
+            self._scroll_to(self.top + int(cantidad) * paso)
+
+    def _on_wheel(self, event):
+        return self.scroll(-WHEEL_ROWS if event.delta > 0 else WHEEL_ROWS)
+
+    def _on_click(self, event):
+        # Un clic sin Ctrl/Shift sobre una fila reemplaza la selección,
+        # incluida la que no se ve
+        region = self.tree.identify_region(event.x, event.y)
+        if region in ("cell", "tree") and not event.state & 0x0005:
+            self._seleccion = {}
+
+    def _on_select(self, event):
+        visibles = {int(iid) for iid in self.tree.get_children()}
+        seleccion = {i: v for i, v in self._seleccion.items() if i not in visibles}
+        for iid in self.tree.selection():
+            seleccion[int(iid)] = tuple(self.tree.item(iid, "values"))
+        self._seleccion = seleccion
+
+    def _move_selection(self, paso):
+        if not self.total:
+            return "break"
+        actual = max(self._seleccion) if self._seleccion else self.top - 1
+        destino = max(0, min(actual + paso, self.total - 1))
+        if destino < self.top:
+            self.top = destino
+        elif destino >= self.top + self._visibles:
+            self.top = destino - self._visibles + 1
+        self._seleccion = {destino: ()}
+        self._render()
+        iid = str(destino)
+        if self.tree.exists(iid):
+            self.tree.focus(iid)
+            self._seleccion[destino] = tuple(self.tree.item(iid, "values"))
+        return "break"
@@ -0,0 +1,209 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from tkinter import messagebox
+
+
+# Cada cuánto (ms) el hilo de Tk revisa si hay tareas terminadas
+POLL_INTERVAL = 50
+MAX_WORKERS = 4
+
+
+class TaskHandle:
+    """Referencia a una tarea en segundo plano; permite cancelarla."""
+
+    def __init__(self):
+        self.future = None
+        self._cancel_event = threading.Event()
+
+    def cancel(self):
+        """
+        Cancela la tarea. Si aún no empezó, no se ejecuta; si ya está en
+        curso, su resultado se descarta y no se llaman los callbacks.
+        """
+        self._cancel_event.set()
+        if self.future is not None:
+            self.future.cancel()
+
+    @property
+    def cancelled(self):
+        return self._cancel_event.is_set()
+
+    @property
+    def done(self):
+        return self.future is not None and self.future.done()
+
+
+class TaskExecutor:
+    """
+    Ejecuta funciones bloqueantes (consultas SQLite, generación de PDF) en un
+    pool de hilos y entrega el resultado en el hilo de Tk mediante root.after.
+
+    Tk no es seguro entre hilos, así que los hilos de trabajo nunca tocan
+    widgets: dejan el resultado en una cola que el hilo principal revisa.
+    """
+
+    def __init__(self, root, max_workers=MAX_WORKERS):
+        self.root = root
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="tarea"
+        )
+        self._results = queue.Queue()
+        self._pending = 0
+        self._polling = False
+        self._busy_cursor = None
+
+    def submit(
+        self,
+        func,
+        *args,
+        on_success=None,
+        on_error=None,
+        owner=None,
+        busy=True,
+        error_title="Error",
+        **kwargs,
+    ):
+        """
+        Ejecuta func(*args, **kwargs) en segundo plano.
+
+        on_success(resultado) y on_error(excepción) se llaman en el hilo de Tk.
+        Si no se indica on_error, el error se muestra con messagebox.
+        owner: widget dueño de la tarea; si se destruye antes de terminar, los
+        callbacks se omiten.
+        busy: muestra el cursor de espera mientras haya tareas en curso; si es
+        un widget (p. ej. un botón) además se deshabilita hasta terminar.
+        """
+        handle = TaskHandle()
+        callbacks = (on_success, on_error, owner, busy, error_title)
+
+        def _run():
+            if handle.cancelled:
+                self._results.put((handle, callbacks, None, None))
+                return
+            try:
+                resultado = func(*args, **kwargs)
+            except Exception as e:
+                self._results.put((handle, callbacks, False, e))
+            else:
+                self._results.put((handle, callbacks, True, resultado))
+
+        self._start_busy(busy)
+        handle.future = self._pool.submit(_run)
+
+        def _on_done(future):
+            # Una tarea cancelada antes de empezar no llega a ejecutar _run
+            if future.cancelled():
+                self._results.put((handle, callbacks, None, None))
+
+        handle.future.add_done_callback(_on_done)
+        self._schedule_poll()
+        return handle
+
+    def shutdown(self):
+        """Cancela las tareas pendientes y libera los hilos (al cerrar la app)."""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def _schedule_poll(self):
+        if not self._polling:
+            self._polling = True
+            self.root.after(POLL_INTERVAL, self._poll)
+
+    def _poll(self):
+        self._polling = False
+        while True:
+            try:
+                handle, callbacks, ok, valor = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self._finish(handle, callbacks, ok, valor)
+        if self._pending:
+            self._schedule_poll()
+
+    def _finish(self, handle, callbacks, ok, valor):
+        on_success, on_error, owner, busy, error_title = callbacks
+        self._stop_busy(busy)
+        if ok is None or handle.cancelled:
+            return
+        if owner is not None and not _exists(owner):
+            return
+        if ok:
+            if on_success:
+                on_success(valor)
+        elif on_error:
+            on_error(valor)
+        else:
+            messagebox.showerror(error_title, f"Ocurrió un error: {valor}")
+
+    def _start_busy(self, busy):
+        self._pending += 1
+        if not busy:
+            return
+        if self._busy_cursor is None:
+            self._busy_cursor = self.root.cget("cursor")
+            self.root.config(cursor="watch")
+        if _is_widget(busy):
+            busy.config(state="disabled")
+
+    def _stop_busy(self, busy):
+        self._pending -= 1
+        if not busy:
+            return
+        if _is_widget(busy) and _exists(busy):
+            busy.config(state="normal")
+        if self._pending == 0 and self._busy_cursor is not None:
+            if _exists(self.root):
+                self.root.config(cursor=self._busy_cursor)
+            self._busy_cursor = None
+
+
+def _is_widget(obj):
+    return hasattr(obj, "winfo_exists")
+
+
+def _exists(widget):
+    try:
+        return bool(widget.winfo_exists())
+    except Exception:
+        return False
+
+
+_executor = None
+
+
+def init_task_executor(root, max_workers=MAX_WORKERS):
+    """Crea el ejecutor compartido asociado a la ventana principal."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown()
+    _executor = TaskExecutor(root, max_workers)
+    return _executor
+
+
+def get_task_executor(widget=None):
+    """
+    Retorna el ejecutor compartido. Si aún no existe, se crea usando la
+    ventana raíz del widget indicado.
+    """
+    if _executor is None:
+        if widget is None:
+            raise RuntimeError("El ejecutor de tareas no ha sido inicializado")
+        return init_task_executor(widget.nametowidget("."))
+    return _executor
+
+
+def shutdown_task_executor():
+    global _executor
+    if _executor is not None:
+        _executor.shutdown()
+        _executor = None
+
+
+def run_in_background(widget, func, *args, **kwargs):
+    """
+    Atajo para las vistas: ejecuta func en segundo plano usando widget como
+    dueño de la tarea (salvo que se indique owner explícitamente). Acepta los
+    mismos parámetros que TaskExecutor.submit.
+    """
+    kwargs.setdefault("owner", widget)
+    return get_task_executor(widget).submit(func, *args, **kwargs)
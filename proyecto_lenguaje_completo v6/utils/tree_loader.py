@@ -0,0 +1,143 @@
+import time
+
+
+# Tiempo máximo (ms) que cada tanda puede ocupar el hilo de Tk; el resto del
+# cuadro queda libre para redibujar y atender eventos
+FRAME_BUDGET_MS = 12
+# Pausa (ms) entre tandas; con after_idle los eventos podrían no atenderse
+BATCH_DELAY_MS = 1
+
+
+class TreeLoad:
+    """
+    Carga en curso de un Treeview. Se crea con populate_tree; cancel()
+    detiene la inserción en la tanda siguiente.
+    """
+
+    def __init__(self, tree, rows, values, on_item, on_done, progress, budget_ms):
+        self.tree = tree
+        self.rows = rows if isinstance(rows, (list, tuple)) else list(rows)
+        self.values = values
+        self.on_item = on_item
+        self.on_done = on_done
+        self.progress = progress
+        self.budget = budget_ms / 1000
+        self.inserted = 0
+        self.cancelled = False
+        self._after = None
+
+    @property
+    def total(self):
+        return len(self.rows)
+
+    @property
+    def done(self):
+        return self.inserted >= self.total
+
+    def cancel(self):
+        if self.cancelled or self.done:
+            return
+        self.cancelled = True
+        if self._after is not None:
+            try:
+                self.tree.after_cancel(self._after)
+            except Exception:
+                pass
+            self._after = None
+        self._report(terminado=True)
+        _release(self)
+
+    def _step(self):
+        self._after = None
+        if self.cancelled or not _exists(self.tree):
+            _release(self)
+            return
+        limite = time.perf_counter() + self.budget
+        while self.inserted < self.total:
+            fila = self.rows[self.inserted]
+            self.inserted += 1
+            valores = self.values(fila) if self.values else fila
+            iid = self.tree.insert("", "end", values=valores)
+            if self.on_item:
+                self.on_item(iid, fila)
+            if time.perf_counter() >= limite:
+                break
+        if not self.done:
+            self._report()
+            self._after = self.tree.after(BATCH_DELAY_MS, self._step)
+            return
+        self._report(terminado=True)
+        _release(self)
+        if self.on_done:
+            self.on_done()
+
+    def _report(self, terminado=False):
+        progreso = self.progress
+        if progreso is None:
+            return
+        if callable(progreso):
+            progreso(self.inserted, self.total)
+        elif not _exists(progreso):
+            return
+        elif "maximum" in progreso.keys():
+            # ttk.Progressbar
+            progreso.config(maximum=max(self.total, 1), value=self.inserted)
+        else:
+            texto = "" if terminado else f"Cargando {self.inserted} de {self.total}..."
+            progreso.config(text=texto)
+
+
+# Carga activa por Treeview (nombre del widget -> TreeLoad)
+_cargas = {}
+
+
+def _release(carga):
+    if _cargas.get(str(carga.tree)) is carga:
+        del _cargas[str(carga.tree)]
+
+
+def _exists(widget):
+    try:
+        return bool(widget.winfo_exists())
+    except Exception:
+        return False
+
+
+def populate_tree(
+    tree,
+    rows,
+    values=None,
+    on_item=None,
+    on_done=None,
+    progress=None,
+    clear=True,
+    budget_ms=FRAME_BUDGET_MS,
+):
+    """
+    Inserta rows en el Treeview por tandas (con after), sin bloquear el
+    hilo de Tk más de budget_ms por tanda.
+
+    values(fila): valores a mostrar (por defecto la fila tal cual).
+    on_item(iid, fila): se llama con cada ítem insertado.
+    on_done(): se llama al terminar (no si la carga se cancela).
+    progress: callable(insertadas, total), un ttk.Progressbar o un Label
+    (muestra "Cargando N de M..." y se vacía al terminar).
+    clear: borra las filas actuales antes de empezar.
+
+    Una carga nueva sobre el mismo Treeview cancela la anterior, así que
+    cambiar de filtro o de período mientras se llena la tabla no mezcla filas.
+    """
+    cancel_population(tree)
+    if clear:
+        tree.delete(*tree.get_children())
+    carga = TreeLoad(tree, rows, values, on_item, on_done, progress, budget_ms)
+    _cargas[str(tree)] = carga
+    carga._step()
+    return carga
+
+
+def cancel_population(tree):
+    """Cancela la carga en curso del Treeview, si la hay."""
+    carga = _cargas.get(str(tree))
+    if carga is not None:
+        carga.cancel()
@@ -1,11 +1,10 @@
-import threading
 import tkinter as tk
-import time
 from tkinter import ttk, messagebox
 from config.database import get_connection, get_db_connection
 from views.base_view import BaseView
 from controllers.auth_controller import AuthController
 from config.styles import configure_styles
+from utils.task_executor import run_in_background
 
 
 class LoginView(BaseView):
@@ -83,14 +82,14 @@ class LoginView(BaseView):
         btn_frame = tk.Frame(self.form_frame, bg="white")
         btn_frame.pack(pady=10)
 
-        btn_login = ttk.Button(
+        self.btn_login = ttk.Button(
             btn_frame,
             text="Iniciar Sesión",
             style="Primary.TButton",
             width=15,
             command=self.login,
         )
-        btn_login.pack(side="left", padx=10)
+        self.btn_login.pack(side="left", padx=10)
 
         btn_cancel = ttk.Button(
             btn_frame,
@@ -118,18 +117,28 @@ class LoginView(BaseView):
         cedula = self.cedula_entry.get()
         password = self.password_entry.get()
 
-        try:
-            time.sleep(1)  # Simular llamada a la red
-            user = self.auth_controller.login(cedula, password)
-            if user:
-                self.frame.after(0, self.handle_login_success, user)
-                # messagebox.showinfo("Éxito", f"Bienvenido, {user.get_full_name()}")
-                # Mostrar la interfaz principal
-                # self.app_controller.show_main_interface(user)
-            else:
-                messagebox.showerror("Error", "Cédula o contraseña incorrectos")
-        except Exception as e:
-            messagebox.showerror("Error", f"Error al iniciar sesión: {str(e)}")
+        # La verificación de credenciales se hace fuera del hilo de Tk;
+        # el botón queda deshabilitado mientras tanto
+        run_in_background(
+            self.frame,
+            self.auth_controller.login,
+            cedula,
+            password,
+            busy=self.btn_login,
+            on_success=self._on_login_result,
+            on_error=lambda e: messagebox.showerror(
+                "Error", f"Error al iniciar sesión: {str(e)}"
+            ),
+        )
+
+    def _on_login_result(self, user):
+        if user:
+            self.handle_login_success(user)
+            # messagebox.showinfo("Éxito", f"Bienvenido, {user.get_full_name()}")
+            # Mostrar la interfaz principal
+            # self.app_controller.show_main_interface(user)
+        else:
+            messagebox.showerror("Error", "Cédula o contraseña incorrectos")
 
     def handle_login_success(self, user):
         """Maneja la UI para un login exitoso."""
@@ -0,0 +1,308 @@
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog
+from controllers.report_controller import ReportController
+from config import database
+from models.coordinator import Coordinator
+from pdf.batch_reports import TIPOS
+from utils.task_executor import run_in_background
+from utils.tree_loader import populate_tree
+
+
+# Cada cuánto (ms) se actualiza el avance mientras se generan los documentos
+PROGRESS_INTERVAL = 200
+
+
+class BatchReportView:
+    """Generación por lote de records académicos y constancias de estudio."""
+
+    TODOS = "Todos"
+    DESTINO_CARPETA = "Carpeta"
+    DESTINO_ZIP = "Archivo ZIP"
+
+    def __init__(self, parent, app_controller, user):
+        self.parent = parent
+        self.app_controller = app_controller
+        self.user = user
+        self.report_controller = ReportController()
+        self.resultado = None
+        self._avance = None
+        self._generando = False
+        self._tipos = {nombre: tipo for tipo, nombre in TIPOS.items()}
+
+        self.create_widgets()
+        self.cargar_carreras()
+
+    def create_widgets(self):
+        # Header
+        header_frame = tk.Frame(self.parent, bg="white", height=60)
+        header_frame.pack(fill="x")
+
+        tk.Label(
+            header_frame,
+            text="Documentos por Lote",
+            font=("Arial", 16, "bold"),
+            bg="white",
+        ).pack(side="left", padx=20, pady=15)
+
+        content_container = tk.Frame(self.parent, bg="#f5f5f5")
+        content_container.pack(fill="both", expand=True, padx=20, pady=20)
+
+        # Documento, filtros y destino
+        form_frame = tk.Frame(content_container, bg="white", padx=10, pady=10)
+        form_frame.pack(fill="x", pady=(0, 10))
+
+        tk.Label(form_frame, text="Documento:", bg="white").grid(
+            row=0, column=0, sticky="w", padx=(0, 10)
+        )
+        self.tipo_var = tk.StringVar(value=TIPOS["record"])
+        ttk.Combobox(
+            form_frame,
+            textvariable=self.tipo_var,
+            values=tuple(TIPOS.values()),
+            state="readonly",
+            width=25,
+        ).grid(row=0, column=1, sticky="w")
+
+        tk.Label(form_frame, text="Carrera:", bg="white").grid(
+            row=1, column=0, sticky="w", padx=(0, 10), pady=(10, 0)
+        )
+        self.carrera_var = tk.StringVar(value=self.TODOS)
+        self.carrera_combo = ttk.Combobox(
+            form_frame,
+            textvariable=self.carrera_var,
+            values=(self.TODOS,),
+            state="disabled",
+            width=40,
+        )
+        self.carrera_combo.grid(row=1, column=1, sticky="w", pady=(10, 0))
+
+        tk.Label(form_frame, text="Semestre:", bg="white").grid(
+            row=2, column=0, sticky="w", padx=(0, 10), pady=(10, 0)
+        )
+        self.semestre_var = tk.StringVar(value=self.TODOS)
+        ttk.Combobox(
+            form_frame,
+            textvariable=self.semestre_var,
+            values=(self.TODOS,) + tuple(str(s) for s in range(1, 13)),
+            state="readonly",
+            width=10,
+        ).grid(row=2, column=1, sticky="w", pady=(10, 0))
+
+        tk.Label(form_frame, text="Guardar en:", bg="white").grid(
+            row=3, column=0, sticky="w", padx=(0, 10), pady=(10, 0)
+        )
+        self.formato_var = tk.StringVar(value=self.DESTINO_ZIP)
+        ttk.Combobox(
+            form_frame,
+            textvariable=self.formato_var,
+            values=(self.DESTINO_ZIP, self.DESTINO_CARPETA),
+            state="readonly",
+            width=15,
+        ).grid(row=3, column=1, sticky="w", pady=(10, 0))
+
+        tk.Label(form_frame, text="Destino:", bg="white").grid(
+            row=4, column=0, sticky="w", padx=(0, 10), pady=(10, 0)
+        )
+        self.destino_var = tk.StringVar()
+        tk.Entry(form_frame, textvariable=self.destino_var, width=60).grid(
+            row=4, column=1, sticky="w", pady=(10, 0)
+        )
+        tk.Button(
+            form_frame,
+            text="Examinar...",
+            bg="#3498db",
+            fg="white",
+            font=("Arial", 10),
+            bd=0,
+            padx=10,
+            pady=2,
+            command=self.seleccionar_destino,
+        ).grid(row=4, column=2, padx=10, pady=(10, 0))
+
+        # Acciones
+        action_frame = tk.Frame(content_container, bg="#f5f5f5", pady=10)
+        action_frame.pack(fill="x")
+
+        self.generar_btn = tk.Button(
+            action_frame,
+            text="Generar",
+            bg="#2ecc71",
+            fg="white",
+            font=("Arial", 10, "bold"),
+            bd=0,
+            padx=15,
+            pady=5,
+            command=self.generar,
+        )
+        self.generar_btn.pack(side="left", padx=5)
+
+        self.reporte_btn = tk.Button(
+            action_frame,
+            text="Guardar reporte de errores",
+            bg="#f39c12",
+            fg="white",
+            font=("Arial", 10, "bold"),
+            bd=0,
+            padx=15,
+            pady=5,
+            state="disabled",
+            command=self.guardar_reporte,
+        )
+        self.reporte_btn.pack(side="left", padx=5)
+
+        self.estado_label = tk.Label(action_frame, text="", bg="#f5f5f5")
+        self.estado_label.pack(side="left", padx=15)
+
+        # Errores por estudiante
+        table_frame = tk.Frame(content_container, bg="white")
+        table_frame.pack(fill="both", expand=True)
+
+        columns = ("cedula", "nombre", "error")
+        self.tree = ttk.Treeview(table_frame, columns=columns, show="headings")
+        vsb = ttk.Scrollbar(table_frame, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=vsb.set)
+        self.tree.grid(row=0, column=0, sticky="nsew")
+        vsb.grid(row=0, column=1, sticky="ns")
+        table_frame.grid_rowconfigure(0, weight=1)
+        table_frame.grid_columnconfigure(0, weight=1)
+
+        for col, texto, ancho in (
+            ("cedula", "Cédula", 120),
+            ("nombre", "Estudiante", 220),
+            ("error", "Error", 400),
+        ):
+            self.tree.heading(col, text=texto)
+            self.tree.column(col, width=ancho, anchor="center" if col == "cedula" else "w")
+
+    def cargar_carreras(self):
+        run_in_background(
+            self.carrera_combo,
+            self._get_carreras,
+            on_success=self._mostrar_carreras,
+            on_error=lambda e: messagebox.showerror(
+                "Error", f"Error al cargar las carreras: {str(e)}"
+            ),
+        )
+
+    def _get_carreras(self):
+        """Carreras disponibles (la coordinación solo ve la suya)."""
+        if self.user.rol == "coordinacion":
+            coordinador = Coordinator.get_by_id(self.user.id)
+            return [coordinador.carrera] if coordinador and coordinador.carrera else []
+        return database.get_carreras()
+
+    def _mostrar_carreras(self, carreras):
+        if self.user.rol == "coordinacion":
+            if not carreras:
+                messagebox.showerror(
+                    "Error", "El coordinador no tiene una carrera asignada."
+                )
+                self.generar_btn.config(state="disabled")
+                return
+            self.carrera_combo.config(values=carreras)
+            self.carrera_var.set(carreras[0])
+            return
+        self.carrera_combo.config(values=(self.TODOS,) + tuple(sorted(carreras)))
+        self.carrera_combo.config(state="readonly")
+
+    def seleccionar_destino(self):
+        if self.formato_var.get() == self.DESTINO_ZIP:
+            ruta = filedialog.asksaveasfilename(
+                defaultextension=".zip",
+                initialfile=f"{self._tipos[self.tipo_var.get()]}s.zip",
+                filetypes=[("Archivo ZIP", "*.zip")],
+                title="Guardar documentos como",
+            )
+        else:
+            ruta = filedialog.askdirectory(title="Carpeta de destino")
+        if ruta:
+            self.destino_var.set(ruta)
+
+    def generar(self):
+        destino = self.destino_var.get().strip()
+        if not destino:
+            messagebox.showwarning("Advertencia", "Seleccione el destino de los documentos")
+            return
+        if self.formato_var.get() == self.DESTINO_ZIP and not destino.lower().endswith(".zip"):
+            destino += ".zip"
+            self.destino_var.set(destino)
+        elif self.formato_var.get() == self.DESTINO_CARPETA and destino.lower().endswith(".zip"):
+            messagebox.showwarning("Advertencia", "Seleccione una carpeta de destino")
+            return
+        carrera = self.carrera_var.get()
+        if carrera == self.TODOS and self.user.rol == "coordinacion":
+            # La carrera del coordinador todavía no se ha cargado
+            return
+        carrera = None if carrera == self.TODOS else carrera
+        semestre = self.semestre_var.get()
+        semestre = None if semestre == self.TODOS else int(semestre)
+
+        for item in self.tree.get_children():
+            self.tree.delete(item)
+        self.reporte_btn.config(state="disabled")
+        self.estado_label.config(text="Generando...")
+        self._avance = None
+        self._generando = True
+        run_in_background(
+            self.tree,
+            self.report_controller.generate_batch,
+            self._tipos[self.tipo_var.get()],
+            destino,
+            self.user.get_full_name(),
+            carrera,
+            semestre,
+            self._registrar_avance,
+            on_success=self._on_generado,
+            on_error=self._on_error,
+            busy=self.generar_btn,
+        )
+        self.parent.after(PROGRESS_INTERVAL, self._mostrar_avance)
+
+    def _registrar_avance(self, hechos, total):
+        # Se llama desde el hilo de trabajo: solo se guarda el valor
+        self._avance = (hechos, total)
+
+    def _mostrar_avance(self):
+        if not self._generando or not self.estado_label.winfo_exists():
+            return
+        if self._avance:
+            hechos, total = self._avance
+            self.estado_label.config(text=f"Generando... {hechos} de {total} documentos")
+        self.parent.after(PROGRESS_INTERVAL, self._mostrar_avance)
+
+    def _on_generado(self, resultado):
+        self._generando = False
+        self.resultado = resultado
+        self.estado_label.config(text=resultado.summary())
+        if resultado.errores:
+            self.reporte_btn.config(state="normal")
+            populate_tree(self.tree, resultado.errores)
+        if resultado.total == 0:
+            messagebox.showinfo(
+                "Documentos por Lote", "No hay estudiantes con los filtros seleccionados."
+            )
+        else:
+            messagebox.showinfo(
+                "Documentos por Lote", f"{resultado.summary()}\n\nDestino:\n{resultado.destino}"
+            )
+
+    def _on_error(self, error):
+        self._generando = False
+        self.estado_label.config(text="")
+        messagebox.showerror("Error", f"No se pudieron generar los documentos: {error}")
+
+    def guardar_reporte(self):
+        if not self.resultado or not self.resultado.errores:
+            return
+        ruta = filedialog.asksaveasfilename(
+            defaultextension=".csv",
+            initialfile="errores_documentos.csv",
+            filetypes=[("CSV", "*.csv")],
+            title="Guardar reporte de errores",
+        )
+        if ruta:
+            try:
+                self.resultado.write_errors(ruta)
+                messagebox.showinfo("Éxito", f"Reporte guardado en:\n{ruta}")
+            except Exception as e:
+                messagebox.showerror("Error", f"No se pudo guardar el reporte: {e}")
@@ -2,14 +2,13 @@ from datetime import datetime
 import tkinter as tk
 from config.database import (
     get_carreras,
-    get_db_connection,
-    set_periodo_activo,
     get_periodo_activo,
 )
 from tkinter import ttk, messagebox
 from controllers.coordinator_controller import CoordinatorController
 from controllers.user_controller import UserController
 from tkcalendar import DateEntry
+from utils.task_executor import run_in_background
 
 
 class CoordinatorListView:
@@ -163,24 +162,32 @@ class CoordinatorListView:
         close_period_btn.pack(side="right", padx=10, pady=15)
 
     def load_coordinators(self):
+        run_in_background(
+            self.tree,
+            self.coordinator_controller.get_all,
+            on_success=self.show_coordinators,
+        )
+
+    def show_coordinators(self, coordinators):
+        # Limpiar tabla
         for item in self.tree.get_children():
             self.tree.delete(item)
 
-        coordinators = self.coordinator_controller.get_all()
-
         for coordinator in coordinators:
             self.tree.insert("", "end", values=coordinator[1:])
 
     def search_coordinators(self):
-        query = self.search_entry.get().lower()
-        coordinators = self.coordinator_controller.get_all()
-        # Limpiar tabla
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        # Filtrar resultados
-        for coordinator in coordinators:
-            if any(query in str(field).lower() for field in coordinator[1:]):
-                self.tree.insert("", "end", values=coordinator[1:])
+        query = self.search_entry.get().strip()
+        if not query:
+            self.load_coordinators()
+            return
+        # Búsqueda en el índice de texto completo (por prefijos y relevancia)
+        run_in_background(
+            self.tree,
+            self.coordinator_controller.search,
+            query,
+            on_success=self.show_coordinators,
+        )
 
     def on_item_double_click(self, event):
         item = self.tree.identify_row(event.y)
@@ -473,96 +480,78 @@ class CoordinatorListView:
             messagebox.showerror("Error", "No se pudo determinar el período activo.")
             return
 
+        # Simulación del cierre para mostrar el resumen antes de confirmar
+        run_in_background(
+            self.parent,
+            self.coordinator_controller.get_period_close_summary,
+            periodo_actual,
+            on_success=self._confirmar_cierre_periodo,
+        )
+
+    def _confirmar_cierre_periodo(self, resumen):
+        periodo_actual = resumen["periodo"]
         confirm = messagebox.askyesno(
             "Confirmar",
-            f"¿Está seguro de cerrar el período académico {periodo_actual}? Esto archivará las notas y eliminará todas las secciones activas de este período.",
+            f"¿Está seguro de cerrar el período académico {periodo_actual}? Esto archivará las notas y eliminará todas las secciones activas de este período.\n\n"
+            f"Materias a archivar: {resumen['materias_archivadas']} "
+            f"(aprobadas: {resumen['aprobados']}, reprobadas: {resumen['reprobados']}, "
+            f"sin nota: {resumen['sin_nota']})\n"
+            f"Secciones a eliminar: {resumen['secciones_eliminadas']}\n"
+            f"Inscripciones a eliminar: {resumen['inscripciones_eliminadas']}\n"
+            f"Calificaciones a eliminar: {resumen['calificaciones_eliminadas']}\n"
+            f"Nuevo período activo: {resumen['siguiente']}",
         )
         if not confirm:
             return
 
-        try:
-            with get_db_connection() as conn:
-                cursor = conn.cursor()
-                # Solo las secciones activas del periodo actual
-                cursor.execute(
-                    "SELECT id_seccion, id_materia, periodo FROM secciones WHERE estado = 'activa' AND periodo = ?",
-                    (periodo_actual,),
-                )
-                secciones = cursor.fetchall()
-
-                for id_seccion, id_materia, periodo in secciones:
-                    # Inscripciones de la sección
-                    cursor.execute(
-                        "SELECT id_estudiante, id_inscripcion FROM inscripciones WHERE id_seccion = ?",
-                        (id_seccion,),
-                    )
-                    inscripciones = cursor.fetchall()
-                    for id_estudiante, id_inscripcion in inscripciones:
-                        # Nota final
-                        cursor.execute(
-                            "SELECT valor_nota FROM calificaciones WHERE id_inscripcion = ? AND tipo_evaluacion = 'nota_def' ORDER BY id_calificacion DESC LIMIT 1",
-                            (id_inscripcion,),
-                        )
-                        nota_row = cursor.fetchone()
-                        nota_final = nota_row[0] if nota_row else None
-
-                        # Estado académico
-                        if nota_final is None:
-                            estado = "REPROBÓ"
-                        elif nota_final >= 10:
-                            estado = "APROBÓ"
-                        else:
-                            estado = "REPROBÓ"
-
-                        # Insertar en materias_cursadas
-                        cursor.execute(
-                            """
-                                INSERT INTO materias_cursadas (id_estudiante, id_materia, periodo, nota_final, estado, fecha_cursada)
-                                VALUES (?, ?, ?, ?, ?, DATE('now'))
-                                """,
-                            (id_estudiante, id_materia, periodo, nota_final, estado),
-                        )
-
-                # Eliminar solo datos del periodo actual
-                cursor.execute(
-                    "DELETE FROM calificaciones WHERE id_inscripcion IN (SELECT id_inscripcion FROM inscripciones WHERE id_seccion IN (SELECT id_seccion FROM secciones WHERE periodo = ?))",
-                    (periodo_actual,),
-                )
-                cursor.execute(
-                    "DELETE FROM inscripciones WHERE id_seccion IN (SELECT id_seccion FROM secciones WHERE periodo = ?)",
-                    (periodo_actual,),
-                )
-                cursor.execute(
-                    "DELETE FROM secciones WHERE periodo = ?", (periodo_actual,)
-                )
-                conn.commit()
-
-            # Avanzar al siguiente periodo
-            anio, lapso = periodo_actual.split("-")
-            if lapso == "1":
-                siguiente = f"{anio}-2"
-            else:
-                siguiente = f"{int(anio)+1}-1"
-
-            # Si el siguiente periodo no existe, crearlo
-            with get_db_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    "SELECT 1 FROM periodos_academicos WHERE periodo = ?", (siguiente,)
-                )
-                if not cursor.fetchone():
-                    cursor.execute(
-                        "INSERT INTO periodos_academicos (periodo, es_activo) VALUES (?, 0)",
-                        (siguiente,),
-                    )
-                    conn.commit()
+        # Ventana de progreso
+        progreso_win = tk.Toplevel(self.parent)
+        progreso_win.title("Cerrando período")
+        progreso_win.resizable(False, False)
+        progreso_win.transient(self.parent.winfo_toplevel())
+        paso_label = tk.Label(progreso_win, text="Iniciando...", font=("Arial", 10))
+        paso_label.pack(padx=20, pady=(15, 5))
+        barra = ttk.Progressbar(progreso_win, length=300, mode="determinate")
+        barra.pack(padx=20, pady=(0, 15))
+
+        # El cierre corre en otro hilo: solo guarda el avance, y la ventana
+        # lo lee periódicamente desde el hilo de Tk
+        avance = {"paso": 0, "total": 1, "descripcion": "Iniciando..."}
+
+        def on_progress(paso, total, descripcion):
+            avance.update(paso=paso, total=total, descripcion=descripcion)
+
+        def refrescar():
+            if not progreso_win.winfo_exists():
+                return
+            barra["maximum"] = avance["total"]
+            barra["value"] = avance["paso"]
+            paso_label.config(
+                text=f"{avance['descripcion']} ({avance['paso']}/{avance['total']})"
+            )
+            progreso_win.after(100, refrescar)
 
-            set_periodo_activo(siguiente)
+        refrescar()
 
+        def on_success(resultado):
+            progreso_win.destroy()
             messagebox.showinfo(
                 "Éxito",
-                f"Período {periodo_actual} cerrado. Ahora el período activo es {siguiente}.",
+                f"Período {periodo_actual} cerrado ({resultado['materias_archivadas']} materias archivadas). Ahora el período activo es {resultado['siguiente']}.",
             )
             self.load_coordinators()
-        except Exception as e:
+
+        def on_error(e):
+            if progreso_win.winfo_exists():
+                progreso_win.destroy()
             messagebox.showerror("Error", f"Ocurrió un error: {e}")
+
+        run_in_background(
+            self.parent,
+            self.coordinator_controller.close_period,
+            periodo_actual,
+            on_progress,
+            owner=None,
+            on_success=on_success,
+            on_error=on_error,
+        )
@@ -1,8 +1,9 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 from tkinter import simpledialog
 from controllers.course_controller import CourseController
 from config.database import get_db_connection
+from utils.task_executor import run_in_background
 
 
 class CourseListView:
@@ -51,6 +52,21 @@ class CourseListView:
         # )
         # add_btn.pack(side="right", padx=20, pady=15)
 
+        # Carga de planes de estudio desde CSV (solo administrador)
+        if getattr(self.user, "rol", None) == "administrador":
+            self.import_btn = tk.Button(
+                header_frame,
+                text="Importar Pensum",
+                bg="#2ecc71",
+                fg="white",
+                font=("Arial", 10, "bold"),
+                bd=0,
+                padx=15,
+                pady=5,
+                command=self.import_curriculum,
+            )
+            self.import_btn.pack(side="right", padx=20, pady=15)
+
         # Contenido
         content_container = tk.Frame(self.parent, bg="#f5f5f5")
         content_container.pack(fill="both", expand=True, padx=20, pady=20)
@@ -242,14 +258,12 @@ class CourseListView:
         user_id = getattr(self.user, "id", None)
         user_rol = getattr(self.user, "rol", None)
 
-        # Obtener materias
-        courses = self.course_controller.get_all()
-
+        # Obtener materias (del catálogo en memoria)
         if user_id == 1:
-            pass  # Admin ve todas las materias
+            courses = self.course_controller.get_all()  # Admin ve todas las materias
         elif user_rol == "coordinacion":
             carrera = self.get_coordinator_carrera(user_id)
-            courses = [c for c in courses if c.carrera == carrera]
+            courses = self.course_controller.filter(carrera=carrera)
         else:
             courses = []
 
@@ -257,20 +271,8 @@ class CourseListView:
 
         # Opciones de filtro según usuario
         if user_id == 1:
-            semestres = sorted(
-                {
-                    str(course.semestre)
-                    for course in self.course_controller.get_all()
-                    if course.semestre is not None
-                }
-            )
-            carreras = sorted(
-                {
-                    str(course.carrera)
-                    for course in self.course_controller.get_all()
-                    if course.carrera is not None
-                }
-            )
+            semestres = self.course_controller.get_semestres()
+            carreras = self.course_controller.get_carreras()
             self.carrera_combo["values"] = [""] + carreras
         elif user_rol == "coordinacion":
             semestres = sorted(
@@ -302,42 +304,46 @@ class CourseListView:
                 ),
             )
 
+    def import_curriculum(self):
+        path = filedialog.askopenfilename(
+            title="Seleccionar plan de estudios",
+            filetypes=[("CSV", "*.csv")],
+        )
+        if not path:
+            return
+        run_in_background(
+            self.tree,
+            self.course_controller.import_curriculum,
+            path,
+            on_success=self._on_curriculum_imported,
+            on_error=lambda e: messagebox.showerror(
+                "Error", f"No se pudo importar el plan de estudios: {e}"
+            ),
+            busy=self.import_btn,
+        )
+
+    def _on_curriculum_imported(self, materias):
+        self.load_courses()
+        messagebox.showinfo(
+            "Éxito", f"Plan de estudios importado: {materias} materias nuevas o actualizadas."
+        )
+
     def apply_filters(self):
         semestre = self.semestre_var.get()
         carrera = self.carrera_var.get()
         user_id = getattr(self.user, "id", None)
         user_rol = getattr(self.user, "rol", None)
-        cursos = self.course_controller.get_all()
-        filtrados = []
-
+        # Admin puede ver todas las carreras; el resto solo la suya
         if user_id == 1:
-            for course in cursos:
-                if carrera and str(course.carrera) != carrera:
-                    continue
-                if semestre and str(course.semestre) != semestre:
-                    continue
-                filtrados.append(course)
-        elif user_rol == "coordinacion":
-            for course in cursos:
-                if str(course.carrera) != carrera:
-                    continue
-                if semestre and str(course.semestre) != semestre:
-                    continue
-                filtrados.append(course)
-        elif user_rol == "profesor":
-            for course in cursos:
-                if str(course.carrera) != carrera:
-                    continue
-                if semestre and str(course.semestre) != semestre:
-                    continue
-                filtrados.append(course)
-        elif user_rol == "estudiante":
-            for course in cursos:
-                if str(course.carrera) != carrera:
-                    continue
-                if semestre and str(course.semestre) != semestre:
-                    continue
-                filtrados.append(course)
+            filtrados = self.course_controller.filter(
+                carrera=carrera or None, semestre=semestre or None
+            )
+        elif user_rol in ("coordinacion", "profesor", "estudiante"):
+            filtrados = self.course_controller.filter(
+                carrera=carrera, semestre=semestre or None
+            )
+        else:
+            filtrados = []
 
         # Limpiar tabla
         for item in self.tree.get_children():
@@ -367,13 +373,7 @@ class CourseListView:
             semestres = [str(i) for i in range(1, 10)]
         else:
             # Si no hay carrera seleccionada, muestra todos los semestres posibles
-            semestres = sorted(
-                {
-                    str(course.semestre)
-                    for course in self.course_controller.get_all()
-                    if course.semestre is not None
-                }
-            )
+            semestres = self.course_controller.get_semestres()
         self.semestre_combo["values"] = [""] + semestres
         self.semestre_var.set("")  # Limpia la selección de semestre
 
@@ -383,21 +383,11 @@ class CourseListView:
             self.load_courses()
             return
 
-        # Obtener todas las materias
-        courses = self.course_controller.get_all()
-
-        # Filtrar por coincidencia en código, nombre, carrera, semestre, créditos o requisitos
-        filtered = []
-        for course in courses:
-            if (
-                query in str(course.codigo).lower()
-                or query in str(course.nombre).lower()
-                or query in str(course.carrera or "").lower()
-                or query in str(course.semestre or "").lower()
-                or query in str(course.creditos or "").lower()
-                or query in str(course.requisitos or "").lower()
-            ):
-                filtered.append(course)
+        # Búsqueda por código, nombre, requisitos o carrera en el índice de
+        # texto completo, respetando la carrera seleccionada en el filtro
+        filtered = self.course_controller.search(
+            query, self.carrera_var.get() or None
+        )
 
         self.current_courses = filtered  # <-- NUEVO
 
@@ -1,8 +1,5 @@
 import tkinter as tk
 from tkinter import ttk
-import matplotlib.pyplot as plt
-import matplotlib.ticker as mticker
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from views.base_view import BaseView
 from controllers.user_controller import UserController
 from controllers.coordinator_controller import CoordinatorController
@@ -10,14 +7,9 @@ from controllers.professor_controller import ProfessorController
 from controllers.student_controller import StudentController
 from controllers.course_controller import CourseController
 from controllers.section_controller import SectionController
-from views.coordinator_views import CoordinatorListView
-from views.professor_views import ProfessorListView
-from views.student_views import StudentListView
-from views.course_views import CourseListView
-from views.section_views import SectionListView
-from views.report_views import ReportView
-from views.enrollment_view import EnrollmentView
 from models.student import Student
+from utils.task_executor import run_in_background
+from config.database import get_dashboard_stats
 
 
 class DashboardView(BaseView):
@@ -121,9 +113,11 @@ class DashboardView(BaseView):
                 ("Coordinadores", "🧑‍💼", self.show_coordinators),  # <-- NUEVO
                 ("Profesores", "👨‍🏫", self.show_professors),
                 ("Estudiantes", "👨‍🎓", self.show_students),
+                ("Importar Usuarios", "📥", self.show_user_import),
                 ("Materias", "📚", self.show_courses),
                 # ("Secciones", "🏛️", self.show_sections),
                 ("Reportes", "📝", self.show_reports),
+                ("Documentos por Lote", "🗂️", self.show_batch_reports),
             ],
             "profesor": [
                 ("Dashboard", "📊", self.show_dashboard),
@@ -143,6 +137,7 @@ class DashboardView(BaseView):
                 ("Gestión de Materias", "📚", self.show_courses),
                 ("Gestión de Secciones", "🏛️", self.show_sections),
                 ("Reportes", "📝", self.show_reports),
+                ("Documentos por Lote", "🗂️", self.show_batch_reports),
                 # ("Estadísticas", "📊", self.show_statistics),
             ],
         }
@@ -182,17 +177,37 @@ class DashboardView(BaseView):
         dashboard_frame = tk.Frame(self.content_frame, bg="#f5f5f5")
         dashboard_frame.pack(fill="both", expand=True, padx=20, pady=20)
 
+        loading_label = tk.Label(
+            dashboard_frame,
+            text="Cargando estadísticas...",
+            font=("Arial", 12),
+            bg="#f5f5f5",
+            fg="#555",
+        )
+        loading_label.pack(pady=20)
+
+        # Las estadísticas se consultan en segundo plano
+        run_in_background(
+            dashboard_frame,
+            get_dashboard_stats,
+            on_success=lambda stats: self._render_dashboard(
+                dashboard_frame, loading_label, stats
+            ),
+            error_title="Error al cargar el dashboard",
+        )
+
+    def _render_dashboard(self, dashboard_frame, loading_label, stats):
+        loading_label.destroy()
+        estudiantes_count = stats["estudiantes"]
+        profesores_count = stats["profesores"]
+        materias_count = stats["materias"]
+        secciones_count = stats["secciones"]
+        usuarios_por_rol = stats["usuarios_por_rol"]
+
         # Tarjetas de información
         cards_frame = tk.Frame(dashboard_frame, bg="#f5f5f5")
         cards_frame.pack(fill="x")
 
-        # Obtener estadísticas
-        estudiantes_count = len(self.student_controller.get_all())
-        coordinadores_count = len(self.coordinator_controller.get_all())
-        profesores_count = len(self.professor_controller.get_all())
-        materias_count = len(self.course_controller.get_all())
-        secciones_count = len(self.section_controller.get_all())
-
         # Crear tarjetas
         card_data = [
             ("Estudiantes", estudiantes_count, "#3498db", "👨‍🎓"),
@@ -259,17 +274,19 @@ class DashboardView(BaseView):
 
         # Datos para el gráfico
         roles = ["Administrador", "Profesor", "Alumno", "Coordinación"]
-        valores = [1, profesores_count, estudiantes_count, coordinadores_count]
+        valores = [
+            usuarios_por_rol["administrador"],
+            usuarios_por_rol["profesor"],
+            usuarios_por_rol["alumno"],
+            usuarios_por_rol["coordinacion"],
+        ]
 
-        fig, ax = plt.subplots(figsize=(8, 4))
-        ax.bar(roles, valores, color=["#3498db", "#2ecc71", "#f39c12", "#e74c3c"])
-        ax.set_ylabel("Cantidad")
-        ax.set_title("Usuarios por Rol")
-        ax.yaxis.set_major_locator(mticker.MaxNLocator(integer=True))
+        # matplotlib se carga con el primer gráfico, no al abrir el dashboard
+        from utils.charts import show_chart
 
-        canvas = FigureCanvasTkAgg(fig, master=chart1_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill="both", expand=True)
+        show_chart("usuarios_por_rol", chart1_frame, roles, valores).pack(
+            fill="both", expand=True
+        )
 
         charts_frame.grid_columnconfigure(0, weight=1)
         charts_frame.grid_columnconfigure(1, weight=1)
@@ -278,6 +295,8 @@ class DashboardView(BaseView):
     def show_coordinators(self):
         for widget in self.content_frame.winfo_children():
             widget.destroy()
+        from views.coordinator_views import CoordinatorListView
+
         coordinator_view = CoordinatorListView(
             self.content_frame, self.app_controller, self.user
         )
@@ -288,6 +307,8 @@ class DashboardView(BaseView):
             widget.destroy()
 
         # Mostrar vista de profesores
+        from views.professor_views import ProfessorListView
+
         professor_view = ProfessorListView(
             self.content_frame, self.app_controller, self.user
         )
@@ -298,10 +319,32 @@ class DashboardView(BaseView):
             widget.destroy()
 
         # Mostrar vista de estudiantes
+        from views.student_views import StudentListView
+
         student_view = StudentListView(
             self.content_frame, self.app_controller, self.user
         )
 
+    def show_user_import(self):
+        # Limpiar contenido actual
+        for widget in self.content_frame.winfo_children():
+            widget.destroy()
+
+        # Mostrar vista de importación masiva
+        from views.import_view import UserImportView
+
+        import_view = UserImportView(self.content_frame, self.app_controller, self.user)
+
+    def show_batch_reports(self):
+        # Limpiar contenido actual
+        for widget in self.content_frame.winfo_children():
+            widget.destroy()
+
+        # Mostrar vista de documentos por lote
+        from views.batch_report_view import BatchReportView
+
+        batch_view = BatchReportView(self.content_frame, self.app_controller, self.user)
+
     def show_professor_courses(self):
         # Limpiar contenido actual
         for widget in self.content_frame.winfo_children():
@@ -384,6 +427,8 @@ class DashboardView(BaseView):
             widget.destroy()
 
         # Mostrar vista de materias
+        from views.course_views import CourseListView
+
         course_view = CourseListView(self.content_frame, self.app_controller, self.user)
 
     def show_sections(self):
@@ -392,6 +437,8 @@ class DashboardView(BaseView):
             widget.destroy()
 
         # Mostrar vista de secciones
+        from views.section_views import SectionListView
+
         section_view = SectionListView(
             self.content_frame, self.app_controller, self.user
         )
@@ -445,6 +492,8 @@ class DashboardView(BaseView):
             widget.destroy()
 
         # Mostrar vista de reportes
+        from views.report_views import ReportView
+
         report_view = ReportView(self.content_frame, self.app_controller, self.user)
 
     def show_statistics(self):
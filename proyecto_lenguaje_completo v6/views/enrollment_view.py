@@ -11,11 +11,38 @@ from reportlab.lib.pagesizes import letter
 from reportlab.pdfgen import canvas
 from tkinter import ttk, messagebox
 from models.course import Course
+from models.enrollment import Enrollment
 from controllers.enrollment_controller import EnrollmentController
 from controllers.student_controller import StudentController
+from utils.task_executor import run_in_background
+from utils.tree_loader import populate_tree
+from models.prerequisite_graph import (
+    get_prerequisite_graph,
+    APROBADA,
+    INSCRITA,
+    BLOQUEADA,
+    EXCEDE_UC,
+    DISPONIBLE,
+)
 
 
 class EnrollmentView:
+    # Ícono de la columna de estado para cada resultado del grafo de requisitos
+    ESTADO_ICONOS = {
+        APROBADA: "✅",
+        INSCRITA: "📋",
+        BLOQUEADA: "🔐",
+        EXCEDE_UC: "⚠️",
+        DISPONIBLE: "📝",
+    }
+
+    # Motivo mostrado por cada sección que enroll_selection no pudo inscribir
+    MOTIVOS_RECHAZO = {
+        Enrollment.SIN_CUPO: "sección sin cupos disponibles",
+        Enrollment.APROBADA: "materia ya aprobada",
+        Enrollment.NO_DISPONIBLE: "sección no disponible",
+    }
+
     def __init__(self, parent, estudiante):
         self.parent = parent
         self.estudiante = estudiante
@@ -23,6 +50,8 @@ class EnrollmentView:
         self.student_controller = StudentController()
         self.materias_seleccionadas = []
         self.uc_inscritas = 0
+        self.materias_task = None
+        self.materia_info = {}
         self.secciones_seleccionadas = (
             {}
         )  # Diccionario para guardar sección por materia
@@ -37,15 +66,17 @@ class EnrollmentView:
         def _verificar():
             with get_db_connection() as conn:
                 cursor = conn.cursor()
+                # Las inscripciones activas se reflejan en la tabla resumen
                 cursor.execute(
                     """
-                    SELECT COUNT(*) FROM inscripciones i
-                    JOIN secciones s ON i.id_seccion = s.id_seccion
-                    WHERE i.id_estudiante = ? AND i.estado = 'activo'
+                    SELECT EXISTS (
+                        SELECT 1 FROM resumen_carga_estudiantes
+                        WHERE id_estudiante = ?
+                    )
                     """,
                     (self.estudiante.id,),
                 )
-                return cursor.fetchone()[0] > 0
+                return bool(cursor.fetchone()[0])
 
         try:
             return execute_with_retry(_verificar)
@@ -403,70 +434,34 @@ class EnrollmentView:
             messagebox.showerror("Error", "Debe seleccionar un período académico.")
             return
 
-        def _inscribir():
-            with get_db_connection() as conn:
-                cursor = conn.cursor()
-                materias_inscritas = []
-
-                # Procesar cada materia a inscribir
-                for item in self.inscribir_tree.get_children():
-                    values = self.inscribir_tree.item(item, "values")
-                    codigo_materia = values[1]
-                    # Obtener directamente el id_seccion de la columna oculta
-                    id_seccion = values[6]
-
-                    # Obtener ID de la materia
-                    cursor.execute(
-                        "SELECT id_materia FROM materias WHERE codigo = ?",
-                        (codigo_materia,),
-                    )
-                    materia_row = cursor.fetchone()
-                    if not materia_row:
-                        continue
-
-                    id_materia = materia_row[0]
-
-                    # Verificar si ya está inscrito
-                    cursor.execute(
-                        """
-                        SELECT id_inscripcion FROM inscripciones 
-                        WHERE id_estudiante = ? AND id_seccion = ?
-                    """,
-                        (self.estudiante.id, id_seccion),
-                    )
-
-                    if not cursor.fetchone():
-                        # Crear inscripción
-                        cursor.execute(
-                            """
-                            INSERT INTO inscripciones (id_estudiante, id_seccion, fecha_inscripcion)
-                            VALUES (?, ?, date('now'))
-                        """,
-                            (self.estudiante.id, id_seccion),
-                        )
-
-                        materias_inscritas.append(codigo_materia)
-
-                # Actualizar semestre del estudiante
-                nuevo_semestre = self.semestre_var.get()
-                cursor.execute(
-                    """
-                    UPDATE estudiantes 
-                    SET semestre = ? 
-                    WHERE id_estudiante = ?
-                """,
-                    (nuevo_semestre, self.estudiante.id),
-                )
+        # Los widgets solo se leen en el hilo de Tk, antes de lanzar la tarea
+        secciones = []
+        for item in self.inscribir_tree.get_children():
+            values = self.inscribir_tree.item(item, "values")
+            # id_seccion de la columna oculta
+            secciones.append(values[6])
+        nuevo_semestre = self.semestre_var.get()
 
-                conn.commit()
-                return materias_inscritas, nuevo_semestre
+        # Toda la selección se valida e inscribe en una sola transacción, con
+        # control de cupos por sección
+        run_in_background(
+            self.parent,
+            self.controller.enroll_selection,
+            self.estudiante.id,
+            secciones,
+            nuevo_semestre,
+            on_success=lambda resultados: self._on_inscripcion_completada(
+                resultados, nuevo_semestre
+            ),
+            on_error=lambda e: messagebox.showerror(
+                "Error", f"Error al inscribir materias: {str(e)}"
+            ),
+        )
 
+    def _on_inscripcion_completada(self, resultados, nuevo_semestre):
         try:
-            result = execute_with_retry(_inscribir)
-            if result is None:
-                return
-
-            materias_inscritas, nuevo_semestre = result
+            inscritas = [r for r in resultados if r[2] == Enrollment.INSCRITA]
+            rechazadas = [r for r in resultados if r[2] in self.MOTIVOS_RECHAZO]
 
             # Actualizar el objeto estudiante
             self.estudiante.semestre = nuevo_semestre
@@ -476,11 +471,21 @@ class EnrollmentView:
             self.actualizar_tabla_materias()
             self.uc_label.config(text=f"UC disponibles: {33 - self.uc_inscritas}")
 
-            messagebox.showinfo(
-                "Inscripción Exitosa",
-                f"Se inscribieron {len(materias_inscritas)} materias correctamente.\n"
-                f"Semestre actualizado a: {nuevo_semestre}",
+            mensaje = (
+                f"Se inscribieron {len(inscritas)} materias correctamente.\n"
+                f"Semestre actualizado a: {nuevo_semestre}"
             )
+            if rechazadas:
+                detalle = "\n".join(
+                    f"- {codigo or id_seccion}: {self.MOTIVOS_RECHAZO[resultado]}"
+                    for id_seccion, codigo, resultado in rechazadas
+                )
+                messagebox.showwarning(
+                    "Inscripción Parcial",
+                    f"{mensaje}\n\nNo se pudieron inscribir:\n{detalle}",
+                )
+            else:
+                messagebox.showinfo("Inscripción Exitosa", mensaje)
 
         except Exception as e:
             messagebox.showerror("Error", f"Error al inscribir materias: {str(e)}")
@@ -492,6 +497,7 @@ class EnrollmentView:
                 cursor.execute(
                     """
                     SELECT 
+                        s.id_seccion,
                         m.codigo,
                         m.nombre,
                         m.creditos,
@@ -516,13 +522,23 @@ class EnrollmentView:
                 self.inscribir_tree.delete(item)
 
             materias = execute_with_retry(_cargar)
-            self.uc_inscritas = 0
+            # Carga de créditos mantenida por la tabla resumen
+            self.uc_inscritas = self.controller.get_creditos_inscritos(
+                self.estudiante.id
+            )
             self.materias_a_inscribir.clear()
             self.secciones_seleccionadas.clear()
 
             for idx, materia in enumerate(materias, start=1):
-                codigo, nombre, creditos, numero_seccion, profesor, requisitos = materia
-                self.uc_inscritas += int(creditos)
+                (
+                    id_seccion,
+                    codigo,
+                    nombre,
+                    creditos,
+                    numero_seccion,
+                    profesor,
+                    requisitos,
+                ) = materia
                 nombre_seccion = f"D{numero_seccion}"
                 self.materias_a_inscribir.add(codigo)
                 self.secciones_seleccionadas[codigo] = nombre_seccion
@@ -536,7 +552,7 @@ class EnrollmentView:
                         creditos,
                         requisitos if requisitos else "-",
                         nombre_seccion,
-                        numero_seccion,
+                        id_seccion,
                     ),
                 )
 
@@ -546,19 +562,29 @@ class EnrollmentView:
             )
 
     def actualizar_tabla_materias(self):
-        for row in self.tree.get_children():
-            self.tree.delete(row)
-
         carrera = self.estudiante.carrera
-        semestre = self.semestre_var.get()
+        semestre = int(self.semestre_var.get())
+        uc_disponibles = 33 - self.uc_inscritas
+        seleccion = set(self.materias_a_inscribir)
 
-        materias = [
-            m
-            for m in Course.get_all()
-            if m.carrera.strip().lower() == carrera.strip().lower()
-            and int(m.semestre) == int(semestre)
-        ]
+        def _cargar():
+            materias = Course.get_by_carrera_semestre(carrera, semestre)
+            # Estado de todas las materias de la carrera en una sola evaluación
+            grafo = get_prerequisite_graph(carrera)
+            estados = grafo.eligible_courses(self.estudiante.id, seleccion, uc_disponibles)
+            return materias, estados
+
+        # Materias y estados en segundo plano; si se cambia de semestre antes
+        # de que lleguen, la carga anterior se descarta
+        if self.materias_task is not None:
+            self.materias_task.cancel()
+        self.materias_task = run_in_background(
+            self.tree,
+            _cargar,
+            on_success=lambda datos: self.mostrar_materias(*datos),
+        )
 
+    def mostrar_materias(self, materias, estados):
         # NUEVO: Calcular la suma total de UC del semestre
         total_uc_semestre = sum(int(m.creditos) for m in materias)
         self.uc_total_semestre_label.config(
@@ -567,87 +593,38 @@ class EnrollmentView:
 
         self.cantidad_materias_semestre = len(materias)
 
-        # --- Cambios aquí: obtener códigos de materias aprobadas ---
-        materias_cursadas = self.controller.get_materias_cursadas(self.estudiante.id)
-        materias_aprobadas_ids = {
-            m["id_materia"] for m in materias_cursadas if m["estado"] == "APROBÓ"
-        }
-        # Obtener los códigos de las materias aprobadas
-        materias_aprobadas_codigos = set()
-        for m in Course.get_all():
-            if m.id in materias_aprobadas_ids:
-                materias_aprobadas_codigos.add(m.codigo)
-
-        materias_inscritas = self.controller.get_materias_inscritas(self.estudiante.id)
-
         self.materia_info = {}
 
-        uc_disponibles = 33 - self.uc_inscritas
-
-        for idx, materia in enumerate(materias, start=1):
-            if materia.codigo in materias_aprobadas_codigos:
-                estado = "✅"
-            elif materia.codigo in self.materias_a_inscribir:
-                estado = "📋"
-            elif materia.id in materias_inscritas:
-                estado = "📋"
-            elif materia.requisitos:
-                req_codigos = [
-                    r.strip() for r in materia.requisitos.split("/") if r.strip()
-                ]
-                req_ids = []
-                corequisito_ok = True
-                for req_codigo in req_codigos:
-                    if req_codigo.startswith("CO-"):
-                        co_codigo = req_codigo[3:]
-                        # Puede inscribir si el corequisito está aprobado o lo está inscribiendo ahora
-                        co_aprobada = False
-                        if (
-                            co_codigo in materias_aprobadas_codigos
-                            or co_codigo in self.materias_a_inscribir
-                        ):
-                            co_aprobada = True
-                        if not co_aprobada:
-                            corequisito_ok = False
-                    else:
-                        # Requisito normal: debe estar aprobado
-                        if req_codigo not in materias_aprobadas_codigos:
-                            req_ids.append(req_codigo)
-                # Si todos los requisitos normales están aprobados y los corequisitos están ok
-                if not req_ids and corequisito_ok:
-                    if int(materia.creditos) > uc_disponibles:
-                        estado = "⚠️"
-                    else:
-                        estado = "📝"
-                else:
-                    estado = "🔐"
-            else:
-                if int(materia.creditos) > uc_disponibles:
-                    estado = "⚠️"
-                else:
-                    estado = "📝"
-
-            item_id = self.tree.insert(
-                "",
-                tk.END,
-                values=(
-                    idx,
-                    materia.codigo,
-                    materia.nombre,
-                    materia.creditos,
-                    materia.requisitos if materia.requisitos else "-",
-                    estado,
-                ),
+        def _valores(fila):
+            idx, materia = fila
+            return (
+                idx,
+                materia.codigo,
+                materia.nombre,
+                materia.creditos,
+                materia.requisitos if materia.requisitos else "-",
+                self.ESTADO_ICONOS[estados.get(materia.codigo, DISPONIBLE)],
             )
+
+        def _registrar(item_id, fila):
+            materia = fila[1]
             self.materia_info[item_id] = {
                 "id_materia": materia.id,
                 "codigo": materia.codigo,
                 "nombre": materia.nombre,
                 "uc": materia.creditos,
                 "requisito": materia.requisitos if materia.requisitos else "-",
-                "estado": estado,
+                "estado": self.ESTADO_ICONOS[estados.get(materia.codigo, DISPONIBLE)],
             }
 
+        # Por tandas; cambiar de semestre a mitad de la carga la reemplaza
+        populate_tree(
+            self.tree,
+            list(enumerate(materias, start=1)),
+            values=_valores,
+            on_item=_registrar,
+        )
+
     def on_hover(self, event):
         region = self.tree.identify("region", event.x, event.y)
         row_id = self.tree.identify_row(event.y)
@@ -958,19 +935,15 @@ class EnrollmentView:
         try:
             materias = execute_with_retry(_cargar)
 
-            total_creditos = 0
-            for materia in materias:
-                codigo, nombre, creditos, numero_seccion, profesor = materia
-                total_creditos += int(creditos)
-
-                # Convertir numero_seccion a formato D1, D2, D3, etc.
-                nombre_seccion = f"D{numero_seccion}"
+            total_creditos = sum(int(materia[2]) for materia in materias)
 
-                self.tree_readonly.insert(
-                    "",
-                    "end",
-                    values=(codigo, nombre, creditos, nombre_seccion, profesor),
-                )
+            # numero_seccion se muestra como D1, D2, D3, etc.
+            populate_tree(
+                self.tree_readonly,
+                materias,
+                values=lambda m: (m[0], m[1], m[2], f"D{m[3]}", m[4]),
+                clear=False,
+            )
 
             # Actualizar estadísticas
             if hasattr(self, "stats_readonly_label"):
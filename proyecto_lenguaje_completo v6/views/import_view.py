@@ -0,0 +1,220 @@
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog
+from controllers.import_controller import ImportController
+from models.user_import import ROLES_IMPORTABLES
+from utils.task_executor import run_in_background
+from utils.tree_loader import populate_tree
+
+
+# Cada cuánto (ms) se actualiza el avance mientras corre la importación
+PROGRESS_INTERVAL = 200
+
+
+class UserImportView:
+    """Importación masiva de usuarios desde un archivo CSV."""
+
+    ROL_DEL_ARCHIVO = "Según el archivo"
+
+    def __init__(self, parent, app_controller, user):
+        self.parent = parent
+        self.app_controller = app_controller
+        self.user = user
+        self.import_controller = ImportController()
+        self.resultado = None
+        self._avance = None
+        self._importando = False
+
+        self.create_widgets()
+
+    def create_widgets(self):
+        # Header
+        header_frame = tk.Frame(self.parent, bg="white", height=60)
+        header_frame.pack(fill="x")
+
+        tk.Label(
+            header_frame,
+            text="Importar Usuarios",
+            font=("Arial", 16, "bold"),
+            bg="white",
+        ).pack(side="left", padx=20, pady=15)
+
+        content_container = tk.Frame(self.parent, bg="#f5f5f5")
+        content_container.pack(fill="both", expand=True, padx=20, pady=20)
+
+        # Archivo y rol
+        form_frame = tk.Frame(content_container, bg="white", padx=10, pady=10)
+        form_frame.pack(fill="x", pady=(0, 10))
+
+        tk.Label(form_frame, text="Archivo CSV:", bg="white").grid(
+            row=0, column=0, sticky="w", padx=(0, 10)
+        )
+        self.archivo_var = tk.StringVar()
+        tk.Entry(form_frame, textvariable=self.archivo_var, width=60).grid(
+            row=0, column=1, sticky="w"
+        )
+        tk.Button(
+            form_frame,
+            text="Examinar...",
+            bg="#3498db",
+            fg="white",
+            font=("Arial", 10),
+            bd=0,
+            padx=10,
+            pady=2,
+            command=self.seleccionar_archivo,
+        ).grid(row=0, column=2, padx=10)
+
+        tk.Label(form_frame, text="Rol:", bg="white").grid(
+            row=1, column=0, sticky="w", padx=(0, 10), pady=(10, 0)
+        )
+        self.rol_var = tk.StringVar(value=self.ROL_DEL_ARCHIVO)
+        ttk.Combobox(
+            form_frame,
+            textvariable=self.rol_var,
+            values=(self.ROL_DEL_ARCHIVO,) + ROLES_IMPORTABLES,
+            state="readonly",
+            width=20,
+        ).grid(row=1, column=1, sticky="w", pady=(10, 0))
+
+        tk.Label(
+            form_frame,
+            text=(
+                "Columnas: cedula, nombre, apellido y opcionalmente rol, carrera, "
+                "semestre, fecha (AAAA-MM-DD) y password"
+            ),
+            bg="white",
+            fg="gray",
+        ).grid(row=2, column=0, columnspan=3, sticky="w", pady=(10, 0))
+
+        # Acciones
+        action_frame = tk.Frame(content_container, bg="#f5f5f5", pady=10)
+        action_frame.pack(fill="x")
+
+        self.import_btn = tk.Button(
+            action_frame,
+            text="Importar",
+            bg="#2ecc71",
+            fg="white",
+            font=("Arial", 10, "bold"),
+            bd=0,
+            padx=15,
+            pady=5,
+            command=self.importar,
+        )
+        self.import_btn.pack(side="left", padx=5)
+
+        self.reporte_btn = tk.Button(
+            action_frame,
+            text="Guardar reporte de errores",
+            bg="#f39c12",
+            fg="white",
+            font=("Arial", 10, "bold"),
+            bd=0,
+            padx=15,
+            pady=5,
+            state="disabled",
+            command=self.guardar_reporte,
+        )
+        self.reporte_btn.pack(side="left", padx=5)
+
+        self.estado_label = tk.Label(action_frame, text="", bg="#f5f5f5")
+        self.estado_label.pack(side="left", padx=15)
+
+        # Errores por fila
+        table_frame = tk.Frame(content_container, bg="white")
+        table_frame.pack(fill="both", expand=True)
+
+        columns = ("linea", "cedula", "error")
+        self.tree = ttk.Treeview(table_frame, columns=columns, show="headings")
+        vsb = ttk.Scrollbar(table_frame, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=vsb.set)
+        self.tree.grid(row=0, column=0, sticky="nsew")
+        vsb.grid(row=0, column=1, sticky="ns")
+        table_frame.grid_rowconfigure(0, weight=1)
+        table_frame.grid_columnconfigure(0, weight=1)
+
+        for col, texto, ancho in (
+            ("linea", "Línea", 70),
+            ("cedula", "Cédula", 120),
+            ("error", "Error", 500),
+        ):
+            self.tree.heading(col, text=texto)
+            self.tree.column(col, width=ancho, anchor="w" if col == "error" else "center")
+
+    def seleccionar_archivo(self):
+        ruta = filedialog.askopenfilename(
+            title="Seleccionar archivo de usuarios",
+            filetypes=[("CSV", "*.csv"), ("Todos los archivos", "*.*")],
+        )
+        if ruta:
+            self.archivo_var.set(ruta)
+
+    def importar(self):
+        ruta = self.archivo_var.get().strip()
+        if not ruta:
+            messagebox.showwarning("Advertencia", "Seleccione un archivo CSV")
+            return
+        rol = self.rol_var.get()
+        rol = None if rol == self.ROL_DEL_ARCHIVO else rol
+
+        for item in self.tree.get_children():
+            self.tree.delete(item)
+        self.reporte_btn.config(state="disabled")
+        self.estado_label.config(text="Importando...")
+        self._avance = None
+        self._importando = True
+        run_in_background(
+            self.tree,
+            self.import_controller.import_users,
+            ruta,
+            rol,
+            self._registrar_avance,
+            on_success=self._on_importado,
+            on_error=self._on_error,
+            busy=self.import_btn,
+        )
+        self.parent.after(PROGRESS_INTERVAL, self._mostrar_avance)
+
+    def _registrar_avance(self, leidas, importadas):
+        # Se llama desde el hilo de trabajo: solo se guarda el valor
+        self._avance = (leidas, importadas)
+
+    def _mostrar_avance(self):
+        if not self._importando or not self.estado_label.winfo_exists():
+            return
+        if self._avance:
+            leidas, importadas = self._avance
+            self.estado_label.config(
+                text=f"Importando... {leidas} filas leídas, {importadas} importadas"
+            )
+        self.parent.after(PROGRESS_INTERVAL, self._mostrar_avance)
+
+    def _on_importado(self, resultado):
+        self._importando = False
+        self.resultado = resultado
+        self.estado_label.config(text=resultado.summary())
+        if resultado.errores:
+            self.reporte_btn.config(state="normal")
+            populate_tree(self.tree, sorted(resultado.errores))
+        messagebox.showinfo("Importación", resultado.summary())
+
+    def _on_error(self, error):
+        self._importando = False
+        self.estado_label.config(text="")
+        messagebox.showerror("Error", f"No se pudo importar el archivo: {error}")
+
+    def guardar_reporte(self):
+        if not self.resultado or not self.resultado.errores:
+            return
+        ruta = filedialog.asksaveasfilename(
+            defaultextension=".csv",
+            initialfile="errores_importacion.csv",
+            filetypes=[("CSV", "*.csv")],
+            title="Guardar reporte de errores",
+        )
+        if ruta:
+            try:
+                self.resultado.write_errors(ruta)
+                messagebox.showinfo("Éxito", f"Reporte guardado en:\n{ruta}")
+            except Exception as e:
+                messagebox.showerror("Error", f"No se pudo guardar el reporte: {e}")
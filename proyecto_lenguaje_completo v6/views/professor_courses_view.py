@@ -2,6 +2,7 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 from controllers.section_controller import SectionController
 from models.professor import Professor
+from utils.tree_loader import populate_tree
 
 
 class ProfessorCoursesView:
@@ -68,20 +69,9 @@ class ProfessorCoursesView:
         tree.column("seccion", width=80, anchor="center")
         tree.column("estudiantes", width=100, anchor="center")
 
-        # Insertar datos
-        for seccion in secciones:
-            # seccion: (id_seccion, nombre_materia, periodo, aula, estudiantes)
-            tree.insert(
-                "",
-                "end",
-                values=(
-                    seccion[0],  # nombre_materia
-                    seccion[1],  # periodo
-                    seccion[2],  # aula
-                    seccion[3],  # sección (número de sección)
-                    seccion[4],  # estudiantes
-                ),
-            )
+        # Insertar datos por tandas
+        # seccion: (nombre_materia, periodo, aula, seccion, estudiantes, id_seccion)
+        populate_tree(tree, secciones, values=lambda seccion: seccion[:5])
 
         if not secciones:
             tk.Label(
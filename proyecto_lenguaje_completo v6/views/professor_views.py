@@ -1,14 +1,18 @@
 from datetime import datetime
 import tkinter as tk
-from config.database import get_carreras, get_db_connection
+from config.database import get_carreras, get_db_connection, run_report
 from tkinter import ttk, messagebox, filedialog
 from controllers.professor_controller import ProfessorController
 from controllers.user_controller import UserController
 from controllers.section_controller import SectionController
-from controllers.grade_controller import GradeController
+from controllers.grade_controller import GradeController, GradeSaveQueue
 from models.professor import Professor
 from tkcalendar import DateEntry
 from pdf import reportesPDF
+from utils.task_executor import run_in_background
+from utils.paged_treeview import PagedTreeview
+from utils.tree_loader import populate_tree, cancel_population
+from config.pagination import KeysetPager, ListSource
 
 
 class ProfessorListView:
@@ -111,6 +115,9 @@ class ProfessorListView:
             self.tree.heading(col, text=col.replace("_", " ").title())
             self.tree.column(col, width=100, anchor="center")
 
+        # Solo las filas visibles se leen (por páginas) y se dibujan
+        self.pager = PagedTreeview(self.tree, vsb)
+
         # Cargar datos
         self.load_professors()
 
@@ -161,25 +168,30 @@ class ProfessorListView:
         refresh_btn.pack(side="left", padx=5)
 
     def load_professors(self):
-        # Limpiar tabla
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        # Listado completo paginado; si ya se está mostrando, solo se refresca
+        if isinstance(self.pager.source, KeysetPager):
+            self.pager.refresh()
+            return
+        run_in_background(
+            self.tree, self.get_visible_professors, on_success=self.pager.set_source
+        )
 
+    def get_visible_professors(self):
         # Filtrar profesores según el usuario
         if self.user.id == 1:  # Admin ve todos
-            professors = self.professor_controller.get_all()
+            return self.professor_controller.paged()
         elif self.user.rol == "coordinacion":
             # Obtener la carrera del coordinador
             carrera = self.get_coordinator_carrera(self.user.id)
-            professors = [
-                p for p in self.professor_controller.get_all() if p[4] == carrera
-            ]
-        else:
-            professors = []
-
-        # Insertar datos en la tabla
-        for professor in professors:
-            self.tree.insert("", "end", values=professor[1:])
+            if carrera:
+                return self.professor_controller.paged(carrera)
+        return ListSource([], self.tree["columns"])
+
+    def show_professors(self, professors):
+        # Resultados de búsqueda (ya en memoria), sin la columna id
+        self.pager.set_source(
+            ListSource([p[1:] for p in professors], self.tree["columns"])
+        )
 
     def get_coordinator_carrera(self, user_id):
         # Busca la carrera del coordinador en la tabla coordinadores
@@ -192,15 +204,17 @@ class ProfessorListView:
             return row[0] if row else None
 
     def search_professors(self):
-        query = self.search_entry.get().lower()
-        professors = self.professor_controller.get_all()
-        # Limpiar tabla
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        # Filtrar resultados
-        for professor in professors:
-            if any(query in str(field).lower() for field in professor[1:]):
-                self.tree.insert("", "end", values=professor[1:])
+        query = self.search_entry.get().strip()
+        if not query:
+            self.load_professors()
+            return
+        # Búsqueda en el índice de texto completo (por prefijos y relevancia)
+        run_in_background(
+            self.tree,
+            self.professor_controller.search,
+            query,
+            on_success=self.show_professors,
+        )
 
     def on_item_double_click(self, event):
         item = self.tree.identify_row(event.y)
@@ -208,14 +222,14 @@ class ProfessorListView:
             self.edit_selected_professor()
 
     def edit_selected_professor(self):
-        selected = self.tree.selection()
+        selected = self.pager.selected_values()
         if not selected:
             messagebox.showwarning(
                 "Advertencia", "Por favor, seleccione un profesor para editar"
             )
             return
 
-        cedula = self.tree.item(selected[0], "values")[0]
+        cedula = selected[0][0]
         professor_id = self.professor_controller.get_id_by_cedula(cedula)
         if not professor_id:
             messagebox.showerror("Error", "No se encontró el coordinador por cédula")
@@ -223,14 +237,14 @@ class ProfessorListView:
         self.show_edit_form(professor_id)
 
     def delete_selected_professor(self):
-        selected = self.tree.selection()
+        selected = self.pager.selected_values()
         if not selected:
             messagebox.showwarning(
                 "Advertencia", "Por favor, seleccione un profesor para eliminar"
             )
             return
 
-        cedula = self.tree.item(selected[0], "values")[0]
+        cedula = selected[0][0]
 
         # Confirmar eliminación
         confirm = messagebox.askyesno(
@@ -490,6 +504,17 @@ class GestionNotasProfesorView:
         self.professor = Professor.get_by_user_id(user.id)
         self.section_controller = SectionController()
         self.grade_controller = GradeController()
+        self.grade_buffer = None
+        self.gradebook_task = None
+        # Materia de la planilla cargada (la del combo puede ir adelantada
+        # mientras se guardan las notas de la anterior)
+        self.materia_cargada = None
+        self.guardados = GradeSaveQueue(
+            self.grade_controller,
+            lambda func, *args, **kwargs: run_in_background(
+                self.parent, func, *args, owner=None, **kwargs
+            ),
+        )
         self.setup_ui()
 
     def setup_ui(self):
@@ -527,6 +552,25 @@ class GestionNotasProfesorView:
         )
         pdf_btn.pack(side="right")
 
+        # Botón para guardar las notas editadas en un solo lote
+        guardar_btn = tk.Button(
+            materia_frame,
+            text="Guardar Notas",
+            bg="#27ae60",
+            fg="white",
+            font=("Arial", 10, "bold"),
+            bd=0,
+            padx=15,
+            pady=5,
+            command=self.guardar_notas,
+        )
+        guardar_btn.pack(side="right", padx=(0, 10))
+
+        self.pendientes_label = tk.Label(materia_frame, text="", fg="#c0392b")
+        self.pendientes_label.pack(side="right", padx=(0, 10))
+        self.progreso_label = tk.Label(materia_frame, text="", fg="gray")
+        self.progreso_label.pack(side="right", padx=(0, 10))
+
         # Cargar materias del profesor
         if not self.professor:
             messagebox.showerror(
@@ -592,6 +636,8 @@ class GestionNotasProfesorView:
         self.tree.pack(fill="both", expand=True, padx=20, pady=10)
 
         self.tree.bind("<Double-1>", self.on_double_click)
+        # Si se abandona la pantalla, las notas pendientes no se pierden
+        self.tree.bind("<Destroy>", lambda e: self.guardar_al_salir())
 
     def on_double_click(self, event):
         # Identificar la celda
@@ -634,127 +680,133 @@ class GestionNotasProfesorView:
         entry.bind("<FocusOut>", lambda e: entry.destroy())
 
     def guardar_nota(self, item_id, col_num, nota):
-        # Obtener datos del estudiante y sección
-        values = self.tree.item(item_id, "values")
-        ci = values[1]
-        display = self.materia_var.get()
-        id_seccion, _ = self.materias_map[display]
-
-        # Buscar la inscripción del estudiante en la sección
-        from models.enrollment import Enrollment
-
-        inscripciones = Enrollment.get_by_section(id_seccion)
-        inscripcion_id = None
-        for ins in inscripciones:
-            if str(ins[1]) == str(ci):  # ins[1] es la cédula
-                inscripcion_id = ins[0]  # ins[0] es id_inscripcion
-                break
-
-        if not inscripcion_id:
-            messagebox.showerror(
-                "Error", "No se encontró la inscripción del estudiante."
-            )
+        if self.grade_buffer is None:
             return
 
+        values = list(self.tree.item(item_id, "values"))
+        ci = values[1]
+
         # Determinar el tipo de corte
         corte_map = {4: "corte1", 5: "corte2", 6: "corte3", 7: "corte4"}
         tipo_evaluacion = corte_map.get(col_num, "corte1")
 
-        # Guardar o actualizar la nota
-        from models.grade import Grade
-
-        Grade.save_or_update(inscripcion_id, tipo_evaluacion, nota)
-        messagebox.showinfo("Éxito", f"Nota guardada para {tipo_evaluacion.upper()}.")
-
-        # Recalcular nota definitiva
-        values = list(self.tree.item(item_id, "values"))
+        # La nota queda pendiente hasta pulsar "Guardar Notas"
         try:
-            # Asegurarse de que los valores no estén vacíos antes de convertirlos
-            cortes = [float(v) for v in values[4:8] if v]
-        except (ValueError, IndexError):
-            cortes = []  # Si hay un error, la lista de cortes estará vacía
+            nota_def = self.grade_buffer.set_grade(ci, tipo_evaluacion, nota)
+        except ValueError as e:
+            messagebox.showerror("Error", str(e))
+            return
 
-        # Calcular la nota solo si hay notas válidas
-        nota_def = round(sum(cortes) / 4, 2) if cortes else 0.0
         values[8] = str(nota_def)  # índice 8 es la columna NOTA DEF.
         self.tree.item(item_id, values=values)
+        self.actualizar_pendientes()
+
+    def actualizar_pendientes(self):
+        pendientes = len(self.grade_buffer) if self.grade_buffer else 0
+        texto = f"{pendientes} nota(s) sin guardar" if pendientes else ""
+        if self.pendientes_label.winfo_exists():
+            self.pendientes_label.config(text=texto)
+
+    def guardar_pendientes(self, on_success=None):
+        """
+        Guarda las notas pendientes en una sola transacción, en segundo
+        plano. on_success() se llama cuando terminan todos los guardados en
+        curso (ver GradeSaveQueue). Si un guardado falla, sus notas vuelven a
+        quedar pendientes en la planilla cargada (solo se reemplaza después
+        de guardar) y el combo vuelve a esa materia.
+        """
+
+        def _error(e):
+            self.actualizar_pendientes()
+            if self.materia_cargada is not None:
+                self.materia_var.set(self.materia_cargada)
+            messagebox.showerror("Error", f"No se pudieron guardar las notas: {e}")
+
+        self.guardados.save(self.grade_buffer, then=on_success, on_error=_error)
+        self.actualizar_pendientes()
+
+    def guardar_al_salir(self):
+        """
+        Guarda lo pendiente al destruir la pantalla. Se hace en el momento y
+        no en segundo plano: al cerrar la aplicación el ejecutor cancela las
+        tareas que no empezaron y las notas se perderían.
+        """
+        if not self.grade_buffer or not len(self.grade_buffer):
+            return
+        try:
+            self.grade_buffer.flush()
+        except Exception as e:
+            messagebox.showerror("Error", f"No se pudieron guardar las notas: {e}")
 
-        # Guardar nota definitiva en la base de datos
-        ci = values[1]
-        display = self.materia_var.get()
-        id_seccion, _ = self.materias_map[display]
-
-        from models.enrollment import Enrollment
-
-        inscripciones = Enrollment.get_by_section(id_seccion)
-        inscripcion_id = None
-        for ins in inscripciones:
-            if str(ins[1]) == str(ci):  # ins[1] es la cédula
-                inscripcion_id = ins[0]  # ins[0] es id_inscripcion
-                break
-
-        if inscripcion_id:
-            from models.grade import Grade
-
-            Grade.save_or_update(inscripcion_id, "nota_def", nota_def)
+    def guardar_notas(self):
+        if not self.grade_buffer or not len(self.grade_buffer):
+            messagebox.showinfo("Información", "No hay notas pendientes por guardar.")
+            return
+        self.guardar_pendientes(
+            on_success=lambda: messagebox.showinfo(
+                "Éxito", "Notas guardadas correctamente."
+            )
+        )
 
     def cargar_estudiantes(self, event=None):
-        # Limpia la tabla
+        # Guardar lo pendiente de la materia anterior y cargar la nueva
+        # planilla solo cuando terminó de guardarse
+        self.guardar_pendientes(on_success=self._cargar_planilla)
+
+    def _cargar_planilla(self):
+        # Notas editadas en la planilla anterior mientras se guardaba
+        if self.grade_buffer and len(self.grade_buffer):
+            self.guardar_pendientes(on_success=self._cargar_planilla)
+            return
+
+        # Limpia la tabla (y detiene el llenado de la materia anterior)
+        cancel_population(self.tree)
         for item in self.tree.get_children():
             self.tree.delete(item)
 
+        self.grade_buffer = None
+        self.actualizar_pendientes()
         display = self.materia_var.get()
         if not display or display not in self.materias_map:
+            self.materia_cargada = None
             return
 
         id_seccion, _ = self.materias_map[display]
+        self.materia_cargada = display
+
+        # Planilla completa (datos y notas) en una sola consulta, en segundo
+        # plano; si se cambia de materia antes de que llegue, se descarta
+        if self.gradebook_task is not None:
+            self.gradebook_task.cancel()
+        self.gradebook_task = run_in_background(
+            self.tree,
+            self.grade_controller.get_gradebook,
+            id_seccion,
+            on_success=self.mostrar_planilla,
+        )
 
-        from models.enrollment import Enrollment
-        from models.grade import Grade
-
-        inscripciones = Enrollment.get_by_section(id_seccion)
-        estudiantes = []
-        for ins in inscripciones:
-            inscripcion_id = ins[0]
-            ci = ins[1]
-            nombres = ins[2]
-            apellidos = ins[3]
-
-            # Obtener notas de la base de datos
-            notas = {"corte1": 0, "corte2": 0, "corte3": 0, "corte4": 0, "nota_def": 0}
-            calificaciones = Grade.get_by_inscripcion(inscripcion_id)
-            for cal in calificaciones:
-                notas[cal.tipo_evaluacion] = cal.valor_nota
-
-            estudiantes.append(
-                (
-                    ci,
-                    nombres,
-                    apellidos,
-                    notas.get("corte1", 0),
-                    notas.get("corte2", 0),
-                    notas.get("corte3", 0),
-                    notas.get("corte4", 0),
-                    notas.get("nota_def", 0),
-                )
-            )
-
-        for idx, est in enumerate(estudiantes, start=1):
-            self.tree.insert(
-                "",
-                "end",
-                values=(
-                    idx,
-                    est[0],  # C.I
-                    est[1],  # Nombres
-                    est[2],  # Apellidos
-                    est[3],  # Corte 1
-                    est[4],  # Corte 2
-                    est[5],  # Corte 3
-                    est[6],  # Corte 4
-                    est[7],  # Nota Def.
-                ),
-            )
+    def mostrar_planilla(self, planilla):
+        self.grade_buffer = self.grade_controller.create_write_buffer(planilla)
+        self.actualizar_pendientes()
+        estudiantes = [row[1:] for row in planilla]
+
+        # Por tandas, para no congelar la ventana con secciones grandes
+        populate_tree(
+            self.tree,
+            list(enumerate(estudiantes, start=1)),
+            values=lambda fila: (
+                fila[0],  # Nº
+                fila[1][0],  # C.I
+                fila[1][1],  # Nombres
+                fila[1][2],  # Apellidos
+                fila[1][3],  # Corte 1
+                fila[1][4],  # Corte 2
+                fila[1][5],  # Corte 3
+                fila[1][6],  # Corte 4
+                fila[1][7],  # Nota Def.
+            ),
+            progress=self.progreso_label,
+        )
 
     def generar_pdf_notas(self):
         # Verificar que se haya seleccionado una materia
@@ -779,66 +831,77 @@ class GestionNotasProfesorView:
             # Obtener datos de la materia seleccionada
             id_seccion, nombre_materia = self.materias_map[display]
 
-            # Obtener información de la sección
-            seccion_info = self.section_controller.get_by_id(id_seccion)
-            if not seccion_info:
-                messagebox.showerror(
-                    "Error", "No se encontró información de la sección"
-                )
-                return
-
-            # Obtener estudiantes y sus notas
-            from models.enrollment import Enrollment
-            from models.grade import Grade
-
-            inscripciones = Enrollment.get_by_section(id_seccion)
-            estudiantes_notas = []
-
-            for ins in inscripciones:
-                inscripcion_id = ins[0]
-                ci = ins[1]
-                nombres = ins[2]
-                apellidos = ins[3]
-
-                # Obtener notas de la base de datos
-                notas = {
-                    "corte1": 0,
-                    "corte2": 0,
-                    "corte3": 0,
-                    "corte4": 0,
-                    "nota_def": 0,
-                }
-                calificaciones = Grade.get_by_inscripcion(inscripcion_id)
-                for cal in calificaciones:
-                    notas[cal.tipo_evaluacion] = cal.valor_nota
-
-                estudiantes_notas.append(
-                    {
-                        "ci": ci,
-                        "nombres": nombres,
-                        "apellidos": apellidos,
-                        "corte1": notas.get("corte1", 0),
-                        "corte2": notas.get("corte2", 0),
-                        "corte3": notas.get("corte3", 0),
-                        "corte4": notas.get("corte4", 0),
-                        "nota_def": notas.get("nota_def", 0),
-                    }
+            # Consultas (en un snapshot de solo lectura) y generación del PDF
+            # fuera del hilo de Tk; el reporte debe reflejar las notas recién
+            # editadas, así que se genera después de guardarlas
+            def exportar():
+                run_in_background(
+                    self.parent,
+                    run_report,
+                    self._generar_pdf_notas,
+                    file_path,
+                    id_seccion,
+                    nombre_materia,
+                    display,
+                    owner=None,
+                    on_success=lambda generado: (
+                        messagebox.showinfo(
+                            "Éxito", "El reporte de notas se exportó correctamente a PDF."
+                        )
+                        if generado
+                        else messagebox.showerror(
+                            "Error", "No se encontró información de la sección"
+                        )
+                    ),
+                    on_error=lambda e: messagebox.showerror(
+                        "Error", f"No se pudo exportar el reporte a PDF:\n{e}"
+                    ),
                 )
 
-            # Generar el PDF usando la función del módulo reportesPDF
-            reportesPDF.generar_reporte_notas_profesor(
-                file_path,
-                estudiantes_notas,
-                nombre_materia,
-                display,
-                self.user.nombre,
-                self.user.apellido,
-                seccion_info,
-            )
-
-            messagebox.showinfo(
-                "Éxito", "El reporte de notas se exportó correctamente a PDF."
-            )
+            self.guardar_pendientes(on_success=exportar)
 
         except Exception as e:
             messagebox.showerror("Error", f"No se pudo exportar el reporte a PDF:\n{e}")
+
+    def _generar_pdf_notas(self, file_path, id_seccion, nombre_materia, display):
+        # Obtener información de la sección
+        seccion_info = self.section_controller.get_by_id(id_seccion)
+        if not seccion_info:
+            return False
+
+        # Obtener estudiantes y sus notas en una sola consulta
+        estudiantes_notas = [
+            {
+                "ci": ci,
+                "nombres": nombres,
+                "apellidos": apellidos,
+                "corte1": corte1,
+                "corte2": corte2,
+                "corte3": corte3,
+                "corte4": corte4,
+                "nota_def": nota_def,
+            }
+            for (
+                _,
+                ci,
+                nombres,
+                apellidos,
+                corte1,
+                corte2,
+                corte3,
+                corte4,
+                nota_def,
+            ) in self.grade_controller.get_gradebook(id_seccion)
+        ]
+
+        # Generar el PDF usando la función del módulo reportesPDF
+        reportesPDF.generar_reporte_notas_profesor(
+            file_path,
+            estudiantes_notas,
+            nombre_materia,
+            display,
+            self.user.nombre,
+            self.user.apellido,
+            seccion_info,
+        )
+        return True
@@ -1,17 +1,18 @@
 import tkinter as tk
-import matplotlib.ticker as mticker
 from tkinter import ttk, messagebox, filedialog
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from pdf import reportesPDF
 from config import database
 from models.student import Student
+from models.transcript import Transcript
 import os
 import traceback
 import sqlite3
 from config.database import get_db_connection, execute_with_retry
 from models.coordinator import Coordinator
 from datetime import datetime
+from utils.task_executor import run_in_background
+from utils.tree_loader import populate_tree
+from utils.charts import show_chart
 
 
 class ReportView:
@@ -19,6 +20,7 @@ class ReportView:
         self.parent = parent
         self.app_controller = app_controller
         self.user = user
+        self.report_task = None
 
         # Crear interfaz
         self.create_widgets()
@@ -104,6 +106,20 @@ class ReportView:
         # # Generar reporte inicial
         # self.generate_report()
 
+    def run_report_task(self, func, *args, **kwargs):
+        """
+        Ejecuta la consulta del reporte en segundo plano, dentro de un snapshot
+        de solo lectura. Si se pide otro reporte antes de que termine, el
+        anterior se cancela.
+        """
+        if self.report_task is not None:
+            self.report_task.cancel()
+        kwargs.setdefault("owner", self.report_frame)
+        self.report_task = run_in_background(
+            self.parent, database.run_report, func, *args, **kwargs
+        )
+        return self.report_task
+
     def generate_report(self):
         # Limpiar área de reporte
         for widget in self.report_frame.winfo_children():
@@ -138,7 +154,13 @@ class ReportView:
         ).pack(anchor="w", pady=(0, 20))
 
         # --- CONSULTA A LA BASE DE DATOS ---
-        resultados = database.get_estudiantes_por_carrera()
+        self.run_report_task(
+            database.get_estudiantes_por_carrera,
+            on_success=self._render_students_by_career_report,
+            error_title="Error al generar el reporte",
+        )
+
+    def _render_students_by_career_report(self, resultados):
 
         carreras_fijas = [
             "Ingeniería en Sistemas",
@@ -153,22 +175,9 @@ class ReportView:
         carreras = carreras_fijas
         valores = [valores_dict[c] for c in carreras_fijas]
 
-        fig, ax = plt.subplots(figsize=(10, 6))
-        ax.bar(
-            carreras,
-            valores,
-            color=["#3498db", "#2ecc71", "#f39c12", "#e74c3c"],
+        show_chart("estudiantes_por_carrera", self.report_frame, carreras, valores).pack(
+            fill="both", expand=True
         )
-        ax.set_ylabel("Cantidad de Estudiantes")
-        ax.set_title("Distribución de Estudiantes por Carrera")
-        ax.yaxis.set_major_locator(mticker.MaxNLocator(integer=True))
-        ax.yaxis.set_major_formatter(mticker.StrMethodFormatter("{x:.0f}"))
-        plt.xticks(rotation=45, ha="right")
-        plt.tight_layout()
-
-        canvas = FigureCanvasTkAgg(fig, master=self.report_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill="both", expand=True)
 
         table_frame = tk.Frame(self.report_frame, bg="white", pady=20)
         table_frame.pack(fill="x")
@@ -180,9 +189,15 @@ class ReportView:
             tree.column(col, width=100, anchor="center")
 
         total = sum(valores)
-        for i, carrera in enumerate(carreras):
-            porcentaje = f"{(valores[i] / total) * 100:.2f}%" if total > 0 else "0.00%"
-            tree.insert("", "end", values=(carrera, valores[i], porcentaje))
+        populate_tree(
+            tree,
+            list(zip(carreras, valores)),
+            values=lambda fila: (
+                fila[0],
+                fila[1],
+                f"{(fila[1] / total) * 100:.2f}%" if total > 0 else "0.00%",
+            ),
+        )
         tree.pack(fill="x")
 
         if hasattr(self, "export_btn") and self.export_btn.winfo_exists():
@@ -203,6 +218,22 @@ class ReportView:
             )
             self.export_btn.pack(side="left", padx=10)
 
+    def export_pdf_in_background(self, generar_pdf, *args):
+        """Genera el PDF fuera del hilo de Tk y avisa al terminar."""
+        run_in_background(
+            self.parent,
+            database.run_report,
+            generar_pdf,
+            *args,
+            owner=None,
+            on_success=lambda _: messagebox.showinfo(
+                "Éxito", "El reporte se exportó correctamente a PDF."
+            ),
+            on_error=lambda e: messagebox.showerror(
+                "Error", f"No se pudo exportar el reporte a PDF:\n{e}"
+            ),
+        )
+
     def pdf_EstudiantesPorCarreras(self, carreras, valores, usuario):
         try:
             # Abrir diálogo para guardar archivo
@@ -215,11 +246,9 @@ class ReportView:
             if not file_path:
                 return  # El usuario canceló
 
-            reportesPDF.estudiantesPorCarrera(
-                self, carreras, valores, file_path, usuario
+            self.export_pdf_in_background(
+                reportesPDF.estudiantesPorCarrera, self, carreras, valores, file_path, usuario
             )
-
-            messagebox.showinfo("Éxito", "El reporte se exportó correctamente a PDF.")
         except Exception as e:
             messagebox.showerror("Error", f"No se pudo exportar el reporte a PDF:\n{e}")
 
@@ -233,7 +262,13 @@ class ReportView:
         ).pack(anchor="w", pady=(0, 20))
 
         # --- CONSULTA A LA BASE DE DATOS ---
-        resultados = database.get_profesores_por_carrera()
+        self.run_report_task(
+            database.get_profesores_por_carrera,
+            on_success=self._render_professors_by_department_report,
+            error_title="Error al generar el reporte",
+        )
+
+    def _render_professors_by_department_report(self, resultados):
 
         carreras_fijas = [
             "Ingeniería en Sistemas",
@@ -248,22 +283,9 @@ class ReportView:
         carreras = carreras_fijas
         valores = [valores_dict[c] for c in carreras_fijas]
 
-        fig, ax = plt.subplots(figsize=(10, 6))
-        ax.bar(
-            carreras,
-            valores,
-            color=["#3498db", "#2ecc71", "#f39c12", "#e74c3c"],
+        show_chart("profesores_por_carrera", self.report_frame, carreras, valores).pack(
+            fill="both", expand=True
         )
-        ax.set_ylabel("Cantidad de Profesores")
-        ax.set_title("Distribución de Profesores por Carrera")
-        ax.yaxis.set_major_locator(mticker.MaxNLocator(integer=True))
-        ax.yaxis.set_major_formatter(mticker.StrMethodFormatter("{x:.0f}"))
-        plt.xticks(rotation=45, ha="right")
-        plt.tight_layout()
-
-        canvas = FigureCanvasTkAgg(fig, master=self.report_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill="both", expand=True)
 
         table_frame = tk.Frame(self.report_frame, bg="white", pady=20)
         table_frame.pack(fill="x")
@@ -275,9 +297,15 @@ class ReportView:
             tree.column(col, width=100, anchor="center")
 
         total = sum(valores)
-        for i, carrera in enumerate(carreras):
-            porcentaje = f"{(valores[i] / total) * 100:.2f}%" if total > 0 else "0.00%"
-            tree.insert("", "end", values=(carrera, valores[i], porcentaje))
+        populate_tree(
+            tree,
+            list(zip(carreras, valores)),
+            values=lambda fila: (
+                fila[0],
+                fila[1],
+                f"{(fila[1] / total) * 100:.2f}%" if total > 0 else "0.00%",
+            ),
+        )
         tree.pack(fill="x")
 
         if hasattr(self, "export_btn") and self.export_btn.winfo_exists():
@@ -310,11 +338,9 @@ class ReportView:
             if not file_path:
                 return  # El usuario canceló
 
-            reportesPDF.profesoresPorCarrera(
-                self, carreras, valores, file_path, usuario
+            self.export_pdf_in_background(
+                reportesPDF.profesoresPorCarrera, self, carreras, valores, file_path, usuario
             )
-
-            messagebox.showinfo("Éxito", "El reporte se exportó correctamente a PDF.")
         except Exception as e:
             messagebox.showerror("Error", f"No se pudo exportar el reporte a PDF:\n{e}")
 
@@ -329,9 +355,9 @@ class ReportView:
             )
             if not file_path:
                 return  # El usuario canceló
-            reportesPDF.estudiantesPorMaterias(self, resultados, file_path, usuario)
-
-            messagebox.showinfo("Éxito", "El reporte se exportó correctamente a PDF.")
+            self.export_pdf_in_background(
+                reportesPDF.estudiantesPorMaterias, self, resultados, file_path, usuario
+            )
         except Exception as e:
             messagebox.showerror("Error", f"No se pudo exportar el reporte a PDF:\n{e}")
 
@@ -346,7 +372,13 @@ class ReportView:
         ).pack(anchor="w", pady=(0, 20))
 
         # Llamada a la función del database
-        resultados = database.get_estudiantes_nombres_y_cantidad_por_materia()
+        self.run_report_task(
+            database.get_estudiantes_nombres_y_cantidad_por_materia,
+            on_success=self._render_students_by_courses_report,
+            error_title="Error al generar el reporte",
+        )
+
+    def _render_students_by_courses_report(self, resultados):
         # Ordenar por materia
         resultados.sort(key=lambda x: x[0])
         print(resultados)
@@ -359,15 +391,19 @@ class ReportView:
             tree.heading(col, text=col.title())
             tree.column(col, width=150, anchor="center")
 
+        filas = []
         materia_actual = None
         for materia, estudiante, cantidad in resultados:
             if materia != materia_actual:
                 # Fila de encabezado para la nueva materia
-                tree.insert(
-                    "", "end", values=(f"Materia: {materia}", "", f"Total: {cantidad}")
-                )
+                filas.append((f"Materia: {materia}", "", f"Total: {cantidad}"))
                 materia_actual = materia
-            tree.insert("", "end", values=("", estudiante, ""))
+            filas.append(("", estudiante, ""))
+
+        # Por tandas: el reporte lista a todos los estudiantes inscritos
+        progreso = tk.Label(self.report_frame, text="", fg="gray", bg="white")
+        progreso.pack(anchor="w")
+        populate_tree(tree, filas, progress=progreso)
 
         tree.pack(fill="x")
         if hasattr(self, "export_btn") and self.export_btn.winfo_exists():
@@ -397,6 +433,15 @@ class ReportView:
         ).pack(anchor="w", pady=(0, 20))
 
         # Obtener carreras y contar materias por carrera
+        self.run_report_task(
+            self._get_materias_por_carrera,
+            on_success=lambda datos: self._render_courses_by_department_report(
+                *datos
+            ),
+            error_title="Error al generar el reporte",
+        )
+
+    def _get_materias_por_carrera(self):
         carreras = database.get_carreras()
         valores = []
         materias_por_carrera = {}
@@ -415,28 +460,14 @@ class ReportView:
                 materias = cursor.fetchall()
                 materias_por_carrera[carrera] = materias
                 valores.append(len(materias))
+        return carreras, valores
+
+    def _render_courses_by_department_report(self, carreras, valores):
 
         # --- GRAFICA ---
-        import matplotlib.pyplot as plt
-        import matplotlib.ticker as mticker
-        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-
-        fig, ax = plt.subplots(figsize=(10, 6))
-        ax.bar(
-            carreras,
-            valores,
-            color=["#3498db", "#2ecc71", "#f39c12", "#e74c3c"][: len(carreras)],
-        )
-        ax.set_ylabel("Cantidad de Materias")
-        ax.set_title("Distribución de Materias por Carrera")
-        ax.yaxis.set_major_locator(mticker.MaxNLocator(integer=True))
-        ax.yaxis.set_major_formatter(mticker.StrMethodFormatter("{x:.0f}"))
-        plt.xticks(rotation=45, ha="right")
-        plt.tight_layout()
-
-        canvas = FigureCanvasTkAgg(fig, master=self.report_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill="both", expand=True)
+        show_chart("materias_por_carrera", self.report_frame, carreras, valores).pack(
+            fill="both", expand=True
+        )
 
         # --- TABLA RESUMEN ---
         table_frame = tk.Frame(self.report_frame, bg="white", pady=20)
@@ -450,8 +481,7 @@ class ReportView:
             tree.heading(col, text=col.replace("_", " ").title())
             tree.column(col, width=180, anchor="center")
 
-        for i, carrera in enumerate(carreras):
-            tree.insert("", "end", values=(carrera, valores[i]))
+        populate_tree(tree, list(zip(carreras, valores)))
         tree.pack(fill="x")
 
         # Botón de exportar a PDF
@@ -482,25 +512,117 @@ class ReportView:
             if not file_path:
                 return  # El usuario canceló
 
-            reportesPDF.materiasPorCarrera(self, file_path, usuario)
-
-            messagebox.showinfo("Éxito", "El reporte se exportó correctamente a PDF.")
+            self.export_pdf_in_background(
+                reportesPDF.materiasPorCarrera, self, file_path, usuario
+            )
         except Exception as e:
             messagebox.showerror("Error", f"No se pudo exportar el reporte a PDF:\n{e}")
 
     def generate_record_academico_report(self):
-        from models.student import Student
-        from tkinter import filedialog, messagebox
-        import os
-        import traceback
-        from config import database
-
-        # 1. Obtener información del estudiante
-        estudiante = Student.get_by_user_id(self.user.id)
+        tk.Label(
+            self.report_frame,
+            text="Reporte: Record Académico",
+            font=("Arial", 14, "bold"),
+            bg="white",
+        ).pack(anchor="w", pady=(0, 20))
+
+        # 1. Obtener información del estudiante y su record en segundo plano
+        def _get_datos():
+            estudiante = Student.get_by_user_id(self.user.id)
+            if not estudiante:
+                return None, None
+            return estudiante, Transcript.get_by_student(estudiante.id)
+
+        self.run_report_task(
+            _get_datos,
+            on_success=lambda datos: self._render_record_academico(*datos),
+            on_error=lambda e: messagebox.showerror(
+                "Error", f"No se pudo obtener el historial académico:\n{e}"
+            ),
+        )
+
+    def _render_record_academico(self, estudiante, record):
         if not estudiante:
             messagebox.showerror("Error", "No se encontró información del estudiante.")
             return
 
+        def _nota(valor):
+            return f"{valor:.2f}" if valor is not None else "-"
+
+        # Materias en el orden del record, con el número de intento
+        titulos = ("Código", "Materia", "UC", "Período", "Nota", "Estado", "Intento")
+        tree = ttk.Treeview(
+            self.report_frame, columns=titulos, show="headings", height=12
+        )
+        for col in titulos:
+            tree.heading(col, text=col)
+            tree.column(col, width=220 if col == "Materia" else 90, anchor="center")
+        tree.pack(fill="x")
+        populate_tree(
+            tree,
+            record.entradas,
+            values=lambda e: (
+                e.codigo,
+                e.materia,
+                e.creditos,
+                e.periodo,
+                _nota(e.nota),
+                e.estado or "-",
+                e.intento,
+            ),
+        )
+
+        # Resumen por período con los promedios ponderados
+        table_frame = tk.Frame(self.report_frame, bg="white", pady=20)
+        table_frame.pack(fill="x")
+        titulos = ("Período", "Materias", "UC", "UC Aprobadas", "Promedio", "Acumulado")
+        periodos = ttk.Treeview(table_frame, columns=titulos, show="headings", height=6)
+        for col in titulos:
+            periodos.heading(col, text=col)
+            periodos.column(col, width=100, anchor="center")
+        populate_tree(
+            periodos,
+            record.periodos(),
+            values=lambda p: (
+                p.periodo,
+                p.materias,
+                p.creditos,
+                p.creditos_aprobados,
+                _nota(p.promedio),
+                _nota(p.promedio_acumulado),
+            ),
+        )
+        periodos.pack(fill="x")
+
+        tk.Label(
+            self.report_frame,
+            text=(
+                f"Materias cursadas: {len(record)}   Aprobadas: {record.aprobadas}   "
+                f"Reprobadas: {record.reprobadas}   Créditos aprobados: "
+                f"{record.creditos_aprobados}   Promedio ponderado: "
+                f"{_nota(record.promedio_ponderado)}"
+            ),
+            font=("Arial", 10, "bold"),
+            bg="white",
+        ).pack(anchor="w")
+
+        if hasattr(self, "export_btn") and self.export_btn.winfo_exists():
+            self.export_btn.destroy()
+        if self.report_combo.get() == "Record Academico":
+            self.export_btn = tk.Button(
+                self.report_combo.master,
+                text="Exportar a PDF",
+                bg="#3498db",
+                fg="white",
+                font=("Arial", 10, "bold"),
+                bd=0,
+                padx=15,
+                pady=5,
+                command=lambda: self._export_record_academico(estudiante, record),
+            )
+            self.export_btn.pack(side="left", padx=10)
+
+    def _export_record_academico(self, estudiante, academic_records):
         # 2. Preparar datos del estudiante para el PDF
         student_data = {
             "cedula": self.user.cedula,
@@ -510,18 +632,7 @@ class ReportView:
             "semestre": estudiante.semestre,
         }
 
-        # 3. Consultar el historial académico usando la función del database
-        try:
-            academic_records = database.get_record_academico_by_student_id(
-                estudiante.id
-            )
-        except Exception as e:
-            messagebox.showerror(
-                "Error", f"No se pudo obtener el historial académico:\n{e}"
-            )
-            return
-
-        # 4. Pedir ruta para guardar el PDF
+        # 3. Pedir ruta para guardar el PDF
         file_path = filedialog.asksaveasfilename(
             defaultextension=".pdf",
             initialfile=f"record_academico_{self.user.cedula}.pdf",
@@ -531,32 +642,34 @@ class ReportView:
         if not file_path:
             return
 
-        # 5. Llamar a la función de generación de PDF
-        try:
-            reportesPDF.generate_record_academico_report(
-                file_path,
-                student_data,
-                academic_records,
-                self.user.nombre + " " + self.user.apellido,
-            )
-            messagebox.showinfo(
+        # 4. Generar el PDF en segundo plano
+        run_in_background(
+            self.parent,
+            database.run_report,
+            reportesPDF.generate_record_academico_report,
+            file_path,
+            student_data,
+            academic_records,
+            self.user.nombre + " " + self.user.apellido,
+            owner=None,
+            on_success=lambda _: messagebox.showinfo(
                 "Éxito", "El record académico se exportó correctamente a PDF."
-            )
-        except Exception as e:
-            messagebox.showerror(
-                "Error",
-                f"No se pudo exportar el record académico a PDF:\n{e}\n{traceback.format_exc()}",
-            )
+            ),
+            on_error=lambda e: messagebox.showerror(
+                "Error", f"No se pudo exportar el record académico a PDF:\n{e}"
+            ),
+        )
 
     def generate_constancia_estudio_report(self):
-        from models.student import Student
-        from tkinter import filedialog, messagebox
-        import os
-        import traceback
-        from config import database
-
-        # 1. Obtener información del estudiante
-        estudiante = Student.get_by_user_id(self.user.id)
+        # 1. Obtener información del estudiante en segundo plano
+        self.run_report_task(
+            Student.get_by_user_id,
+            self.user.id,
+            on_success=self._export_constancia_estudio,
+            error_title="Error",
+        )
+
+    def _export_constancia_estudio(self, estudiante):
         if not estudiante:
             messagebox.showerror("Error", "No se encontró información del estudiante.")
             return
@@ -580,48 +693,69 @@ class ReportView:
         if not file_path:
             return
 
-        # 4. Llamar a la función de generación de PDF
-        try:
-            reportesPDF.generate_constancia_estudio_report(
-                file_path,
-                student_data,
-                self.user.nombre + " " + self.user.apellido,
-            )
-            messagebox.showinfo(
+        # 4. Generar el PDF en segundo plano
+        run_in_background(
+            self.parent,
+            database.run_report,
+            reportesPDF.generate_constancia_estudio_report,
+            file_path,
+            student_data,
+            self.user.nombre + " " + self.user.apellido,
+            owner=None,
+            on_success=lambda _: messagebox.showinfo(
                 "Éxito", "La constancia de estudio se exportó correctamente a PDF."
-            )
-        except Exception as e:
-            messagebox.showerror(
-                "Error",
-                f"No se pudo exportar la constancia de estudio a PDF:\n{e}\n{traceback.format_exc()}",
-            )
-
-    def generate_students_by_semester_report(self):
-        from models.coordinator import Coordinator
-        from tkinter import filedialog, messagebox
-        import os
-        import traceback
-        from config import database
+            ),
+            on_error=lambda e: messagebox.showerror(
+                "Error", f"No se pudo exportar la constancia de estudio a PDF:\n{e}"
+            ),
+        )
 
-        # 1. Obtener información del coordinador
+    def _get_datos_coordinador(self, consulta):
+        """Obtiene el coordinador y los datos de su carrera (fuera del hilo de Tk)."""
         coordinador = Coordinator.get_by_id(self.user.id)
+        if not coordinador or not coordinador.carrera:
+            return coordinador, None
+        return coordinador, consulta(coordinador.carrera)
+
+    def _validar_coordinador(self, coordinador):
         if not coordinador:
             messagebox.showerror("Error", "No se encontró información del coordinador.")
-            return
-
+            return False
         if not coordinador.carrera:
             messagebox.showerror(
                 "Error", "El coordinador no tiene una carrera asignada."
             )
-            return
+            return False
+        return True
+
+    def _export_pdf_coordinador(self, generar_pdf, **kwargs):
+        run_in_background(
+            self.parent,
+            database.run_report,
+            generar_pdf,
+            owner=None,
+            on_success=lambda _: messagebox.showinfo(
+                "Éxito", f"Reporte generado exitosamente en:\n{kwargs['file_path']}"
+            ),
+            on_error=lambda e: messagebox.showerror(
+                "Error", f"Error al generar el PDF: {str(e)}"
+            ),
+            **kwargs,
+        )
 
-        # 2. Obtener estudiantes por semestre filtrados por carrera
-        try:
-            estudiantes_por_semestre = (
-                database.get_estudiantes_por_semestre_por_carrera(coordinador.carrera)
-            )
-        except Exception as e:
-            messagebox.showerror("Error", f"Error al obtener datos: {str(e)}")
+    def generate_students_by_semester_report(self):
+        # 1. Obtener el coordinador y sus estudiantes por semestre
+        self.run_report_task(
+            self._get_datos_coordinador,
+            database.get_estudiantes_por_semestre_por_carrera,
+            on_success=lambda datos: self._export_students_by_semester(*datos),
+            on_error=lambda e: messagebox.showerror(
+                "Error", f"Error al obtener datos: {str(e)}"
+            ),
+        )
+
+    def _export_students_by_semester(self, coordinador, estudiantes_por_semestre):
+        if not self._validar_coordinador(coordinador):
             return
 
         if not estudiantes_por_semestre:
@@ -631,12 +765,8 @@ class ReportView:
             )
             return
 
-        # 3. Solicitar ubicación para guardar el PDF
-        carrera_safe = (
-            coordinador.carrera.replace(" ", "_")
-            if coordinador.carrera
-            else "Sin_Carrera"
-        )
+        # 2. Solicitar ubicación para guardar el PDF
+        carrera_safe = coordinador.carrera.replace(" ", "_")
         file_path = filedialog.asksaveasfilename(
             defaultextension=".pdf",
             filetypes=[("PDF files", "*.pdf")],
@@ -647,49 +777,28 @@ class ReportView:
         if not file_path:
             return
 
-        # 4. Generar el PDF
-        try:
-            from pdf import reportesPDF
-
-            reportesPDF.generate_students_by_semester_report(
-                file_path=file_path,
-                students_by_semester=estudiantes_por_semestre,
-                carrera=coordinador.carrera,
-                usuario=self.user.nombre + " " + self.user.apellido,
-            )
-            messagebox.showinfo(
-                "Éxito", f"Reporte generado exitosamente en:\n{file_path}"
-            )
-        except Exception as e:
-            messagebox.showerror("Error", f"Error al generar el PDF: {str(e)}")
-            print(f"Error completo: {traceback.format_exc()}")
+        # 3. Generar el PDF en segundo plano
+        self._export_pdf_coordinador(
+            reportesPDF.generate_students_by_semester_report,
+            file_path=file_path,
+            students_by_semester=estudiantes_por_semestre,
+            carrera=coordinador.carrera,
+            usuario=self.user.nombre + " " + self.user.apellido,
+        )
 
     def generate_professors_by_courses_report(self):
-        from models.coordinator import Coordinator
-        from tkinter import filedialog, messagebox
-        import os
-        import traceback
-        from config import database
-
-        # 1. Obtener información del coordinador
-        coordinador = Coordinator.get_by_id(self.user.id)
-        if not coordinador:
-            messagebox.showerror("Error", "No se encontró información del coordinador.")
-            return
-
-        if not coordinador.carrera:
-            messagebox.showerror(
-                "Error", "El coordinador no tiene una carrera asignada."
-            )
-            return
+        # 1. Obtener el coordinador y los profesores por materia de su carrera
+        self.run_report_task(
+            self._get_datos_coordinador,
+            database.get_profesores_por_materias_por_carrera,
+            on_success=lambda datos: self._export_professors_by_courses(*datos),
+            on_error=lambda e: messagebox.showerror(
+                "Error", f"Error al obtener datos: {str(e)}"
+            ),
+        )
 
-        # 2. Obtener profesores por materias filtrados por carrera
-        try:
-            profesores_por_materias = database.get_profesores_por_materias_por_carrera(
-                coordinador.carrera
-            )
-        except Exception as e:
-            messagebox.showerror("Error", f"Error al obtener datos: {str(e)}")
+    def _export_professors_by_courses(self, coordinador, profesores_por_materias):
+        if not self._validar_coordinador(coordinador):
             return
 
         if not profesores_por_materias:
@@ -699,12 +808,8 @@ class ReportView:
             )
             return
 
-        # 3. Solicitar ubicación para guardar el PDF
-        carrera_safe = (
-            coordinador.carrera.replace(" ", "_")
-            if coordinador.carrera
-            else "Sin_Carrera"
-        )
+        # 2. Solicitar ubicación para guardar el PDF
+        carrera_safe = coordinador.carrera.replace(" ", "_")
         file_path = filedialog.asksaveasfilename(
             defaultextension=".pdf",
             filetypes=[("PDF files", "*.pdf")],
@@ -715,19 +820,11 @@ class ReportView:
         if not file_path:
             return
 
-        # 4. Generar el PDF
-        try:
-            from pdf import reportesPDF
-
-            reportesPDF.generate_professors_by_courses_report(
-                file_path=file_path,
-                professors_by_courses=profesores_por_materias,
-                carrera=coordinador.carrera,
-                usuario=self.user.nombre + " " + self.user.apellido,
-            )
-            messagebox.showinfo(
-                "Éxito", f"Reporte generado exitosamente en:\n{file_path}"
-            )
-        except Exception as e:
-            messagebox.showerror("Error", f"Error al generar el PDF: {str(e)}")
-            print(f"Error completo: {traceback.format_exc()}")
+        # 3. Generar el PDF en segundo plano
+        self._export_pdf_coordinador(
+            reportesPDF.generate_professors_by_courses_report,
+            file_path=file_path,
+            professors_by_courses=profesores_por_materias,
+            carrera=coordinador.carrera,
+            usuario=self.user.nombre + " " + self.user.apellido,
+        )
@@ -9,6 +9,9 @@ from config.database import (
 from controllers.section_controller import SectionController
 from controllers.course_controller import CourseController
 from controllers.professor_controller import ProfessorController
+from config.pagination import KeysetPager, ListSource
+from utils.paged_treeview import PagedTreeview
+from utils.task_executor import run_in_background
 
 
 class SectionListView:
@@ -156,6 +159,9 @@ class SectionListView:
 
         self.tree.pack(fill="both", expand=True)
 
+        # Solo las filas visibles se leen (por páginas) y se dibujan
+        self.pager = PagedTreeview(self.tree, vsb)
+
         # Botones de acción
         action_frame = tk.Frame(content_frame)
         action_frame.pack(fill="x", pady=10)
@@ -194,61 +200,45 @@ class SectionListView:
         if not periodo:
             return
 
-        # Limpiar tabla
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-
-        try:
-            with get_db_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    """
-                    SELECT 
-                        s.id_seccion,
-                        m.codigo,
-                        m.nombre,
-                        s.numero_seccion,
-                        COALESCE(u.nombre || ' ' || u.apellido, 'Por asignar') as profesor,
-                        COALESCE(s.aula, 'Por asignar') as aula,
-                        s.capacidad,
-                        s.estado
-                    FROM secciones s
-                    JOIN materias m ON s.id_materia = m.id_materia
-                    LEFT JOIN profesores p ON s.id_profesor = p.id_profesor
-                    LEFT JOIN usuarios u ON p.id_usuario = u.id_usuario
-                    WHERE s.periodo = ?
-                    ORDER BY m.codigo, s.numero_seccion
-                """,
-                    (periodo,),
-                )
-
-                for row in cursor.fetchall():
-                    self.tree.insert("", "end", values=row)
-
-        except Exception as e:
-            messagebox.showerror("Error", f"Error al cargar secciones: {str(e)}")
+        # Si ya se muestra el listado de este período, solo se refresca
+        fuente = self.pager.source
+        if isinstance(fuente, KeysetPager) and fuente.params == (periodo,):
+            self.pager.refresh()
+        else:
+            self.pager.set_source(self.section_controller.paged(periodo))
 
     def search_sections(self):
-        query = self.search_var.get().lower()
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        sections = self.section_controller.get_all()
-        for section in sections:
-            if any(query in str(field).lower() for field in section):
-                self.tree.insert(
-                    "",
-                    "end",
-                    values=(
-                        section[0],
-                        section[1],
-                        section[2],
-                        f"D{section[3]}" if section[3] else "N/A",
-                        section[4],
-                        section[5],
-                        section[6],
-                        section[7],
-                    ),
-                )
+        query = self.search_var.get().strip()
+        if not query:
+            self.load_sections()
+            return
+        # Búsqueda en el índice de texto completo (por prefijos y relevancia)
+        run_in_background(
+            self.tree,
+            self.section_controller.search,
+            query,
+            on_success=self.show_sections,
+            on_error=lambda e: messagebox.showerror(
+                "Error", f"Error al buscar secciones: {str(e)}"
+            ),
+        )
+
+    def show_sections(self, sections):
+        # Resultados de búsqueda (ya en memoria)
+        filas = [
+            (
+                section[0],
+                section[1],
+                section[2],
+                f"D{section[3]}" if section[3] else "N/A",
+                section[4],
+                section[5],
+                section[6],
+                section[7],
+            )
+            for section in sections
+        ]
+        self.pager.set_source(ListSource(filas, self.tree["columns"]))
 
     def on_item_double_click(self, event):
         item = self.tree.identify_row(event.y)
@@ -256,25 +246,25 @@ class SectionListView:
             self.edit_selected_section()
 
     def edit_selected_section(self):
-        selected = self.tree.selection()
+        selected = self.pager.selected_values()
         if not selected:
             messagebox.showwarning(
                 "Advertencia", "Por favor, seleccione una sección para editar"
             )
             return
 
-        item_id = self.tree.item(selected[0], "values")[0]
+        item_id = selected[0][0]
         self.show_edit_form(item_id)
 
     def delete_selected_section(self):
-        selected = self.tree.selection()
+        selected = self.pager.selected_values()
         if not selected:
             messagebox.showwarning(
                 "Advertencia", "Por favor, seleccione una sección para eliminar"
             )
             return
 
-        item_id = self.tree.item(selected[0], "values")[0]
+        item_id = selected[0][0]
         confirm = messagebox.askyesno(
             "Confirmar", "¿Está seguro de eliminar esta sección?"
         )
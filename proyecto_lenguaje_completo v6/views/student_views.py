@@ -2,6 +2,9 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 from controllers.student_controller import StudentController
 from controllers.user_controller import UserController
+from utils.task_executor import run_in_background
+from utils.paged_treeview import PagedTreeview
+from config.pagination import KeysetPager, ListSource
 from config.inscripcion import set_inscripcion_habilitada, get_inscripcion_habilitada
 
 
@@ -111,6 +114,9 @@ class StudentListView:
             self.tree.heading(col, text=col.replace("_", " ").title())
             self.tree.column(col, width=100, anchor="center")
 
+        # Solo las filas visibles se leen (por páginas) y se dibujan
+        self.pager = PagedTreeview(self.tree, vsb)
+
         # Cargar datos
         self.load_students()
 
@@ -161,28 +167,30 @@ class StudentListView:
         refresh_btn.pack(side="left", padx=5)
 
     def load_students(self):
-        # Limpiar tabla
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-
-        # Obtener estudiantes
-        students = self.student_controller.get_all()
-
-        # Insertar datos en la tabla
-        for student in students:
-            self.tree.insert("", "end", values=student[1:])
+        # Listado completo paginado; si ya se está mostrando, solo se refresca
+        if isinstance(self.pager.source, KeysetPager):
+            self.pager.refresh()
+        else:
+            self.pager.set_source(self.student_controller.paged())
+
+    def show_students(self, students):
+        # Resultados de búsqueda (ya en memoria), sin la columna id
+        self.pager.set_source(
+            ListSource([student[1:] for student in students], self.tree["columns"])
+        )
 
     def search_students(self):
-        query = self.search_entry.get().lower()
-        students = self.student_controller.get_all()
-        # Limpiar tabla
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        # Filtrar resultados
-        for student in students:
-            # Convierte todos los campos a string y busca coincidencia parcial
-            if any(query in str(field).lower() for field in student[1:]):
-                self.tree.insert("", "end", values=student[1:])
+        query = self.search_entry.get().strip()
+        if not query:
+            self.load_students()
+            return
+        # Búsqueda en el índice de texto completo (por prefijos y relevancia)
+        run_in_background(
+            self.tree,
+            self.student_controller.search,
+            query,
+            on_success=self.show_students,
+        )
 
     def on_item_double_click(self, event):
         item = self.tree.identify_row(event.y)
@@ -190,14 +198,14 @@ class StudentListView:
             self.edit_selected_student()
 
     def edit_selected_student(self):
-        selected = self.tree.selection()
+        selected = self.pager.selected_values()
         if not selected:
             messagebox.showwarning(
                 "Advertencia", "Por favor, seleccione un estudiante para editar"
             )
             return
 
-        cedula = self.tree.item(selected[0], "values")[0]
+        cedula = selected[0][0]
 
         student_id = self.student_controller.get_id_by_cedula(cedula)
 
@@ -208,14 +216,14 @@ class StudentListView:
         self.show_edit_form(student_id)
 
     def delete_selected_student(self):
-        selected = self.tree.selection()
+        selected = self.pager.selected_values()
         if not selected:
             messagebox.showwarning(
                 "Advertencia", "Por favor, seleccione un estudiante para eliminar"
             )
             return
 
-        cedula = self.tree.item(selected[0], "values")[0]
+        cedula = selected[0][0]
 
         # Confirmar eliminación
         confirm = messagebox.askyesno(